@@ -108,6 +108,16 @@ def cli(ctx, log_level, audit_actor, no_audit):
     default=4,
     help='Expected number of speakers (default: 4)'
 )
+@click.option(
+    '--no-llm-cache',
+    is_flag=True,
+    help='Bypass the on-disk LLM response cache for IC/OOC classification'
+)
+@click.option(
+    '--purge-llm-cache',
+    is_flag=True,
+    help='Delete all cached LLM responses before processing'
+)
 @click.pass_context
 def process(
     ctx,
@@ -120,12 +130,24 @@ def process(
     skip_diarization,
     skip_classification,
     skip_snippets,
-    num_speakers
+    num_speakers,
+    no_llm_cache,
+    purge_llm_cache
 ):
     """Process a D&D session recording"""
 
     input_path = Path(input_file)
 
+    if purge_llm_cache:
+        from src.llm_response_cache import LLMResponseCache
+
+        cache = LLMResponseCache.from_config()
+        removed = cache.purge()
+        cache.close()
+        console.print(f"[cyan]Purged {removed} cached LLM responses[/cyan]")
+
+    use_llm_cache = False if no_llm_cache else None
+
     # Default session ID to filename
     if session_id is None:
         session_id = input_path.stem
@@ -137,7 +159,8 @@ def process(
         processor = DDSessionProcessor(
             session_id=session_id,
             num_speakers=num_speakers,
-            party_id=party
+            party_id=party,
+            use_llm_cache=use_llm_cache
         )
     else:
         # Parse character and player names
@@ -148,7 +171,8 @@ def process(
             session_id=session_id,
             character_names=character_names,
             player_names=player_names,
-            num_speakers=num_speakers
+            num_speakers=num_speakers,
+            use_llm_cache=use_llm_cache
         )
 
     # Process
@@ -836,6 +860,48 @@ def cleanup(ctx, empty, incomplete, stale_checkpoints, dry_run, force, output):
         report_path=report_path,
     )
 
+@sessions.command('convert-intermediates')
+@click.option('--format', '-f', 'storage_format', type=click.Choice(['columnar', 'json']), default='columnar',
+              help='Target format for stage 4-6 intermediate outputs (default: columnar)')
+@click.option('--session-dir', '-s', type=click.Path(exists=True, file_okay=False),
+              help='Convert a single session directory instead of every session in the output directory')
+@click.pass_context
+def convert_intermediates(ctx, storage_format, session_dir):
+    """Rewrite saved intermediate stage outputs in another format."""
+    from src.intermediate_output import IntermediateOutputManager
+
+    if session_dir:
+        session_dirs = [Path(session_dir)]
+    else:
+        session_dirs = sorted(
+            path.parent for path in Path(Config.OUTPUT_DIR).glob("*/intermediates") if path.is_dir()
+        )
+
+    converted_files = 0
+    for path in session_dirs:
+        manager = IntermediateOutputManager(path, storage_format=storage_format)
+        try:
+            converted = manager.convert_stage_outputs(storage_format)
+        except Exception as exc:
+            console.print(f"[red]Failed to convert {path.name}: {exc}[/red]")
+            continue
+        if converted:
+            console.print(f"  {path.name}: {', '.join(file.name for file in converted)}")
+        converted_files += len(converted)
+
+    console.print(
+        f"\n[bold green][OK] Converted {converted_files} intermediate file(s) "
+        f"in {len(session_dirs)} session(s) to {storage_format}[/bold green]"
+    )
+    _audit(
+        ctx,
+        "cli.sessions.convert_intermediates",
+        status="success",
+        storage_format=storage_format,
+        sessions=len(session_dirs),
+        converted=converted_files,
+    )
+
 cli.add_command(sessions)
 
 
@@ -1544,7 +1610,7 @@ def ingest(ingest_all, session, rebuild, output_dir, knowledge_dir):
 
     try:
         # Initialize embedding service and vector store
-        embedding_service = EmbeddingService()
+        embedding_service = EmbeddingService(use_cache=Config.EMBEDDING_CACHE_ENABLED)
         vector_store = CampaignVectorStore(
             persist_dir=Config.PROJECT_ROOT / "vector_db",
             embedding_service=embedding_service
@@ -1567,6 +1633,9 @@ def ingest(ingest_all, session, rebuild, output_dir, knowledge_dir):
             table.add_row("Knowledge Bases Ingested", str(stats["knowledge_bases_ingested"]))
             table.add_row("Knowledge Bases Failed", str(stats["knowledge_bases_failed"]))
             table.add_row("Total Documents", str(stats["total_documents"]))
+            table.add_row("Records Embedded (new/changed)", str(stats["records_upserted"]))
+            table.add_row("Records Unchanged", str(stats["records_unchanged"]))
+            table.add_row("Records Deleted", str(stats["records_deleted"]))
 
             console.print(table)
 
@@ -1585,6 +1654,9 @@ def ingest(ingest_all, session, rebuild, output_dir, knowledge_dir):
             table.add_row("Knowledge Bases Ingested", str(stats["knowledge_bases_ingested"]))
             table.add_row("Knowledge Bases Failed", str(stats["knowledge_bases_failed"]))
             table.add_row("Total Documents", str(stats["total_documents"]))
+            table.add_row("Records Embedded (new/changed)", str(stats["records_upserted"]))
+            table.add_row("Records Unchanged", str(stats["records_unchanged"]))
+            table.add_row("Records Deleted", str(stats["records_deleted"]))
 
             console.print(table)
 
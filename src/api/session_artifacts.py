@@ -40,6 +40,7 @@ class SessionArtifactsAPI:
             output_dir: Base output directory (defaults to Config.OUTPUT_DIR)
         """
         self.service = SessionArtifactService(output_dir=output_dir)
+        self.snippet_renderer = self.service.snippet_renderer
         self.logger = get_logger('session_artifacts_api')
 
     def _success_response(self, data: Any) -> Dict[str, Any]:
@@ -236,6 +237,9 @@ class SessionArtifactsAPI:
 
         Returns:
             Tuple of (file_path, filename) or None if not found
+
+        Clips of virtual snippet manifests have no file of their own; they are
+        rendered from the session audio into the temp directory on request.
         """
         if not relative_path:
             return None
@@ -244,6 +248,14 @@ class SessionArtifactsAPI:
             # Resolve the path through the service (sandboxed)
             artifact_path = self.service._resolve_relative_path(relative_path)
 
+            if not artifact_path.exists() and self.snippet_renderer.is_virtual_clip(artifact_path):
+                rendered_path = (
+                    self.service.temp_dir / "virtual_snippets"
+                    / self.service._to_relative_str(artifact_path.parent) / artifact_path.name
+                )
+                self.snippet_renderer.render_to_file(artifact_path.parent, artifact_path.name, rendered_path)
+                return (rendered_path, artifact_path.name)
+
             if not artifact_path.exists() or not artifact_path.is_file():
                 return None
 
@@ -78,6 +78,10 @@ class AudioProcessor:
         ]
 
         try:
+            # FFmpeg truncates an existing output in place; unlinking first gives the new
+            # conversion its own inode so hard links to the old one (virtual snippet
+            # sources) keep their audio
+            output_path.unlink(missing_ok=True)
             subprocess.run(
                 command,
                 check=True,
@@ -0,0 +1,159 @@
+"""Run speaker diarization in a child process while other stages proceed."""
+from __future__ import annotations
+
+import multiprocessing
+from pathlib import Path
+from time import perf_counter
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from .diarizer import DiarizerFactory, SpeakerSegment
+from .logger import get_logger
+
+
+class BackgroundDiarizationError(RuntimeError):
+    """Raised when the background diarization process fails or dies."""
+
+
+def _run_diarization(backend: str, wav_path: str, num_speakers: Optional[int], conn) -> None:
+    """Child-process entry point; sends (status, segments, embeddings, seconds) back."""
+    started = perf_counter()
+    try:
+        diarizer = DiarizerFactory.create(backend=backend)
+        segments, embeddings = diarizer.diarize(Path(wav_path), num_speakers=num_speakers)
+        conn.send(("ok", segments, embeddings, perf_counter() - started))
+    except BaseException as exc:  # report everything, including KeyboardInterrupt
+        conn.send(("error", f"{type(exc).__name__}: {exc}", None, perf_counter() - started))
+    finally:
+        conn.close()
+
+
+class BackgroundDiarization:
+    """
+    Speaker diarization running in a separate process.
+
+    Diarization only needs the converted WAV from stage 1, so it can run while
+    the pipeline chunks and transcribes. A dedicated process (rather than a
+    thread) keeps pyannote's CPU/GPU work from contending with the GIL-bound
+    transcription loop and lets the job be terminated if the pipeline fails.
+
+    The child builds its own diarizer through DiarizerFactory; the parent's
+    diarizer instance is never shared across the process boundary.
+
+    Example:
+        >>> job = BackgroundDiarization("pyannote", wav_file, num_speakers=4).start()
+        >>> ...  # transcribe
+        >>> segments, embeddings = job.result()
+    """
+
+    def __init__(
+        self,
+        backend: str,
+        wav_file: Path,
+        num_speakers: Optional[int] = None,
+        start_method: str = "spawn",
+    ):
+        self.backend = backend
+        self.wav_file = Path(wav_file)
+        self.num_speakers = num_speakers
+        self.start_method = start_method
+        self.logger = get_logger("background_diarization")
+
+        self._process: Optional[multiprocessing.process.BaseProcess] = None
+        self._conn = None
+        self._result: Optional[Tuple[List[SpeakerSegment], Dict[str, np.ndarray]]] = None
+        self._error: Optional[str] = None
+        self._started_at: Optional[float] = None
+
+        # Timings in seconds, filled in once the result has been collected
+        self.diarization_seconds: Optional[float] = None
+        self.wait_seconds: Optional[float] = None
+
+    def start(self) -> "BackgroundDiarization":
+        """Launch the child process and return self."""
+        context = multiprocessing.get_context(self.start_method)
+        parent_conn, child_conn = context.Pipe(duplex=False)
+        self._process = context.Process(
+            target=_run_diarization,
+            args=(self.backend, str(self.wav_file), self.num_speakers, child_conn),
+            name="diarization",
+            daemon=True,
+        )
+        self._started_at = perf_counter()
+        self._process.start()
+        child_conn.close()
+        self._conn = parent_conn
+        self.logger.info(
+            "Started background diarization (pid=%s, backend=%s) for %s",
+            self._process.pid, self.backend, self.wav_file.name
+        )
+        return self
+
+    @property
+    def started(self) -> bool:
+        return self._process is not None
+
+    def done(self) -> bool:
+        """True once a result (or error) is available without blocking."""
+        if self._result is not None or self._error is not None:
+            return True
+        return self._conn is not None and self._conn.poll()
+
+    def result(self, timeout: Optional[float] = None) -> Tuple[List[SpeakerSegment], Dict[str, np.ndarray]]:
+        """
+        Wait for diarization to finish and return ``(speaker_segments, embeddings)``.
+
+        Raises:
+            BackgroundDiarizationError: If the job was never started, failed,
+                exited without a result, or did not finish within ``timeout``.
+        """
+        if self._result is not None:
+            return self._result
+        if self._error is not None:
+            raise BackgroundDiarizationError(self._error)
+        if self._conn is None:
+            raise BackgroundDiarizationError("Background diarization was not started")
+
+        wait_started = perf_counter()
+        try:
+            if not self._conn.poll(timeout):
+                raise BackgroundDiarizationError(
+                    f"Background diarization did not finish within {timeout} seconds"
+                )
+            status, payload, embeddings, elapsed = self._conn.recv()
+        except (EOFError, OSError) as exc:
+            exit_code = self._process.exitcode if self._process else None
+            self._error = f"Diarization process exited without a result (exit code {exit_code}): {exc}"
+            self._cleanup()
+            raise BackgroundDiarizationError(self._error) from exc
+
+        self.wait_seconds = perf_counter() - wait_started
+        self.diarization_seconds = elapsed
+        self._cleanup()
+
+        if status != "ok":
+            self._error = payload
+            raise BackgroundDiarizationError(payload)
+
+        self._result = (payload, embeddings)
+        self.logger.info(
+            "Background diarization finished in %.1fs (pipeline waited %.1fs)",
+            self.diarization_seconds, self.wait_seconds
+        )
+        return self._result
+
+    def cancel(self) -> None:
+        """Terminate the child process if it is still running."""
+        if self._process is not None and self._process.is_alive():
+            self.logger.info("Cancelling background diarization (pid=%s)", self._process.pid)
+            self._process.terminate()
+        self._cleanup()
+
+    def _cleanup(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+        if self._process is not None:
+            self._process.join(timeout=5)
+            self._process = None
@@ -1,7 +1,6 @@
 """High-level character profile extraction and update workflow."""
 from __future__ import annotations
 
-import json
 import logging
 import re
 from collections import defaultdict
@@ -88,15 +87,16 @@ class CharacterProfileExtractor:
         character_lookup = {char.name: char for char in (party.characters or [])}
         character_names = list(character_lookup.keys())
 
-        classification_file = session_path / "intermediates" / "stage_6_classification.json"
-        scenes_file = session_path / "intermediates" / "stage_6_scenes.json"
+        from .intermediate_output import IntermediateOutputManager
 
-        if not classification_file.exists():
-            LOGGER.error(f"Classification file not found: {classification_file}")
+        intermediates = IntermediateOutputManager(session_path)
+        scenes_file = intermediates.intermediates_dir / "stage_6_scenes.json"
+
+        if not intermediates.stage_output_exists(6):
+            LOGGER.error(f"Classification file not found: {intermediates.get_stage_path(6)}")
             return {}
 
-        with open(classification_file, 'r', encoding='utf-8') as f:
-            all_segments = json.load(f)
+        all_segments, _ = intermediates.load_stage_output(6)
 
         character_segments = [s for s in all_segments if s.get("classification_type") == "CHARACTER"]
         if not character_segments:
@@ -111,8 +111,7 @@ class CharacterProfileExtractor:
 
         if scenes_file.exists():
             LOGGER.info("Scenes file found, processing scene-by-scene.")
-            with open(scenes_file, 'r', encoding='utf-8') as f:
-                scenes = json.load(f)
+            scenes, _ = intermediates.load_scene_bundles()
             
             character_segments_by_id = {seg['segment_index']: seg for seg in character_segments}
             
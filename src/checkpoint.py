@@ -3,6 +3,7 @@ from __future__ import annotations
 
 import json
 import gzip
+import os
 import shutil
 from dataclasses import asdict, dataclass, field, is_dataclass
 from datetime import datetime
@@ -101,6 +102,57 @@ class CheckpointManager:
         with gzip.open(path, "rt", encoding="utf-8") as handle:
             return json.load(handle)
 
+    def _journal_path(self, stage: str, name: str) -> Path:
+        safe_stage = stage.replace("/", "_")
+        safe_name = name.replace("/", "_")
+        return self.checkpoint_dir / f"{safe_stage}_{safe_name}.jsonl"
+
+    def append_journal(self, stage: str, name: str, entry: Any) -> None:
+        """
+        Append a single record to an append-only stage journal.
+
+        Journals let long stages persist partial progress (e.g. one record per
+        transcribed chunk) so a crash mid-stage does not discard finished work.
+        Each record is flushed to disk before returning.
+        """
+        path = self._journal_path(stage, name)
+        line = json.dumps(_make_json_safe(entry), ensure_ascii=False)
+        with path.open("a", encoding="utf-8") as handle:
+            handle.write(line + "\n")
+            handle.flush()
+            os.fsync(handle.fileno())
+
+    def read_journal(self, stage: str, name: str) -> List[Any]:
+        """Load all journal records, skipping a partial trailing line left by a crash."""
+        path = self._journal_path(stage, name)
+        if not path.exists():
+            return []
+        entries: List[Any] = []
+        with path.open("r", encoding="utf-8") as handle:
+            for line_number, line in enumerate(handle, start=1):
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    entries.append(json.loads(line))
+                except json.JSONDecodeError:
+                    self.logger.warning(
+                        "Skipping corrupt journal record %d in %s", line_number, path.name
+                    )
+        return entries
+
+    def reset_journal(self, stage: str, name: str, entries: Optional[List[Any]] = None) -> None:
+        """Replace a stage journal with the given records (or remove it when empty)."""
+        path = self._journal_path(stage, name)
+        if not entries:
+            path.unlink(missing_ok=True)
+            return
+        temp_path = path.with_suffix(".jsonl.tmp")
+        with temp_path.open("w", encoding="utf-8") as handle:
+            for entry in entries:
+                handle.write(json.dumps(_make_json_safe(entry), ensure_ascii=False) + "\n")
+        temp_path.replace(path)
+
     def load(self, stage: str) -> Optional[CheckpointRecord]:
         """Load checkpoint record for a specific stage."""
         path = self._stage_path(stage)
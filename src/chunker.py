@@ -1,9 +1,12 @@
 """Audio chunking with VAD and overlap strategy"""
+import struct
+import threading
 import torch
 import numpy as np
+import soundfile as sf
 from pathlib import Path
-from typing import List, Tuple, Optional, Callable
-from dataclasses import dataclass
+from typing import Iterator, List, Tuple, Optional, Callable
+from dataclasses import dataclass, field
 from .config import Config
 from .audio_processor import AudioProcessor
 from .logger import get_logger
@@ -43,6 +46,209 @@ class AudioChunk:
         )
 
 
+class MappedAudioFile:
+    """
+    Read-only, memory-mapped view of a WAV file's sample data.
+
+    PCM 16/32-bit and float32 WAVs are mapped with ``np.memmap`` so reading a
+    segment only touches the pages it covers and the OS page cache is shared
+    by every chunk of the session. Other formats fall back to seek+read via
+    soundfile. The file is opened on first access, so creating a
+    MappedAudioFile (and chunks referencing it) costs nothing up front.
+    """
+
+    _WAVE_FORMAT_PCM = 0x0001
+    _WAVE_FORMAT_IEEE_FLOAT = 0x0003
+    _WAVE_FORMAT_EXTENSIBLE = 0xFFFE
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._samples: Optional[np.ndarray] = None  # (frames, channels) memmap
+        self._scale: float = 1.0
+        self._opened = False
+
+    def read(self, start_time: float, end_time: float, sample_rate: int) -> np.ndarray:
+        """Return mono float32 samples for [start_time, end_time)."""
+        self._ensure_open()
+        start = max(0, int(start_time * sample_rate))
+        end = max(start, int(end_time * sample_rate))
+
+        if self._samples is None:
+            with sf.SoundFile(str(self.path), 'r') as reader:
+                reader.seek(min(start, reader.frames))
+                audio = reader.read(end - start, dtype='float32')
+        else:
+            audio = np.array(self._samples[start:end], dtype=np.float32)
+            if self._scale != 1.0:
+                audio *= self._scale
+
+        if audio.ndim > 1:
+            audio = audio.mean(axis=1)
+        return audio.astype(np.float32, copy=False)
+
+    def peak(self, start_time: float, end_time: float, sample_rate: int, block_seconds: float = 30.0) -> float:
+        """Largest absolute sample in [start_time, end_time), read in bounded blocks."""
+        peak = 0.0
+        position = start_time
+        while position < end_time:
+            block_end = min(end_time, position + block_seconds)
+            block = self.read(position, block_end, sample_rate)
+            if block.size:
+                peak = max(peak, float(np.abs(block).max()))
+            position = block_end
+        return peak
+
+    def _ensure_open(self) -> None:
+        if self._opened:
+            return
+        with self._lock:
+            if self._opened:
+                return
+            try:
+                self._samples, self._scale = self._map_wav(self.path)
+            except (OSError, ValueError, RuntimeError, struct.error):
+                self._samples = None
+            self._opened = True
+
+    @classmethod
+    def _map_wav(cls, path: Path) -> Tuple[Optional[np.ndarray], float]:
+        """Locate the RIFF ``data`` chunk and memory-map it, or return (None, 1.0)."""
+        file_size = path.stat().st_size
+        with open(path, 'rb') as handle:
+            riff, _, wave = struct.unpack('<4sI4s', handle.read(12))
+            if riff != b'RIFF' or wave != b'WAVE':
+                return None, 1.0
+
+            fmt = None
+            while True:
+                header = handle.read(8)
+                if len(header) < 8:
+                    return None, 1.0
+                chunk_id, chunk_size = struct.unpack('<4sI', header)
+                if chunk_id == b'fmt ':
+                    fmt = struct.unpack('<HHIIHH', handle.read(16))
+                    handle.seek(chunk_size - 16 + (chunk_size & 1), 1)
+                elif chunk_id == b'data':
+                    data_offset = handle.tell()
+                    # Streamed WAVs may leave the size unset; trust the file length
+                    data_size = min(chunk_size, file_size - data_offset)
+                    break
+                else:
+                    handle.seek(chunk_size + (chunk_size & 1), 1)
+
+        if fmt is None:
+            return None, 1.0
+        format_tag, channels, _, _, _, bits = fmt
+        if format_tag == cls._WAVE_FORMAT_EXTENSIBLE:
+            # Let libsndfile decode the sub-format GUID
+            subtype = sf.info(str(path)).subtype
+            format_tag = cls._WAVE_FORMAT_IEEE_FLOAT if subtype == 'FLOAT' else cls._WAVE_FORMAT_PCM
+
+        if format_tag == cls._WAVE_FORMAT_PCM and bits == 16:
+            dtype, scale = np.dtype('<i2'), 1.0 / 32768.0
+        elif format_tag == cls._WAVE_FORMAT_PCM and bits == 32:
+            dtype, scale = np.dtype('<i4'), 1.0 / 2147483648.0
+        elif format_tag == cls._WAVE_FORMAT_IEEE_FLOAT and bits == 32:
+            dtype, scale = np.dtype('<f4'), 1.0
+        else:
+            return None, 1.0
+
+        frames = data_size // (dtype.itemsize * channels)
+        if frames == 0:
+            return None, 1.0
+        samples = np.memmap(path, dtype=dtype, mode='r', offset=data_offset, shape=(frames, channels))
+        return samples, scale
+
+
+class LazyAudioChunk(AudioChunk):
+    """
+    AudioChunk whose samples are read from a MappedAudioFile on access.
+
+    Only metadata is held in memory; ``audio`` is materialized from the
+    memory-mapped source every time it is read and is not cached, so a long
+    session's chunk list stays small and each chunk's samples are released as
+    soon as the consumer drops them. ``gain`` is applied on read so
+    normalization does not require a resident copy.
+    """
+
+    def __init__(
+        self,
+        source: MappedAudioFile,
+        start_time: float,
+        end_time: float,
+        sample_rate: int,
+        chunk_index: int,
+        gain: float = 1.0
+    ):
+        self.source = source
+        self.gain = gain
+        self._audio_override: Optional[np.ndarray] = None
+        super().__init__(
+            audio=None,
+            start_time=start_time,
+            end_time=end_time,
+            sample_rate=sample_rate,
+            chunk_index=chunk_index,
+        )
+
+    @property
+    def audio(self) -> np.ndarray:
+        if self._audio_override is not None:
+            return self._audio_override
+        audio = self.source.read(self.start_time, self.end_time, self.sample_rate)
+        if self.gain != 1.0:
+            audio *= self.gain
+        return audio
+
+    @audio.setter
+    def audio(self, value: Optional[np.ndarray]) -> None:
+        # Set by the dataclass __init__ (None) or explicitly to pin samples
+        self._audio_override = value
+
+    @property
+    def is_loaded(self) -> bool:
+        return self._audio_override is not None
+
+    def __repr__(self) -> str:
+        return (
+            f"LazyAudioChunk(chunk_index={self.chunk_index}, start_time={self.start_time}, "
+            f"end_time={self.end_time}, sample_rate={self.sample_rate}, source={self.source.path})"
+        )
+
+    @classmethod
+    def from_dict(cls, data: dict, source: MappedAudioFile) -> "LazyAudioChunk":
+        """Creates a LazyAudioChunk from serialized metadata and a shared source."""
+        return cls(
+            source=source,
+            start_time=data["start_time"],
+            end_time=data["end_time"],
+            sample_rate=data["sample_rate"],
+            chunk_index=data["chunk_index"],
+        )
+
+
+@dataclass
+class _StreamingVadState:
+    """Speech regions detected so far while reading a recording block by block."""
+    speech_segments: List[Tuple[float, float]] = field(default_factory=list)
+    # Segment that reached the end of the last block's settled region; it is
+    # finalized (or extended) once the next block has been analysed.
+    pending: Optional[Tuple[float, float]] = None
+    # Speech detection is final for everything before this time (seconds)
+    settled_until: float = 0.0
+    # Largest absolute sample value seen so far, used for normalization
+    peak: float = 0.0
+    # Audio up to this time (seconds) has been read and counted in ``peak``
+    scanned_until: float = 0.0
+    finished: bool = False
+
+    def segments_with_pending(self) -> List[Tuple[float, float]]:
+        if self.pending is None:
+            return self.speech_segments
+        return self.speech_segments + [self.pending]
+
+
 class HybridChunker:
     """
     Hybrid chunking strategy combining VAD and fixed-length chunking.
@@ -59,6 +265,13 @@ class HybridChunker:
     - Natural pauses create better semantic boundaries
     """
 
+    # Gaps are considered if they end within this many seconds of the ideal split
+    PAUSE_SEARCH_WINDOW = 60.0
+    # Streaming mode reads and runs VAD over blocks of this length...
+    STREAM_BLOCK_SECONDS = 300.0
+    # ...re-reading this much of the previous block so VAD has context at the seam
+    STREAM_VAD_CARRY_SECONDS = 10.0
+
     def __init__(
         self,
         max_chunk_length: int = None,
@@ -80,12 +293,20 @@ class HybridChunker:
         )
         self.get_speech_timestamps = utils[0]
 
-    def chunk_audio(self, audio_path: Path, progress_callback: Optional[Callable[[AudioChunk, float], None]] = None) -> List[AudioChunk]:
+    def chunk_audio(
+        self,
+        audio_path: Path,
+        progress_callback: Optional[Callable[[AudioChunk, float], None]] = None,
+        streaming: Optional[bool] = None
+    ) -> List[AudioChunk]:
         """
         Chunk audio file into overlapping segments.
 
         Args:
             audio_path: Path to WAV file (must be 16kHz mono)
+            progress_callback: Called with (chunk, total_duration) per chunk
+            streaming: Read the file block by block instead of loading it whole
+                (defaults to Config.CHUNKER_STREAMING). See iter_chunks().
 
         Returns:
             List of AudioChunk objects
@@ -97,6 +318,13 @@ class HybridChunker:
         4. Fall back to fixed-length if no pause found
         5. Add overlap between all chunks
         """
+        if streaming is None:
+            streaming = Config.CHUNKER_STREAMING
+        if streaming:
+            chunks = list(self.iter_chunks(audio_path, progress_callback=progress_callback))
+            self.logger.info("Created %d audio chunks", len(chunks))
+            return chunks
+
         # Load audio
         audio, sr = self.audio_processor.load_audio(audio_path)
         self.logger.info("Chunking audio %s (duration~%.1f sec, sample_rate=%d)", audio_path, len(audio) / sr, sr)
@@ -129,6 +357,203 @@ class HybridChunker:
 
         return chunks
 
+    def iter_chunks(
+        self,
+        audio_path: Path,
+        progress_callback: Optional[Callable[[AudioChunk, float], None]] = None
+    ) -> Iterator[AudioChunk]:
+        """
+        Lazily chunk an audio file with bounded memory.
+
+        The file is read in STREAM_BLOCK_SECONDS blocks; Silero VAD runs on each
+        block (plus STREAM_VAD_CARRY_SECONDS of the previous one for context)
+        and speech regions are stitched across block seams. A chunk is yielded
+        as soon as VAD has settled far enough past its ideal end to pick the
+        same pause the eager chunker would, so consumers can start
+        transcribing while the rest of the file is still being analysed.
+
+        Audio is normalized by the running peak seen so far rather than the
+        global peak, and multi-channel audio is downmixed to mono. Peak memory
+        is roughly one VAD block plus one chunk, independent of file length.
+        With Config.CHUNKER_LAZY_AUDIO the yielded chunks are LazyAudioChunks
+        that read their samples from a memory-mapped view of the file on
+        access, so the chunk list itself holds no audio.
+
+        Args:
+            audio_path: Path to WAV file (16kHz mono recommended)
+            progress_callback: Called with (chunk, total_duration) per chunk
+
+        Yields:
+            AudioChunk objects in chunk_index order
+        """
+        with sf.SoundFile(str(audio_path), 'r') as info:
+            sr = info.samplerate
+            total_frames = info.frames
+        total_duration = total_frames / sr if sr else 0.0
+        self.logger.info(
+            "Streaming chunking of %s (duration~%.1f sec, sample_rate=%d)",
+            audio_path, total_duration, sr
+        )
+
+        state = _StreamingVadState()
+        vad_blocks = self._iter_vad_blocks(audio_path, sr, total_frames, state)
+
+        lazy = Config.CHUNKER_LAZY_AUDIO
+        source = MappedAudioFile(audio_path)
+
+        chunk_start = 0.0
+        chunk_index = 0
+        with sf.SoundFile(str(audio_path), 'r') as reader:
+            while chunk_start < total_duration:
+                ideal_end = chunk_start + self.max_chunk_length
+
+                if ideal_end >= total_duration:
+                    chunk_end = total_duration
+                else:
+                    # Make sure every gap _find_best_pause could pick has been seen
+                    while not state.finished and state.settled_until <= ideal_end + self.PAUSE_SEARCH_WINDOW:
+                        next(vad_blocks, None)
+                    chunk_end = self._find_best_pause(
+                        state.segments_with_pending(),
+                        ideal_end,
+                        chunk_start
+                    )
+
+                if lazy:
+                    if chunk_end > state.scanned_until:
+                        # Only the final chunk can reach past the VAD blocks read so far
+                        state.peak = max(state.peak, source.peak(state.scanned_until, chunk_end, sr))
+                        state.scanned_until = chunk_end
+                    chunk = LazyAudioChunk(
+                        source=source,
+                        start_time=chunk_start,
+                        end_time=chunk_end,
+                        sample_rate=sr,
+                        chunk_index=chunk_index,
+                        gain=1.0 / state.peak if state.peak > 0 else 1.0
+                    )
+                else:
+                    start_sample = int(chunk_start * sr)
+                    end_sample = int(chunk_end * sr)
+                    reader.seek(start_sample)
+                    chunk_audio = self._to_mono(reader.read(max(0, end_sample - start_sample), dtype='float32'))
+                    state.peak = max(state.peak, float(np.abs(chunk_audio).max()) if chunk_audio.size else 0.0)
+                    if state.peak > 0:
+                        chunk_audio = (chunk_audio / state.peak).astype(np.float32, copy=False)
+
+                    chunk = AudioChunk(
+                        audio=chunk_audio,
+                        start_time=chunk_start,
+                        end_time=chunk_end,
+                        sample_rate=sr,
+                        chunk_index=chunk_index
+                    )
+                self.logger.debug(
+                    "Chunk %d | start=%.2fs end=%.2fs duration=%.2fs",
+                    chunk_index, chunk_start, chunk_end, chunk_end - chunk_start
+                )
+
+                if progress_callback:
+                    try:
+                        progress_callback(chunk, total_duration)
+                    except Exception as exc:
+                        self.logger.warning("Chunk progress callback failed: %s", exc)
+
+                yield chunk
+
+                if chunk_end >= total_duration:
+                    break
+
+                chunk_start = chunk_end - self.overlap_length
+                chunk_index += 1
+
+        self.logger.debug("Detected %d speech regions via streaming VAD", len(state.speech_segments))
+
+    def _iter_vad_blocks(
+        self,
+        audio_path: Path,
+        sr: int,
+        total_frames: int,
+        state: _StreamingVadState
+    ) -> Iterator[None]:
+        """
+        Run VAD block by block, updating ``state`` after each block.
+
+        Each block re-reads ``carry`` frames of the previous one. Speech regions
+        ending inside that carried tail are held back as ``state.pending`` and
+        merged with the next block's first region when it starts at the seam.
+        """
+        block_frames = max(1, int(self.STREAM_BLOCK_SECONDS * sr))
+        carry_frames = min(int(self.STREAM_VAD_CARRY_SECONDS * sr), block_frames // 2)
+        seam_tolerance = 0.1  # seconds; covers Silero's speech padding
+
+        with sf.SoundFile(str(audio_path), 'r') as reader:
+            block_start = 0
+            while block_start < total_frames:
+                block_end = min(total_frames, block_start + block_frames)
+                is_last = block_end >= total_frames
+                reader.seek(block_start)
+                block = self._to_mono(reader.read(block_end - block_start, dtype='float32'))
+                state.scanned_until = max(state.scanned_until, block_end / sr)
+                if block.size:
+                    state.peak = max(state.peak, float(np.abs(block).max()))
+                    if state.peak > 0:
+                        block = (block / state.peak).astype(np.float32, copy=False)
+
+                timestamps = self.get_speech_timestamps(
+                    torch.from_numpy(block),
+                    self.vad_model,
+                    sampling_rate=sr,
+                    threshold=self.vad_threshold,
+                    min_speech_duration_ms=250,
+                    min_silence_duration_ms=500
+                ) if block.size else []
+
+                offset = block_start / sr
+                settle_limit = float('inf') if is_last else (block_end - carry_frames) / sr
+                pending = state.pending
+                state.pending = None
+
+                for ts in timestamps:
+                    seg_start = offset + ts['start'] / sr
+                    seg_end = offset + ts['end'] / sr
+                    if pending is not None:
+                        if seg_start <= offset + seam_tolerance:
+                            seg_start = pending[0]
+                        else:
+                            state.speech_segments.append(pending)
+                        pending = None
+                    if seg_end < settle_limit:
+                        state.speech_segments.append((seg_start, seg_end))
+                    else:
+                        # Later regions start beyond the seam and are re-detected next block
+                        state.pending = (seg_start, seg_end)
+                        break
+
+                if pending is not None:
+                    state.speech_segments.append(pending)
+
+                state.settled_until = settle_limit
+                if is_last:
+                    if state.pending is not None:
+                        state.speech_segments.append(state.pending)
+                        state.pending = None
+                    state.finished = True
+                    yield None
+                    return
+
+                yield None
+                block_start = block_end - carry_frames
+
+        state.settled_until = float('inf')
+        state.finished = True
+
+    @staticmethod
+    def _to_mono(audio: np.ndarray) -> np.ndarray:
+        if audio.ndim > 1:
+            audio = audio.mean(axis=1)
+        return audio.astype(np.float32, copy=False)
+
     def _create_chunks_with_pauses(
         self,
         audio: np.ndarray,
@@ -214,7 +639,7 @@ class HybridChunker:
         - If no good gap found within tolerance, just use ideal_end
         """
         # Search window: ±60 seconds from ideal end to consider nearby pauses
-        search_window = 60.0
+        search_window = self.PAUSE_SEARCH_WINDOW
         best_gap_end = ideal_end
         best_gap_score = float('inf')
 
@@ -0,0 +1,98 @@
+"""Bounded-concurrency dispatch of classification requests."""
+from __future__ import annotations
+
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Callable, Dict, List, Optional, Sequence, TypeVar
+
+from .logger import get_logger
+from .rate_limiter import RateLimiter
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+ProgressCallback = Callable[[int, int], None]
+
+
+class ClassificationDispatcher:
+    """
+    Run classification requests with a bounded number in flight.
+
+    LLM backends (a local Ollama server with ``OLLAMA_NUM_PARALLEL`` > 1, or
+    Groq) can serve several prompts at once, so batches are submitted
+    concurrently up to ``max_in_flight``. Results come back in input order.
+
+    A request that raises is logged and reported as ``None`` in the result
+    list rather than aborting the run, so callers can route those items to
+    their fallback path. ``on_progress`` is always called from the calling
+    thread as ``(completed, total)``.
+    """
+
+    def __init__(
+        self,
+        max_in_flight: int = 1,
+        rate_limiter: Optional[RateLimiter] = None,
+        name: str = "classify",
+    ):
+        self.max_in_flight = max(1, int(max_in_flight or 1))
+        self.rate_limiter = rate_limiter
+        self.name = name
+        self.logger = get_logger("classification_dispatcher")
+
+    def map(
+        self,
+        fn: Callable[[T], R],
+        items: Sequence[T],
+        on_progress: Optional[ProgressCallback] = None,
+    ) -> List[Optional[R]]:
+        """
+        Apply ``fn`` to every item and return results in item order.
+
+        Args:
+            fn: Request function; exceptions mark the item as failed
+            items: Work items (e.g. prepared batch prompts)
+            on_progress: Called as ``(completed, total)`` after each item
+
+        Returns:
+            List aligned with ``items``; ``None`` where ``fn`` raised
+        """
+        total = len(items)
+        results: List[Optional[R]] = [None] * total
+        if total == 0:
+            return results
+
+        if self.max_in_flight == 1 or total == 1:
+            for position, item in enumerate(items):
+                results[position] = self._call(fn, item, position)
+                if on_progress:
+                    on_progress(position + 1, total)
+            return results
+
+        workers = min(self.max_in_flight, total)
+        completed = 0
+        next_position = 0
+        in_flight: Dict[Future, int] = {}
+
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix=self.name) as pool:
+            while next_position < total or in_flight:
+                while next_position < total and len(in_flight) < workers:
+                    future = pool.submit(self._call, fn, items[next_position], next_position)
+                    in_flight[future] = next_position
+                    next_position += 1
+
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    results[in_flight.pop(future)] = future.result()
+                    completed += 1
+                    if on_progress:
+                        on_progress(completed, total)
+
+        return results
+
+    def _call(self, fn: Callable[[T], R], item: T, position: int) -> Optional[R]:
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire()
+        try:
+            return fn(item)
+        except Exception as exc:
+            self.logger.error("Classification request %d failed: %s", position, exc)
+            return None
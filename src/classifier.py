@@ -14,6 +14,8 @@ from .preflight import PreflightIssue
 from .retry import retry_with_backoff
 from .constants import Classification, ClassificationType, ConfidenceDefaults
 from .rate_limiter import RateLimiter
+from .classification_dispatcher import ClassificationDispatcher
+from .llm_response_cache import LLMResponseCache
 from .status_tracker import StatusTracker
 from .llm_factory import OllamaClientFactory, OllamaConfig, OllamaConnectionError
 
@@ -299,7 +301,8 @@ class OllamaClassifier(BaseClassifier):
         self,
         model: str = None,
         base_url: str = None,
-        fallback_model: Optional[str] = None
+        fallback_model: Optional[str] = None,
+        use_response_cache: Optional[bool] = None
     ):
         self.model = model or Config.OLLAMA_MODEL
         self.base_url = base_url or Config.OLLAMA_BASE_URL
@@ -365,6 +368,26 @@ class OllamaClassifier(BaseClassifier):
         self.max_future_duration = Config.CLASSIFIER_CONTEXT_FUTURE_SECONDS
         self.use_batching = Config.CLASSIFICATION_USE_BATCHING
         self.batch_size = Config.CLASSIFICATION_BATCH_SIZE
+        self.rate_limiter = RateLimiter(
+            max_calls=max(1, Config.OLLAMA_MAX_CALLS_PER_SECOND),
+            period=Config.OLLAMA_RATE_LIMIT_PERIOD_SECONDS,
+            burst_size=Config.OLLAMA_RATE_LIMIT_BURST,
+        )
+        # The dispatcher acquires the limiter before each request it submits
+        self.dispatcher = ClassificationDispatcher(
+            max_in_flight=Config.CLASSIFICATION_MAX_IN_FLIGHT,
+            rate_limiter=self.rate_limiter,
+            name="classify-ollama",
+        )
+
+        if use_response_cache is None:
+            use_response_cache = Config.LLM_CACHE_ENABLED
+        self.response_cache: Optional[LLMResponseCache] = None
+        if use_response_cache:
+            try:
+                self.response_cache = LLMResponseCache.from_config()
+            except Exception as exc:
+                self.logger.warning("LLM response cache unavailable, continuing without it: %s", exc)
 
     def preflight_check(self):
         issues = []
@@ -478,7 +501,14 @@ class OllamaClassifier(BaseClassifier):
         speaker_map: Optional[Dict[str, Dict[str, Any]]] = None,
         temporal_metadata: Optional[List[Dict[str, Any]]] = None
     ) -> List[ClassificationResult]:
-        """Classify segments in batches for performance optimization."""
+        """
+        Classify segments in batches for performance optimization.
+
+        Batches are sent through a ClassificationDispatcher, so up to
+        ``max_in_flight`` prompts are outstanding at once. Segments from failed
+        or incomplete batches are re-classified one by one with full context,
+        also concurrently.
+        """
         active_speaker_map = speaker_map or self._build_fallback_speaker_map(segments)
         speaker_overview = self._format_speaker_overview(active_speaker_map)
 
@@ -486,11 +516,15 @@ class OllamaClassifier(BaseClassifier):
         total_segments = len(segments)
         session_id = segments[0].get("session_id", "unknown") if segments else "unknown"
 
-        self.logger.info(f"Starting batched classification for {total_segments} segments (batch size: {self.batch_size})")
+        self.logger.info(
+            f"Starting batched classification for {total_segments} segments "
+            f"(batch size: {self.batch_size}, in flight: {self.dispatcher.max_in_flight})"
+        )
         StatusTracker.update_stage(session_id, 6, "running", f"Batch classifying {total_segments} segments...")
 
         start_time_all = time.time()
 
+        batches = []
         for i in range(0, total_segments, self.batch_size):
             batch_segments = segments[i : min(i + self.batch_size, total_segments)]
             batch_indices = list(range(i, i + len(batch_segments)))
@@ -510,52 +544,67 @@ class OllamaClassifier(BaseClassifier):
                 speaker_map=speaker_overview,
                 batch_text=batch_text
             )
+            batches.append((batch_indices, prompt))
 
-            # Progress logging
-            if i > 0:
-                elapsed = time.time() - start_time_all
-                processed = i
-                avg_time_per_segment = elapsed / processed
-                remaining = (total_segments - processed) * avg_time_per_segment
-                percentage = (processed / total_segments) * 100
-                msg = f"Classified {processed}/{total_segments} ({percentage:.1f}%) - ETA: {remaining/60:.1f}m"
-                self.logger.info(msg)
-                StatusTracker.update_stage(session_id, 6, "running", msg)
+        # Sizes of the batches that have finished (successfully or not), in
+        # completion order; batches can finish out of order when run concurrently
+        finished_batch_sizes: List[int] = []
 
+        def _classify_batch(batch) -> List[ClassificationResult]:
+            batch_indices, prompt = batch
             try:
-                response_payload = self._generate_with_retry(prompt, i)
-
-                if response_payload:
-                    response_text = response_payload.get("response", "")
-                    parsed_results = self._parse_batch_response(response_text, batch_indices)
-
-                    # Fill in results
-                    for res in parsed_results:
-                        idx = res.segment_index
-                        if i <= idx < i + self.batch_size:
-                            # Enrich result with metadata/context logic as in single mode
-                            # Note: context-aware classification is reduced in batched mode,
-                            # relying more on the LLM's ability to see local context in the batch
-                            speaker_info = self._resolve_speaker_info(segments[idx].get("speaker"), active_speaker_map)
-
-                            res.model = response_payload.get("model")
-                            self._apply_speaker_metadata(res, speaker_info)
-                            self._infer_classification_type(res, speaker_info)
-                            self._attach_prompt_metadata(res, prompt, response_text)
+                return _classify_batch_prompt(batch_indices, prompt)
+            finally:
+                finished_batch_sizes.append(len(batch_indices))
 
-                            results[idx] = res
+        def _classify_batch_prompt(batch_indices: List[int], prompt: str) -> List[ClassificationResult]:
+            response_payload = self._generate_with_retry(prompt, batch_indices[0])
+            if not response_payload:
+                return []
 
-            except Exception as e:
-                self.logger.error(f"Batch classification failed for indices {batch_indices}: {e}")
-                # Will be handled by fallback loop
+            response_text = response_payload.get("response", "")
+            parsed_results = self._parse_batch_response(response_text, batch_indices)
+            for res in parsed_results:
+                # Enrich result with metadata/context logic as in single mode
+                # Note: context-aware classification is reduced in batched mode,
+                # relying more on the LLM's ability to see local context in the batch
+                speaker_info = self._resolve_speaker_info(segments[res.segment_index].get("speaker"), active_speaker_map)
+
+                res.model = response_payload.get("model")
+                self._apply_speaker_metadata(res, speaker_info)
+                self._infer_classification_type(res, speaker_info)
+                self._attach_prompt_metadata(res, prompt, response_text)
+            return parsed_results
+
+        def _report_batch_progress(completed: int, total: int) -> None:
+            processed = sum(finished_batch_sizes)
+            elapsed = time.time() - start_time_all
+            avg_time_per_segment = elapsed / processed if processed else 0
+            remaining = (total_segments - processed) * avg_time_per_segment
+            percentage = (processed / total_segments) * 100
+            msg = f"Classified {processed}/{total_segments} ({percentage:.1f}%) - ETA: {remaining/60:.1f}m"
+            self.logger.info(msg)
+            StatusTracker.update_stage(session_id, 6, "running", msg)
+
+        batch_results = self.dispatcher.map(_classify_batch, batches, on_progress=_report_batch_progress)
+
+        # Fill in results in segment order, whatever order the batches finished in
+        for (batch_indices, _), parsed_results in zip(batches, batch_results):
+            if parsed_results is None:
+                self.logger.error(f"Batch classification failed for indices {batch_indices}")
+                continue
+            for res in parsed_results:
+                results[res.segment_index] = res
 
         # Fill in any missing results (failed batches)
         failed_indices = [idx for idx, res in enumerate(results) if res is None]
         if failed_indices:
-            self.logger.warning(f"Falling back to sequential classification for {len(failed_indices)} failed segments")
+            self.logger.warning(f"Falling back to per-segment classification for {len(failed_indices)} failed segments")
+            session_duration = self._get_session_duration(segments)
 
-            # Group contiguous indices into mini-batches for efficiency if we want,
-            # but for safety let's just process them sequentially using the existing helper methods.
+            # Prompts are built up front from the batch results so the
+            # per-segment requests can run concurrently.
+            fallback_requests = []
             for idx in failed_indices:
                 segment = segments[idx]
                 context_segments = self._gather_context_segments(segments, idx)
@@ -570,7 +619,7 @@ class OllamaClassifier(BaseClassifier):
                         segments,
                         # Pass recent classifications if available, else empty list
                         [r.classification for r in results[:idx] if r],
-                        self._get_session_duration(segments)
+                        session_duration
                     )
                 )
 
@@ -583,14 +632,27 @@ class OllamaClassifier(BaseClassifier):
                     speaker_info=speaker_info,
                     speaker_map=active_speaker_map,
                 )
-
-                # Use sequential classification helper
-                results[idx] = self._classify_with_context(
-                    prompt_text,
-                    index=idx,
-                    speaker_info=speaker_info,
-                    metadata=metadata,
-                )
+                fallback_requests.append((idx, prompt_text, speaker_info, metadata))
+
+            fallback_results = self.dispatcher.map(
+                lambda request: self._classify_with_context(
+                    request[1],
+                    index=request[0],
+                    speaker_info=request[2],
+                    metadata=request[3],
+                ),
+                fallback_requests
+            )
+            for (idx, _, speaker_info, _), result in zip(fallback_requests, fallback_results):
+                if result is None:
+                    result = ClassificationResult(
+                        segment_index=idx,
+                        classification=Classification.IN_CHARACTER,
+                        confidence=ConfidenceDefaults.DEFAULT,
+                        reasoning="Classification failed, defaulted to IC"
+                    )
+                    self._apply_speaker_metadata(result, speaker_info)
+                results[idx] = result
 
         total_time = time.time() - start_time_all
         avg_time = total_time / total_segments if total_segments > 0 else 0
@@ -959,12 +1021,41 @@ class OllamaClassifier(BaseClassifier):
             options["low_vram"] = True
             if "num_ctx" in options:
                 options["num_ctx"] = min(options["num_ctx"], 1024)
-        return self.client.generate(
+
+        cache_key = None
+        if self.response_cache is not None:
+            cache_key = self.response_cache.make_key(model, options, prompt)
+            cached = self.response_cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+        response = self.client.generate(
             model=model,
             prompt=prompt,
             options=options
         )
 
+        if cache_key is not None:
+            payload = self._response_to_dict(response)
+            if payload and payload.get("response"):
+                try:
+                    self.response_cache.put(cache_key, model, payload)
+                except Exception as exc:
+                    self.logger.warning("Failed to cache LLM response: %s", exc)
+        return response
+
+    @staticmethod
+    def _response_to_dict(response: Any) -> Optional[Dict[str, Any]]:
+        """Plain dict form of an Ollama generate response, suitable for caching."""
+        if isinstance(response, dict):
+            return response
+        if hasattr(response, "model_dump"):
+            return response.model_dump()
+        try:
+            return {"response": response["response"], "model": response["model"]}
+        except (KeyError, TypeError):
+            return None
+
     def _default_generation_options(self) -> Dict[str, float]:
         return {
             'temperature': 0.1,
@@ -1158,6 +1249,12 @@ class GroqClassifier(BaseClassifier):
             period=Config.GROQ_RATE_LIMIT_PERIOD_SECONDS,
             burst_size=Config.GROQ_RATE_LIMIT_BURST,
         )
+        # _make_api_call acquires the rate limiter for every attempt (including
+        # retries), so the dispatcher only bounds concurrency.
+        self.dispatcher = ClassificationDispatcher(
+            max_in_flight=Config.CLASSIFICATION_MAX_IN_FLIGHT,
+            name="classify-groq",
+        )
 
     def preflight_check(self):
         """Check that Groq API is accessible and configured."""
@@ -1198,27 +1295,27 @@ class GroqClassifier(BaseClassifier):
         speaker_map: Optional[Dict[str, Dict[str, Any]]] = None,
         temporal_metadata: Optional[List[Dict[str, Any]]] = None
     ) -> List[ClassificationResult]:
-        """Classify each segment using the Groq API."""
-        results = []
-        for i, segment in enumerate(segments):
+        """Classify each segment using the Groq API, several requests at a time."""
+        def _classify(i: int) -> ClassificationResult:
             prev_text = segments[i-1]['text'] if i > 0 else ""
-            current_text = segment['text']
+            current_text = segments[i]['text']
             next_text = segments[i+1]['text'] if i < len(segments) - 1 else ""
 
             prompt = self._build_prompt(prev_text, current_text, next_text, character_names, player_names)
 
             try:
                 response_text = self._make_api_call(prompt)
-                results.append(self._parse_response(response_text, i))
+                return self._parse_response(response_text, i)
             except Exception as e:
                 self.logger.error(f"Error classifying segment {i} with Groq: {e}")
-                results.append(ClassificationResult(
+                return ClassificationResult(
                     segment_index=i,
                     classification=Classification.IN_CHARACTER,
                     confidence=ConfidenceDefaults.DEFAULT,
                     reasoning="Classification failed, defaulted to IC"
-                ))
-        return results
+                )
+
+        return self.dispatcher.map(_classify, list(range(len(segments))))
 
     @retry_with_backoff()
     def _make_api_call(self, prompt):
@@ -1447,7 +1544,11 @@ class ClassifierFactory:
     """Factory to create appropriate classifier."""
 
     @staticmethod
-    def create(backend: str = None, gdrive_mount_root: str = None) -> BaseClassifier:
+    def create(
+        backend: str = None,
+        gdrive_mount_root: str = None,
+        use_response_cache: Optional[bool] = None
+    ) -> BaseClassifier:
         """
         Create classifier instance.
 
@@ -1455,6 +1556,8 @@ class ClassifierFactory:
             backend: Backend type ('ollama', 'groq', 'colab', 'openai')
             gdrive_mount_root: For 'colab' backend, the Google Drive mount path
                               (defaults to "/content/drive" for Colab, or OS-specific for local)
+            use_response_cache: For 'ollama', read/write the on-disk LLM response
+                              cache (defaults to Config.LLM_CACHE_ENABLED)
 
         Returns:
             BaseClassifier instance
@@ -1462,7 +1565,7 @@ class ClassifierFactory:
         backend = backend or Config.LLM_BACKEND
 
         if backend == "ollama":
-            return OllamaClassifier()
+            return OllamaClassifier(use_response_cache=use_response_cache)
         elif backend == "groq":
             return GroqClassifier()
         elif backend == "colab":
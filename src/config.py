@@ -80,9 +80,29 @@ class Config:
     # Processing Settings
     CHUNK_LENGTH_SECONDS: int = get_env_as_int("CHUNK_LENGTH_SECONDS", 600)
     CHUNK_OVERLAP_SECONDS: int = get_env_as_int("CHUNK_OVERLAP_SECONDS", 10)
+    # Read and VAD the WAV block by block instead of loading it whole
+    CHUNKER_STREAMING: bool = get_env_as_bool("CHUNKER_STREAMING", True)
+    # Streamed chunks read their samples from a memory-mapped WAV on access
+    CHUNKER_LAZY_AUDIO: bool = get_env_as_bool("CHUNKER_LAZY_AUDIO", True)
     AUDIO_SAMPLE_RATE: int = get_env_as_int("AUDIO_SAMPLE_RATE", 16000)
     CLEAN_STALE_CLIPS: bool = get_env_as_bool("CLEAN_STALE_CLIPS", True)
     SAVE_INTERMEDIATE_OUTPUTS: bool = get_env_as_bool("SAVE_INTERMEDIATE_OUTPUTS", True)
+    # Stage 4-6 intermediate file format: "json" or "columnar" (NumPy .npz, loaded per column)
+    INTERMEDIATE_FORMAT: str = os.getenv("INTERMEDIATE_FORMAT", "json").strip().lower()
+    # Split transcript segments at speaker changes using word timestamps
+    DIARIZATION_WORD_LEVEL: bool = get_env_as_bool("DIARIZATION_WORD_LEVEL", False)
+    # Run diarization in a separate process while chunks are transcribed
+    PIPELINE_OVERLAP_DIARIZATION: bool = get_env_as_bool("PIPELINE_OVERLAP_DIARIZATION", False)
+    # Concurrent chunk uploads for cloud transcription backends (local Whisper is always sequential)
+    TRANSCRIPTION_MAX_WORKERS: int = get_env_as_int("TRANSCRIPTION_MAX_WORKERS", 4)
+    TRANSCRIPTION_RATE_LIMIT_CALLS: int = get_env_as_int("TRANSCRIPTION_RATE_LIMIT_CALLS", 20)
+    TRANSCRIPTION_RATE_LIMIT_PERIOD_SECONDS: float = get_env_as_float(
+        "TRANSCRIPTION_RATE_LIMIT_PERIOD_SECONDS", 60.0
+    )
+    # Encoding for cloud transcription uploads: flac (lossless), opus (smallest) or wav
+    TRANSCRIPTION_UPLOAD_FORMAT: str = os.getenv("TRANSCRIPTION_UPLOAD_FORMAT", "flac").strip().lower()
+    # Chunks whose encoded upload exceeds this size are split into several requests
+    TRANSCRIPTION_UPLOAD_MAX_MB: float = get_env_as_float("TRANSCRIPTION_UPLOAD_MAX_MB", 24.0)
     SNIPPET_PLACEHOLDER_MESSAGE: str = os.getenv(
         "SNIPPET_PLACEHOLDER_MESSAGE",
         "No audio snippets were generated for this session."
@@ -91,12 +111,23 @@ class Config:
         "USE_STREAMING_SNIPPET_EXPORT",
         True  # Default to streaming for memory efficiency
     )
+    # Slice WAV sources in-process (no FFmpeg spawn per clip); other formats use the mode above
+    USE_NATIVE_SNIPPET_EXPORT: bool = get_env_as_bool("USE_NATIVE_SNIPPET_EXPORT", True)
+    # Threads writing snippet clips concurrently
+    SNIPPET_EXPORT_WORKERS: int = get_env_as_int("SNIPPET_EXPORT_WORKERS", 4)
+    # Store sample offsets into the session WAV instead of clip files; clips render on request
+    USE_VIRTUAL_SNIPPETS: bool = get_env_as_bool("USE_VIRTUAL_SNIPPETS", False)
+    # In-memory LRU of rendered virtual clips
+    SNIPPET_RENDER_CACHE_MB: float = get_env_as_float("SNIPPET_RENDER_CACHE_MB", 64.0)
 
     # Ollama Settings
     OLLAMA_MODEL: str = os.getenv("OLLAMA_MODEL", "qwen2.5:7b")
     OLLAMA_BASE_URL: str = os.getenv("OLLAMA_BASE_URL", "http://localhost:11434")
     _fallback_model = os.getenv("OLLAMA_FALLBACK_MODEL", "")
     OLLAMA_FALLBACK_MODEL: Optional[str] = _fallback_model.strip() or None
+    OLLAMA_MAX_CALLS_PER_SECOND: int = get_env_as_int("OLLAMA_MAX_CALLS_PER_SECOND", 10)
+    OLLAMA_RATE_LIMIT_PERIOD_SECONDS: float = get_env_as_float("OLLAMA_RATE_LIMIT_PERIOD_SECONDS", 1.0)
+    OLLAMA_RATE_LIMIT_BURST: int = get_env_as_int("OLLAMA_RATE_LIMIT_BURST", 10)
     GROQ_MAX_CALLS_PER_SECOND: int = get_env_as_int("GROQ_MAX_CALLS_PER_SECOND", 2)
     GROQ_RATE_LIMIT_PERIOD_SECONDS: float = get_env_as_float("GROQ_RATE_LIMIT_PERIOD_SECONDS", 1.0)
     GROQ_RATE_LIMIT_BURST: int = get_env_as_int("GROQ_RATE_LIMIT_BURST", 2)
@@ -107,12 +138,40 @@ class Config:
     CLASSIFIER_PROMPT_PREVIEW_CHARS: int = get_env_as_int("CLASSIFIER_PROMPT_PREVIEW_CHARS", 256)
     CLASSIFICATION_USE_BATCHING: bool = get_env_as_bool("CLASSIFICATION_USE_BATCHING", True)
     CLASSIFICATION_BATCH_SIZE: int = get_env_as_int("CLASSIFICATION_BATCH_SIZE", 10)
+    # Classification requests outstanding at once (Ollama queues beyond OLLAMA_NUM_PARALLEL)
+    CLASSIFICATION_MAX_IN_FLIGHT: int = get_env_as_int("CLASSIFICATION_MAX_IN_FLIGHT", 4)
+    # Knowledge extraction: transcript windows sent at once, and each window's size and
+    # overlap with the previous window in (estimated) tokens
+    KNOWLEDGE_EXTRACTION_MAX_IN_FLIGHT: int = get_env_as_int("KNOWLEDGE_EXTRACTION_MAX_IN_FLIGHT", 4)
+    KNOWLEDGE_WINDOW_TOKENS: int = get_env_as_int("KNOWLEDGE_WINDOW_TOKENS", 2000)
+    KNOWLEDGE_WINDOW_OVERLAP_TOKENS: int = get_env_as_int("KNOWLEDGE_WINDOW_OVERLAP_TOKENS", 200)
+    # Persistent cache of classification LLM responses (keyed by model + options + prompt)
+    LLM_CACHE_ENABLED: bool = get_env_as_bool("LLM_CACHE_ENABLED", True)
+    LLM_CACHE_MAX_MB: float = get_env_as_float("LLM_CACHE_MAX_MB", 256.0)
+    # Persistent cache of sentence-transformer embeddings (keyed by model + text hash)
+    EMBEDDING_CACHE_ENABLED: bool = get_env_as_bool("EMBEDDING_CACHE_ENABLED", True)
+    EMBEDDING_CACHE_MAX_MB: float = get_env_as_float("EMBEDDING_CACHE_MAX_MB", 512.0)
+    # In-memory LRU of search-query embeddings (0 disables)
+    EMBEDDING_QUERY_CACHE_SIZE: int = get_env_as_int("EMBEDDING_QUERY_CACHE_SIZE", 1024)
+    # Semantic search backend: "chroma" (ChromaDB) or "numpy" (embedded quantized index)
+    VECTOR_STORE_BACKEND: str = os.getenv("VECTOR_STORE_BACKEND", "chroma")
+    # Embedded index settings: vector storage ("int8" or "float16"), and the live-vector count
+    # past which an IVF index is trained and how many of its lists each query scores
+    VECTOR_STORE_QUANTIZATION: str = os.getenv("VECTOR_STORE_QUANTIZATION", "int8")
+    VECTOR_STORE_IVF_THRESHOLD: int = get_env_as_int("VECTOR_STORE_IVF_THRESHOLD", 50000)
+    VECTOR_STORE_IVF_NPROBE: int = get_env_as_int("VECTOR_STORE_IVF_NPROBE", 32)
+    # Incrementally update the transcript search index after each processed session
+    TRANSCRIPT_INDEX_AUTO_UPDATE: bool = get_env_as_bool("TRANSCRIPT_INDEX_AUTO_UPDATE", True)
 
     # Paths
     PROJECT_ROOT: Path = Path(__file__).parent.parent
     OUTPUT_DIR: Path = PROJECT_ROOT / "output"
     TEMP_DIR: Path = PROJECT_ROOT / "temp"
     MODELS_DIR: Path = PROJECT_ROOT / "models"
+    LLM_CACHE_PATH: Path = Path(os.getenv("LLM_CACHE_PATH", str(OUTPUT_DIR / "_cache" / "llm_responses.sqlite")))
+    EMBEDDING_CACHE_PATH: Path = Path(
+        os.getenv("EMBEDDING_CACHE_PATH", str(OUTPUT_DIR / "_cache" / "embeddings.sqlite"))
+    )
 
     # Google Drive Integration (for Colab classifier)
     GDRIVE_CLASSIFICATION_PENDING: str = os.getenv(
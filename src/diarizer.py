@@ -11,7 +11,7 @@ import warnings
 import shutil
 from .config import Config
 from .constants import SpeakerLabel
-from .transcriber import TranscriptionSegment
+from .transcriber import TranscriptionSegment, join_words
 from .logger import get_logger
 from .preflight import PreflightIssue
 from .retry import retry_with_backoff
@@ -134,6 +134,66 @@ class SpeakerSegment:
     confidence: Optional[float] = None
 
 
+def _best_overlapping_speakers(
+    starts: np.ndarray,
+    ends: np.ndarray,
+    speaker_starts: np.ndarray,
+    speaker_ends: np.ndarray,
+) -> np.ndarray:
+    """
+    For each query interval, return the index of the speaker interval with the
+    largest positive overlap (-1 when nothing overlaps).
+
+    Ties resolve to the lowest speaker index, matching a first-wins linear scan.
+    Speaker intervals are sorted by start once; each query only examines
+    intervals starting inside ``[start - longest_speaker_turn, end)``, which
+    are located with binary search, so the cost is O((N + M) log M) plus the
+    number of genuine candidates instead of O(N * M).
+    """
+    num_queries = len(starts)
+    best = np.full(num_queries, -1, dtype=np.int64)
+    if num_queries == 0 or len(speaker_starts) == 0:
+        return best
+
+    order = np.argsort(speaker_starts, kind="stable")
+    sorted_starts = speaker_starts[order]
+    max_turn = float(np.max(speaker_ends - speaker_starts))
+
+    # Widen the lower bound slightly so float rounding never drops a candidate;
+    # extra candidates are harmless because overlaps are computed exactly.
+    lo = np.searchsorted(sorted_starts, starts - max_turn - 1e-6, side="right")
+    hi = np.searchsorted(sorted_starts, ends, side="left")
+    counts = np.maximum(hi - lo, 0)
+    total = int(counts.sum())
+    if total == 0:
+        return best
+
+    # Flatten every (query, candidate) pair into one vectorized overlap computation.
+    query_ids = np.repeat(np.arange(num_queries), counts)
+    group_offsets = np.cumsum(counts) - counts
+    positions = np.arange(total) - np.repeat(group_offsets, counts) + np.repeat(lo, counts)
+    candidates = order[positions]
+    overlaps = (
+        np.minimum(ends[query_ids], speaker_ends[candidates])
+        - np.maximum(starts[query_ids], speaker_starts[candidates])
+    )
+
+    non_empty = counts > 0
+    group_starts = group_offsets[non_empty]
+    group_max = np.full(num_queries, -np.inf)
+    group_max[non_empty] = np.maximum.reduceat(overlaps, group_starts)
+
+    is_best = (overlaps == group_max[query_ids]) & (overlaps > 0)
+    sentinel = np.iinfo(np.int64).max
+    ranked = np.where(is_best, candidates, sentinel)
+    group_best = np.full(num_queries, sentinel, dtype=np.int64)
+    group_best[non_empty] = np.minimum.reduceat(ranked, group_starts)
+
+    found = group_best != sentinel
+    best[found] = group_best[found]
+    return best
+
+
 class BaseDiarizer:
     """Abstract base class for diarization backends."""
     def diarize(self, audio_path: Path, num_speakers: Optional[int] = None) -> Tuple[List[SpeakerSegment], Dict[str, np.ndarray]]:
@@ -142,23 +202,94 @@ class BaseDiarizer:
     def assign_speakers_to_transcription(
         self,
         transcription_segments: List[TranscriptionSegment],
-        speaker_segments: List[SpeakerSegment]
+        speaker_segments: List[SpeakerSegment],
+        word_level: bool = False
     ) -> List[Dict]:
-        """Assign speaker labels based on timing overlap."""
+        """
+        Assign speaker labels based on timing overlap.
+
+        Each transcription segment gets the speaker whose single turn overlaps
+        it the most (UNKNOWN when no turn overlaps).
+
+        Args:
+            transcription_segments: Merged transcription segments
+            speaker_segments: Speaker turns from diarization
+            word_level: When True, label each word individually and split
+                segments wherever the speaker changes. Segments without word
+                timestamps keep their segment-level label.
+
+        Returns:
+            List of segment dicts with a 'speaker' key
+        """
+        speaker_ids = [seg.speaker_id for seg in speaker_segments]
+        speaker_starts = np.fromiter((seg.start_time for seg in speaker_segments), dtype=np.float64, count=len(speaker_segments))
+        speaker_ends = np.fromiter((seg.end_time for seg in speaker_segments), dtype=np.float64, count=len(speaker_segments))
+
+        def _labels(starts: np.ndarray, ends: np.ndarray) -> List[str]:
+            best = _best_overlapping_speakers(starts, ends, speaker_starts, speaker_ends)
+            return [speaker_ids[i] if i >= 0 else SpeakerLabel.UNKNOWN for i in best]
+
+        count = len(transcription_segments)
+        segment_labels = _labels(
+            np.fromiter((seg.start_time for seg in transcription_segments), dtype=np.float64, count=count),
+            np.fromiter((seg.end_time for seg in transcription_segments), dtype=np.float64, count=count),
+        )
+
         enriched_segments = []
-        for trans_seg in transcription_segments:
-            best_speaker, max_overlap = SpeakerLabel.UNKNOWN, 0.0
-            for speaker_seg in speaker_segments:
-                overlap = max(0, min(trans_seg.end_time, speaker_seg.end_time) - max(trans_seg.start_time, speaker_seg.start_time))
-                if overlap > max_overlap:
-                    max_overlap = overlap
-                    best_speaker = speaker_seg.speaker_id
+        for trans_seg, speaker in zip(transcription_segments, segment_labels):
+            if word_level and trans_seg.words:
+                enriched_segments.extend(self._split_segment_by_word_speakers(trans_seg, speaker, _labels))
+                continue
             enriched_segments.append({
                 'text': trans_seg.text, 'start_time': trans_seg.start_time, 'end_time': trans_seg.end_time,
-                'speaker': best_speaker, 'confidence': trans_seg.confidence, 'words': trans_seg.words
+                'speaker': speaker, 'confidence': trans_seg.confidence, 'words': trans_seg.words
             })
         return enriched_segments
 
+    @staticmethod
+    def _split_segment_by_word_speakers(
+        trans_seg: TranscriptionSegment,
+        segment_speaker: str,
+        label_intervals: Callable[[np.ndarray, np.ndarray], List[str]]
+    ) -> List[Dict]:
+        """Split a segment into runs of consecutive words attributed to the same speaker."""
+        words = trans_seg.words
+        word_labels = label_intervals(
+            np.array([float(w.get('start', trans_seg.start_time)) for w in words], dtype=np.float64),
+            np.array([float(w.get('end', trans_seg.end_time)) for w in words], dtype=np.float64),
+        )
+
+        # Words falling in diarization gaps inherit the preceding speaker (or the
+        # segment speaker at the start) instead of creating UNKNOWN fragments.
+        previous = segment_speaker
+        for i, label in enumerate(word_labels):
+            if label == SpeakerLabel.UNKNOWN:
+                word_labels[i] = previous
+            previous = word_labels[i]
+
+        runs: List[Tuple[str, List[Dict]]] = []
+        for word, label in zip(words, word_labels):
+            if runs and runs[-1][0] == label:
+                runs[-1][1].append(word)
+            else:
+                runs.append((label, [word]))
+
+        if len(runs) == 1:
+            return [{
+                'text': trans_seg.text, 'start_time': trans_seg.start_time, 'end_time': trans_seg.end_time,
+                'speaker': runs[0][0], 'confidence': trans_seg.confidence, 'words': trans_seg.words
+            }]
+
+        pieces = []
+        for index, (label, run_words) in enumerate(runs):
+            start_time = trans_seg.start_time if index == 0 else float(run_words[0].get('start', trans_seg.start_time))
+            end_time = trans_seg.end_time if index == len(runs) - 1 else float(run_words[-1].get('end', trans_seg.end_time))
+            pieces.append({
+                'text': join_words(run_words), 'start_time': start_time, 'end_time': end_time,
+                'speaker': label, 'confidence': trans_seg.confidence, 'words': run_words
+            })
+        return pieces
+
     def preflight_check(self) -> List:
         return []
 
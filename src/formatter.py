@@ -25,6 +25,7 @@ Example:
 """
 import json
 import re
+from contextlib import ExitStack
 from pathlib import Path
 from typing import List, Dict, Optional
 from datetime import timedelta
@@ -35,6 +36,9 @@ from .constants import Classification, TranscriptFilter, OutputFormat
 
 logger = get_logger(__name__)
 
+# Write buffer per output file in save_all_formats (seven files are open at once)
+OUTPUT_BUFFER_SIZE = 256 * 1024
+
 def sanitize_filename(name: str) -> str:
     """Remove characters that are invalid for file paths."""
     # Replace spaces and common separators with underscores
@@ -84,27 +88,33 @@ class TranscriptFormatter:
         lines.append("")
 
         for seg, classif in zip(segments, classifications):
-            timestamp = self.format_timestamp(seg['start_time'])
-            speaker = seg.get('speaker', 'UNKNOWN')
+            lines.append(self._full_line(seg, classif, speaker_profiles))
 
-            # Map to person name if available
-            if speaker_profiles and speaker in speaker_profiles:
-                speaker = speaker_profiles[speaker]
+        return "\n".join(lines)
 
-            # Build speaker label
-            speaker_label = speaker
+    def _full_line(
+        self,
+        seg: Dict,
+        classif: ClassificationResult,
+        speaker_profiles: Optional[Dict[str, str]]
+    ) -> str:
+        timestamp = self.format_timestamp(seg['start_time'])
+        speaker = seg.get('speaker', 'UNKNOWN')
 
-            if classif.character and classif.classification == Classification.IN_CHARACTER:
-                speaker_label = f"{speaker} as {classif.character}"
+        # Map to person name if available
+        if speaker_profiles and speaker in speaker_profiles:
+            speaker = speaker_profiles[speaker]
 
-            # Add classification marker
-            marker = classif.classification
+        # Build speaker label
+        speaker_label = speaker
 
-            # Format line
-            line = f"[{timestamp}] {speaker_label} ({marker}): {seg['text']}"
-            lines.append(line)
+        if classif.character and classif.classification == Classification.IN_CHARACTER:
+            speaker_label = f"{speaker} as {classif.character}"
 
-        return "\n".join(lines)
+        # Add classification marker
+        marker = classif.classification
+
+        return f"[{timestamp}] {speaker_label} ({marker}): {seg['text']}"
 
     def format_filtered(
         self,
@@ -155,24 +165,32 @@ class TranscriptFormatter:
             if not filter_type.should_include(classif.classification):
                 continue
 
-            timestamp = self.format_timestamp(seg['start_time'])
-            speaker = seg.get('speaker', 'UNKNOWN')
+            lines.append(self._filtered_line(seg, classif, filter_type, speaker_profiles))
+
+        return "\n".join(lines)
 
-            # Map to person name if available
-            if speaker_profiles and speaker in speaker_profiles:
-                speaker = speaker_profiles[speaker]
+    def _filtered_line(
+        self,
+        seg: Dict,
+        classif: ClassificationResult,
+        filter_type: TranscriptFilter,
+        speaker_profiles: Optional[Dict[str, str]]
+    ) -> str:
+        timestamp = self.format_timestamp(seg['start_time'])
+        speaker = seg.get('speaker', 'UNKNOWN')
 
-            # For IC-only, use character name if available
-            # For OOC and ALL, use speaker name
-            if filter_type == TranscriptFilter.IN_CHARACTER_ONLY:
-                display_name = classif.character or speaker
-            else:
-                display_name = speaker
+        # Map to person name if available
+        if speaker_profiles and speaker in speaker_profiles:
+            speaker = speaker_profiles[speaker]
 
-            line = f"[{timestamp}] {display_name}: {seg['text']}"
-            lines.append(line)
+        # For IC-only, use character name if available
+        # For OOC and ALL, use speaker name
+        if filter_type == TranscriptFilter.IN_CHARACTER_ONLY:
+            display_name = classif.character or speaker
+        else:
+            display_name = speaker
 
-        return "\n".join(lines)
+        return f"[{timestamp}] {display_name}: {seg['text']}"
 
     def format_ic_only(
         self,
@@ -218,6 +236,10 @@ class TranscriptFormatter:
             speaker_profiles
         )
 
+    @staticmethod
+    def _header(title: str) -> str:
+        return "\n".join(["=" * 80, title, "=" * 80, ""])
+
     def format_json(
         self,
         segments: List[Dict],
@@ -239,30 +261,36 @@ class TranscriptFormatter:
         }
 
         for seg, classif in zip(segments, classifications):
-            speaker = seg.get('speaker', 'UNKNOWN')
-            person_name = None
-
-            if speaker_profiles and speaker in speaker_profiles:
-                person_name = speaker_profiles[speaker]
-
-            segment_data = {
-                "start_time": seg['start_time'],
-                "end_time": seg['end_time'],
-                "duration": seg['end_time'] - seg['start_time'],
-                "text": seg['text'],
-                "speaker_id": speaker,
-                "speaker_name": person_name,
-                "classification": classif.classification,
-                "classification_confidence": classif.confidence,
-                "classification_reasoning": classif.reasoning,
-                "character": classif.character,
-                "words": seg.get('words', [])
-            }
-
-            output["segments"].append(segment_data)
+            output["segments"].append(self._segment_record(seg, classif, speaker_profiles))
 
         return json.dumps(output, indent=2, ensure_ascii=False)
 
+    @staticmethod
+    def _segment_record(
+        seg: Dict,
+        classif: ClassificationResult,
+        speaker_profiles: Optional[Dict[str, str]]
+    ) -> Dict:
+        speaker = seg.get('speaker', 'UNKNOWN')
+        person_name = None
+
+        if speaker_profiles and speaker in speaker_profiles:
+            person_name = speaker_profiles[speaker]
+
+        return {
+            "start_time": seg['start_time'],
+            "end_time": seg['end_time'],
+            "duration": seg['end_time'] - seg['start_time'],
+            "text": seg['text'],
+            "speaker_id": speaker,
+            "speaker_name": person_name,
+            "classification": classif.classification,
+            "classification_confidence": classif.confidence,
+            "classification_reasoning": classif.reasoning,
+            "character": classif.character,
+            "words": seg.get('words', [])
+        }
+
     def save_all_formats(
         self,
         segments: List[Dict],
@@ -275,6 +303,12 @@ class TranscriptFormatter:
         """
         Save transcript in all formats.
 
+        Segments are read once and every output (full, IC-only and OOC-only
+        text, JSON, and the three SRT files) is written incrementally through
+        its own buffered file, so memory use does not grow with session length.
+        The files match format_full_transcript, format_filtered, format_json
+        and SRTExporter output.
+
         Args:
             segments: Transcribed and diarized segments
             classifications: IC/OOC classifications
@@ -282,78 +316,84 @@ class TranscriptFormatter:
             session_name: Base name for output files
             speaker_profiles: Optional speaker ID to name mapping
             metadata: Optional metadata to include in JSON
+
+        Returns:
+            Mapping of OutputFormat to the written file path
         """
         output_dir = Path(output_dir)
         output_dir.mkdir(exist_ok=True, parents=True)
 
-        # Full transcript
-        full_text = self.format_full_transcript(
-            segments, classifications, speaker_profiles
-        )
-        (output_dir / f"{session_name}_full.txt").write_text(
-            full_text, encoding='utf-8'
-        )
-
-        # IC-only transcript
-        ic_text = self.format_ic_only(
-            segments, classifications, speaker_profiles
-        )
-        (output_dir / f"{session_name}_ic_only.txt").write_text(
-            ic_text, encoding='utf-8'
-        )
-
-        # OOC-only transcript
-        ooc_text = self.format_ooc_only(
-            segments, classifications, speaker_profiles
-        )
-        (output_dir / f"{session_name}_ooc_only.txt").write_text(
-            ooc_text, encoding='utf-8'
-        )
-
-        # JSON format
-        json_text = self.format_json(
-            segments, classifications, speaker_profiles, metadata
-        )
-        json_path = output_dir / f"{session_name}_data.json"
-        json_path.write_text(json_text, encoding='utf-8')
-
-        # SRT subtitle exports
-        try:
-            from .srt_exporter import SRTExporter
-            srt_exporter = SRTExporter()
-
-            # Full SRT
-            srt_exporter.export_from_json(
-                json_path,
-                output_dir / f"{session_name}_full.srt",
-                include_speaker=True
-            )
+        from .srt_exporter import SRTExporter
+        srt_exporter = SRTExporter()
 
-            # IC-only SRT
-            srt_exporter.export_ic_only_srt(
-                json_path,
-                output_dir / f"{session_name}_ic_only.srt",
-                include_speaker=True
-            )
-
-            # OOC-only SRT
-            srt_exporter.export_ooc_only_srt(
-                json_path,
-                output_dir / f"{session_name}_ooc_only.srt",
-                include_speaker=True
-            )
-        except Exception as e:
-            logger.warning(f"SRT export failed: {e}")
-
-        return {
+        paths = {
             OutputFormat.FULL: output_dir / f"{session_name}_full.txt",
             OutputFormat.IC_ONLY: output_dir / f"{session_name}_ic_only.txt",
             OutputFormat.OOC_ONLY: output_dir / f"{session_name}_ooc_only.txt",
-            OutputFormat.JSON: json_path,
+            OutputFormat.JSON: output_dir / f"{session_name}_data.json",
             OutputFormat.SRT_FULL: output_dir / f"{session_name}_full.srt",
             OutputFormat.SRT_IC: output_dir / f"{session_name}_ic_only.srt",
             OutputFormat.SRT_OOC: output_dir / f"{session_name}_ooc_only.srt"
         }
+        text_filters = {
+            OutputFormat.IC_ONLY: TranscriptFilter.IN_CHARACTER_ONLY,
+            OutputFormat.OOC_ONLY: TranscriptFilter.OUT_OF_CHARACTER_ONLY,
+        }
+        # The SRT exports keep only exact IC/OOC matches (MIXED segments are left out)
+        srt_classifications = {
+            OutputFormat.SRT_FULL: None,
+            OutputFormat.SRT_IC: Classification.IN_CHARACTER.value,
+            OutputFormat.SRT_OOC: Classification.OUT_OF_CHARACTER.value,
+        }
+        srt_counts = dict.fromkeys(srt_classifications, 0)
+
+        written = 0
+        with ExitStack() as stack:
+            files = {
+                output_format: stack.enter_context(
+                    open(path, 'w', encoding='utf-8', buffering=OUTPUT_BUFFER_SIZE)
+                )
+                for output_format, path in paths.items()
+            }
+
+            files[OutputFormat.FULL].write(self._header("D&D SESSION TRANSCRIPT - FULL VERSION"))
+            for output_format, filter_type in text_filters.items():
+                files[output_format].write(self._header(filter_type.get_title()))
+
+            # Same layout as format_json, written one segment at a time
+            metadata_json = json.dumps(metadata or {}, indent=2, ensure_ascii=False)
+            files[OutputFormat.JSON].write(
+                '{\n  "metadata": ' + metadata_json.replace("\n", "\n  ") + ',\n  "segments": ['
+            )
+
+            for seg, classif in zip(segments, classifications):
+                files[OutputFormat.FULL].write("\n" + self._full_line(seg, classif, speaker_profiles))
+                for output_format, filter_type in text_filters.items():
+                    if filter_type.should_include(classif.classification):
+                        files[output_format].write(
+                            "\n" + self._filtered_line(seg, classif, filter_type, speaker_profiles)
+                        )
+
+                record = self._segment_record(seg, classif, speaker_profiles)
+                record_json = json.dumps(record, indent=2, ensure_ascii=False).replace("\n", "\n    ")
+                files[OutputFormat.JSON].write((",\n    " if written else "\n    ") + record_json)
+                written += 1
+
+                classification = str(classif.classification or '').upper()
+                for output_format, wanted in srt_classifications.items():
+                    if wanted is None or classification == wanted:
+                        srt_counts[output_format] += 1
+                        files[output_format].write(
+                            srt_exporter.format_entry(srt_counts[output_format], record, include_speaker=True)
+                        )
+
+            files[OutputFormat.JSON].write("\n  ]\n}" if written else "]\n}")
+
+        for output_format, count in srt_counts.items():
+            if not count:
+                logger.info(f"No segments for {paths[output_format].name}; wrote an empty SRT file")
+
+        return paths
 
 
 class StatisticsGenerator:
@@ -0,0 +1,189 @@
+"""
+Columnar storage for intermediate stage outputs.
+
+Stage outputs are lists of flat segment dictionaries, so instead of one
+pretty-printed JSON document they can be stored column by column in an
+uncompressed NumPy ``.npz`` archive:
+
+- numbers and booleans as typed arrays
+- strings as one NUL-joined UTF-8 buffer per column
+- lists of dictionaries (per-word timings) as a flattened child table
+  with a per-row item count
+- anything else as a compact JSON array
+
+Columns missing from some rows carry a presence mask. A JSON header member
+holds the schema plus the stage metadata and statistics, and every column
+is a separate archive member that is only read when it is requested.
+
+Example:
+    >>> write_stage_columns(path, segments, {"metadata": {...}})
+    >>> rows, header = read_stage_columns(path, columns=["text", "speaker"])
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+FORMAT_VERSION = 1
+HEADER_MEMBER = "header"
+
+_INT64_MIN = -(2 ** 63)
+_INT64_MAX = 2 ** 63 - 1
+
+
+def write_stage_columns(path: Path, segments: List[Dict[str, Any]], header: Dict[str, Any]) -> None:
+    """
+    Write ``segments`` column by column to a ``.npz`` archive at ``path``.
+
+    Args:
+        path: Destination file (replaced atomically)
+        segments: List of segment dictionaries
+        header: JSON-serializable header (metadata, statistics) stored alongside
+    """
+    arrays: Dict[str, np.ndarray] = {}
+    schema = _encode_table(segments, "", arrays)
+    _write_archive(Path(path), arrays, {**header, "format_version": FORMAT_VERSION, "schema": schema})
+
+
+def read_stage_header(path: Path) -> Dict[str, Any]:
+    """Read the header (schema, metadata, statistics) without loading any column."""
+    with np.load(path, allow_pickle=False) as archive:
+        return _read_header(archive)
+
+
+def read_stage_columns(
+    path: Path, columns: Optional[Iterable[str]] = None
+) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+    """
+    Read segments back from a ``.npz`` archive.
+
+    Args:
+        path: Archive written by write_stage_columns
+        columns: Top-level keys to load (default: all); other columns are not read
+
+    Returns:
+        Tuple of (segments, header)
+    """
+    with np.load(path, allow_pickle=False) as archive:
+        header = _read_header(archive)
+        wanted = set(columns) if columns is not None else None
+        rows = _decode_table(archive, header["schema"], wanted)
+    return rows, header
+
+
+def update_stage_header(path: Path, updates: Dict[str, Any]) -> None:
+    """Merge ``updates`` into the archive header, keeping every column as stored."""
+    path = Path(path)
+    with np.load(path, allow_pickle=False) as archive:
+        header = _read_header(archive)
+        arrays = {name: archive[name] for name in archive.files if name != HEADER_MEMBER}
+    header.update(updates)
+    _write_archive(path, arrays, header)
+
+
+def _write_archive(path: Path, arrays: Dict[str, np.ndarray], header: Dict[str, Any]) -> None:
+    arrays = dict(arrays)
+    arrays[HEADER_MEMBER] = _utf8_array(json.dumps(header, ensure_ascii=False))
+    tmp_path = path.with_name(path.name + ".tmp")
+    with open(tmp_path, "wb") as f:
+        np.savez(f, **arrays)
+    os.replace(tmp_path, path)
+
+
+def _read_header(archive) -> Dict[str, Any]:
+    header = json.loads(archive[HEADER_MEMBER].tobytes().decode("utf-8"))
+    if header.get("format_version") != FORMAT_VERSION:
+        raise ValueError(f"Unsupported columnar format version: {header.get('format_version')}")
+    return header
+
+
+def _utf8_array(text: str) -> np.ndarray:
+    return np.frombuffer(text.encode("utf-8"), dtype=np.uint8)
+
+
+def _column_kind(values: List[Any]) -> str:
+    types = {type(value) for value in values}
+    if types == {float}:
+        return "float64"
+    if types == {bool}:
+        return "bool"
+    if types == {int} and all(_INT64_MIN <= value <= _INT64_MAX for value in values):
+        return "int64"
+    if types == {str}:
+        # NUL separates values in the joined buffer
+        return "json" if any("\x00" in value for value in values) else "str"
+    if types == {list} and all(isinstance(item, dict) for value in values for item in value):
+        return "table"
+    return "json"
+
+
+def _encode_table(rows: List[Dict[str, Any]], prefix: str, arrays: Dict[str, np.ndarray]) -> Dict[str, Any]:
+    names = list(dict.fromkeys(name for row in rows for name in row))
+    columns = []
+    for index, name in enumerate(names):
+        member = f"{prefix}c{index}"
+        present = [name in row for row in rows]
+        values = [row[name] for row in rows if name in row]
+        kind = _column_kind(values)
+        column: Dict[str, Any] = {"name": name, "member": member, "kind": kind}
+
+        if not all(present):
+            arrays[f"{member}.present"] = np.array(present, dtype=bool)
+            column["sparse"] = True
+
+        if kind in ("float64", "int64", "bool"):
+            arrays[member] = np.array(values, dtype=kind)
+        elif kind == "str":
+            arrays[member] = _utf8_array("\x00".join(values))
+        elif kind == "table":
+            arrays[f"{member}.count"] = np.array([len(value) for value in values], dtype=np.int64)
+            column["table"] = _encode_table(
+                [item for value in values for item in value], f"{member}.", arrays
+            )
+        else:
+            arrays[member] = _utf8_array(json.dumps(values, ensure_ascii=False))
+        columns.append(column)
+
+    return {"rows": len(rows), "columns": columns}
+
+
+def _decode_column(archive, column: Dict[str, Any], count: int) -> List[Any]:
+    kind = column["kind"]
+    member = column["member"]
+    if kind in ("float64", "int64", "bool"):
+        return archive[member].tolist()
+    if kind == "str":
+        if count == 0:
+            return []
+        return archive[member].tobytes().decode("utf-8").split("\x00")
+    if kind == "table":
+        counts = archive[f"{member}.count"].tolist()
+        items = _decode_table(archive, column["table"], None)
+        values = []
+        start = 0
+        for length in counts:
+            values.append(items[start:start + length])
+            start += length
+        return values
+    return json.loads(archive[member].tobytes().decode("utf-8"))
+
+
+def _decode_table(archive, schema: Dict[str, Any], wanted: Optional[set]) -> List[Dict[str, Any]]:
+    rows: List[Dict[str, Any]] = [{} for _ in range(schema["rows"])]
+    for column in schema["columns"]:
+        name = column["name"]
+        if wanted is not None and name not in wanted:
+            continue
+
+        if column.get("sparse"):
+            present = archive[f"{column['member']}.present"]
+            targets = [rows[index] for index in np.flatnonzero(present).tolist()]
+        else:
+            targets = rows
+
+        for row, value in zip(targets, _decode_column(archive, column, len(targets))):
+            row[name] = value
+    return rows
@@ -9,14 +9,25 @@ Supported stages:
 - Stage 4: Merged Transcript (TranscriptionSegment list)
 - Stage 5: Diarization (Speaker-labeled segments)
 - Stage 6: IC/OOC Classification (Classification results)
+
+Stage outputs are written as JSON or, with INTERMEDIATE_FORMAT=columnar, as a
+columnar ``.npz`` archive (see src/intermediate_columns.py). Either format is
+read back transparently.
 """
 
 import json
 import logging
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
-
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from src.config import Config
+from src.intermediate_columns import (
+    read_stage_columns,
+    read_stage_header,
+    update_stage_header,
+    write_stage_columns,
+)
 from src.transcriber import TranscriptionSegment
 
 logger = logging.getLogger("DDSessionProcessor.intermediate_output")
@@ -31,16 +42,30 @@ class IntermediateOutputManager:
         6: "classification",
     }
 
-    def __init__(self, session_output_dir: Path):
+    # File extension per storage format
+    STORAGE_FORMATS = {
+        "json": ".json",
+        "columnar": ".npz",
+    }
+
+    def __init__(self, session_output_dir: Path, storage_format: Optional[str] = None):
         """
         Initialize the manager.
 
         Args:
             session_output_dir: Path to the session's output directory
+            storage_format: Format for saved stage outputs, "json" or "columnar"
+                            (default: Config.INTERMEDIATE_FORMAT)
         """
         self.session_output_dir = Path(session_output_dir)
         self.intermediates_dir = self.session_output_dir / "intermediates"
-        self.session_id = session_output_dir.name
+        self.session_id = self.session_output_dir.name
+        self.storage_format = (storage_format or Config.INTERMEDIATE_FORMAT).lower()
+        if self.storage_format not in self.STORAGE_FORMATS:
+            raise ValueError(
+                f"Invalid intermediate storage format: {self.storage_format} "
+                f"(expected one of {', '.join(self.STORAGE_FORMATS)})"
+            )
 
     def ensure_intermediates_dir(self) -> Path:
         """
@@ -52,12 +77,13 @@ class IntermediateOutputManager:
         self.intermediates_dir.mkdir(parents=True, exist_ok=True)
         return self.intermediates_dir
 
-    def get_stage_filename(self, stage_number: int) -> str:
+    def get_stage_filename(self, stage_number: int, storage_format: Optional[str] = None) -> str:
         """
         Get the filename for a stage's output.
 
         Args:
             stage_number: The stage number (4, 5, or 6)
+            storage_format: "json" or "columnar" (default: the manager's format)
 
         Returns:
             Filename for the stage's output file
@@ -65,19 +91,31 @@ class IntermediateOutputManager:
         stage_name = self.STAGE_NAMES.get(stage_number)
         if not stage_name:
             raise ValueError(f"Invalid stage number: {stage_number}")
-        return f"stage_{stage_number}_{stage_name}.json"
+        extension = self.STORAGE_FORMATS[storage_format or self.storage_format]
+        return f"stage_{stage_number}_{stage_name}{extension}"
 
     def get_stage_path(self, stage_number: int) -> Path:
         """
         Get the full path for a stage's output file.
 
+        An existing output in the other storage format is returned when there
+        is none in the manager's format, so sessions saved before a format
+        change stay readable.
+
         Args:
             stage_number: The stage number (4, 5, or 6)
 
         Returns:
             Path to the stage's output file
         """
-        return self.intermediates_dir / self.get_stage_filename(stage_number)
+        preferred = self.intermediates_dir / self.get_stage_filename(stage_number)
+        if preferred.exists():
+            return preferred
+        for storage_format in self.STORAGE_FORMATS:
+            path = self.intermediates_dir / self.get_stage_filename(stage_number, storage_format)
+            if path.exists():
+                return path
+        return preferred
 
     def save_stage_output(
         self,
@@ -87,7 +125,7 @@ class IntermediateOutputManager:
         input_file: Optional[str] = None,
     ) -> Path:
         """
-        Save a stage's output to JSON.
+        Save a stage's output in the manager's storage format.
 
         Args:
             stage_number: The stage number (4, 5, or 6)
@@ -124,10 +162,7 @@ class IntermediateOutputManager:
         if statistics:
             output_data["statistics"] = statistics
 
-        output_path = self.get_stage_path(stage_number)
-
-        with open(output_path, "w", encoding="utf-8") as f:
-            json.dump(output_data, f, indent=2, ensure_ascii=False)
+        output_path = self._write_stage_data(stage_number, output_data, self.storage_format)
 
         logger.info(
             "Saved stage %d (%s) output to %s (%d segments)",
@@ -140,13 +175,15 @@ class IntermediateOutputManager:
         return output_path
 
     def load_stage_output(
-        self, stage_number: int
+        self, stage_number: int, columns: Optional[Iterable[str]] = None
     ) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
         """
-        Load a stage's output from JSON.
+        Load a stage's output (JSON or columnar).
 
         Args:
             stage_number: The stage number (4, 5, or 6)
+            columns: Optional segment keys to load; other keys are dropped,
+                     and for columnar outputs are never read from disk
 
         Returns:
             Tuple of (segments, metadata)
@@ -162,8 +199,7 @@ class IntermediateOutputManager:
                 f"Stage {stage_number} output not found at {output_path}"
             )
 
-        with open(output_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        data = self._read_stage_data(output_path, columns)
 
         # Validate structure
         if "metadata" not in data or "segments" not in data:
@@ -194,6 +230,68 @@ class IntermediateOutputManager:
 
         return segments, metadata
 
+    def _write_stage_data(self, stage_number: int, data: Dict[str, Any], storage_format: str) -> Path:
+        output_path = self.intermediates_dir / self.get_stage_filename(stage_number, storage_format)
+
+        if storage_format == "columnar":
+            header = {key: value for key, value in data.items() if key != "segments"}
+            write_stage_columns(output_path, data["segments"], header)
+        else:
+            with open(output_path, "w", encoding="utf-8") as f:
+                json.dump(data, f, indent=2, ensure_ascii=False)
+
+        # A leftover file in the other format would otherwise shadow or duplicate this one
+        for other_format in self.STORAGE_FORMATS:
+            if other_format != storage_format:
+                stale = self.intermediates_dir / self.get_stage_filename(stage_number, other_format)
+                stale.unlink(missing_ok=True)
+
+        return output_path
+
+    def _read_stage_data(self, path: Path, columns: Optional[Iterable[str]] = None) -> Dict[str, Any]:
+        if path.suffix == self.STORAGE_FORMATS["columnar"]:
+            segments, header = read_stage_columns(path, columns)
+            data = {key: value for key, value in header.items() if key not in ("format_version", "schema")}
+            data["segments"] = segments
+            return data
+
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        if columns is not None and isinstance(data.get("segments"), list):
+            wanted = set(columns)
+            data["segments"] = [
+                {key: value for key, value in segment.items() if key in wanted}
+                for segment in data["segments"]
+            ]
+        return data
+
+    def convert_stage_outputs(self, storage_format: str) -> List[Path]:
+        """
+        Rewrite existing stage outputs in another storage format.
+
+        Metadata (including the original timestamp) and statistics are kept
+        as saved; outputs already in ``storage_format`` are left untouched.
+
+        Args:
+            storage_format: "json" or "columnar"
+
+        Returns:
+            Paths of the converted files
+        """
+        if storage_format not in self.STORAGE_FORMATS:
+            raise ValueError(f"Invalid intermediate storage format: {storage_format}")
+
+        converted = []
+        for stage_number in self.STAGE_NAMES:
+            path = self.get_stage_path(stage_number)
+            if not path.exists() or path.suffix == self.STORAGE_FORMATS[storage_format]:
+                continue
+            data = self._read_stage_data(path)
+            output_path = self._write_stage_data(stage_number, data, storage_format)
+            logger.info("Converted stage %d output %s -> %s", stage_number, path.name, output_path.name)
+            converted.append(output_path)
+        return converted
+
     def stage_output_exists(self, stage_number: int) -> bool:
         """
         Check if a stage's output file exists.
@@ -521,7 +619,7 @@ class IntermediateOutputManager:
 
     def update_classification_metadata(self, metadata: Dict[str, Any]) -> None:
         """
-        Update the metadata block of stage_6_classification.json.
+        Update the metadata block of the stage 6 classification output.
 
         Args:
             metadata: Dictionary containing metadata to merge (model, generation_stats, etc.)
@@ -531,6 +629,16 @@ class IntermediateOutputManager:
             logger.warning(f"Cannot update metadata: {stage_path} does not exist")
             return
 
+        if stage_path.suffix == self.STORAGE_FORMATS["columnar"]:
+            existing_metadata = read_stage_header(stage_path).get("metadata", {})
+            existing_metadata.update(metadata)
+            audit_log = self.get_audit_log_path()
+            if audit_log.exists():
+                existing_metadata["prompt_log"] = str(audit_log.relative_to(self.session_output_dir))
+            update_stage_header(stage_path, {"metadata": existing_metadata})
+            logger.debug(f"Updated classification metadata in {stage_path}")
+            return
+
         with open(stage_path, "r", encoding="utf-8") as f:
             data = json.load(f)
 
@@ -0,0 +1,702 @@
+"""
+Inverted Index - Tokenized full-text index with BM25 ranking and filter bitmaps.
+
+Documents are added once with their text plus categorical fields (speaker,
+IC/OOC, session) and sortable attributes (timestamps, dates). Queries are
+answered from positional postings, so cost depends on how many documents
+contain the query terms rather than on the size of the corpus, and filters
+are applied as boolean masks before any text is scored.
+"""
+from __future__ import annotations
+
+import json
+import math
+import re
+from bisect import bisect_left
+from itertools import chain
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Set, Tuple
+
+import numpy as np
+
+_TOKEN_PATTERN = re.compile(r"\w+", re.UNICODE)
+
+# Bump when the layout written by InvertedIndex.save changes
+INDEX_FILE_VERSION = 1
+
+
+def tokenize(text: str) -> List[str]:
+    """Split text into lowercase word tokens."""
+    return _TOKEN_PATTERN.findall(text.lower()) if text else []
+
+
+class _Postings:
+    """
+    Frozen postings for one term: sorted doc ids, term frequencies and positions.
+
+    Positions of all documents share one flat array; ``position_offsets[i]``
+    to ``position_offsets[i + 1]`` are the positions in ``doc_ids[i]``.
+    """
+
+    __slots__ = ("doc_ids", "freqs", "positions", "position_offsets")
+
+    def __init__(self, doc_ids: np.ndarray, positions: np.ndarray, position_offsets: np.ndarray):
+        self.doc_ids = doc_ids
+        self.positions = positions
+        self.position_offsets = position_offsets
+        self.freqs = np.diff(position_offsets).astype(np.float64)
+
+    @classmethod
+    def from_lists(cls, doc_ids: List[int], position_lists: List[List[int]]) -> "_Postings":
+        position_offsets = np.zeros(len(position_lists) + 1, dtype=np.int64)
+        np.cumsum([len(p) for p in position_lists], out=position_offsets[1:])
+        return cls(
+            np.asarray(doc_ids, dtype=np.int64),
+            np.fromiter(chain.from_iterable(position_lists), dtype=np.int64, count=int(position_offsets[-1])),
+            position_offsets,
+        )
+
+    def starting_at(self, doc_id: int) -> Optional["_Postings"]:
+        """The postings of documents ``doc_id`` and later (None if there are none)."""
+        cut = int(np.searchsorted(self.doc_ids, doc_id))
+        if cut == len(self.doc_ids):
+            return None
+        offsets = self.position_offsets[cut:]
+        return _Postings(self.doc_ids[cut:], self.positions[offsets[0]:], offsets - offsets[0])
+
+    def positions_for(self, doc_id: int) -> Optional[np.ndarray]:
+        slot = int(np.searchsorted(self.doc_ids, doc_id))
+        if slot < len(self.doc_ids) and self.doc_ids[slot] == doc_id:
+            return self.positions[self.position_offsets[slot]:self.position_offsets[slot + 1]]
+        return None
+
+
+class _StoredPostings:
+    """Postings of every term as flat arrays, as read by ``InvertedIndex.load``."""
+
+    __slots__ = ("slots", "term_offsets", "doc_ids", "position_offsets", "positions")
+
+    def __init__(
+        self,
+        terms: List[str],
+        term_offsets: np.ndarray,
+        doc_ids: np.ndarray,
+        position_offsets: np.ndarray,
+        positions: np.ndarray,
+    ):
+        self.slots = {term: slot for slot, term in enumerate(terms)}
+        self.term_offsets = term_offsets
+        self.doc_ids = doc_ids
+        self.position_offsets = position_offsets
+        self.positions = positions
+
+    def document_frequency(self, term: str) -> int:
+        slot = self.slots.get(term)
+        if slot is None:
+            return 0
+        return int(self.term_offsets[slot + 1] - self.term_offsets[slot])
+
+    def postings(self, term: str) -> Optional[_Postings]:
+        slot = self.slots.get(term)
+        if slot is None:
+            return None
+        start, end = int(self.term_offsets[slot]), int(self.term_offsets[slot + 1])
+        offsets = self.position_offsets[start:end + 1]
+        return _Postings(
+            self.doc_ids[start:end],
+            self.positions[offsets[0]:offsets[-1]],
+            offsets - offsets[0],
+        )
+
+
+class InvertedIndex:
+    """
+    Positional inverted index with BM25 scoring.
+
+    Features:
+    - Postings with term positions (phrase queries)
+    - Okapi BM25 ranking over the documents that contain the query terms
+    - Bitmaps per categorical field value (e.g. speaker, IC/OOC, session)
+    - Range masks over sortable attributes (e.g. timestamp, session date)
+
+    Documents get consecutive integer ids in insertion order. The index can
+    keep growing; postings and bitmaps are frozen into NumPy arrays lazily on
+    the first query after a change. ``remove`` retires documents: they are
+    no longer returned by text queries and no longer count towards the BM25
+    document count, average length and document frequencies, but their ids
+    are not reused. ``save`` writes the index to a single ``.npz`` file;
+    ``load`` reads postings back as flat arrays and only converts them to
+    growable lists if more documents are added. ``save(path, first_doc=n)``
+    writes only the documents added from id ``n`` on, which ``load_tail``
+    appends to an index holding the first ``n`` documents.
+
+    Example usage:
+        index = InvertedIndex()
+        index.add("The dragon attacks", fields={"speaker": "DM"})
+        mask = index.field_mask("speaker", {"DM"})
+        doc_ids, scores = index.bm25(tokenize("dragon"), mask=mask)
+    """
+
+    def __init__(self, k1: float = 1.5, b: float = 0.75):
+        """
+        Args:
+            k1: BM25 term-frequency saturation
+            b: BM25 document-length normalization
+        """
+        self.k1 = k1
+        self.b = b
+
+        self._doc_count = 0
+        self._doc_lengths: List[int] = []
+        # term -> ([doc ids], [positions per doc])
+        self._postings: Dict[str, Tuple[List[int], List[List[int]]]] = {}
+        # field -> value -> [doc ids]
+        self._fields: Dict[str, Dict[str, List[int]]] = {}
+        # attribute -> [value or None per doc]
+        self._attributes: Dict[str, List[Any]] = {}
+
+        self._frozen_postings: Dict[str, _Postings] = {}
+        self._frozen_bitmaps: Dict[Tuple[str, str], np.ndarray] = {}
+        self._frozen_attributes: Dict[str, Tuple[np.ndarray, np.ndarray]] = {}
+        self._frozen_lengths: Optional[np.ndarray] = None
+        self._sorted_terms: Optional[List[str]] = None
+
+        # Documents retired by ``remove`` and their total token count
+        self._removed: Set[int] = set()
+        self._removed_length = 0
+        self._frozen_removed: Optional[np.ndarray] = None
+
+        # Postings read by ``load``; moved into ``_postings`` on the next add
+        self._stored: Optional[_StoredPostings] = None
+
+    def __len__(self) -> int:
+        return self._doc_count
+
+    @property
+    def live_count(self) -> int:
+        """Documents that have not been removed."""
+        return self._doc_count - len(self._removed)
+
+    @property
+    def vocabulary_size(self) -> int:
+        return len(self._stored.slots) if self._stored is not None else len(self._postings)
+
+    def terms_with_prefix(self, prefix: str) -> List[str]:
+        """Indexed terms starting with ``prefix`` (e.g. to expand partial words)."""
+        if self._sorted_terms is None:
+            terms = self._stored.slots if self._stored is not None else self._postings
+            self._sorted_terms = sorted(terms)
+        terms = self._sorted_terms
+        matches = []
+        for position in range(bisect_left(terms, prefix), len(terms)):
+            if not terms[position].startswith(prefix):
+                break
+            matches.append(terms[position])
+        return matches
+
+    def add(
+        self,
+        text: str,
+        fields: Optional[Mapping[str, str]] = None,
+        attributes: Optional[Mapping[str, Any]] = None,
+    ) -> int:
+        """
+        Index one document.
+
+        Args:
+            text: Document text (tokenized with ``tokenize``)
+            fields: Categorical values usable in ``field_mask``
+            attributes: Sortable values usable in ``range_mask`` (None = unknown)
+
+        Returns:
+            The new document id
+        """
+        if self._stored is not None:
+            self._thaw()
+        doc_id = self._doc_count
+        self._doc_count += 1
+
+        tokens = tokenize(text)
+        self._doc_lengths.append(len(tokens))
+
+        term_positions: Dict[str, List[int]] = {}
+        for position, token in enumerate(tokens):
+            positions = term_positions.get(token)
+            if positions is None:
+                term_positions[token] = [position]
+            else:
+                positions.append(position)
+        postings = self._postings
+        for term, positions in term_positions.items():
+            entry = postings.get(term)
+            if entry is None:
+                entry = postings[term] = ([], [])
+                self._sorted_terms = None
+            entry[0].append(doc_id)
+            entry[1].append(positions)
+
+        for name, value in (fields or {}).items():
+            self._fields.setdefault(name, {}).setdefault(value, []).append(doc_id)
+
+        attributes = attributes or {}
+        for name in attributes:
+            if name not in self._attributes:
+                self._attributes[name] = [None] * doc_id
+        for name, column in self._attributes.items():
+            column.append(attributes.get(name))
+
+        self._invalidate()
+        return doc_id
+
+    def add_many(
+        self,
+        documents: Iterable[Tuple[str, Optional[Mapping[str, str]], Optional[Mapping[str, Any]]]],
+    ) -> None:
+        """Index ``(text, fields, attributes)`` tuples in order."""
+        for text, fields, attributes in documents:
+            self.add(text, fields, attributes)
+
+    def remove(self, doc_ids: Iterable[int]) -> None:
+        """Retire documents from text queries and the BM25 statistics."""
+        for doc_id in doc_ids:
+            doc_id = int(doc_id)
+            if 0 <= doc_id < self._doc_count and doc_id not in self._removed:
+                self._removed.add(doc_id)
+                self._removed_length += self._doc_lengths[doc_id]
+        self._frozen_removed = None
+
+    def _invalidate(self) -> None:
+        if self._frozen_postings or self._frozen_bitmaps or self._frozen_attributes:
+            self._frozen_postings.clear()
+            self._frozen_bitmaps.clear()
+            self._frozen_attributes.clear()
+        self._frozen_lengths = None
+        self._frozen_removed = None
+
+    def _thaw(self) -> None:
+        """Turn postings read by ``load`` back into growable lists."""
+        stored, self._stored = self._stored, None
+        offsets = stored.position_offsets.tolist()
+        positions = stored.positions.tolist()
+        doc_ids = stored.doc_ids.tolist()
+        term_offsets = stored.term_offsets.tolist()
+        for term, slot in stored.slots.items():
+            start, end = term_offsets[slot], term_offsets[slot + 1]
+            self._postings[term] = (
+                doc_ids[start:end],
+                [positions[offsets[i]:offsets[i + 1]] for i in range(start, end)],
+            )
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+
+    def save(self, path: Path, first_doc: int = 0) -> None:
+        """
+        Write the index to ``path`` as an uncompressed ``.npz`` archive.
+
+        Postings are stored as flat arrays (terms, per-term offsets, doc ids,
+        per-posting position offsets, positions) next to a JSON header with
+        the vocabulary and field values; nothing is pickled.
+
+        Args:
+            first_doc: Only write documents from this id on (read back with
+                ``load_tail``); the set of removed documents is always written
+        """
+        terms = sorted(self._stored.slots if self._stored is not None else self._postings)
+        if first_doc:
+            tails = [(term, self._postings_from(term, first_doc)) for term in terms]
+            tails = [(term, postings) for term, postings in tails if postings is not None]
+            terms = [term for term, _ in tails]
+            frozen = [postings for _, postings in tails]
+        else:
+            frozen = [self.postings(term) for term in terms]
+        term_offsets = np.zeros(len(terms) + 1, dtype=np.int64)
+        np.cumsum([len(p.doc_ids) for p in frozen], out=term_offsets[1:])
+        position_offsets = np.zeros(int(term_offsets[-1]) + 1, dtype=np.int64)
+        if frozen:
+            np.cumsum(
+                np.fromiter(chain.from_iterable(np.diff(p.position_offsets) for p in frozen), dtype=np.int64),
+                out=position_offsets[1:],
+            )
+
+        arrays: Dict[str, np.ndarray] = {
+            "doc_lengths": np.asarray(self._doc_lengths[first_doc:], dtype=np.int32),
+            "removed": np.asarray(sorted(self._removed), dtype=np.int64),
+            "term_offsets": term_offsets,
+            "doc_ids": np.concatenate([p.doc_ids for p in frozen]) if frozen else np.empty(0, dtype=np.int64),
+            "position_offsets": position_offsets,
+            "positions": (
+                np.concatenate([p.positions for p in frozen]) if frozen else np.empty(0, dtype=np.int64)
+            ).astype(np.int32),
+        }
+
+        fields: Dict[str, Dict[str, List[int]]] = {}
+        field_doc_ids: List[int] = []
+        for name, values in self._fields.items():
+            fields[name] = {}
+            for value, doc_ids in values.items():
+                doc_ids = doc_ids[bisect_left(doc_ids, first_doc):]
+                if doc_ids:
+                    fields[name][value] = [len(field_doc_ids), len(doc_ids)]
+                    field_doc_ids.extend(doc_ids)
+        arrays["field_doc_ids"] = np.asarray(field_doc_ids, dtype=np.int64)
+
+        attributes = sorted(self._attributes)
+        for number, name in enumerate(attributes):
+            if first_doc:
+                values, present = self._column(self._attributes[name][first_doc:])
+            else:
+                values, present = self._attribute_column(name)
+            arrays[f"attribute_values_{number}"] = values
+            arrays[f"attribute_present_{number}"] = present
+
+        header = {
+            "version": INDEX_FILE_VERSION,
+            "first_doc": first_doc,
+            "k1": self.k1,
+            "b": self.b,
+            "terms": terms,
+            "fields": fields,
+            "attributes": attributes,
+        }
+        arrays["header"] = np.frombuffer(json.dumps(header).encode("utf-8"), dtype=np.uint8)
+
+        with open(path, "wb") as f:
+            np.savez(f, **arrays)
+
+    @classmethod
+    def load(cls, path: Path) -> "InvertedIndex":
+        """
+        Read an index written by ``save``.
+
+        Raises:
+            ValueError: If the file was written by an incompatible version
+        """
+        with np.load(path, allow_pickle=False) as data:
+            header = cls._read_header(data, path)
+            if header.get("first_doc", 0):
+                raise ValueError(f"{path} only holds documents from {header['first_doc']} on; use load_tail")
+
+            index = cls(k1=header["k1"], b=header["b"])
+            index._doc_lengths = data["doc_lengths"].tolist()
+            index._doc_count = len(index._doc_lengths)
+            index._stored = _StoredPostings(
+                header["terms"],
+                data["term_offsets"],
+                data["doc_ids"],
+                data["position_offsets"],
+                data["positions"].astype(np.int64),
+            )
+
+            field_doc_ids = data["field_doc_ids"].tolist()
+            for name, values in header["fields"].items():
+                index._fields[name] = {
+                    value: field_doc_ids[start:start + count] for value, (start, count) in values.items()
+                }
+
+            for number, name in enumerate(header["attributes"]):
+                values = data[f"attribute_values_{number}"].tolist()
+                present = data[f"attribute_present_{number}"].tolist()
+                index._attributes[name] = [
+                    value if is_present else None for value, is_present in zip(values, present)
+                ]
+            index._restore_removed(data)
+        return index
+
+    def load_tail(self, path: Path) -> None:
+        """
+        Append the documents of a file written by ``save(path, first_doc=len(self))``.
+
+        Raises:
+            ValueError: If the file does not continue this index
+        """
+        with np.load(path, allow_pickle=False) as data:
+            header = self._read_header(data, path)
+            if header.get("first_doc", 0) != self._doc_count:
+                raise ValueError(
+                    f"{path} starts at document {header.get('first_doc', 0)}, index has {self._doc_count}"
+                )
+            if self._stored is not None:
+                self._thaw()
+
+            term_offsets = data["term_offsets"].tolist()
+            doc_ids = data["doc_ids"].tolist()
+            offsets = data["position_offsets"].tolist()
+            positions = data["positions"].tolist()
+            for slot, term in enumerate(header["terms"]):
+                entry = self._postings.get(term)
+                if entry is None:
+                    entry = self._postings[term] = ([], [])
+                start, end = term_offsets[slot], term_offsets[slot + 1]
+                entry[0].extend(doc_ids[start:end])
+                entry[1].extend(positions[offsets[i]:offsets[i + 1]] for i in range(start, end))
+
+            field_doc_ids = data["field_doc_ids"].tolist()
+            for name, values in header["fields"].items():
+                for value, (start, count) in values.items():
+                    self._fields.setdefault(name, {}).setdefault(value, []).extend(
+                        field_doc_ids[start:start + count]
+                    )
+
+            added = len(data["doc_lengths"])
+            tail_columns: Dict[str, List[Any]] = {}
+            for number, name in enumerate(header["attributes"]):
+                values = data[f"attribute_values_{number}"].tolist()
+                present = data[f"attribute_present_{number}"].tolist()
+                tail_columns[name] = [
+                    value if is_present else None for value, is_present in zip(values, present)
+                ]
+            for name in tail_columns.keys() - self._attributes.keys():
+                self._attributes[name] = [None] * self._doc_count
+            for name, column in self._attributes.items():
+                column.extend(tail_columns.get(name, [None] * added))
+
+            self._doc_lengths.extend(data["doc_lengths"].tolist())
+            self._doc_count += added
+            self._restore_removed(data)
+        self._sorted_terms = None
+        self._invalidate()
+
+    @staticmethod
+    def _read_header(data: Any, path: Path) -> Dict[str, Any]:
+        header = json.loads(bytes(data["header"]).decode("utf-8"))
+        if header.get("version") != INDEX_FILE_VERSION:
+            raise ValueError(f"Unsupported inverted index version in {path}: {header.get('version')}")
+        return header
+
+    def _restore_removed(self, data: Any) -> None:
+        if "removed" in data.files:
+            self.remove(data["removed"].tolist())
+
+    # ------------------------------------------------------------------
+    # Filters
+    # ------------------------------------------------------------------
+
+    def all_mask(self) -> np.ndarray:
+        """Mask selecting every document."""
+        return np.ones(self._doc_count, dtype=bool)
+
+    def field_values(self, name: str) -> List[str]:
+        """Distinct values seen for a categorical field."""
+        return sorted(self._fields.get(name, {}))
+
+    def field_mask(self, name: str, values: Iterable[str]) -> np.ndarray:
+        """Bitmap of documents whose field ``name`` is any of ``values``."""
+        mask = np.zeros(self._doc_count, dtype=bool)
+        for value in values:
+            mask |= self._bitmap(name, value)
+        return mask
+
+    def _bitmap(self, name: str, value: str) -> np.ndarray:
+        key = (name, value)
+        bitmap = self._frozen_bitmaps.get(key)
+        if bitmap is None:
+            bitmap = np.zeros(self._doc_count, dtype=bool)
+            doc_ids = self._fields.get(name, {}).get(value)
+            if doc_ids:
+                bitmap[np.asarray(doc_ids, dtype=np.int64)] = True
+            self._frozen_bitmaps[key] = bitmap
+        return bitmap
+
+    def range_mask(
+        self,
+        name: str,
+        low: Any = None,
+        high: Any = None,
+        include_missing: bool = False,
+    ) -> np.ndarray:
+        """
+        Documents whose attribute lies in ``[low, high]`` (either bound optional).
+
+        Args:
+            include_missing: Whether documents without the attribute pass
+        """
+        values, present = self._attribute_column(name)
+        mask = present.copy()
+        if low is not None:
+            mask &= values >= low
+        if high is not None:
+            mask &= values <= high
+        if include_missing:
+            mask |= ~present
+        return mask
+
+    def attribute_values(self, name: str) -> np.ndarray:
+        """Values of attribute ``name`` by document (NaN, or "" for text, where missing)."""
+        return self._attribute_column(name)[0]
+
+    def _attribute_column(self, name: str) -> Tuple[np.ndarray, np.ndarray]:
+        column = self._frozen_attributes.get(name)
+        if column is None:
+            raw = self._attributes.get(name, [])
+            column = self._column(raw + [None] * (self._doc_count - len(raw)))
+            self._frozen_attributes[name] = column
+        return column
+
+    @staticmethod
+    def _column(raw: List[Any]) -> Tuple[np.ndarray, np.ndarray]:
+        present = np.array([value is not None for value in raw], dtype=bool)
+        sample = next((value for value in raw if value is not None), None)
+        if isinstance(sample, str):
+            values = np.array(["" if value is None else value for value in raw], dtype=str)
+        else:
+            values = np.array(
+                [np.nan if value is None else float(value) for value in raw],
+                dtype=np.float64,
+            )
+        return values, present
+
+    # ------------------------------------------------------------------
+    # Text queries
+    # ------------------------------------------------------------------
+
+    def postings(self, term: str) -> Optional[_Postings]:
+        """Frozen postings for ``term`` (None if the term does not occur)."""
+        frozen = self._frozen_postings.get(term)
+        if frozen is None:
+            if self._stored is not None:
+                frozen = self._stored.postings(term)
+                if frozen is None:
+                    return None
+            else:
+                raw = self._postings.get(term)
+                if raw is None:
+                    return None
+                frozen = _Postings.from_lists(*raw)
+            self._frozen_postings[term] = frozen
+        return frozen
+
+    def _postings_from(self, term: str, first_doc: int) -> Optional[_Postings]:
+        """Postings of ``term`` in documents ``first_doc`` and later, without freezing the rest."""
+        if self._stored is not None or term in self._frozen_postings:
+            postings = self.postings(term)
+            return postings.starting_at(first_doc) if postings is not None else None
+        doc_ids, position_lists = self._postings[term]
+        cut = bisect_left(doc_ids, first_doc)
+        if cut == len(doc_ids):
+            return None
+        return _Postings.from_lists(doc_ids[cut:], position_lists[cut:])
+
+    def idf(self, term: str) -> float:
+        """BM25 inverse document frequency (always positive)."""
+        removed = self._removed_mask()
+        if removed is not None:
+            postings = self.postings(term)
+            df = int(np.count_nonzero(~removed[postings.doc_ids])) if postings is not None else 0
+        elif self._stored is not None:
+            df = self._stored.document_frequency(term)
+        else:
+            raw = self._postings.get(term)
+            df = len(raw[0]) if raw else 0
+        return math.log(1.0 + (self.live_count - df + 0.5) / (df + 0.5))
+
+    def bm25(
+        self,
+        terms: Sequence[str],
+        mask: Optional[np.ndarray] = None,
+        require_all: bool = True,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Score documents containing the query terms.
+
+        Only postings of the query terms are visited; documents outside
+        ``mask`` are dropped from each posting list before scoring.
+
+        Args:
+            terms: Query tokens (duplicates are ignored)
+            mask: Optional boolean document filter
+            require_all: Only return documents containing every term
+
+        Returns:
+            ``(doc_ids, scores)`` arrays for the matching documents
+        """
+        unique_terms = list(dict.fromkeys(terms))
+        if not unique_terms or self.live_count == 0:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float64)
+
+        removed = self._removed_mask()
+        if removed is not None:
+            mask = ~removed if mask is None else mask & ~removed
+
+        lengths = self._lengths()
+        avg_length = (float(lengths.sum()) - self._removed_length) / self.live_count
+        norm = self.k1 * (1.0 - self.b + self.b * lengths / avg_length) if avg_length else np.full(
+            len(lengths), self.k1
+        )
+
+        per_term: List[Tuple[np.ndarray, np.ndarray]] = []
+        for term in unique_terms:
+            postings = self.postings(term)
+            if postings is None:
+                if require_all:
+                    return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float64)
+                continue
+            doc_ids, freqs = postings.doc_ids, postings.freqs
+            if mask is not None:
+                keep = mask[doc_ids]
+                doc_ids, freqs = doc_ids[keep], freqs[keep]
+            contribution = self.idf(term) * freqs * (self.k1 + 1.0) / (freqs + norm[doc_ids])
+            per_term.append((doc_ids, contribution))
+
+        if not per_term:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float64)
+
+        doc_ids = np.concatenate([ids for ids, _ in per_term])
+        contributions = np.concatenate([c for _, c in per_term])
+        matched, inverse, counts = np.unique(doc_ids, return_inverse=True, return_counts=True)
+        totals = np.bincount(inverse, weights=contributions, minlength=len(matched))
+        if require_all:
+            keep = counts == len(unique_terms)
+            matched, totals = matched[keep], totals[keep]
+        return matched, totals
+
+    def phrase_docs(self, terms: Sequence[str], mask: Optional[np.ndarray] = None) -> np.ndarray:
+        """Documents containing ``terms`` as consecutive tokens."""
+        if not terms:
+            return np.empty(0, dtype=np.int64)
+        postings = [self.postings(term) for term in terms]
+        if any(p is None for p in postings):
+            return np.empty(0, dtype=np.int64)
+
+        # Intersect the rarest posting lists first
+        order = sorted(range(len(terms)), key=lambda i: len(postings[i].doc_ids))
+        candidates = postings[order[0]].doc_ids
+        if mask is not None:
+            candidates = candidates[mask[candidates]]
+        removed = self._removed_mask()
+        if removed is not None:
+            candidates = candidates[~removed[candidates]]
+        for i in order[1:]:
+            candidates = np.intersect1d(candidates, postings[i].doc_ids, assume_unique=True)
+            if not len(candidates):
+                return candidates
+
+        if len(terms) == 1:
+            return candidates
+
+        matches = []
+        for doc_id in candidates:
+            starts = postings[0].positions_for(doc_id)
+            for offset in range(1, len(terms)):
+                starts = np.intersect1d(starts, postings[offset].positions_for(doc_id) - offset)
+                if not len(starts):
+                    break
+            if len(starts):
+                matches.append(doc_id)
+        return np.asarray(matches, dtype=np.int64)
+
+    def _lengths(self) -> np.ndarray:
+        if self._frozen_lengths is None:
+            self._frozen_lengths = np.asarray(self._doc_lengths, dtype=np.float64)
+        return self._frozen_lengths
+
+    def _removed_mask(self) -> Optional[np.ndarray]:
+        """Mask of removed documents, or None if none were removed."""
+        if not self._removed:
+            return None
+        if self._frozen_removed is None:
+            mask = np.zeros(self._doc_count, dtype=bool)
+            mask[np.fromiter(self._removed, dtype=np.int64, count=len(self._removed))] = True
+            self._frozen_removed = mask
+        return self._frozen_removed
@@ -5,13 +5,18 @@ from typing import List, Dict, Optional, Any
 from dataclasses import dataclass, asdict, field
 from datetime import datetime
 import ollama
+from .classification_dispatcher import ClassificationDispatcher
 from .config import Config
 from .logger import get_logger
 from .file_lock import get_file_lock
+from .langchain.keyword_index import notify_sources_changed
 
 
 logger = get_logger(__name__)
 
+# Rough characters-per-token ratio used to budget transcript windows (no tokenizer dependency)
+CHARS_PER_TOKEN = 4
+
 
 @dataclass
 class Quest:
@@ -80,17 +85,42 @@ class Item:
 
 
 class KnowledgeExtractor:
-    """Extract campaign knowledge from structured transcript segments using LLM"""
+    """
+    Extract campaign knowledge from structured transcript segments using LLM.
+
+    Sessions are processed map-reduce style: every scene's narrative
+    transcript is split into windows of at most ``window_tokens`` (estimated)
+    tokens that overlap by ``window_overlap_tokens``, the windows are sent to
+    the LLM with up to ``max_in_flight`` requests outstanding, and the
+    per-window results are merged in transcript order.
+    """
 
     def __init__(self):
         self.client = ollama.Client(host=Config.OLLAMA_BASE_URL)
         self.model = Config.OLLAMA_MODEL
+        self.window_tokens = max(1, int(Config.KNOWLEDGE_WINDOW_TOKENS))
+        # The overlap must leave room for new lines in every window
+        self.window_overlap_tokens = min(
+            max(0, int(Config.KNOWLEDGE_WINDOW_OVERLAP_TOKENS)), self.window_tokens // 2
+        )
+        self.dispatcher = ClassificationDispatcher(
+            max_in_flight=Config.KNOWLEDGE_EXTRACTION_MAX_IN_FLIGHT,
+            name="knowledge-ollama",
+        )
+
+    @staticmethod
+    def estimate_tokens(text: str) -> int:
+        """Approximate token count of ``text`` for window budgeting."""
+        return len(text) // CHARS_PER_TOKEN + 1
 
     def _build_rich_transcript(self, segments: List[Dict[str, Any]]) -> str:
         """
         Build a formatted transcript string from structured segments,
         including only narratively relevant classifications.
         """
+        return "\n".join(self._narrative_lines(segments))
+
+    def _narrative_lines(self, segments: List[Dict[str, Any]]) -> List[str]:
         transcript_parts = []
         narrative_types = {"CHARACTER", "DM_NARRATION", "NPC_DIALOGUE"}
 
@@ -110,7 +140,52 @@ class KnowledgeExtractor:
                 if actor and text:
                     transcript_parts.append(f"{actor}: {text}")
         
-        return "\n".join(transcript_parts)
+        return transcript_parts
+
+    def _build_transcript_windows(self, segments: List[Dict[str, Any]]) -> List[str]:
+        """
+        Split the narrative transcript of ``segments`` into token-budgeted windows.
+
+        Lines are packed greedily up to ``window_tokens``; each new window
+        starts with the trailing lines of the previous one (up to
+        ``window_overlap_tokens``) so entities mentioned across a boundary
+        keep their context. A single line longer than the budget is split.
+        """
+        max_chars = self.window_tokens * CHARS_PER_TOKEN
+        lines: List[str] = []
+        for line in self._narrative_lines(segments):
+            lines.extend(line[start:start + max_chars] for start in range(0, len(line), max_chars))
+
+        windows: List[str] = []
+        current: List[str] = []
+        current_tokens: List[int] = []
+        total = 0
+        for line in lines:
+            tokens = self.estimate_tokens(line)
+            if current and total + tokens > self.window_tokens:
+                windows.append("\n".join(current))
+
+                # Carry the tail of this window into the next one
+                keep = 0
+                total = 0
+                for previous_tokens in reversed(current_tokens):
+                    if total + previous_tokens > self.window_overlap_tokens:
+                        break
+                    total += previous_tokens
+                    keep += 1
+                current = current[len(current) - keep:]
+                current_tokens = current_tokens[len(current_tokens) - keep:]
+                while current and total + tokens > self.window_tokens:
+                    current.pop(0)
+                    total -= current_tokens.pop(0)
+
+            current.append(line)
+            current_tokens.append(tokens)
+            total += tokens
+
+        if current:
+            windows.append("\n".join(current))
+        return windows
 
     def _merge_scene_results(self, all_results: List[Dict[str, List]]) -> Dict[str, List]:
         """
@@ -190,16 +265,60 @@ class KnowledgeExtractor:
         """
         Run knowledge extraction on a specific list of segments.
         """
+        return self._map_reduce([segments], session_id, party_context)
+
+    def _map_reduce(
+        self,
+        segment_groups: List[List[Dict[str, Any]]],
+        session_id: str,
+        party_context: Optional[Dict] = None,
+    ) -> Dict[str, List]:
+        """
+        Extract knowledge from every window of every segment group and merge the results.
+
+        Windows never span two groups (scenes), and results are merged in
+        window order so later windows enrich entities from earlier ones.
+        """
+        windows = [window for segments in segment_groups for window in self._build_transcript_windows(segments)]
+        if not windows:
+            return {'quests': [], 'npcs': [], 'plot_hooks': [], 'locations': [], 'items': []}
+
+        logger.info(
+            f"Extracting knowledge from {len(windows)} transcript window(s) in {len(segment_groups)} "
+            f"scene(s), {self.dispatcher.max_in_flight} request(s) in flight"
+        )
+
+        def report(completed: int, total: int) -> None:
+            logger.debug(f"Knowledge extraction: {completed}/{total} windows done")
+
+        results = self.dispatcher.map(
+            lambda window: self.extract_knowledge(window, session_id, party_context),
+            windows,
+            on_progress=report,
+        )
+        return self._merge_scene_results([result for result in results if result])
+
+    def extract_knowledge(
+        self, transcript: str, session_id: str, party_context: Optional[Dict] = None
+    ) -> Dict[str, List]:
+        """
+        Extract knowledge from one transcript (or notes) text with a single LLM call.
+
+        The text is sent as-is; use _map_reduce for transcripts that may
+        exceed the model's context.
+
+        Returns:
+            Dict of entity lists; all empty if the request or parsing fails
+        """
+        if not transcript:
+            return {'quests': [], 'npcs': [], 'plot_hooks': [], 'locations': [], 'items': []}
+
         party_info = ""
         if party_context:
             party_info = f"""
 Party Characters: {', '.join(party_context.get('character_names', []))}
 Campaign: {party_context.get('campaign', 'Unknown')}
 """
-        
-        rich_transcript = self._build_rich_transcript(segments)
-        if not rich_transcript:
-            return {'quests': [], 'npcs': [], 'plot_hooks': [], 'locations': [], 'items': []}
 
         prompt = f"""You are analyzing a D&D session transcript to extract campaign knowledge.
 
@@ -213,7 +332,7 @@ Campaign: {party_context.get('campaign', 'Unknown')}
 5. **Items**: Important objects, artifacts, or equipment
 
 **Transcript**:
-{rich_transcript[:8000]}
+{transcript}
 
 **Instructions**:
 - Be specific and extract only concrete information from the provided transcript.
@@ -269,37 +388,36 @@ Extract only what is explicitly mentioned. If nothing found, use empty array. Re
     ) -> Dict[str, List]:
         """
         Extracts knowledge from a session, processing scene-by-scene if available.
+
+        Every scene (or the whole session without a scenes file) is split into
+        token-budgeted windows that are extracted concurrently and merged.
         """
-        classification_file = session_path / "intermediates" / "stage_6_classification.json"
-        scenes_file = session_path / "intermediates" / "stage_6_scenes.json"
+        from .intermediate_output import IntermediateOutputManager
 
-        if not classification_file.exists():
-            logger.error(f"Classification file not found: {classification_file}")
+        intermediates = IntermediateOutputManager(session_path)
+        scenes_file = intermediates.intermediates_dir / "stage_6_scenes.json"
+
+        if not intermediates.stage_output_exists(6):
+            logger.error(f"Classification file not found: {intermediates.get_stage_path(6)}")
             return {'quests': [], 'npcs': [], 'plot_hooks': [], 'locations': [], 'items': []}
 
-        with open(classification_file, 'r', encoding='utf-8') as f:
-            all_segments = json.load(f)
+        all_segments, _ = intermediates.load_stage_output(6)
         
         segments_by_id = {seg['segment_index']: seg for seg in all_segments}
 
         if scenes_file.exists():
             logger.info("Scenes file found, processing scene-by-scene.")
-            with open(scenes_file, 'r', encoding='utf-8') as f:
-                scenes = json.load(f)
-            
-            all_results = []
-            for i, scene in enumerate(scenes):
-                logger.info(f"Extracting knowledge from scene {i+1}/{len(scenes)}...")
-                scene_segments = [segments_by_id[seg_id] for seg_id in scene.get("segment_ids", []) if seg_id in segments_by_id]
-                if scene_segments:
-                    scene_result = self._extract_knowledge_from_segments(scene_segments, session_id, party_context)
-                    all_results.append(scene_result)
-            
-            logger.info("Merging results from all scenes.")
-            return self._merge_scene_results(all_results)
+            scenes, _ = intermediates.load_scene_bundles()
+            segment_groups = [
+                [segments_by_id[seg_id] for seg_id in scene.get("segment_ids", []) if seg_id in segments_by_id]
+                for scene in scenes
+            ]
+            segment_groups = [group for group in segment_groups if group]
         else:
             logger.info("No scenes file found, processing all segments at once.")
-            return self._extract_knowledge_from_segments(all_segments, session_id, party_context)
+            segment_groups = [all_segments]
+
+        return self._map_reduce(segment_groups, session_id, party_context)
 
 
 class CampaignKnowledgeBase:
@@ -362,6 +480,9 @@ class CampaignKnowledgeBase:
             with open(self.knowledge_file, 'w', encoding='utf-8') as f:
                 json.dump(data, f, indent=2, ensure_ascii=False)
 
+        # Let campaign chat search the saved entities right away
+        notify_sources_changed()
+
     def merge_new_knowledge(self, new_knowledge: Dict, session_id: str):
         """Merge newly extracted knowledge into the knowledge base"""
 
@@ -6,7 +6,10 @@ from __future__ import annotations
 import hashlib
 import json
 import logging
+import os
 import re
+import sqlite3
+import threading
 import uuid
 from datetime import datetime
 from pathlib import Path
@@ -18,6 +21,15 @@ logger = logging.getLogger("DDSessionProcessor.conversation_store")
 # Valid conversation ID pattern: conv_[8 hex chars]
 CONVERSATION_ID_PATTERN = re.compile(r'^conv_[0-9a-f]{8}$')
 
+# Per-conversation append-only message log, next to the conversation header JSON
+MESSAGE_LOG_SUFFIX = ".messages.jsonl"
+
+# Summary index used for listing conversations without opening their files
+INDEX_FILE = ".index.sqlite"
+
+# Block size when reading a message log backwards for paging
+LOG_READ_BLOCK_SIZE = 64 * 1024
+
 # Conversation schema for validation
 CONVERSATION_SCHEMA = {
     "required_keys": ["conversation_id", "created_at", "updated_at", "messages", "context"],
@@ -27,7 +39,20 @@ CONVERSATION_SCHEMA = {
 
 
 class ConversationStore:
-    """Save and load conversation history."""
+    """
+    Save and load conversation history.
+
+    Each conversation is a small header file ``conv_<id>.json`` (campaign,
+    timestamps, context) plus an append-only ``conv_<id>.messages.jsonl``
+    log with one message per line, so adding a message is a single append
+    instead of a rewrite of the whole conversation. A SQLite summary index
+    (campaign, timestamps, message count) answers ``list_conversations``
+    without opening any conversation file, and ``load_messages`` pages
+    through history from the newest message backwards.
+
+    Headers written before the message log existed may still carry their
+    messages inline; those are read as the start of the history.
+    """
 
     def __init__(self, conversations_dir: Path):
         """
@@ -43,6 +68,11 @@ class ConversationStore:
         self.locks_dir = self.conversations_dir / ".locks"
         self.locks_dir.mkdir(exist_ok=True)
 
+        self.index_path = self.conversations_dir / INDEX_FILE
+        self._index_lock = threading.Lock()
+        # Opened on first use
+        self._index_conn: Optional[sqlite3.Connection] = None
+
         logger.info(f"Initialized ConversationStore at {self.conversations_dir}")
 
     def _validate_conversation_id(self, conversation_id: str) -> bool:
@@ -121,6 +151,149 @@ class ConversationStore:
         """Get the lock file path for a conversation."""
         return self.locks_dir / f"{conversation_id}.lock"
 
+    def _get_log_path(self, conversation_id: str) -> Path:
+        """Get the message log path for a conversation."""
+        return self.conversations_dir / f"{conversation_id}{MESSAGE_LOG_SUFFIX}"
+
+    def _index_connection(self) -> sqlite3.Connection:
+        """Open (and create if needed) the summary index. Caller must hold _index_lock."""
+        if self._index_conn is None:
+            conn = sqlite3.connect(str(self.index_path), timeout=10, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS conversations (
+                    conversation_id TEXT PRIMARY KEY,
+                    campaign TEXT NOT NULL,
+                    created_at TEXT NOT NULL,
+                    updated_at TEXT NOT NULL,
+                    message_count INTEGER NOT NULL
+                )
+                """
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_conversations_updated ON conversations(updated_at)")
+            conn.commit()
+            self._index_conn = conn
+        return self._index_conn
+
+    def _index_upsert(self, summary: Dict) -> None:
+        with self._index_lock:
+            conn = self._index_connection()
+            conn.execute(
+                "INSERT OR REPLACE INTO conversations "
+                "(conversation_id, campaign, created_at, updated_at, message_count) VALUES (?, ?, ?, ?, ?)",
+                (
+                    summary["conversation_id"],
+                    summary["campaign"],
+                    summary["created_at"],
+                    summary["updated_at"],
+                    summary["message_count"],
+                ),
+            )
+            conn.commit()
+
+    def _index_record_message(self, conversation_id: str, timestamp: str) -> None:
+        with self._index_lock:
+            conn = self._index_connection()
+            conn.execute(
+                "UPDATE conversations SET updated_at = ?, message_count = message_count + 1 "
+                "WHERE conversation_id = ?",
+                (timestamp, conversation_id),
+            )
+            conn.commit()
+
+    def _index_delete(self, conversation_ids: List[str]) -> None:
+        if not conversation_ids:
+            return
+        with self._index_lock:
+            conn = self._index_connection()
+            conn.executemany(
+                "DELETE FROM conversations WHERE conversation_id = ?",
+                [(conversation_id,) for conversation_id in conversation_ids],
+            )
+            conn.commit()
+
+    def close(self) -> None:
+        """Close the summary index connection."""
+        with self._index_lock:
+            if self._index_conn is not None:
+                self._index_conn.close()
+                self._index_conn = None
+
+    def _append_to_log(self, conversation_id: str, message: Dict) -> None:
+        """Append one message as a JSON line. Caller MUST hold the lock!"""
+        line = json.dumps(message, ensure_ascii=False).encode("utf-8") + b"\n"
+        with open(self._get_log_path(conversation_id), "a+b") as f:
+            f.seek(0, os.SEEK_END)
+            size = f.tell()
+            if size:
+                # Terminate a line torn by an interrupted write so it cannot swallow this one
+                f.seek(size - 1)
+                if f.read(1) != b"\n":
+                    line = b"\n" + line
+            f.write(line)
+            f.flush()
+
+    def _parse_log_lines(self, conversation_id: str, lines: List[bytes]) -> List[Dict]:
+        messages = []
+        for raw in lines:
+            if not raw.strip():
+                continue
+            try:
+                messages.append(json.loads(raw))
+            except (json.JSONDecodeError, UnicodeDecodeError) as e:
+                logger.warning(
+                    "Skipping unreadable message in conversation %s: %s", self._redacted_id(conversation_id), e
+                )
+        return messages
+
+    def _read_log(self, conversation_id: str) -> List[Dict]:
+        """All messages in a conversation's log, oldest first."""
+        log_path = self._get_log_path(conversation_id)
+        if not log_path.exists():
+            return []
+        with open(log_path, "rb") as f:
+            return self._parse_log_lines(conversation_id, f.read().split(b"\n"))
+
+    def _read_log_tail(self, conversation_id: str, count: int) -> List[Dict]:
+        """The last ``count`` messages of a conversation's log, reading backwards from the end."""
+        log_path = self._get_log_path(conversation_id)
+        if count <= 0 or not log_path.exists():
+            return []
+
+        with open(log_path, "rb") as f:
+            f.seek(0, os.SEEK_END)
+            position = f.tell()
+            buffer = b""
+            # One extra newline so the oldest collected line is complete
+            while position > 0 and buffer.count(b"\n") <= count + 1:
+                step = min(LOG_READ_BLOCK_SIZE, position)
+                position -= step
+                f.seek(position)
+                buffer = f.read(step) + buffer
+
+        lines = [line for line in buffer.split(b"\n") if line.strip()]
+        if position > 0:
+            # The first line may start before the block we read
+            lines = lines[1:]
+        return self._parse_log_lines(conversation_id, lines[-count:])
+
+    @staticmethod
+    def _merge_log(conversation: Dict, log_messages: List[Dict]) -> Dict:
+        """Fold logged messages into a header: history, updated_at and relevant sessions."""
+        conversation["messages"] = list(conversation.get("messages", [])) + log_messages
+
+        relevant_sessions = conversation["context"]["relevant_sessions"]
+        for message in log_messages:
+            for source in message.get("sources") or []:
+                session_id = source.get("metadata", {}).get("session_id")
+                if session_id and session_id not in relevant_sessions:
+                    relevant_sessions.append(session_id)
+
+        if log_messages and log_messages[-1].get("timestamp", "") > conversation["updated_at"]:
+            conversation["updated_at"] = log_messages[-1]["timestamp"]
+        return conversation
+
     def create_conversation(self, campaign: str = None) -> str:
         """
         Create a new conversation.
@@ -149,6 +322,13 @@ class ConversationStore:
         # though create is unique ID so collision unlikely unless UUID conflict (impossible).
         # We can just save directly as no one else knows this ID yet.
         self._save_conversation_no_lock(conversation_id, conversation)
+        self._index_upsert({
+            "conversation_id": conversation_id,
+            "campaign": conversation["context"]["campaign"],
+            "created_at": timestamp,
+            "updated_at": timestamp,
+            "message_count": 0,
+        })
         logger.info(f"Created new conversation: {conversation_id}")
 
         return conversation_id
@@ -163,6 +343,9 @@ class ConversationStore:
         """
         Add a message to a conversation.
 
+        The message is appended to the conversation's log; the header and
+        earlier messages are not read or rewritten.
+
         Args:
             conversation_id: Conversation ID
             role: Message role ('user' or 'assistant')
@@ -185,10 +368,7 @@ class ConversationStore:
 
         try:
             with lock:
-                # Use internal load to avoid double locking/deadlock
-                conversation = self._load_conversation_internal(conversation_id)
-
-                if conversation is None:
+                if not (self.conversations_dir / f"{conversation_id}.json").exists():
                     raise ValueError(f"Conversation not found: {conversation_id}")
 
                 message_id = f"msg_{uuid.uuid4().hex[:8]}"
@@ -201,19 +381,12 @@ class ConversationStore:
                     "timestamp": timestamp
                 }
 
+                # Relevant sessions are derived from the sources when the conversation is loaded
                 if sources:
                     message["sources"] = sources
 
-                    # Update relevant sessions
-                    for source in sources:
-                        session_id = source.get("metadata", {}).get("session_id")
-                        if session_id and session_id not in conversation["context"]["relevant_sessions"]:
-                            conversation["context"]["relevant_sessions"].append(session_id)
-
-                conversation["messages"].append(message)
-                conversation["updated_at"] = timestamp
-
-                self._save_conversation_no_lock(conversation_id, conversation)
+                self._append_to_log(conversation_id, message)
+                self._index_record_message(conversation_id, timestamp)
                 logger.debug(f"Added {role} message to conversation {conversation_id}")
 
                 return message
@@ -223,7 +396,17 @@ class ConversationStore:
 
     def _load_conversation_internal(self, conversation_id: str) -> Optional[Dict]:
         """
-        Internal method to load conversation without locking.
+        Internal method to load conversation (header plus message log) without locking.
+        Caller must hold the lock if calling this!
+        """
+        conversation = self._load_header_internal(conversation_id)
+        if conversation is None:
+            return None
+        return self._merge_log(conversation, self._read_log(conversation_id))
+
+    def _load_header_internal(self, conversation_id: str) -> Optional[Dict]:
+        """
+        Internal method to load a conversation header without locking.
         Caller must hold the lock if calling this!
         """
         # Validate conversation ID to prevent path traversal
@@ -291,6 +474,48 @@ class ConversationStore:
             logger.error(f"Timeout acquiring lock for loading conversation {conversation_id}")
             return None
 
+    def load_messages(self, conversation_id: str, limit: int = 50, offset: int = 0) -> List[Dict]:
+        """
+        Load one page of a conversation's history without reading all of it.
+
+        Pages are counted from the newest message: ``offset=0`` returns the
+        latest ``limit`` messages, ``offset=limit`` the page before that.
+
+        Args:
+            conversation_id: Conversation ID
+            limit: Maximum number of messages to return
+            offset: Number of newest messages to skip
+
+        Returns:
+            Messages in chronological order (empty if not found)
+        """
+        try:
+            self._validate_conversation_id(conversation_id)
+        except ValueError as e:
+            logger.error(f"Invalid conversation ID in load_messages: {e}")
+            return []
+
+        limit = max(0, int(limit))
+        offset = max(0, int(offset))
+        wanted = offset + limit
+
+        lock = filelock.FileLock(self._get_lock_path(conversation_id), timeout=10)
+        try:
+            with lock:
+                messages = self._read_log_tail(conversation_id, wanted)
+                if len(messages) < wanted:
+                    # The log is exhausted; older messages may be inline in the header
+                    header = self._load_header_internal(conversation_id)
+                    if header is None:
+                        return []
+                    messages = header.get("messages", [])[-(wanted - len(messages)):] + messages
+        except filelock.Timeout:
+            logger.error(f"Timeout acquiring lock for loading messages of {conversation_id}")
+            return []
+
+        end = len(messages) - offset
+        return messages[max(0, end - limit):max(0, end)]
+
     def _quarantine_corrupted_file(self, conversation_file: Path) -> None:
         """Move a corrupted conversation file aside to prevent repeated failures."""
 
@@ -322,37 +547,74 @@ class ConversationStore:
         """
         List all conversations, sorted by most recent.
 
+        Summaries come from the index; only conversation files the index
+        does not know yet (e.g. created before the index existed) are opened,
+        once, to add them.
+
         Args:
             limit: Maximum number of conversations to return
 
         Returns:
             List of conversation metadata dicts
         """
-        conversations = []
+        on_disk = {
+            conv_file.name[:-len(".json")]: conv_file
+            for conv_file in self.conversations_dir.glob("conv_*.json")
+        }
+
+        with self._index_lock:
+            indexed = {
+                row[0] for row in self._index_connection().execute("SELECT conversation_id FROM conversations")
+            }
 
-        # Note: listing does not lock individual files for performance.
+        # Conversation files removed behind the store's back
+        self._index_delete([conversation_id for conversation_id in indexed if conversation_id not in on_disk])
+
+        # Note: indexing does not lock individual files for performance.
         # It handles potential read errors gracefully.
-        for conv_file in self.conversations_dir.glob("conv_*.json"):
+        for conversation_id, conv_file in on_disk.items():
+            if conversation_id in indexed:
+                continue
             try:
                 with open(conv_file, "r", encoding="utf-8") as f:
                     conv = json.load(f)
 
-                # Extract metadata
-                conversations.append({
-                    "conversation_id": conv["conversation_id"],
+                log_messages = []
+                if CONVERSATION_ID_PATTERN.match(conversation_id):
+                    log_messages = self._read_log(conversation_id)
+                updated_at = conv["updated_at"]
+                if log_messages:
+                    updated_at = max(updated_at, log_messages[-1].get("timestamp", ""))
+
+                # Keyed by file name so the file is not re-indexed on every listing
+                self._index_upsert({
+                    "conversation_id": conversation_id,
+                    "campaign": conv.get("context", {}).get("campaign", "Unknown"),
                     "created_at": conv["created_at"],
-                    "updated_at": conv["updated_at"],
-                    "message_count": len(conv.get("messages", [])),
-                    "campaign": conv.get("context", {}).get("campaign", "Unknown")
+                    "updated_at": updated_at,
+                    "message_count": len(conv.get("messages", [])) + len(log_messages),
                 })
             except (json.JSONDecodeError, KeyError, IOError) as e:
                 logger.warning(f"Error loading conversation file {conv_file}: {e}")
                 continue
 
-        # Sort by updated_at descending
-        conversations.sort(key=lambda x: x["updated_at"], reverse=True)
+        with self._index_lock:
+            rows = self._index_connection().execute(
+                "SELECT conversation_id, created_at, updated_at, message_count, campaign "
+                "FROM conversations ORDER BY updated_at DESC LIMIT ?",
+                (max(0, int(limit)),),
+            ).fetchall()
 
-        return conversations[:limit]
+        return [
+            {
+                "conversation_id": conversation_id,
+                "created_at": created_at,
+                "updated_at": updated_at,
+                "message_count": message_count,
+                "campaign": campaign
+            }
+            for conversation_id, created_at, updated_at, message_count, campaign in rows
+        ]
 
     def rename_conversation(self, conversation_id: str, new_campaign_name: str) -> bool:
         """
@@ -386,8 +648,8 @@ class ConversationStore:
 
         try:
             with lock:
-                # Use internal load
-                conversation = self._load_conversation_internal(conversation_id)
+                # Only the header is rewritten; the message log is untouched
+                conversation = self._load_header_internal(conversation_id)
                 if not conversation:
                     logger.warning(f"Cannot rename, conversation not found: {conversation_id}")
                     return False
@@ -397,6 +659,13 @@ class ConversationStore:
                 conversation["updated_at"] = datetime.now().isoformat()
 
                 self._save_conversation_no_lock(conversation_id, conversation)
+                with self._index_lock:
+                    conn = self._index_connection()
+                    conn.execute(
+                        "UPDATE conversations SET campaign = ?, updated_at = ? WHERE conversation_id = ?",
+                        (new_campaign_name, conversation["updated_at"], conversation_id),
+                    )
+                    conn.commit()
                 logger.info(f"Renamed conversation {conversation_id} to '{new_campaign_name}'")
 
             return True
@@ -447,6 +716,10 @@ class ConversationStore:
         try:
             with lock:
                 conversation_file.unlink()
+                log_path = self._get_log_path(conversation_id)
+                if log_path.exists():
+                    log_path.unlink()
+                self._index_delete([conversation_id])
                 logger.info(f"Deleted conversation: {conversation_id}")
 
             # Clean up lock file AFTER releasing the lock
@@ -509,12 +782,13 @@ class ConversationStore:
                     pass
             raise
 
-    def get_chat_history(self, conversation_id: str) -> List[Dict]:
+    def get_chat_history(self, conversation_id: str, limit: Optional[int] = None) -> List[Dict]:
         """
         Get chat history in Gradio chatbot format.
 
         Args:
             conversation_id: Conversation ID
+            limit: Only return the latest ``limit`` messages (default: all)
 
         Returns:
             List of messages in format expected by Gradio Chatbot
@@ -526,11 +800,15 @@ class ConversationStore:
             logger.error(f"Invalid conversation ID in get_chat_history: {e}")
             return []
 
-        # Uses the locking load_conversation now
-        conversation = self.load_conversation(conversation_id)
+        if limit is not None:
+            messages = self.load_messages(conversation_id, limit=limit)
+        else:
+            # Uses the locking load_conversation now
+            conversation = self.load_conversation(conversation_id)
 
-        if conversation is None:
-            return []
+            if conversation is None:
+                return []
+            messages = conversation.get("messages", [])
 
         # Convert to Gradio format (list of dicts with 'role' and 'content')
         return [
@@ -538,5 +816,5 @@ class ConversationStore:
                 "role": msg["role"],
                 "content": msg["content"]
             }
-            for msg in conversation.get("messages", [])
+            for msg in messages
         ]
@@ -57,16 +57,17 @@ class DataIngestor:
                 logger.warning(f"No segments found in {transcript_file}")
                 return {"success": False, "error": "No segments in transcript"}
 
-            # Add to vector store
+            # Add to vector store (only new or changed segments are embedded)
             session_id = session_dir.name
-            self.vector_store.add_transcript_segments(session_id, segments)
+            changes = self.vector_store.add_transcript_segments(session_id, segments)
 
             logger.info(f"Successfully ingested {len(segments)} segments from {session_id}")
 
             return {
                 "success": True,
                 "session_id": session_id,
-                "segments_count": len(segments)
+                "segments_count": len(segments),
+                "changes": changes
             }
 
         except Exception as e:
@@ -133,15 +134,16 @@ class DataIngestor:
                 logger.warning(f"No documents extracted from {kb_file}")
                 return {"success": False, "error": "No documents found"}
 
-            # Add to vector store
-            self.vector_store.add_knowledge_documents(documents)
+            # Add to vector store (only new or changed documents are embedded)
+            changes = self.vector_store.add_knowledge_documents(documents, source=kb_file.name)
 
             logger.info(f"Successfully ingested {len(documents)} documents from {kb_file.name}")
 
             return {
                 "success": True,
                 "source": kb_file.name,
-                "documents_count": len(documents)
+                "documents_count": len(documents),
+                "changes": changes
             }
 
         except Exception as e:
@@ -174,7 +176,10 @@ class DataIngestor:
             "knowledge_bases_ingested": 0,
             "knowledge_bases_failed": 0,
             "total_segments": 0,
-            "total_documents": 0
+            "total_documents": 0,
+            "records_upserted": 0,
+            "records_unchanged": 0,
+            "records_deleted": 0
         }
 
         try:
@@ -196,6 +201,7 @@ class DataIngestor:
                     if result.get("success"):
                         stats["sessions_ingested"] += 1
                         stats["total_segments"] += result.get("segments_count", 0)
+                        self._add_changes(stats, result)
                     else:
                         stats["sessions_failed"] += 1
             else:
@@ -211,6 +217,7 @@ class DataIngestor:
                     if result.get("success"):
                         stats["knowledge_bases_ingested"] += 1
                         stats["total_documents"] += result.get("documents_count", 0)
+                        self._add_changes(stats, result)
                     else:
                         stats["knowledge_bases_failed"] += 1
             else:
@@ -224,6 +231,14 @@ class DataIngestor:
             logger.error(f"Error during bulk ingestion: {e}", exc_info=True)
             return stats
 
+    @staticmethod
+    def _add_changes(stats: Dict, result: Dict) -> None:
+        """Accumulate the vector store's upserted/unchanged/deleted counts."""
+        changes = result.get("changes")
+        if isinstance(changes, dict):
+            for key in ("upserted", "unchanged", "deleted"):
+                stats[f"records_{key}"] += changes.get(key, 0)
+
     def _prepare_segments(self, transcript_data: Dict) -> List[Dict]:
         """Extract and prepare segments from transcript data."""
         segments = []
@@ -234,12 +249,15 @@ class DataIngestor:
             if not text:
                 continue
 
-            segments.append({
+            segment = {
                 "text": text,
                 "speaker": seg.get("speaker", "Unknown"),
                 "start": seg.get("start", 0),
                 "end": seg.get("end", 0)
-            })
+            }
+            if seg.get("classification"):
+                segment["classification"] = seg["classification"]
+            segments.append(segment)
 
         return segments
 
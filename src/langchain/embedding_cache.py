@@ -0,0 +1,188 @@
+"""
+Persistent, content-addressed cache of text embeddings.
+"""
+from __future__ import annotations
+
+import hashlib
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+from src.config import Config
+
+logger = logging.getLogger("DDSessionProcessor.embedding_cache")
+
+
+class EmbeddingCache:
+    """
+    SQLite-backed cache of embedding vectors keyed by model name and text hash.
+
+    Entries are scoped to ``model_name`` so switching embedding models never
+    returns vectors from another model. Vectors are stored as float32 blobs;
+    when the stored size exceeds ``max_bytes`` the least recently used entries
+    are evicted.
+
+    Example:
+        >>> cache = EmbeddingCache(Path("output/_cache/embeddings.sqlite"), "all-MiniLM-L6-v2")
+        >>> cached = cache.get_many(["The dragon attacks"])  # [None] on first use
+        >>> cache.put_many(["The dragon attacks"], [[0.1, 0.2, ...]])
+    """
+
+    # After exceeding max_bytes, evict down to this fraction to avoid evicting on every put
+    EVICTION_TARGET_RATIO = 0.9
+    # SQLite limits the number of bound parameters per statement
+    LOOKUP_CHUNK_SIZE = 500
+
+    def __init__(self, db_path: Path, model_name: str, max_bytes: int = 512 * 1024 * 1024):
+        self.db_path = Path(db_path)
+        self.model_name = model_name
+        self.max_bytes = max(0, int(max_bytes))
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+        # Opened on first use so constructing an EmbeddingService never touches disk
+        self._conn: Optional[sqlite3.Connection] = None
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS embeddings (
+                    model TEXT NOT NULL,
+                    text_hash TEXT NOT NULL,
+                    vector BLOB NOT NULL,
+                    size INTEGER NOT NULL,
+                    last_access REAL NOT NULL,
+                    PRIMARY KEY (model, text_hash)
+                )
+                """
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_embeddings_last_access ON embeddings(last_access)")
+            conn.commit()
+            self._conn = conn
+        return self._conn
+
+    @classmethod
+    def from_config(cls, model_name: str) -> "EmbeddingCache":
+        """Create the cache at Config.EMBEDDING_CACHE_PATH bounded by Config.EMBEDDING_CACHE_MAX_MB."""
+        return cls(
+            Path(Config.EMBEDDING_CACHE_PATH),
+            model_name,
+            max_bytes=int(Config.EMBEDDING_CACHE_MAX_MB * 1024 * 1024),
+        )
+
+    @staticmethod
+    def text_hash(text: str) -> str:
+        return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+    def get_many(self, texts: Sequence[str]) -> List[Optional[np.ndarray]]:
+        """Cached float32 vectors aligned with ``texts`` (None where not cached)."""
+        hashes = [self.text_hash(text) for text in texts]
+        found: Dict[str, bytes] = {}
+        unique = list(dict.fromkeys(hashes))
+        with self._lock:
+            conn = self._connection()
+            for start in range(0, len(unique), self.LOOKUP_CHUNK_SIZE):
+                chunk = unique[start:start + self.LOOKUP_CHUNK_SIZE]
+                placeholders = ",".join("?" * len(chunk))
+                rows = conn.execute(
+                    f"SELECT text_hash, vector FROM embeddings WHERE model = ? AND text_hash IN ({placeholders})",
+                    (self.model_name, *chunk),
+                ).fetchall()
+                found.update(rows)
+            if found:
+                now = time.time()
+                conn.executemany(
+                    "UPDATE embeddings SET last_access = ? WHERE model = ? AND text_hash = ?",
+                    [(now, self.model_name, text_hash) for text_hash in found],
+                )
+                conn.commit()
+            hits = sum(1 for text_hash in hashes if text_hash in found)
+            self.hits += hits
+            self.misses += len(hashes) - hits
+
+        return [
+            np.frombuffer(found[text_hash], dtype=np.float32) if text_hash in found else None
+            for text_hash in hashes
+        ]
+
+    def put_many(self, texts: Sequence[str], vectors: Sequence[Sequence[float]]) -> None:
+        """Store one vector per text and evict old entries if over the size bound."""
+        now = time.time()
+        rows = []
+        for text, vector in zip(texts, vectors):
+            blob = np.asarray(vector, dtype=np.float32).tobytes()
+            rows.append((self.model_name, self.text_hash(text), blob, len(blob), now))
+        if not rows:
+            return
+        with self._lock:
+            conn = self._connection()
+            conn.executemany(
+                "INSERT OR REPLACE INTO embeddings (model, text_hash, vector, size, last_access) "
+                "VALUES (?, ?, ?, ?, ?)",
+                rows,
+            )
+            self._evict_locked()
+            conn.commit()
+
+    def purge(self) -> int:
+        """Delete every cached vector of this model; returns the number of entries removed."""
+        with self._lock:
+            removed = self._connection().execute(
+                "DELETE FROM embeddings WHERE model = ?", (self.model_name,)
+            ).rowcount
+            self._connection().commit()
+        logger.info(f"Purged {removed} cached embeddings for {self.model_name} from {self.db_path}")
+        return removed
+
+    def stats(self) -> Dict:
+        """Hit/miss counters for this instance plus entry count and size for this model."""
+        with self._lock:
+            entries, size = self._connection().execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM embeddings WHERE model = ?",
+                (self.model_name,),
+            ).fetchone()
+            hits, misses = self.hits, self.misses
+        lookups = hits + misses
+        return {
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": hits / lookups if lookups else 0.0,
+            "entries": entries,
+            "size_bytes": size,
+        }
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def _evict_locked(self) -> None:
+        if not self.max_bytes:
+            return
+        conn = self._connection()
+        total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM embeddings").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+
+        target = int(self.max_bytes * self.EVICTION_TARGET_RATIO)
+        evicted = []
+        for model, text_hash, size in conn.execute(
+            "SELECT model, text_hash, size FROM embeddings ORDER BY last_access ASC"
+        ).fetchall():
+            if total <= target:
+                break
+            evicted.append((model, text_hash))
+            total -= size
+        conn.executemany("DELETE FROM embeddings WHERE model = ? AND text_hash = ?", evicted)
+        logger.debug(f"Evicted {len(evicted)} cached embeddings (cache now {total} bytes)")
@@ -4,15 +4,92 @@ Embedding service for generating text embeddings.
 from __future__ import annotations
 
 import logging
-from typing import List
+import queue
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Callable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from src.config import Config
+from src.langchain.embedding_cache import EmbeddingCache
 
 logger = logging.getLogger("DDSessionProcessor.embeddings")
 
+# Upper bound on the single-text requests coalesced into one model.encode call
+MAX_COALESCED_QUERIES = 64
+
+
+class _QueryBatcher:
+    """
+    Coalesces concurrent single-text embedding requests into batched calls.
+
+    A daemon worker drains every request queued while the previous batch was
+    being encoded, so a lone request is encoded immediately and concurrent
+    requests (UI, MCP server) share one ``encode`` call instead of queueing
+    behind each other.
+    """
+
+    def __init__(self, encode: Callable[[List[str]], np.ndarray], max_batch: int = MAX_COALESCED_QUERIES):
+        self._encode = encode
+        self.max_batch = max(1, int(max_batch))
+        self.batches = 0
+        self._queue: "queue.Queue[Tuple[str, Future]]" = queue.Queue()
+        self._worker: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def submit(self, text: str) -> Future:
+        """Queue ``text``; the future resolves to its embedding vector."""
+        future: Future = Future()
+        with self._lock:
+            if self._worker is None:
+                self._worker = threading.Thread(target=self._run, name="embedding-batcher", daemon=True)
+                self._worker.start()
+        self._queue.put((text, future))
+        return future
+
+    def _run(self) -> None:
+        while True:
+            requests = [self._queue.get()]
+            while len(requests) < self.max_batch:
+                try:
+                    requests.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            texts = list(dict.fromkeys(text for text, _ in requests))
+            try:
+                vectors = dict(zip(texts, self._encode(texts)))
+            except Exception as e:
+                for _, future in requests:
+                    future.set_exception(e)
+                continue
+
+            self.batches += 1
+            if len(requests) > 1:
+                logger.debug(f"Coalesced {len(requests)} embedding requests into one batch of {len(texts)}")
+            for text, future in requests:
+                future.set_result(vectors[text])
 
-class EmbeddingService:
-    """Generate embeddings for text using sentence-transformers."""
 
-    def __init__(self, model_name: str = "all-MiniLM-L6-v2"):
+class EmbeddingService:
+    """
+    Generate embeddings for text using sentence-transformers.
+
+    Embeddings are returned as float32 NumPy arrays. Single texts (search
+    queries) go through an in-memory LRU cache of ``query_cache_size``
+    entries and are micro-batched with concurrent ``embed`` calls. With
+    ``use_cache`` enabled, vectors are looked up in an on-disk EmbeddingCache
+    first and only texts the model has not embedded before are encoded.
+    """
+
+    def __init__(
+        self,
+        model_name: str = "all-MiniLM-L6-v2",
+        use_cache: bool = False,
+        query_cache_size: Optional[int] = None,
+    ):
         """
         Initialize the embedding service.
 
@@ -21,8 +98,20 @@ class EmbeddingService:
                        Options:
                        - 'all-MiniLM-L6-v2' (384 dim, fast, good quality) - DEFAULT
                        - 'all-mpnet-base-v2' (768 dim, slower, better quality)
+            use_cache: Reuse embeddings from the cache at Config.EMBEDDING_CACHE_PATH
+            query_cache_size: Query embeddings kept in memory
+                              (default: Config.EMBEDDING_QUERY_CACHE_SIZE, 0 disables)
         """
         self.model_name = model_name
+        self.cache: Optional[EmbeddingCache] = EmbeddingCache.from_config(model_name) if use_cache else None
+        self.query_cache_size = max(
+            0, int(Config.EMBEDDING_QUERY_CACHE_SIZE if query_cache_size is None else query_cache_size)
+        )
+        self.query_cache_hits = 0
+        self.query_cache_misses = 0
+        self._query_cache: "OrderedDict[str, np.ndarray]" = OrderedDict()
+        self._query_cache_lock = threading.Lock()
+        self._batcher = _QueryBatcher(lambda texts: self._embed_texts(texts, batch_size=len(texts)))
 
         try:
             from sentence_transformers import SentenceTransformer
@@ -38,7 +127,7 @@ class EmbeddingService:
                 "Run: pip install sentence-transformers"
             ) from e
 
-    def embed(self, text: str) -> List[float]:
+    def embed(self, text: str) -> np.ndarray:
         """
         Generate embedding for a single text.
 
@@ -46,17 +135,34 @@ class EmbeddingService:
             text: Input text
 
         Returns:
-            Embedding vector as list of floats
+            Read-only float32 embedding vector (shared with the query cache)
         """
         try:
-            embedding = self.model.encode(text, convert_to_numpy=True)
-            return embedding.tolist()
+            # Whitespace differences do not change the tokenization
+            key = " ".join(text.split())
+            with self._query_cache_lock:
+                cached = self._query_cache.get(key)
+                if cached is not None:
+                    self._query_cache.move_to_end(key)
+                    self.query_cache_hits += 1
+                    return cached
+                self.query_cache_misses += 1
+
+            embedding = self._batcher.submit(key).result()
+            embedding.flags.writeable = False
+            if self.query_cache_size:
+                with self._query_cache_lock:
+                    self._query_cache[key] = embedding
+                    self._query_cache.move_to_end(key)
+                    while len(self._query_cache) > self.query_cache_size:
+                        self._query_cache.popitem(last=False)
+            return embedding
 
         except Exception as e:
             logger.error(f"Error generating embedding: {e}", exc_info=True)
             raise
 
-    def embed_batch(self, texts: List[str], batch_size: int = 32) -> List[List[float]]:
+    def embed_batch(self, texts: Sequence[str], batch_size: int = 32) -> np.ndarray:
         """
         Generate embeddings for multiple texts.
 
@@ -65,21 +171,49 @@ class EmbeddingService:
             batch_size: Batch size for encoding (default: 32)
 
         Returns:
-            List of embedding vectors
+            float32 array of shape (len(texts), dimension)
         """
         try:
-            embeddings = self.model.encode(
-                texts,
-                batch_size=batch_size,
-                show_progress_bar=len(texts) > 100,
-                convert_to_numpy=True
-            )
-            return embeddings.tolist()
+            return self._embed_texts(list(texts), batch_size)
 
         except Exception as e:
             logger.error(f"Error generating batch embeddings: {e}", exc_info=True)
             raise
 
+    def clear_query_cache(self) -> None:
+        with self._query_cache_lock:
+            self._query_cache.clear()
+
+    def _embed_texts(self, texts: List[str], batch_size: int) -> np.ndarray:
+        if not texts:
+            return np.empty((0, self.get_embedding_dimension()), dtype=np.float32)
+        if self.cache is None:
+            return self._encode(texts, batch_size)
+
+        embeddings = self.cache.get_many(texts)
+        missing = list(dict.fromkeys(
+            text for text, embedding in zip(texts, embeddings) if embedding is None
+        ))
+        if not missing:
+            return np.stack(embeddings)
+
+        computed = dict(zip(missing, self._encode(missing, batch_size)))
+        self.cache.put_many(missing, [computed[text] for text in missing])
+        logger.debug(f"Embedded {len(texts)} texts ({len(missing)} not cached)")
+        return np.stack([
+            computed[text] if embedding is None else embedding
+            for text, embedding in zip(texts, embeddings)
+        ])
+
+    def _encode(self, texts: List[str], batch_size: int) -> np.ndarray:
+        embeddings = self.model.encode(
+            texts,
+            batch_size=batch_size,
+            show_progress_bar=len(texts) > 100,
+            convert_to_numpy=True
+        )
+        return np.asarray(embeddings, dtype=np.float32).reshape(len(texts), -1)
+
     def get_embedding_dimension(self) -> int:
         """Get the dimension of the embedding vectors."""
         return self.model.get_sentence_embedding_dimension()
@@ -4,24 +4,55 @@ Hybrid search combining keyword and semantic search.
 from __future__ import annotations
 
 import logging
-from typing import List, Dict, Tuple
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, List, Dict, Optional, Tuple
 
 logger = logging.getLogger("DDSessionProcessor.hybrid_search")
 
+# Result cache settings
+RESULT_CACHE_SIZE = 256  # Maximum number of cached queries
+RESULT_CACHE_TTL = 300  # Time-to-live in seconds (5 minutes)
+
 
 class HybridSearcher:
-    """Combine keyword and semantic search for optimal results."""
+    """
+    Combine keyword and semantic search for optimal results.
+
+    The semantic and keyword backends run concurrently and their results are
+    fused with Reciprocal Rank Fusion. Fused results are cached per normalized
+    query, ``top_k`` and weight for ``cache_ttl`` seconds; the cache is also
+    invalidated as soon as the vector store's ``generation`` changes (i.e.
+    after ingestion), so new data is never hidden behind a cached answer.
+    """
 
-    def __init__(self, vector_store, keyword_retriever):
+    def __init__(
+        self,
+        vector_store,
+        keyword_retriever,
+        cache_size: int = RESULT_CACHE_SIZE,
+        cache_ttl: float = RESULT_CACHE_TTL
+    ):
         """
         Initialize hybrid searcher.
 
         Args:
             vector_store: CampaignVectorStore for semantic search
             keyword_retriever: CampaignRetriever for keyword search
+            cache_size: Maximum number of cached queries (0 disables caching)
+            cache_ttl: Seconds a cached result stays valid
         """
         self.vector_store = vector_store
         self.keyword_retriever = keyword_retriever
+        self.cache_size = max(0, int(cache_size))
+        self.cache_ttl = cache_ttl
+
+        # key -> (results, cached_at, vector store generation)
+        self._result_cache: "OrderedDict[Tuple, Tuple[List[Dict], float, Any]]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="hybrid_search")
 
     def search(
         self,
@@ -41,39 +72,144 @@ class HybridSearcher:
         Returns:
             List of search results
         """
-        semantic_results: List[Dict] = []
-        keyword_results: List[Dict] = []
+        results, _ = self.search_with_timings(query, top_k=top_k, semantic_weight=semantic_weight)
+        return results
+
+    def search_with_timings(
+        self,
+        query: str,
+        top_k: int = 5,
+        semantic_weight: float = 0.7
+    ) -> Tuple[List[Dict], Dict[str, Any]]:
+        """
+        Hybrid search that also reports where the time went.
+
+        Args:
+            query: Search query
+            top_k: Number of results to return
+            semantic_weight: Weight for semantic results (0-1)
+
+        Returns:
+            Tuple of (results, timings). Timings holds ``embed_ms``,
+            ``vector_ms``, ``keyword_ms``, ``fusion_ms`` and ``total_ms``
+            (milliseconds) plus ``cache_hit``. Semantic and keyword search
+            overlap, so the parts can add up to more than the total.
+        """
+        started = time.perf_counter()
+        timings: Dict[str, Any] = {
+            "embed_ms": 0.0,
+            "vector_ms": 0.0,
+            "keyword_ms": 0.0,
+            "fusion_ms": 0.0,
+            "total_ms": 0.0,
+            "cache_hit": False,
+        }
+
+        cache_key = self._cache_key(query, top_k, semantic_weight)
+        cached = self._get_cached(cache_key)
+        if cached is not None:
+            timings["cache_hit"] = True
+            timings["total_ms"] = (time.perf_counter() - started) * 1000
+            return cached, timings
+
+        semantic_future = self._executor.submit(self._semantic_results, query, top_k * 2, timings)
+        keyword_future = self._executor.submit(self._timed_keyword_results, query, top_k * 2, timings)
+        semantic_results = semantic_future.result()
+        keyword_results = keyword_future.result()
+
+        if not semantic_results and not keyword_results:
+            logger.error("Hybrid search failed: both semantic and keyword backends returned no results")
+            timings["total_ms"] = (time.perf_counter() - started) * 1000
+            return [], timings
 
+        fusion_started = time.perf_counter()
+        merged = self._reciprocal_rank_fusion(
+            semantic_results,
+            keyword_results,
+            weights=(semantic_weight, 1 - semantic_weight)
+        )[:top_k]
+        timings["fusion_ms"] = (time.perf_counter() - fusion_started) * 1000
+
+        self._put_cached(cache_key, merged)
+        timings["total_ms"] = (time.perf_counter() - started) * 1000
+        logger.debug(
+            "Hybrid search timings: embed=%.1fms vector=%.1fms keyword=%.1fms fusion=%.1fms total=%.1fms",
+            timings["embed_ms"], timings["vector_ms"], timings["keyword_ms"],
+            timings["fusion_ms"], timings["total_ms"]
+        )
+        return list(merged), timings
+
+    def clear_cache(self) -> None:
+        """Drop all cached search results."""
+        with self._cache_lock:
+            self._result_cache.clear()
+
+    def close(self) -> None:
+        """Shut down the worker threads."""
+        self._executor.shutdown(wait=True)
+
+    def _semantic_results(self, query: str, top_k: int, timings: Dict[str, Any]) -> List[Dict]:
+        vector_timings: Dict[str, float] = {}
         try:
-            semantic_results = self.vector_store.search(query, top_k=top_k * 2)
-        except Exception as exc:
+            results = self.vector_store.search(query, top_k=top_k, timings=vector_timings)
+        except Exception:
             logger.error("Semantic search failed during hybrid search", exc_info=True)
+            results = []
+        timings["embed_ms"] = vector_timings.get("embed_ms", 0.0)
+        timings["vector_ms"] = vector_timings.get("vector_ms", 0.0)
+        return results
+
+    def _timed_keyword_results(self, query: str, top_k: int, timings: Dict[str, Any]) -> List[Dict]:
+        started = time.perf_counter()
+        results = self._keyword_results(query, top_k)
+        timings["keyword_ms"] = (time.perf_counter() - started) * 1000
+        return results
+
+    def _cache_key(self, query: str, top_k: int, semantic_weight: float) -> Tuple:
+        normalized = " ".join(query.lower().split())
+        return (normalized, int(top_k), round(float(semantic_weight), 6))
+
+    def _get_cached(self, key: Tuple) -> Optional[List[Dict]]:
+        if not self.cache_size:
+            return None
+        generation = getattr(self.vector_store, "generation", None)
+        with self._cache_lock:
+            entry = self._result_cache.get(key)
+            if entry is None:
+                return None
+            results, cached_at, cached_generation = entry
+            if time.time() - cached_at >= self.cache_ttl or cached_generation != generation:
+                # Expired, or the vector store was re-ingested since
+                del self._result_cache[key]
+                return None
+            self._result_cache.move_to_end(key)
+            return list(results)
 
+    def _put_cached(self, key: Tuple, results: List[Dict]) -> None:
+        if not self.cache_size:
+            return
+        generation = getattr(self.vector_store, "generation", None)
+        with self._cache_lock:
+            self._result_cache[key] = (list(results), time.time(), generation)
+            self._result_cache.move_to_end(key)
+            while len(self._result_cache) > self.cache_size:
+                self._result_cache.popitem(last=False)
+
+    def _keyword_results(self, query: str, top_k: int) -> List[Dict]:
+        """Keyword retrieval results in vector-store result format."""
         try:
-            keyword_results_docs = self.keyword_retriever.retrieve(query, top_k=top_k * 2)
-            keyword_results = [
+            return [
                 {
                     "text": doc.page_content,
                     "metadata": doc.metadata,
                     "distance": 0.5
                 }
-                for doc in keyword_results_docs
+                for doc in self.keyword_retriever.retrieve(query, top_k=top_k)
             ]
-        except Exception as exc:
+        except Exception:
             logger.error("Keyword retrieval failed during hybrid search", exc_info=True)
-
-        if not semantic_results and not keyword_results:
-            logger.error("Hybrid search failed: both semantic and keyword backends returned no results")
             return []
 
-        merged = self._reciprocal_rank_fusion(
-            semantic_results,
-            keyword_results,
-            weights=(semantic_weight, 1 - semantic_weight)
-        )
-
-        return merged[:top_k]
-
     def _reciprocal_rank_fusion(
         self,
         results_a: List[Dict],
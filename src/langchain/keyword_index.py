@@ -0,0 +1,473 @@
+"""
+Persistent keyword index over campaign knowledge bases and transcripts.
+"""
+from __future__ import annotations
+
+import json
+import logging
+import os
+import threading
+import time
+import weakref
+from bisect import bisect_right
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from src.inverted_index import InvertedIndex, tokenize
+
+logger = logging.getLogger("DDSessionProcessor.keyword_index")
+
+# Bump when the manifest layout or the indexed text changes; older caches are rebuilt
+KEYWORD_INDEX_VERSION = 2
+
+KB_CATEGORIES = ("npcs", "quests", "locations", "items")
+TRANSCRIPT_FILE = "diarized_transcript.json"
+
+# Query words shorter than this only match whole words (no prefix expansion)
+MIN_PREFIX_LENGTH = 3
+# Rebuild instead of appending once this fraction of indexed documents is stale
+COMPACT_STALE_RATIO = 0.3
+# Parsed transcripts kept in memory for turning hits into results
+TRANSCRIPT_CACHE_SIZE = 8
+# Sources on disk are re-scanned at most this often (seconds) unless a refresh is
+# forced or notify_sources_changed() was called; only catches writes by other processes
+REFRESH_INTERVAL_SECONDS = 30.0
+# Saved updates appended after the base index file before it is rewritten whole
+MAX_INDEX_TAIL_FILES = 8
+
+
+@dataclass
+class KeywordHit:
+    """One keyword search result: a knowledge base entity or a transcript segment."""
+
+    score: float
+    kind: str  # "kb" or "transcript"
+    source: Path  # knowledge base file or transcript file
+    item: Dict[str, Any]  # entity or segment dict
+    category: Optional[str] = None  # knowledge base category ("npcs", ...)
+
+
+def _kb_entities(data: Dict) -> Iterator[Tuple[str, Dict]]:
+    """Entities of a knowledge base in indexing order."""
+    for category in KB_CATEGORIES:
+        for entity in data.get(category, []) or []:
+            if isinstance(entity, dict):
+                yield category, entity
+
+
+def _string_values(value: Any) -> Iterator[str]:
+    """Every scalar value nested in an entity, so all fields are searchable."""
+    if isinstance(value, dict):
+        for nested in value.values():
+            yield from _string_values(nested)
+    elif isinstance(value, (list, tuple)):
+        for nested in value:
+            yield from _string_values(nested)
+    elif value is not None:
+        yield str(value)
+
+
+def _read_json(path: Path) -> Dict:
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+# Keyword indexes alive in this process, so writers can invalidate them
+_live_indexes: "weakref.WeakSet[CampaignKeywordIndex]" = weakref.WeakSet()
+_live_indexes_lock = threading.Lock()
+
+
+def notify_sources_changed() -> None:
+    """
+    Make every keyword index in this process rescan its sources on the next
+    refresh instead of waiting for ``REFRESH_INTERVAL_SECONDS`` to pass.
+
+    Called after a session transcript is written or a knowledge base is saved.
+    """
+    with _live_indexes_lock:
+        indexes = list(_live_indexes)
+    for index in indexes:
+        index.mark_stale()
+
+
+class CampaignKeywordIndex:
+    """
+    Keyword index over ``*_knowledge.json`` files and session transcripts.
+
+    Every knowledge base entity and transcript segment is one document in an
+    InvertedIndex. Sources are fingerprinted by modification time and size;
+    ``refresh`` appends new or changed sources and removes the documents of
+    changed or removed ones from the index, rebuilding only when more than
+    ``COMPACT_STALE_RATIO`` of the index is stale. Sources are re-scanned at
+    most every ``refresh_interval`` seconds, or on the next refresh after
+    ``notify_sources_changed`` (the pipeline and knowledge base saves call
+    it). The index and a manifest of
+    sources are saved under ``cache_dir`` so a new process starts from the
+    saved index instead of re-reading every file; an update only writes the
+    documents it added (and the removed ids) to a tail file next to the base
+    index, which is rewritten whole after ``MAX_INDEX_TAIL_FILES`` updates.
+
+    Documents store no text of their own: a hit is resolved by re-reading
+    the source file, through ``kb_loader`` for knowledge bases and a small
+    LRU cache for transcripts. A hit whose file no longer matches its
+    fingerprint is dropped and the next refresh rescans.
+
+    Query words match indexed words they are a prefix of ("wiz" finds
+    "wizard"); every query word must match for a document to be returned.
+    Results are ranked by BM25.
+    """
+
+    def __init__(
+        self,
+        kb_dir: Path,
+        transcript_dir: Path,
+        cache_dir: Optional[Path] = None,
+        kb_loader: Optional[Callable[[Path], Dict]] = None,
+        refresh_interval: Optional[float] = None,
+    ):
+        """
+        Args:
+            kb_dir: Directory containing ``*_knowledge.json`` files
+            transcript_dir: Directory of session folders with ``diarized_transcript.json``
+            cache_dir: Where the index is persisted (defaults to transcript_dir/.cache/keyword_index)
+            kb_loader: Reads a knowledge base file when resolving hits (defaults to json.load)
+            refresh_interval: Minimum seconds between scans of the source files
+                (defaults to ``REFRESH_INTERVAL_SECONDS``)
+        """
+        self.kb_dir = Path(kb_dir)
+        self.transcript_dir = Path(transcript_dir)
+        self.cache_dir = Path(cache_dir) if cache_dir else self.transcript_dir / ".cache" / "keyword_index"
+        self.index_file = self.cache_dir / "index.npz"
+        self.manifest_file = self.cache_dir / "manifest.json"
+        self._kb_loader = kb_loader or _read_json
+        self.refresh_interval = REFRESH_INTERVAL_SECONDS if refresh_interval is None else refresh_interval
+
+        self._index: Optional[InvertedIndex] = None
+        self._last_refresh: Optional[float] = None
+        # Index files making up the saved index (base first) and the documents they hold
+        self._saved_files: List[str] = []
+        self._saved_docs = 0
+        # source key -> {kind, path, fingerprint, start, count}
+        self._sources: Dict[str, Dict[str, Any]] = {}
+        self._live: Optional[np.ndarray] = None
+        self._kind_masks: Dict[str, np.ndarray] = {}
+        self._source_starts: List[int] = []
+        self._source_keys: List[str] = []
+        self._transcripts: "OrderedDict[str, List[Dict]]" = OrderedDict()
+        self._lock = threading.RLock()
+        with _live_indexes_lock:
+            _live_indexes.add(self)
+
+    def __len__(self) -> int:
+        """Number of live (searchable) documents."""
+        with self._lock:
+            return int(self._live.sum()) if self._live is not None else 0
+
+    def refresh(self, force: bool = False) -> List[Path]:
+        """
+        Bring the index up to date with the files on disk.
+
+        Args:
+            force: Scan even if the last scan was less than ``refresh_interval`` ago
+
+        Returns:
+            Source files that were added, changed or removed since the last refresh
+        """
+        with self._lock:
+            now = time.monotonic()
+            if self._index is None:
+                self._load()
+            elif (
+                not force
+                and self._last_refresh is not None
+                and now - self._last_refresh < self.refresh_interval
+            ):
+                return []
+            self._last_refresh = now
+
+            current = self._scan()
+            stale = [
+                key for key, entry in self._sources.items()
+                if key not in current or current[key][2] != entry["fingerprint"]
+            ]
+            pending = sorted(
+                key for key, (_, _, fingerprint) in current.items()
+                if key not in self._sources or self._sources[key]["fingerprint"] != fingerprint
+            )
+            if not stale and not pending:
+                return []
+
+            touched = [Path(self._sources[key]["path"]) for key in stale]
+            touched += [current[key][1] for key in pending if key not in self._sources]
+            for key in stale:
+                entry = self._sources.pop(key)
+                self._index.remove(range(entry["start"], entry["start"] + entry["count"]))
+                self._transcripts.pop(key, None)
+
+            indexed = len(self._index)
+            stale_docs = indexed - self._index.live_count
+            rebuild = bool(indexed) and stale_docs / indexed > COMPACT_STALE_RATIO
+            if rebuild:
+                logger.info(f"Rebuilding keyword index ({stale_docs}/{indexed} documents stale)")
+                self._index = InvertedIndex()
+                self._sources = {}
+                pending = sorted(current)
+
+            for key in pending:
+                kind, path, fingerprint = current[key]
+                self._add_source(key, kind, path, fingerprint)
+
+            self._rebuild_masks()
+            self._save(full=rebuild)
+            logger.info(
+                f"Keyword index updated: {len(pending)} source(s) indexed, "
+                f"{len(stale)} stale, {len(self)} documents searchable"
+            )
+            return touched
+
+    def search(self, query: str, kind: Optional[str] = None, top_k: int = 5) -> List[KeywordHit]:
+        """
+        Find the ``top_k`` best documents containing every word of ``query``.
+
+        Args:
+            query: Free-text query
+            kind: Restrict to "kb" or "transcript" documents
+            top_k: Maximum number of hits
+
+        Returns:
+            Hits ordered by descending BM25 score
+        """
+        with self._lock:
+            if self._index is None or self._live is None or top_k <= 0:
+                return []
+            mask = self._live if kind is None else self._kind_masks.get(kind)
+            if mask is None:
+                return []
+
+            doc_ids: Optional[np.ndarray] = None
+            scores: Optional[np.ndarray] = None
+            for word in dict.fromkeys(tokenize(query)):
+                terms = self._index.terms_with_prefix(word) if len(word) >= MIN_PREFIX_LENGTH else [word]
+                word_ids, word_scores = self._index.bm25(terms, mask=mask, require_all=False)
+                if doc_ids is None:
+                    doc_ids, scores = word_ids, word_scores
+                else:
+                    doc_ids, left, right = np.intersect1d(
+                        doc_ids, word_ids, assume_unique=True, return_indices=True
+                    )
+                    scores = scores[left] + word_scores[right]
+                if not len(doc_ids):
+                    return []
+            if doc_ids is None:
+                return []
+
+            order = np.argsort(-scores, kind="stable")[:top_k]
+            hits = []
+            for position in order:
+                hit = self._resolve(int(doc_ids[position]), float(scores[position]))
+                if hit is not None:
+                    hits.append(hit)
+            return hits
+
+    def mark_stale(self) -> None:
+        """Rescan the sources on the next refresh, even within ``refresh_interval``."""
+        with self._lock:
+            self._last_refresh = None
+
+    def reset(self) -> None:
+        """Forget the in-memory index; the next refresh reloads it from disk."""
+        with self._lock:
+            self._index = None
+            self._sources = {}
+            self._live = None
+            self._kind_masks = {}
+            self._transcripts.clear()
+            self._last_refresh = None
+
+    # ------------------------------------------------------------------
+    # Indexing
+    # ------------------------------------------------------------------
+
+    def _scan(self) -> Dict[str, Tuple[str, Path, List[int]]]:
+        """Current sources on disk: key -> (kind, path, fingerprint)."""
+        sources: Dict[str, Tuple[str, Path, List[int]]] = {}
+        if self.kb_dir.exists():
+            for kb_file in self.kb_dir.glob("*_knowledge.json"):
+                fingerprint = self._fingerprint(kb_file)
+                if fingerprint is not None:
+                    sources[f"kb/{kb_file.name}"] = ("kb", kb_file, fingerprint)
+        if self.transcript_dir.exists():
+            for session_dir in self.transcript_dir.iterdir():
+                if not session_dir.is_dir():
+                    continue
+                transcript_file = session_dir / TRANSCRIPT_FILE
+                fingerprint = self._fingerprint(transcript_file)
+                if fingerprint is not None:
+                    sources[f"transcript/{session_dir.name}"] = ("transcript", transcript_file, fingerprint)
+        return sources
+
+    @staticmethod
+    def _fingerprint(path: Path) -> Optional[List[int]]:
+        try:
+            stat = path.stat()
+        except OSError:
+            return None
+        return [stat.st_mtime_ns, stat.st_size]
+
+    def _add_source(self, key: str, kind: str, path: Path, fingerprint: List[int]) -> None:
+        start = len(self._index)
+        try:
+            data = _read_json(path)
+            if kind == "kb":
+                for _, entity in _kb_entities(data):
+                    self._index.add(" ".join(_string_values(entity)), {"kind": kind})
+            else:
+                for segment in data.get("segments", []):
+                    self._index.add(str(segment.get("text", "")), {"kind": kind})
+        except (OSError, ValueError, AttributeError) as e:
+            # Recorded with whatever was indexed so it is retried only once the file changes
+            logger.warning(f"Error indexing {path}: {e}")
+
+        self._sources[key] = {
+            "kind": kind,
+            "path": str(path),
+            "fingerprint": fingerprint,
+            "start": start,
+            "count": len(self._index) - start,
+        }
+
+    def _rebuild_masks(self) -> None:
+        total = len(self._index)
+        self._live = np.zeros(total, dtype=bool)
+        self._kind_masks = {kind: np.zeros(total, dtype=bool) for kind in ("kb", "transcript")}
+        for entry in self._sources.values():
+            span = slice(entry["start"], entry["start"] + entry["count"])
+            self._live[span] = True
+            self._kind_masks[entry["kind"]][span] = True
+
+        ordered = sorted(self._sources.items(), key=lambda item: item[1]["start"])
+        self._source_starts = [entry["start"] for _, entry in ordered]
+        self._source_keys = [key for key, _ in ordered]
+
+    # ------------------------------------------------------------------
+    # Resolving hits
+    # ------------------------------------------------------------------
+
+    def _resolve(self, doc_id: int, score: float) -> Optional[KeywordHit]:
+        position = bisect_right(self._source_starts, doc_id) - 1
+        if position < 0:
+            return None
+        key = self._source_keys[position]
+        entry = self._sources[key]
+        ordinal = doc_id - entry["start"]
+        path = Path(entry["path"])
+        if self._fingerprint(path) != entry["fingerprint"]:
+            # Changed since it was indexed: positions no longer line up
+            logger.debug(f"Skipping keyword hit in changed file {path}")
+            self._last_refresh = None
+            return None
+        try:
+            if entry["kind"] == "kb":
+                category, entity = list(_kb_entities(self._kb_loader(path)))[ordinal]
+                return KeywordHit(score, "kb", path, entity, category)
+            return KeywordHit(score, "transcript", path, self._transcript_segments(key, path)[ordinal])
+        except (OSError, ValueError, IndexError) as e:
+            # The file changed after the last refresh; it is reindexed on the next one
+            logger.debug(f"Could not resolve keyword hit in {path}: {e}")
+            return None
+
+    def _transcript_segments(self, key: str, path: Path) -> List[Dict]:
+        segments = self._transcripts.get(key)
+        if segments is None:
+            segments = _read_json(path).get("segments", [])
+            self._transcripts[key] = segments
+            if len(self._transcripts) > TRANSCRIPT_CACHE_SIZE:
+                self._transcripts.popitem(last=False)
+        else:
+            self._transcripts.move_to_end(key)
+        return segments
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+
+    def _load(self) -> None:
+        """Start from the saved index if it is compatible, else from an empty one."""
+        self._index = InvertedIndex()
+        self._sources = {}
+        self._saved_files = []
+        self._saved_docs = 0
+        if not self.manifest_file.exists() or not self.index_file.exists():
+            return
+        try:
+            manifest = _read_json(self.manifest_file)
+            if manifest.get("version") != KEYWORD_INDEX_VERSION:
+                logger.info("Keyword index format changed, rebuilding")
+                return
+            files = manifest["files"]
+            index = InvertedIndex.load(self.cache_dir / files[0])
+            for name in files[1:]:
+                index.load_tail(self.cache_dir / name)
+            if len(index) != manifest.get("doc_count"):
+                logger.warning("Keyword index does not match its manifest, rebuilding")
+                return
+        except (OSError, ValueError, KeyError, IndexError) as e:
+            logger.warning(f"Failed to load keyword index: {e}")
+            return
+        self._index = index
+        self._sources = manifest.get("sources", {})
+        self._saved_files = list(files)
+        self._saved_docs = len(index)
+        self._rebuild_masks()
+        logger.debug(f"Loaded keyword index with {len(index)} documents from {self.cache_dir}")
+
+    def _save(self, full: bool = False) -> None:
+        """
+        Persist the index: the documents added since the last save go to a new
+        tail file, or the whole index is rewritten as the base file if ``full``,
+        nothing was saved yet, or there are ``MAX_INDEX_TAIL_FILES`` tails.
+        """
+        # Only persist next to real transcripts; never create the output tree
+        if not self.transcript_dir.exists():
+            return
+        full = full or not self._saved_files or len(self._saved_files) > MAX_INDEX_TAIL_FILES
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            if full:
+                target, first_doc = self.index_file, 0
+                files = [self.index_file.name]
+            else:
+                target = self.cache_dir / f"{self.index_file.stem}.{len(self._saved_files)}.npz"
+                first_doc = self._saved_docs
+                files = self._saved_files + [target.name]
+            tmp_index = target.with_name(target.name + ".tmp")
+            self._index.save(tmp_index, first_doc=first_doc)
+            os.replace(tmp_index, target)
+
+            manifest = {
+                "version": KEYWORD_INDEX_VERSION,
+                "doc_count": len(self._index),
+                "files": files,
+                "sources": self._sources,
+            }
+            tmp_manifest = self.manifest_file.with_suffix(".json.tmp")
+            with open(tmp_manifest, "w", encoding="utf-8") as f:
+                json.dump(manifest, f)
+            os.replace(tmp_manifest, self.manifest_file)
+        except OSError as e:
+            logger.warning(f"Failed to save keyword index: {e}")
+            return
+
+        if full:
+            # Tails of the previous base are no longer referenced
+            for stale_tail in self.cache_dir.glob(f"{self.index_file.stem}.*.npz"):
+                try:
+                    stale_tail.unlink()
+                except OSError:
+                    pass
+        self._saved_files = files
+        self._saved_docs = len(self._index)
@@ -0,0 +1,778 @@
+"""
+Embedded vector index: quantized, memory-mapped NumPy segments with optional IVF.
+
+``NumpyVectorClient`` and ``NumpyCollection`` implement the subset of the
+ChromaDB client/collection API that ``CampaignVectorStore`` uses (``get``,
+``upsert``, ``delete``, ``query``, ``count`` and collection management), so
+the store can run without ChromaDB.
+"""
+from __future__ import annotations
+
+import json
+import logging
+import math
+import os
+import shutil
+import threading
+import uuid
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+logger = logging.getLogger("DDSessionProcessor.numpy_vector_index")
+
+MANIFEST_FILE = "manifest.json"
+MANIFEST_VERSION = 1
+
+QUANTIZATIONS = ("int8", "float16")
+# Each int8 row is scaled so its largest component maps to this value
+INT8_MAX = 127.0
+
+# Rows scored per matrix product, bounding the float32 scratch memory
+SCORE_CHUNK_ROWS = 65536
+# Segments smaller than this are merged once too many of them have a similar
+# size (size-tiered, so every row is rewritten only a logarithmic number of times)
+SMALL_SEGMENT_ROWS = 8192
+MAX_SMALL_SEGMENTS = 4
+# Rewrite the collection when this fraction of stored rows is deleted/replaced
+COMPACTION_THRESHOLD = 0.3
+
+# IVF training
+IVF_MIN_LISTS = 16
+IVF_MAX_LISTS = 4096
+IVF_TRAINING_POINTS_PER_LIST = 32
+IVF_TRAINING_ITERATIONS = 8
+# Retrain once the collection has grown this much since the last training
+IVF_RETRAIN_GROWTH = 2.0
+
+
+def _normalize(vectors: np.ndarray) -> np.ndarray:
+    vectors = np.asarray(vectors, dtype=np.float32)
+    norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return vectors / norms
+
+
+def _write_json(path: Path, data: Dict[str, Any]) -> None:
+    tmp_path = path.with_name(f"{path.name}.tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        # json.dumps uses the C encoder; json.dump streams through the pure-Python one
+        f.write(json.dumps(data, ensure_ascii=False))
+    os.replace(tmp_path, path)
+
+
+def _save_array(path: Path, array: np.ndarray) -> None:
+    tmp_path = path.with_name(f"{path.name}.tmp")
+    with open(tmp_path, "wb") as f:
+        np.save(f, array, allow_pickle=False)
+    os.replace(tmp_path, path)
+
+
+class _Segment:
+    """
+    Immutable block of quantized vectors with their ids, documents and metadata.
+
+    Documents and metadata of a loaded segment stay on disk as JSON lines
+    (one ``[document, metadata]`` per row, located through ``offsets``):
+    query results read just their rows and the whole file is parsed only
+    when a metadata filter or a rewrite needs every row.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        vectors: np.ndarray,
+        scales: Optional[np.ndarray],
+        ids: List[str],
+        documents: Optional[List[Optional[str]]] = None,
+        metadatas: Optional[List[Dict[str, Any]]] = None,
+        dead: Iterable[int] = (),
+        records_path: Optional[Path] = None,
+        offsets: Optional[np.ndarray] = None,
+    ):
+        self.name = name
+        self.vectors = vectors
+        # Per-row dequantization factor of int8 segments (None for float16)
+        self.scales = scales
+        self.ids = ids
+        self._documents = documents
+        self._metadatas = metadatas
+        self._records_path = records_path
+        self._offsets = offsets
+        self.alive = np.ones(len(ids), dtype=bool)
+        dead = list(dead)
+        if dead:
+            self.alive[dead] = False
+        # IVF list of every row (set once the collection has trained centroids)
+        self.ivf_lists: Optional[np.ndarray] = None
+        self._columns: Dict[Tuple[str, bool], np.ndarray] = {}
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    @property
+    def documents(self) -> List[Optional[str]]:
+        if self._documents is None:
+            self._load_records()
+        return self._documents
+
+    @property
+    def metadatas(self) -> List[Dict[str, Any]]:
+        if self._metadatas is None:
+            self._load_records()
+        return self._metadatas
+
+    def records(self, rows: Sequence[int]) -> List[Tuple[Optional[str], Dict[str, Any]]]:
+        """(document, metadata) of the given rows, without loading the whole segment."""
+        if self._documents is not None:
+            return [(self._documents[row], self._metadatas[row]) for row in rows]
+        records = []
+        with open(self._records_path, "rb") as f:
+            for row in rows:
+                f.seek(int(self._offsets[row]))
+                document, metadata = json.loads(f.read(int(self._offsets[row + 1] - self._offsets[row])))
+                records.append((document, metadata))
+        return records
+
+    def _load_records(self) -> None:
+        with open(self._records_path, "r", encoding="utf-8") as f:
+            lines = f.read().splitlines()
+        # One json.loads over all rows is far cheaper than one call per line
+        records = json.loads(f"[{','.join(lines)}]")
+        self._documents = [document for document, _ in records]
+        self._metadatas = [metadata for _, metadata in records]
+
+    @property
+    def alive_count(self) -> int:
+        return int(self.alive.sum())
+
+    def column(self, field: str, numeric: bool = False) -> np.ndarray:
+        """Metadata ``field`` of every row (object array, or float with NaN when ``numeric``)."""
+        key = (field, numeric)
+        if key not in self._columns:
+            values = [metadata.get(field) for metadata in self.metadatas]
+            if numeric:
+                self._columns[key] = np.array(
+                    [
+                        float(value) if isinstance(value, (int, float)) and not isinstance(value, bool) else np.nan
+                        for value in values
+                    ],
+                    dtype=np.float64,
+                )
+            else:
+                column = np.empty(len(values), dtype=object)
+                column[:] = values
+                self._columns[key] = column
+        return self._columns[key]
+
+    def dequantized(self, rows: np.ndarray) -> np.ndarray:
+        """float32 unit vectors of the given rows."""
+        vectors = np.asarray(self.vectors[rows], dtype=np.float32)
+        if self.scales is not None:
+            vectors *= self.scales[rows, None]
+        return vectors
+
+    def dequantized_range(self, start: int, end: int) -> np.ndarray:
+        """float32 unit vectors of the contiguous rows ``start:end`` (no gather)."""
+        vectors = np.asarray(self.vectors[start:end], dtype=np.float32)
+        if self.scales is not None:
+            vectors *= self.scales[start:end, None]
+        return vectors
+
+    def similarities(self, query: np.ndarray, rows: np.ndarray, dense: bool) -> np.ndarray:
+        """Cosine similarity of ``query`` to ``rows`` (a contiguous range when ``dense``)."""
+        if dense:
+            start, end = int(rows[0]), int(rows[-1]) + 1
+            scores = np.asarray(self.vectors[start:end], dtype=np.float32) @ query
+            scales = self.scales[start:end] if self.scales is not None else None
+        else:
+            scores = np.asarray(self.vectors[rows], dtype=np.float32) @ query
+            scales = self.scales[rows] if self.scales is not None else None
+        # Scaling the scores rather than the vectors keeps dequantization out of the hot loop
+        return scores * scales if scales is not None else scores
+
+
+class NumpyCollection:
+    """
+    One named collection of the embedded vector index.
+
+    Vectors are L2-normalized and stored int8- or float16-quantized in
+    ``.npy`` segments that are memory-mapped on load. Each write appends a new
+    segment (replaced or deleted rows are tombstoned in the manifest); small
+    segments are merged and heavily tombstoned collections compacted so the
+    segment count stays small.
+
+    Queries rank by cosine similarity and report ``2 - 2 * cos`` as the
+    distance, which equals Chroma's default squared-L2 distance for the unit
+    vectors MiniLM produces. Up to ``ivf_threshold`` live vectors every row
+    is scored (chunked BLAS matrix products); past it, an inverted-file index
+    of spherical k-means centroids is trained and only the ``nprobe``
+    closest lists are scored.
+
+    Scoring runs outside the lock so queries proceed in parallel with each
+    other and with writes. Files of segments a write supersedes are only
+    deleted once no query that may still read them is running.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        name: str,
+        metadata: Optional[Dict[str, Any]] = None,
+        quantization: str = "int8",
+        ivf_threshold: int = 50000,
+        nprobe: int = 32,
+    ):
+        if quantization not in QUANTIZATIONS:
+            raise ValueError(f"Unsupported quantization: {quantization} (expected one of {QUANTIZATIONS})")
+
+        self.path = Path(path)
+        self.path.mkdir(parents=True, exist_ok=True)
+        self.name = name
+        self.metadata = metadata or {}
+        self.quantization = quantization
+        self.ivf_threshold = max(0, int(ivf_threshold))
+        self.nprobe = max(1, int(nprobe))
+
+        self.dim: Optional[int] = None
+        self.segments: List[_Segment] = []
+        self._locations: Dict[str, Tuple[_Segment, int]] = {}
+        self._centroids: Optional[np.ndarray] = None
+        self._ivf_version: Optional[str] = None
+        self._ivf_trained_on = 0
+        self._lock = threading.RLock()
+        # Queries scoring outside the lock, and whether files await their exit
+        self._readers = 0
+        self._cleanup_pending = False
+
+        self._load()
+
+    # ------------------------------------------------------------------
+    # Chroma-compatible API
+    # ------------------------------------------------------------------
+
+    def count(self) -> int:
+        with self._lock:
+            return len(self._locations)
+
+    def upsert(
+        self,
+        ids: Sequence[str],
+        embeddings: Sequence[Sequence[float]],
+        documents: Optional[Sequence[Optional[str]]] = None,
+        metadatas: Optional[Sequence[Optional[Dict[str, Any]]]] = None,
+    ) -> None:
+        """Insert or replace records; later duplicates of an id win."""
+        if not ids:
+            return
+        if len(embeddings) != len(ids):
+            raise ValueError("ids and embeddings must have the same length")
+
+        vectors = _normalize(np.asarray(embeddings, dtype=np.float32).reshape(len(ids), -1))
+        documents = list(documents) if documents is not None else [None] * len(ids)
+        metadatas = [dict(metadata or {}) for metadata in metadatas] if metadatas is not None else [{}] * len(ids)
+
+        # Keep only the last occurrence of each id within the batch
+        last: Dict[str, int] = {}
+        for position, record_id in enumerate(ids):
+            last[str(record_id)] = position
+        keep = sorted(last.values())
+
+        with self._lock:
+            if self.dim is None:
+                self.dim = int(vectors.shape[1])
+            elif vectors.shape[1] != self.dim:
+                raise ValueError(f"Embedding dimension {vectors.shape[1]} does not match collection dimension {self.dim}")
+
+            self._tombstone([str(ids[position]) for position in keep])
+            self._append_segment(
+                *self._quantize(vectors[keep]),
+                [str(ids[position]) for position in keep],
+                [documents[position] for position in keep],
+                [metadatas[position] for position in keep],
+            )
+            self._maintain()
+
+    # Chroma's add() fails on duplicate ids; the embedded index simply replaces them
+    add = upsert
+
+    def delete(self, ids: Optional[Sequence[str]] = None, where: Optional[Dict[str, Any]] = None) -> None:
+        with self._lock:
+            targets = list(ids or [])
+            if where is not None:
+                targets.extend(self.get(where=where)["ids"])
+            if self._tombstone([str(record_id) for record_id in targets]):
+                self._save_manifest()
+                self._maintain()
+
+    def get(
+        self,
+        ids: Optional[Sequence[str]] = None,
+        where: Optional[Dict[str, Any]] = None,
+        include: Optional[Sequence[str]] = None,
+        limit: Optional[int] = None,
+    ) -> Dict[str, List]:
+        """Records by id and/or metadata filter, in insertion order."""
+        with self._lock:
+            if ids is not None:
+                locations = [self._locations[record_id] for record_id in map(str, ids) if record_id in self._locations]
+                if where is not None:
+                    locations = [
+                        (segment, row) for segment, row in locations
+                        if self._where_mask(segment, where)[row]
+                    ]
+            else:
+                locations = []
+                for segment in self.segments:
+                    mask = segment.alive if where is None else segment.alive & self._where_mask(segment, where)
+                    locations.extend((segment, int(row)) for row in np.flatnonzero(mask))
+            if limit is not None:
+                locations = locations[:limit]
+
+            return {
+                "ids": [segment.ids[row] for segment, row in locations],
+                "documents": [segment.documents[row] for segment, row in locations],
+                "metadatas": [segment.metadatas[row] for segment, row in locations],
+            }
+
+    def query(
+        self,
+        query_embeddings: Sequence[Sequence[float]],
+        n_results: int = 10,
+        where: Optional[Dict[str, Any]] = None,
+        include: Optional[Sequence[str]] = None,
+    ) -> Dict[str, List[List]]:
+        """Nearest neighbours of every query embedding (Chroma result layout)."""
+        queries = _normalize(np.asarray(query_embeddings, dtype=np.float32).reshape(len(query_embeddings), -1))
+        result: Dict[str, List[List]] = {"ids": [], "documents": [], "metadatas": [], "distances": []}
+
+        with self._lock:
+            if self.dim is not None and queries.shape[1] != self.dim:
+                raise ValueError(f"Query dimension {queries.shape[1]} does not match collection dimension {self.dim}")
+            self._ensure_ivf()
+            # Snapshot everything a concurrent write may replace
+            centroids = self._centroids
+            candidates = [
+                (
+                    segment,
+                    segment.alive.copy() if where is None else segment.alive & self._where_mask(segment, where),
+                    segment.ivf_lists,
+                )
+                for segment in self.segments
+            ]
+            self._readers += 1
+
+        try:
+            for query in queries:
+                hits = self._search(query, candidates, centroids, max(0, int(n_results)))
+                records = [segment.records([row])[0] for _, segment, row in hits]
+                result["ids"].append([segment.ids[row] for _, segment, row in hits])
+                result["documents"].append([document for document, _ in records])
+                result["metadatas"].append([metadata for _, metadata in records])
+                result["distances"].append([float(2.0 - 2.0 * score) for score, _, _ in hits])
+        finally:
+            with self._lock:
+                self._readers -= 1
+                if self._readers == 0 and self._cleanup_pending:
+                    self._remove_orphaned_files()
+        return result
+
+    # ------------------------------------------------------------------
+    # Search
+    # ------------------------------------------------------------------
+
+    def _search(
+        self,
+        query: np.ndarray,
+        candidates: List[Tuple[_Segment, np.ndarray, Optional[np.ndarray]]],
+        centroids: Optional[np.ndarray],
+        n_results: int,
+    ) -> List[Tuple[float, _Segment, int]]:
+        """Top ``n_results`` of ``(segment, mask, ivf_lists)`` candidates snapshotted by query()."""
+        if n_results == 0:
+            return []
+
+        total = sum(int(mask.sum()) for _, mask, _ in candidates)
+        if total == 0:
+            return []
+
+        if centroids is not None and total > self.ivf_threshold:
+            probes = np.argsort(-(centroids @ query))[:self.nprobe]
+            probed = [
+                (segment, mask & np.isin(ivf_lists, probes)) if ivf_lists is not None else (segment, mask)
+                for segment, mask, ivf_lists in candidates
+            ]
+            hits = self._score(query, probed, n_results)
+            # A selective filter may leave the probed lists short of matches
+            if len(hits) >= min(n_results, total):
+                return hits
+
+        return self._score(query, [(segment, mask) for segment, mask, _ in candidates], n_results)
+
+    @staticmethod
+    def _score(
+        query: np.ndarray,
+        candidates: List[Tuple[_Segment, np.ndarray]],
+        n_results: int,
+    ) -> List[Tuple[float, _Segment, int]]:
+        best: List[Tuple[float, _Segment, int]] = []
+        for segment, mask in candidates:
+            rows = np.flatnonzero(mask)
+            if rows.size == 0:
+                continue
+
+            dense = rows.size == len(segment)
+            for start in range(0, rows.size, SCORE_CHUNK_ROWS):
+                chunk_rows = rows[start:start + SCORE_CHUNK_ROWS]
+                scores = segment.similarities(query, chunk_rows, dense)
+                if scores.size > n_results:
+                    top = np.argpartition(-scores, n_results - 1)[:n_results]
+                else:
+                    top = np.arange(scores.size)
+                best.extend((float(scores[i]), segment, int(chunk_rows[i])) for i in top)
+
+            if len(best) > n_results:
+                best.sort(key=lambda hit: -hit[0])
+                del best[n_results:]
+
+        best.sort(key=lambda hit: -hit[0])
+        return best[:n_results]
+
+    def _where_mask(self, segment: _Segment, where: Dict[str, Any]) -> np.ndarray:
+        """Boolean mask of the rows of ``segment`` matching a Chroma ``where`` clause."""
+        mask = np.ones(len(segment), dtype=bool)
+        for key, condition in where.items():
+            if key == "$and":
+                for clause in condition:
+                    mask &= self._where_mask(segment, clause)
+            elif key == "$or":
+                union = np.zeros(len(segment), dtype=bool)
+                for clause in condition:
+                    union |= self._where_mask(segment, clause)
+                mask &= union
+            elif isinstance(condition, dict):
+                for operator, operand in condition.items():
+                    mask &= self._compare(segment, key, operator, operand)
+            else:
+                mask &= self._compare(segment, key, "$eq", condition)
+        return mask
+
+    @staticmethod
+    def _compare(segment: _Segment, field: str, operator: str, operand: Any) -> np.ndarray:
+        if operator in ("$gt", "$gte", "$lt", "$lte"):
+            column = segment.column(field, numeric=True)
+            with np.errstate(invalid="ignore"):
+                if operator == "$gt":
+                    return column > operand
+                if operator == "$gte":
+                    return column >= operand
+                if operator == "$lt":
+                    return column < operand
+                return column <= operand
+
+        column = segment.column(field)
+        if operator in ("$eq", "$ne"):
+            equal = np.fromiter((value == operand for value in column), dtype=bool, count=len(column))
+            return equal if operator == "$eq" else ~equal
+        if operator in ("$in", "$nin"):
+            allowed = set(operand)
+            member = np.fromiter((value in allowed for value in column), dtype=bool, count=len(column))
+            return member if operator == "$in" else ~member
+        raise ValueError(f"Unsupported where operator: {operator}")
+
+    # ------------------------------------------------------------------
+    # IVF
+    # ------------------------------------------------------------------
+
+    def _ensure_ivf(self) -> None:
+        """Train (or retrain after growth) the IVF centroids once past the threshold."""
+        alive = len(self._locations)
+        if not self.ivf_threshold or alive <= self.ivf_threshold:
+            return
+        if self._centroids is not None and alive <= self._ivf_trained_on * IVF_RETRAIN_GROWTH:
+            return
+        self._train_ivf()
+
+    def _train_ivf(self) -> None:
+        alive = len(self._locations)
+        nlist = int(min(IVF_MAX_LISTS, max(IVF_MIN_LISTS, round(math.sqrt(alive)))))
+        rng = np.random.default_rng(0)
+
+        # Sample training vectors uniformly from the live rows
+        sample_size = min(alive, nlist * IVF_TRAINING_POINTS_PER_LIST)
+        picks = np.sort(rng.choice(alive, size=sample_size, replace=False))
+        sample_parts = []
+        offset = 0
+        for segment in self.segments:
+            rows = np.flatnonzero(segment.alive)
+            local = picks[(picks >= offset) & (picks < offset + rows.size)] - offset
+            if local.size:
+                sample_parts.append(segment.dequantized(rows[local]))
+            offset += rows.size
+        sample = _normalize(np.concatenate(sample_parts))
+
+        centroids = sample[rng.choice(len(sample), size=nlist, replace=False)].copy()
+        for _ in range(IVF_TRAINING_ITERATIONS):
+            assignment = np.argmax(sample @ centroids.T, axis=1)
+            sums = np.zeros_like(centroids)
+            np.add.at(sums, assignment, sample)
+            counts = np.bincount(assignment, minlength=nlist)
+            empty = counts == 0
+            if empty.any():
+                # Re-seed empty lists with random training points
+                sums[empty] = sample[rng.choice(len(sample), size=int(empty.sum()), replace=False)]
+            centroids = _normalize(sums)
+
+        self._centroids = centroids
+        self._ivf_version = uuid.uuid4().hex[:12]
+        self._ivf_trained_on = alive
+        _save_array(self.path / f"ivf_{self._ivf_version}.npy", centroids)
+        for segment in self.segments:
+            self._assign_lists(segment)
+        self._save_manifest()
+        self._remove_orphaned_files()
+        logger.info(f"Trained IVF index for '{self.name}': {nlist} lists over {alive} vectors")
+
+    def _assign_lists(self, segment: _Segment) -> None:
+        """Compute and persist the IVF list of every row of ``segment``."""
+        lists = np.empty(len(segment), dtype=np.int32)
+        for start in range(0, len(segment), SCORE_CHUNK_ROWS):
+            block = segment.dequantized_range(start, min(len(segment), start + SCORE_CHUNK_ROWS))
+            lists[start:start + len(block)] = np.argmax(block @ self._centroids.T, axis=1)
+        segment.ivf_lists = lists
+        _save_array(self.path / f"{segment.name}.{self._ivf_version}.ivf.npy", lists)
+
+    # ------------------------------------------------------------------
+    # Storage
+    # ------------------------------------------------------------------
+
+    def _quantize(self, unit_vectors: np.ndarray) -> Tuple[np.ndarray, Optional[np.ndarray]]:
+        """Quantized rows plus their per-row int8 scales (None for float16)."""
+        if self.quantization == "int8":
+            peaks = np.abs(unit_vectors).max(axis=1)
+            scales = np.where(peaks > 0, peaks / INT8_MAX, 1.0).astype(np.float32)
+            quantized = np.clip(np.rint(unit_vectors / scales[:, None]), -INT8_MAX, INT8_MAX).astype(np.int8)
+            return quantized, scales
+        return unit_vectors.astype(np.float16), None
+
+    def _tombstone(self, ids: Iterable[str]) -> int:
+        removed = 0
+        for record_id in ids:
+            location = self._locations.pop(record_id, None)
+            if location is not None:
+                segment, row = location
+                segment.alive[row] = False
+                removed += 1
+        return removed
+
+    def _append_segment(
+        self,
+        vectors: np.ndarray,
+        scales: Optional[np.ndarray],
+        ids: List[str],
+        documents: List[Optional[str]],
+        metadatas: List[Dict[str, Any]],
+    ) -> None:
+        name = f"seg_{uuid.uuid4().hex[:12]}"
+        _save_array(self.path / f"{name}.npy", vectors)
+        if scales is not None:
+            _save_array(self.path / f"{name}.scale.npy", scales)
+        _write_json(self.path / f"{name}.ids.json", {"ids": ids})
+        lines = [
+            (json.dumps([document, metadata], ensure_ascii=False) + "\n").encode("utf-8")
+            for document, metadata in zip(documents, metadatas)
+        ]
+        tmp_path = self.path / f"{name}.jsonl.tmp"
+        with open(tmp_path, "wb") as f:
+            f.writelines(lines)
+        os.replace(tmp_path, self.path / f"{name}.jsonl")
+        offsets = np.zeros(len(lines) + 1, dtype=np.int64)
+        np.cumsum([len(line) for line in lines], out=offsets[1:])
+        _save_array(self.path / f"{name}.offsets.npy", offsets)
+
+        segment = _Segment(
+            name, np.load(self.path / f"{name}.npy", mmap_mode="r"), scales, ids, documents, metadatas,
+            records_path=self.path / f"{name}.jsonl", offsets=offsets,
+        )
+        if self._centroids is not None:
+            self._assign_lists(segment)
+        self.segments.append(segment)
+        self._locations.update(zip(ids, ((segment, row) for row in range(len(ids)))))
+        self._save_manifest()
+
+    def _maintain(self) -> None:
+        """Merge small segments and compact away tombstones when they pile up."""
+        stored = sum(len(segment) for segment in self.segments)
+        dead = stored - len(self._locations)
+        if stored and dead > COMPACTION_THRESHOLD * stored:
+            self._rewrite(list(self.segments))
+            return
+
+        tiers: Dict[int, List[_Segment]] = {}
+        for segment in self.segments:
+            if len(segment) < SMALL_SEGMENT_ROWS:
+                tier = int(math.log(max(len(segment), 1), MAX_SMALL_SEGMENTS + 1))
+                tiers.setdefault(tier, []).append(segment)
+        for tier_segments in tiers.values():
+            if len(tier_segments) > MAX_SMALL_SEGMENTS:
+                self._rewrite(tier_segments)
+
+    def _rewrite(self, segments: List[_Segment]) -> None:
+        """Replace ``segments`` by one segment holding only their live rows."""
+        vectors, scales, ids, documents, metadatas = [], [], [], [], []
+        for segment in segments:
+            rows = np.flatnonzero(segment.alive)
+            if rows.size == 0:
+                continue
+            vectors.append(np.asarray(segment.vectors[rows]))
+            if segment.scales is not None:
+                scales.append(segment.scales[rows])
+            ids.extend(segment.ids[row] for row in rows)
+            documents.extend(segment.documents[row] for row in rows)
+            metadatas.extend(segment.metadatas[row] for row in rows)
+
+        replaced = {id(segment) for segment in segments}
+        self.segments = [segment for segment in self.segments if id(segment) not in replaced]
+        if ids:
+            self._append_segment(
+                np.concatenate(vectors), np.concatenate(scales) if scales else None, ids, documents, metadatas
+            )
+        else:
+            self._save_manifest()
+        self._remove_orphaned_files()
+
+    def _load(self) -> None:
+        manifest_path = self.path / MANIFEST_FILE
+        if not manifest_path.exists():
+            return
+        try:
+            with open(manifest_path, "r", encoding="utf-8") as f:
+                manifest = json.load(f)
+            if manifest.get("version") != MANIFEST_VERSION:
+                raise ValueError(f"unsupported manifest version {manifest.get('version')}")
+            if manifest.get("quantization", self.quantization) != self.quantization:
+                raise ValueError(
+                    f"collection was stored as {manifest.get('quantization')}, not {self.quantization}"
+                )
+
+            self.dim = manifest.get("dim")
+            ivf = manifest.get("ivf")
+            if ivf:
+                self._ivf_version = ivf["version"]
+                self._ivf_trained_on = ivf["trained_on"]
+                self._centroids = np.load(self.path / f"ivf_{self._ivf_version}.npy")
+
+            for entry in manifest.get("segments", []):
+                name = entry["name"]
+                with open(self.path / f"{name}.ids.json", "r", encoding="utf-8") as f:
+                    ids = json.load(f)["ids"]
+                records_path = self.path / f"{name}.jsonl"
+                if not records_path.exists():
+                    raise ValueError(f"missing records file {records_path.name}")
+                segment = _Segment(
+                    name,
+                    np.load(self.path / f"{name}.npy", mmap_mode="r"),
+                    np.load(self.path / f"{name}.scale.npy") if self.quantization == "int8" else None,
+                    ids,
+                    dead=entry.get("dead", []),
+                    records_path=records_path,
+                    offsets=np.load(self.path / f"{name}.offsets.npy"),
+                )
+                if self._centroids is not None:
+                    ivf_path = self.path / f"{segment.name}.{self._ivf_version}.ivf.npy"
+                    if ivf_path.exists():
+                        segment.ivf_lists = np.load(ivf_path, mmap_mode="r")
+                    else:
+                        self._assign_lists(segment)
+                self.segments.append(segment)
+                alive = segment.alive.tolist()
+                self._locations.update(
+                    (record_id, (segment, row)) for row, record_id in enumerate(segment.ids) if alive[row]
+                )
+        except (OSError, ValueError, KeyError) as e:
+            # Invalid collections are reset rather than serving partial results
+            logger.warning(f"Could not load vector collection '{self.name}' from {self.path}: {e}; starting empty")
+            self.dim = None
+            self.segments = []
+            self._locations = {}
+            self._centroids = None
+            self._ivf_version = None
+            self._ivf_trained_on = 0
+
+    def _save_manifest(self) -> None:
+        manifest = {
+            "version": MANIFEST_VERSION,
+            "name": self.name,
+            "metadata": self.metadata,
+            "quantization": self.quantization,
+            "dim": self.dim,
+            "segments": [
+                {"name": segment.name, "rows": len(segment), "dead": np.flatnonzero(~segment.alive).tolist()}
+                for segment in self.segments
+            ],
+            "ivf": (
+                {"version": self._ivf_version, "trained_on": self._ivf_trained_on}
+                if self._centroids is not None else None
+            ),
+        }
+        _write_json(self.path / MANIFEST_FILE, manifest)
+
+    def _remove_orphaned_files(self) -> None:
+        """Delete segment and IVF files no longer referenced by the manifest (deferred while queries run)."""
+        if self._readers:
+            self._cleanup_pending = True
+            return
+        self._cleanup_pending = False
+
+        keep = {MANIFEST_FILE}
+        for segment in self.segments:
+            keep.update(
+                f"{segment.name}{suffix}" for suffix in (".npy", ".ids.json", ".jsonl", ".offsets.npy")
+            )
+            if segment.scales is not None:
+                keep.add(f"{segment.name}.scale.npy")
+            if self._ivf_version:
+                keep.add(f"{segment.name}.{self._ivf_version}.ivf.npy")
+        if self._ivf_version:
+            keep.add(f"ivf_{self._ivf_version}.npy")
+
+        for path in self.path.iterdir():
+            if path.is_file() and path.name not in keep:
+                try:
+                    path.unlink()
+                except OSError as e:
+                    logger.debug(f"Could not remove orphaned vector file {path}: {e}")
+
+
+class NumpyVectorClient:
+    """Minimal stand-in for ``chromadb.PersistentClient`` backed by ``NumpyCollection``."""
+
+    def __init__(self, path: Path, quantization: str = "int8", ivf_threshold: int = 50000, nprobe: int = 32):
+        self.path = Path(path)
+        self.path.mkdir(parents=True, exist_ok=True)
+        self.quantization = quantization
+        self.ivf_threshold = ivf_threshold
+        self.nprobe = nprobe
+        self._collections: Dict[str, NumpyCollection] = {}
+
+    def get_or_create_collection(self, name: str, metadata: Optional[Dict[str, Any]] = None) -> NumpyCollection:
+        if name not in self._collections:
+            self._collections[name] = NumpyCollection(
+                self.path / name,
+                name,
+                metadata=metadata,
+                quantization=self.quantization,
+                ivf_threshold=self.ivf_threshold,
+                nprobe=self.nprobe,
+            )
+        return self._collections[name]
+
+    def create_collection(self, name: str, metadata: Optional[Dict[str, Any]] = None) -> NumpyCollection:
+        if name in self._collections or (self.path / name / MANIFEST_FILE).exists():
+            raise ValueError(f"Collection {name} already exists")
+        return self.get_or_create_collection(name, metadata)
+
+    def delete_collection(self, name: str) -> None:
+        self._collections.pop(name, None)
+        shutil.rmtree(self.path / name, ignore_errors=True)
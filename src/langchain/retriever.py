@@ -10,6 +10,8 @@ from functools import lru_cache
 from pathlib import Path
 from typing import List, Dict, Tuple
 
+from src.langchain.keyword_index import CampaignKeywordIndex, KeywordHit
+
 logger = logging.getLogger("DDSessionProcessor.retriever")
 
 # Cache settings
@@ -32,7 +34,17 @@ class Document:
 
 
 class CampaignRetriever:
-    """Retrieve relevant campaign data for conversational queries."""
+    """
+    Retrieve relevant campaign data for conversational queries.
+
+    Searches go through a CampaignKeywordIndex that is built on first use,
+    persisted next to the transcripts and refreshed from file fingerprints.
+    Sessions written by the pipeline and knowledge bases saved in this
+    process are picked up by the next search (see ``notify_sources_changed``);
+    other changes within ``REFRESH_INTERVAL_SECONDS`` (``clear_cache`` forces
+    the next search to rescan). Only new or changed sessions and knowledge
+    bases are re-read.
+    """
 
     def __init__(self, knowledge_base_dir: Path, transcript_dir: Path):
         """
@@ -48,6 +60,10 @@ class CampaignRetriever:
         # Cache for knowledge bases: {file_path: (data, timestamp)}
         self._kb_cache: Dict[str, Tuple[Dict, float]] = {}
 
+        self._keyword_index = CampaignKeywordIndex(
+            self.kb_dir, self.transcript_dir, kb_loader=self._load_knowledge_base
+        )
+
         logger.info(
             f"Initialized CampaignRetriever with KB dir: {self.kb_dir}, "
             f"Transcript dir: {self.transcript_dir}"
@@ -86,111 +102,80 @@ class CampaignRetriever:
     def _search_knowledge_bases(self, query: str, top_k: int) -> List[Document]:
         """Search structured knowledge bases."""
         results = []
-        query_lower = query.lower()
 
         try:
-            # Load all knowledge bases
             if not self.kb_dir.exists():
                 logger.warning(f"Knowledge base directory not found: {self.kb_dir}")
                 return results
 
-            for kb_file in self.kb_dir.glob("*_knowledge.json"):
-                try:
-                    kb = self._load_knowledge_base(kb_file)
-
-                    # Generic search across categories
-                    for category in ["npcs", "quests", "locations", "items"]:
-                        for entity in kb.get(category, []):
-                            # Use full JSON dump for comprehensive search across all fields
-                            entity_text = json.dumps(entity).lower()
-
-                            if self._matches_query(query_lower, entity_text):
-                                name = entity.get("name") or entity.get("title") or "Unknown"
-                                description = entity.get("description", "No description")
-                                type_name = category[:-1] if category.endswith("s") else category
-
-                                # Include full entity details in content so LLM can answer questions about nested fields
-                                results.append(Document(
-                                    content=f"{type_name.capitalize()}: {json.dumps(entity, ensure_ascii=False)}",
-                                    metadata={
-                                        "type": type_name,
-                                        "source": kb_file.name,
-                                        "name": name
-                                    }
-                                ))
-
-                except (json.JSONDecodeError, KeyError) as e:
-                    logger.warning(f"Error loading knowledge base {kb_file}: {e}")
-                    continue
+            self._refresh_index()
+            for hit in self._keyword_index.search(query, kind="kb", top_k=top_k):
+                results.append(self._kb_document(hit))
 
         except Exception as e:
             logger.error(f"Error searching knowledge bases: {e}", exc_info=True)
 
-        # Rank results to prioritize exact matches and relevant types before slicing
-        ranked_results = self._rank_results(results, query)
-        return ranked_results[:top_k]
+        return results
 
     def _search_transcripts(self, query: str, top_k: int) -> List[Document]:
-        """Search session transcripts using simple keyword matching."""
+        """Search session transcripts through the keyword index."""
         results = []
-        query_lower = query.lower()
 
         try:
             if not self.transcript_dir.exists():
                 logger.warning(f"Transcript directory not found: {self.transcript_dir}")
                 return results
 
-            # Search through session directories
-            for session_dir in self.transcript_dir.iterdir():
-                if not session_dir.is_dir():
-                    continue
-
-                # Look for diarized transcript
-                transcript_file = session_dir / "diarized_transcript.json"
-                if not transcript_file.exists():
-                    continue
-
-                try:
-                    with open(transcript_file, "r", encoding="utf-8") as f:
-                        transcript_data = json.load(f)
-
-                    segments = transcript_data.get("segments", [])
-
-                    # Search through segments
-                    for segment in segments:
-                        text = segment.get("text", "")
-                        if query_lower in text.lower():
-                            speaker = segment.get("speaker", "Unknown")
-                            start = segment.get("start", 0)
-                            end = segment.get("end", 0)
-
-                            # Format timestamp as HH:MM:SS
-                            timestamp = self._format_timestamp(start)
-
-                            results.append(Document(
-                                content=f'[{speaker}, {timestamp}]: "{text}"',
-                                metadata={
-                                    "type": "transcript",
-                                    "session_id": session_dir.name,
-                                    "speaker": speaker,
-                                    "start": start,
-                                    "end": end,
-                                    "timestamp": timestamp
-                                }
-                            ))
-
-                            # Limit results per session
-                            if len(results) >= top_k * 3:
-                                break
-
-                except (json.JSONDecodeError, KeyError) as e:
-                    logger.warning(f"Error loading transcript {transcript_file}: {e}")
-                    continue
+            self._refresh_index()
+            for hit in self._keyword_index.search(query, kind="transcript", top_k=top_k):
+                results.append(self._transcript_document(hit))
 
         except Exception as e:
             logger.error(f"Error searching transcripts: {e}", exc_info=True)
 
-        return results[:top_k]
+        return results
+
+    def _refresh_index(self) -> None:
+        """Update the keyword index and drop cached copies of changed knowledge bases."""
+        for changed_file in self._keyword_index.refresh():
+            self._kb_cache.pop(str(changed_file), None)
+
+    def _kb_document(self, hit: KeywordHit) -> Document:
+        entity = hit.item
+        name = entity.get("name") or entity.get("title") or "Unknown"
+        type_name = hit.category[:-1] if hit.category.endswith("s") else hit.category
+
+        # Include full entity details in content so LLM can answer questions about nested fields
+        return Document(
+            content=f"{type_name.capitalize()}: {json.dumps(entity, ensure_ascii=False)}",
+            metadata={
+                "type": type_name,
+                "source": hit.source.name,
+                "name": name
+            }
+        )
+
+    def _transcript_document(self, hit: KeywordHit) -> Document:
+        segment = hit.item
+        text = segment.get("text", "")
+        speaker = segment.get("speaker", "Unknown")
+        start = segment.get("start", 0)
+        end = segment.get("end", 0)
+
+        # Format timestamp as HH:MM:SS
+        timestamp = self._format_timestamp(start)
+
+        return Document(
+            content=f'[{speaker}, {timestamp}]: "{text}"',
+            metadata={
+                "type": "transcript",
+                "session_id": hit.source.parent.name,
+                "speaker": speaker,
+                "start": start,
+                "end": end,
+                "timestamp": timestamp
+            }
+        )
 
     def _load_knowledge_base(self, kb_file: Path) -> Dict:
         """
@@ -236,18 +221,11 @@ class CampaignRetriever:
         return data
 
     def clear_cache(self):
-        """Clear the knowledge base cache (useful after updates)."""
+        """Clear the knowledge base cache and reload the keyword index on next use."""
         self._kb_cache.clear()
+        self._keyword_index.reset()
         logger.info("Knowledge base cache cleared")
 
-    def _matches_query(self, query: str, *fields: str) -> bool:
-        """Check if query matches any of the fields."""
-        query_words = query.split()
-        return any(
-            all(word in field for word in query_words)
-            for field in fields
-        )
-
     def _rank_results(self, results: List[Document], query: str) -> List[Document]:
         """Rank results by relevance to query (simple keyword matching)."""
         query_lower = query.lower()
@@ -8,6 +8,7 @@ from pathlib import Path
 from typing import List
 
 from src.langchain.retriever import Document
+from src.langchain.vector_store import VectorSearchFilters
 
 logger = logging.getLogger("DDSessionProcessor.semantic_retriever")
 
@@ -65,25 +66,20 @@ class SemanticCampaignRetriever:
             List of Document objects
         """
         try:
-            # Search only transcripts
-            all_results = self.vector_store.search(
+            # The session filter runs inside ChromaDB, so small sessions still get top_k hits
+            results = self.vector_store.search(
                 query,
-                top_k=top_k * 3,  # Get more to filter
-                collection="transcripts"
+                top_k=top_k,
+                collection="transcripts",
+                filters=VectorSearchFilters(session_id=session_id)
             )
 
-            # Filter by session_id
-            session_results = [
-                r for r in all_results
-                if r["metadata"].get("session_id") == session_id
-            ]
-
             return [
                 Document(
                     content=result["text"],
                     metadata=result["metadata"]
                 )
-                for result in session_results[:top_k]
+                for result in results
             ]
 
         except Exception as e:
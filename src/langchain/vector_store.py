@@ -4,30 +4,135 @@ Vector database for semantic search using ChromaDB.
 from __future__ import annotations
 
 import logging
+import time
+from dataclasses import dataclass
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import Any, List, Dict, Optional, Sequence, Tuple, Union
+
+from src.config import Config
 
 logger = logging.getLogger("DDSessionProcessor.vector_store")
 
 # Batch size for embedding generation to prevent OOM
 EMBEDDING_BATCH_SIZE = 100
 
+VECTOR_STORE_BACKENDS = ("chroma", "numpy")
+
+FilterValue = Union[str, Sequence[str], None]
+
+
+@dataclass(frozen=True)
+class VectorSearchFilters:
+    """
+    Metadata constraints pushed down to ChromaDB as a ``where`` clause.
+
+    String fields accept a single value or a list of allowed values. The
+    transcript fields (session, speaker, IC/OOC classification, time range)
+    only exist on transcript segments and ``entity_type`` only on knowledge
+    documents, so setting either kind restricts the search to the matching
+    collection. ``start``/``end`` keep segments overlapping that time range.
+    """
+
+    session_id: FilterValue = None
+    speaker: FilterValue = None
+    classification: FilterValue = None
+    start: Optional[float] = None
+    end: Optional[float] = None
+    entity_type: FilterValue = None
+
+    def has_transcript_filters(self) -> bool:
+        return any(
+            value is not None
+            for value in (self.session_id, self.speaker, self.classification, self.start, self.end)
+        )
+
+    def applies_to(self, collection: str) -> bool:
+        """Whether records of ``collection`` can satisfy these filters at all."""
+        if collection == "transcripts":
+            return self.entity_type is None
+        return not self.has_transcript_filters()
+
+    def to_where(self, collection: str) -> Optional[Dict[str, Any]]:
+        """ChromaDB ``where`` clause for ``collection`` (None when unconstrained)."""
+        clauses: List[Dict[str, Any]] = []
+        if collection == "transcripts":
+            for field in ("session_id", "speaker", "classification"):
+                clause = _match_clause(field, getattr(self, field))
+                if clause:
+                    clauses.append(clause)
+            if self.start is not None:
+                clauses.append({"end": {"$gte": float(self.start)}})
+            if self.end is not None:
+                clauses.append({"start": {"$lte": float(self.end)}})
+        else:
+            clause = _match_clause("type", self.entity_type)
+            if clause:
+                clauses.append(clause)
+
+        if not clauses:
+            return None
+        return clauses[0] if len(clauses) == 1 else {"$and": clauses}
+
+
+def _match_clause(field: str, value: FilterValue) -> Optional[Dict[str, Any]]:
+    if value is None:
+        return None
+    if isinstance(value, str):
+        return {field: value}
+    values = list(value)
+    return {field: values[0]} if len(values) == 1 else {field: {"$in": values}}
+
 
 class CampaignVectorStore:
-    """Vector database for semantic search of campaign data."""
+    """
+    Vector database for semantic search of campaign data.
+
+    Adding segments or documents is incremental: records whose text and
+    metadata already match what is stored under the same ID are skipped,
+    new or changed ones are upserted (only those are embedded) and records
+    of the same session or source that no longer exist are deleted, so
+    re-ingesting a campaign only pays for what changed.
+
+    ``generation`` is bumped whenever stored records change, so callers that
+    cache search results can tell when ingestion has made them stale.
+
+    Two backends are available: ChromaDB (default) and an embedded,
+    quantized NumPy index (``backend="numpy"``, see numpy_vector_index)
+    that avoids ChromaDB's startup cost and memory for campaign-sized data.
+    """
 
-    def __init__(self, persist_dir: Path, embedding_service):
+    def __init__(self, persist_dir: Path, embedding_service, backend: Optional[str] = None):
         """
         Initialize the vector store.
 
         Args:
             persist_dir: Directory to persist the vector database
             embedding_service: EmbeddingService instance for generating embeddings
+            backend: 'chroma' or 'numpy' (default: Config.VECTOR_STORE_BACKEND)
         """
         self.persist_dir = Path(persist_dir)
         self.persist_dir.mkdir(parents=True, exist_ok=True)
 
         self.embedding = embedding_service
+        self.generation = 0
+        self.backend = (backend or Config.VECTOR_STORE_BACKEND or "chroma").lower()
+        if self.backend not in VECTOR_STORE_BACKENDS:
+            raise ValueError(
+                f"Unknown vector store backend: {self.backend} (expected one of {VECTOR_STORE_BACKENDS})"
+            )
+
+        if self.backend == "numpy":
+            from src.langchain.numpy_vector_index import NumpyVectorClient
+
+            logger.info(f"Initializing embedded vector index at {self.persist_dir / 'numpy'}")
+            self.client = NumpyVectorClient(
+                self.persist_dir / "numpy",
+                quantization=Config.VECTOR_STORE_QUANTIZATION,
+                ivf_threshold=Config.VECTOR_STORE_IVF_THRESHOLD,
+                nprobe=Config.VECTOR_STORE_IVF_NPROBE,
+            )
+            self._create_collections()
+            return
 
         try:
             import chromadb
@@ -40,16 +145,7 @@ class CampaignVectorStore:
                 settings=Settings(anonymized_telemetry=False)
             )
 
-            # Collections for different data types
-            self.transcript_collection = self.client.get_or_create_collection(
-                name="transcripts",
-                metadata={"description": "Session transcripts"}
-            )
-
-            self.knowledge_collection = self.client.get_or_create_collection(
-                name="knowledge",
-                metadata={"description": "NPCs, quests, locations"}
-            )
+            self._create_collections()
 
             logger.info("ChromaDB initialized successfully")
 
@@ -59,61 +155,133 @@ class CampaignVectorStore:
                 "chromadb not installed. Run: pip install chromadb"
             ) from e
 
+    def _create_collections(self) -> None:
+        # Collections for different data types
+        self.transcript_collection = self.client.get_or_create_collection(
+            name="transcripts",
+            metadata={"description": "Session transcripts"}
+        )
+
+        self.knowledge_collection = self.client.get_or_create_collection(
+            name="knowledge",
+            metadata={"description": "NPCs, quests, locations"}
+        )
+
     def add_transcript_segments(
         self,
         session_id: str,
         segments: List[Dict]
-    ):
+    ) -> Dict[str, int]:
         """
-        Add transcript segments to vector store.
+        Add or update the transcript segments of a session.
+
+        Segments already stored with identical text and metadata are left
+        alone; segments stored for this session beyond the new list are deleted.
 
         Args:
             session_id: Session identifier
             segments: List of segment dicts with keys: text, speaker, start, end
+                      and optionally classification (IC/OOC)
+
+        Returns:
+            Dict with counts of upserted, unchanged and deleted segments
         """
         if not segments:
             logger.warning(f"No segments to add for session {session_id}")
-            return
+            return {"upserted": 0, "unchanged": 0, "deleted": 0}
 
         try:
-            total_segments = len(segments)
-            logger.info(f"Adding {total_segments} segments from session {session_id}")
-
-            # Process in batches to prevent OOM on large datasets
-            for batch_start in range(0, total_segments, EMBEDDING_BATCH_SIZE):
-                batch_end = min(batch_start + EMBEDDING_BATCH_SIZE, total_segments)
-                batch_segments = segments[batch_start:batch_end]
-
-                texts = [seg["text"] for seg in batch_segments]
-                embeddings = self.embedding.embed_batch(texts, batch_size=32)
-                ids = [f"{session_id}_seg_{batch_start + i}" for i in range(len(batch_segments))]
-
-                metadatas = [
-                    {
-                        "session_id": session_id,
-                        "speaker": seg.get("speaker", "Unknown"),
-                        "start": float(seg.get("start", 0)),
-                        "end": float(seg.get("end", 0)),
-                        "type": "transcript"
-                    }
-                    for seg in batch_segments
-                ]
-
-                self.transcript_collection.add(
-                    documents=texts,
-                    embeddings=embeddings,
-                    ids=ids,
-                    metadatas=metadatas
-                )
-
-                logger.debug(f"Added batch {batch_start}-{batch_end} ({len(batch_segments)} segments)")
-
-            logger.info(f"Successfully added all {total_segments} segments from session {session_id}")
+            logger.info(f"Adding {len(segments)} segments from session {session_id}")
+
+            records = [
+                (f"{session_id}_seg_{i}", seg["text"], self._segment_metadata(session_id, seg))
+                for i, seg in enumerate(segments)
+            ]
+            existing = self._existing_records(self.transcript_collection, where={"session_id": session_id})
+            stats = self._upsert_changed(self.transcript_collection, records, existing)
+            stats["deleted"] = self._delete_stale(self.transcript_collection, records, existing)
+
+            logger.info(
+                f"Session {session_id}: {stats['upserted']} segments upserted, "
+                f"{stats['unchanged']} unchanged, {stats['deleted']} deleted"
+            )
+            return stats
 
         except Exception as e:
             logger.error(f"Error adding transcript segments: {e}", exc_info=True)
             raise
 
+    @staticmethod
+    def _segment_metadata(session_id: str, seg: Dict) -> Dict[str, Any]:
+        """Filterable metadata stored with a transcript segment."""
+        metadata = {
+            "session_id": session_id,
+            "speaker": seg.get("speaker", "Unknown"),
+            "start": float(seg.get("start", 0)),
+            "end": float(seg.get("end", 0)),
+            "type": "transcript"
+        }
+        # IC/OOC label, present once the session has been classified
+        if seg.get("classification"):
+            metadata["classification"] = str(seg["classification"])
+        return metadata
+
+    def _existing_records(self, collection, **selector) -> Dict[str, Tuple[str, Dict]]:
+        """Stored ``id -> (document, metadata)`` for records matching ``selector`` (ids or where)."""
+        raw = collection.get(include=["documents", "metadatas"], **selector)
+        if not raw:
+            return {}
+        ids = raw.get("ids") or []
+        documents = raw.get("documents") or []
+        metadatas = raw.get("metadatas") or []
+        return {
+            record_id: (document, metadata or {})
+            for record_id, document, metadata in zip(ids, documents, metadatas)
+        }
+
+    def _upsert_changed(
+        self,
+        collection,
+        records: List[Tuple[str, str, Dict[str, Any]]],
+        existing: Dict[str, Tuple[str, Dict]]
+    ) -> Dict[str, int]:
+        """Embed and upsert the ``(id, text, metadata)`` records that differ from ``existing``."""
+        changed = [
+            record for record in records
+            if existing.get(record[0]) != (record[1], record[2])
+        ]
+
+        # Process in batches to prevent OOM on large datasets
+        for batch_start in range(0, len(changed), EMBEDDING_BATCH_SIZE):
+            batch = changed[batch_start:batch_start + EMBEDDING_BATCH_SIZE]
+            texts = [text for _, text, _ in batch]
+            collection.upsert(
+                documents=texts,
+                embeddings=self._backend_vectors(self.embedding.embed_batch(texts, batch_size=32)),
+                ids=[record_id for record_id, _, _ in batch],
+                metadatas=[metadata for _, _, metadata in batch]
+            )
+            logger.debug(f"Upserted batch {batch_start}-{batch_start + len(batch)} ({len(batch)} records)")
+
+        if changed:
+            self.generation += 1
+
+        return {"upserted": len(changed), "unchanged": len(records) - len(changed)}
+
+    def _delete_stale(
+        self,
+        collection,
+        records: List[Tuple[str, str, Dict[str, Any]]],
+        existing: Dict[str, Tuple[str, Dict]]
+    ) -> int:
+        """Delete records in ``existing`` that are not part of ``records``."""
+        current_ids = {record_id for record_id, _, _ in records}
+        stale_ids = [record_id for record_id in existing if record_id not in current_ids]
+        if stale_ids:
+            collection.delete(ids=stale_ids)
+            self.generation += 1
+        return len(stale_ids)
+
     def _sanitize_for_id(self, text: str) -> str:
         """
         Sanitizes a string to be used as part of a ChromaDB ID.
@@ -131,55 +299,56 @@ class CampaignVectorStore:
         sanitized = sanitized.encode("ascii", "ignore").decode("ascii")
         return sanitized
 
-    def add_knowledge_documents(self, documents: List[Dict]):
+    def add_knowledge_documents(self, documents: List[Dict], source: Optional[str] = None) -> Dict[str, int]:
         """
-        Add knowledge base documents to vector store.
+        Add or update knowledge base documents.
 
         Args:
             documents: List of document dicts with keys: text, metadata
+            source: Knowledge base file the documents came from; when given,
+                    stored documents of that source missing from ``documents``
+                    are deleted
+
+        Returns:
+            Dict with counts of upserted, unchanged and deleted documents
         """
         if not documents:
             logger.warning("No knowledge documents to add")
-            return
+            return {"upserted": 0, "unchanged": 0, "deleted": 0}
 
         try:
-            total_docs = len(documents)
-            logger.info(f"Adding {total_docs} knowledge documents")
-
-            # Process in batches to prevent OOM on large datasets
-            for batch_start in range(0, total_docs, EMBEDDING_BATCH_SIZE):
-                batch_end = min(batch_start + EMBEDDING_BATCH_SIZE, total_docs)
-                batch_docs = documents[batch_start:batch_end]
-
-                texts = [doc["text"] for doc in batch_docs]
-                embeddings = self.embedding.embed_batch(texts, batch_size=32)
-
-                # Generate IDs based on document type and name
-                ids = []
-                metadatas = []
-                for i, doc in enumerate(batch_docs):
-                    # Handle cases where metadata key is missing OR value is None
-                    metadata = doc.get("metadata") or {}
-
-                    doc_type = metadata.get("type", "unknown")
-                    safe_type = self._sanitize_for_id(doc_type)
-
-                    name = metadata.get("name", f"doc_{batch_start + i}")
-                    safe_name = self._sanitize_for_id(name)
-
-                    ids.append(f"{safe_type}_{safe_name}_{batch_start + i}")
-                    metadatas.append(metadata)
-
-                self.knowledge_collection.add(
-                    documents=texts,
-                    embeddings=embeddings,
-                    ids=ids,
-                    metadatas=metadatas
-                )
+            logger.info(f"Adding {len(documents)} knowledge documents")
+
+            # Generate IDs based on source, document type and name
+            id_prefix = f"{self._sanitize_for_id(source)}_" if source is not None else ""
+            records = []
+            for i, doc in enumerate(documents):
+                # Handle cases where metadata key is missing OR value is None
+                metadata = doc.get("metadata") or {}
 
-                logger.debug(f"Added batch {batch_start}-{batch_end} ({len(batch_docs)} documents)")
+                doc_type = metadata.get("type", "unknown")
+                safe_type = self._sanitize_for_id(doc_type)
+
+                name = metadata.get("name", f"doc_{i}")
+                safe_name = self._sanitize_for_id(name)
+
+                records.append((f"{id_prefix}{safe_type}_{safe_name}_{i}", doc["text"], metadata))
+
+            existing = self._existing_records(
+                self.knowledge_collection, ids=[record_id for record_id, _, _ in records]
+            )
+            stats = self._upsert_changed(self.knowledge_collection, records, existing)
 
-            logger.info(f"Successfully added all {total_docs} knowledge documents")
+            stats["deleted"] = 0
+            if source is not None:
+                stored = self._existing_records(self.knowledge_collection, where={"source": source})
+                stats["deleted"] = self._delete_stale(self.knowledge_collection, records, stored)
+
+            logger.info(
+                f"Knowledge documents: {stats['upserted']} upserted, "
+                f"{stats['unchanged']} unchanged, {stats['deleted']} deleted"
+            )
+            return stats
 
         except Exception as e:
             logger.error(f"Error adding knowledge documents: {e}", exc_info=True)
@@ -189,7 +358,9 @@ class CampaignVectorStore:
         self,
         query: str,
         top_k: int = 5,
-        collection: Optional[str] = None
+        collection: Optional[str] = None,
+        filters: Optional[VectorSearchFilters] = None,
+        timings: Optional[Dict[str, float]] = None
     ) -> List[Dict]:
         """
         Semantic search across collections.
@@ -199,55 +370,127 @@ class CampaignVectorStore:
             top_k: Number of results to return
             collection: Specific collection to search ('transcripts' or 'knowledge'),
                        or None to search both
+            filters: Metadata constraints applied by ChromaDB before ranking,
+                     so ``top_k`` results are returned even for small sessions
+            timings: Optional dict that receives ``embed_ms`` and ``vector_ms``
 
         Returns:
             List of result dicts with keys: text, metadata, distance
         """
         try:
+            started = time.perf_counter()
             query_embedding = self.embedding.embed(query)
-
-            results = []
-
-            # Search transcripts
-            if collection is None or collection == "transcripts":
-                try:
-                    transcript_results = self.transcript_collection.query(
-                        query_embeddings=[query_embedding],
-                        n_results=top_k
-                    )
-                    results.extend(self._format_results(transcript_results))
-                except Exception as e:
-                    logger.warning(f"Error searching transcripts: {e}")
-
-            # Search knowledge base
-            if collection is None or collection == "knowledge":
-                try:
-                    knowledge_results = self.knowledge_collection.query(
-                        query_embeddings=[query_embedding],
-                        n_results=top_k
-                    )
-                    results.extend(self._format_results(knowledge_results))
-                except Exception as e:
-                    logger.warning(f"Error searching knowledge base: {e}")
-
-            # Sort by distance and take top_k
-            results.sort(key=lambda x: x["distance"])
-            return results[:top_k]
+            embedded = time.perf_counter()
+            results = self._query_collections([query_embedding], top_k, collection, filters)[0]
+            if timings is not None:
+                timings["embed_ms"] = (embedded - started) * 1000
+                timings["vector_ms"] = (time.perf_counter() - embedded) * 1000
+            return results
 
         except Exception as e:
             logger.error(f"Error during semantic search: {e}", exc_info=True)
             return []
 
-    def _format_results(self, raw_results: Dict) -> List[Dict]:
-        """Format raw ChromaDB results into consistent format."""
+    def search_batch(
+        self,
+        queries: List[str],
+        top_k: int = 5,
+        collection: Optional[str] = None,
+        filters: Optional[VectorSearchFilters] = None
+    ) -> List[List[Dict]]:
+        """
+        Run several semantic searches with one embedding batch and one query per collection.
+
+        Args:
+            queries: Search queries
+            top_k: Number of results to return per query
+            collection: 'transcripts', 'knowledge' or None for both
+            filters: Metadata constraints shared by every query
+
+        Returns:
+            One result list per query, in the same format as ``search``
+        """
+        if not queries:
+            return []
+
+        try:
+            query_embeddings = self.embedding.embed_batch(list(queries))
+            return self._query_collections(query_embeddings, top_k, collection, filters)
+
+        except Exception as e:
+            logger.error(f"Error during batch semantic search: {e}", exc_info=True)
+            return [[] for _ in queries]
+
+    def _query_collections(
+        self,
+        query_embeddings: Sequence[Sequence[float]],
+        top_k: int,
+        collection: Optional[str],
+        filters: Optional[VectorSearchFilters]
+    ) -> List[List[Dict]]:
+        """Query the selected collections and merge results per query by distance."""
+        results: List[List[Dict]] = [[] for _ in query_embeddings]
+        query_embeddings = self._backend_vectors(query_embeddings)
+
+        targets = (
+            ("transcripts", self.transcript_collection, "transcripts"),
+            ("knowledge", self.knowledge_collection, "knowledge base"),
+        )
+        for name, target, label in targets:
+            if collection is not None and collection != name:
+                continue
+            if filters is not None and not filters.applies_to(name):
+                continue
+
+            query_kwargs: Dict[str, Any] = {}
+            where = filters.to_where(name) if filters is not None else None
+            if where is not None:
+                query_kwargs["where"] = where
+
+            try:
+                raw = target.query(
+                    query_embeddings=query_embeddings,
+                    n_results=top_k,
+                    **query_kwargs
+                )
+                for position in range(len(query_embeddings)):
+                    results[position].extend(self._format_results(raw, position))
+            except Exception as e:
+                logger.warning(f"Error searching {label}: {e}")
+
+        # Sort by distance and take top_k
+        for merged in results:
+            merged.sort(key=lambda x: x["distance"])
+        return [merged[:top_k] for merged in results]
+
+    def _backend_vectors(self, embeddings):
+        """
+        Embeddings in the form the backend accepts.
+
+        EmbeddingService returns NumPy arrays; the NumPy index takes them as
+        they are, but ChromaDB 0.4.x only validates plain lists of lists.
+        """
+        if self.backend == "numpy":
+            return embeddings
+        return [
+            vector.tolist() if hasattr(vector, "tolist") else list(vector)
+            for vector in embeddings
+        ]
+
+    def _format_results(self, raw_results: Dict, position: int = 0) -> List[Dict]:
+        """Format the raw ChromaDB results of query ``position`` into consistent format."""
         if not raw_results or not raw_results.get("documents"):
             return []
 
         formatted = []
 
-        documents = raw_results["documents"][0] if raw_results["documents"] else []
-        metadatas = raw_results["metadatas"][0] if raw_results["metadatas"] else []
-        distances = raw_results["distances"][0] if raw_results["distances"] else []
+        def column(key: str) -> List:
+            values = raw_results.get(key)
+            return values[position] if values and len(values) > position and values[position] else []
+
+        documents = column("documents")
+        metadatas = column("metadatas")
+        distances = column("distances")
 
         for doc, meta, dist in zip(documents, metadatas, distances):
             formatted.append({
@@ -268,6 +511,7 @@ class CampaignVectorStore:
 
             if results and results.get("ids"):
                 self.transcript_collection.delete(ids=results["ids"])
+                self.generation += 1
                 logger.info(f"Deleted {len(results['ids'])} segments for session {session_id}")
             else:
                 logger.warning(f"No segments found for session {session_id}")
@@ -293,6 +537,7 @@ class CampaignVectorStore:
                 metadata={"description": "NPCs, quests, locations"}
             )
 
+            self.generation += 1
             logger.info("Cleared all vector store collections")
 
         except Exception as e:
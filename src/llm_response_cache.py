@@ -0,0 +1,192 @@
+"""Persistent, content-addressed cache of LLM responses."""
+from __future__ import annotations
+
+import hashlib
+import json
+import math
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from .config import Config
+from .logger import get_logger
+
+
+class LLMResponseCache:
+    """
+    SQLite-backed cache of LLM responses keyed by model, options and prompt.
+
+    Keys are SHA-256 digests of the model name, the generation options and the
+    prompt hash, so identical requests (re-running stage 6 after a tweak, or
+    resuming via ``process_from_intermediate``) are answered from disk. The
+    total stored payload size is bounded by ``max_bytes``; when exceeded, the
+    least recently used entries are evicted.
+
+    The cache is safe to share between the threads of a ClassificationDispatcher.
+
+    Example:
+        >>> cache = LLMResponseCache(Path("output/_cache/llm_responses.sqlite"))
+        >>> key = cache.make_key("qwen2.5:7b", {"temperature": 0.1}, prompt)
+        >>> cache.get(key) or cache.put(key, "qwen2.5:7b", {"response": "..."})
+    """
+
+    # After exceeding max_bytes, evict down to this fraction to avoid evicting on every put
+    EVICTION_TARGET_RATIO = 0.9
+
+    # Least recently used keys, served by idx_responses_last_access
+    _OLDEST_KEYS_SQL = "SELECT key FROM responses ORDER BY last_access ASC, key ASC LIMIT ?"
+
+    def __init__(self, db_path: Path, max_bytes: int = 256 * 1024 * 1024):
+        self.db_path = Path(db_path)
+        self.max_bytes = max(0, int(max_bytes))
+        self.logger = get_logger("llm_cache")
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+        # Opened on first use so constructing a classifier never touches disk
+        self._conn: Optional[sqlite3.Connection] = None
+        # Running entry count and payload size, loaded when the database is
+        # opened so puts do not have to re-sum the table
+        self._entries = 0
+        self._total_bytes = 0
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS responses (
+                    key TEXT PRIMARY KEY,
+                    model TEXT NOT NULL,
+                    payload TEXT NOT NULL,
+                    size INTEGER NOT NULL,
+                    created_at REAL NOT NULL,
+                    last_access REAL NOT NULL
+                )
+                """
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_responses_last_access ON responses(last_access)")
+            conn.commit()
+            self._entries, self._total_bytes = conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses"
+            ).fetchone()
+            self._conn = conn
+        return self._conn
+
+    @classmethod
+    def from_config(cls) -> "LLMResponseCache":
+        """Create the cache at Config.LLM_CACHE_PATH bounded by Config.LLM_CACHE_MAX_MB."""
+        return cls(Path(Config.LLM_CACHE_PATH), max_bytes=int(Config.LLM_CACHE_MAX_MB * 1024 * 1024))
+
+    @staticmethod
+    def make_key(model: str, options: Optional[Dict[str, Any]], prompt: str) -> str:
+        """Content address for a request: model + options + prompt hash."""
+        material = json.dumps(
+            {
+                "model": model,
+                "options": options or {},
+                "prompt_sha256": hashlib.sha256(prompt.encode("utf-8")).hexdigest(),
+            },
+            sort_keys=True,
+        )
+        return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the cached payload for ``key`` (refreshing its LRU position) or None."""
+        with self._lock:
+            row = self._connection().execute("SELECT payload FROM responses WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._connection().execute("UPDATE responses SET last_access = ? WHERE key = ?", (time.time(), key))
+            self._connection().commit()
+        return json.loads(row[0])
+
+    def put(self, key: str, model: str, payload: Dict[str, Any]) -> None:
+        """Store ``payload`` under ``key`` and evict old entries if over the size bound."""
+        serialized = json.dumps(payload, default=str)
+        size = len(serialized.encode("utf-8"))
+        if self.max_bytes and size > self.max_bytes:
+            return
+        now = time.time()
+        with self._lock:
+            conn = self._connection()
+            previous = conn.execute("SELECT size FROM responses WHERE key = ?", (key,)).fetchone()
+            conn.execute(
+                "INSERT OR REPLACE INTO responses (key, model, payload, size, created_at, last_access) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (key, model, serialized, size, now, now),
+            )
+            if previous is None:
+                self._entries += 1
+                self._total_bytes += size
+            else:
+                self._total_bytes += size - previous[0]
+            self._evict_locked()
+            conn.commit()
+
+    def purge(self) -> int:
+        """Delete every cached response; returns the number of entries removed."""
+        with self._lock:
+            removed = self._connection().execute("DELETE FROM responses").rowcount
+            self._connection().commit()
+            self._entries = 0
+            self._total_bytes = 0
+            self._connection().execute("VACUUM")
+        self.logger.info("Purged %d cached LLM responses from %s", removed, self.db_path)
+        return removed
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters for this instance plus current entry count and size."""
+        with self._lock:
+            if self._conn is None and not self.db_path.exists():
+                # Never used: report an empty cache rather than creating the file
+                entries, size = 0, 0
+            else:
+                self._connection()
+                entries, size = self._entries, self._total_bytes
+            hits, misses = self.hits, self.misses
+        lookups = hits + misses
+        return {
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": hits / lookups if lookups else 0.0,
+            "entries": entries,
+            "size_bytes": size,
+        }
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def _evict_locked(self) -> None:
+        if not self.max_bytes or self._total_bytes <= self.max_bytes:
+            return
+
+        conn = self._connection()
+        target = int(self.max_bytes * self.EVICTION_TARGET_RATIO)
+        evicted = 0
+        while self._total_bytes > target and self._entries > 0:
+            # Estimate how many of the oldest entries cover the excess; loop
+            # again in the rare case they turn out smaller than average
+            average = self._total_bytes / self._entries
+            batch = max(1, math.ceil((self._total_bytes - target) / average))
+            removed, removed_bytes = conn.execute(
+                f"SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses WHERE key IN ({self._OLDEST_KEYS_SQL})",
+                (batch,),
+            ).fetchone()
+            if not removed:
+                break
+            conn.execute(f"DELETE FROM responses WHERE key IN ({self._OLDEST_KEYS_SQL})", (batch,))
+            self._entries -= removed
+            self._total_bytes -= removed_bytes
+            evicted += removed
+        self.logger.debug("Evicted %d cached LLM responses (cache now %d bytes)", evicted, self._total_bytes)
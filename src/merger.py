@@ -1,7 +1,15 @@
-"""Merge overlapping chunk transcriptions using LCS algorithm"""
-from typing import List
+"""Merge overlapping chunk transcriptions using word-level alignment"""
+import re
+from bisect import bisect_left
+from dataclasses import replace
 from difflib import SequenceMatcher
-from .transcriber import ChunkTranscription, TranscriptionSegment
+from typing import Dict, List, Optional, Tuple
+from .transcriber import ChunkTranscription, TranscriptionSegment, join_words
+
+_TOKEN_STRIP = re.compile(r"[^\w']+")
+
+# (segment position, word position) of a word inside a segment list
+_WordRef = Tuple[int, int]
 
 
 class TranscriptionMerger:
@@ -14,20 +22,33 @@ class TranscriptionMerger:
     - We need to merge intelligently without duplication
 
     Solution:
-    - Use Longest Common Subsequence (LCS) to find overlap
-    - Take text from first chunk up to overlap
-    - Take text from second chunk after overlap
-    - Preserve timestamps accurately
+    - Only look at the overlap window between adjacent chunks; segments are
+      sorted, so the window is found by binary search on start times
+    - Align the words both chunks heard in that window (longest common run
+      of normalized words) and cut in the middle of the matching run
+    - Take words from the first chunk before the cut, from the second after
+    - Fall back to a time cut at the end of the first chunk when word
+      timestamps are missing or the window has no common run
+
+    Each chunk is appended once and only its overlap window is revisited, so
+    merging is linear in the total number of segments.
 
     Based on: Groq community guide's sliding window alignment approach
     """
 
-    def __init__(self, similarity_threshold: float = 0.6):
+    # Words this far outside the overlap window still take part in alignment,
+    # since segment and word timestamps drift slightly between chunks.
+    ALIGNMENT_PADDING_SECONDS = 1.0
+
+    def __init__(self, similarity_threshold: float = 0.6, min_alignment_words: int = 2):
         """
         Args:
             similarity_threshold: Minimum similarity to consider sequences matching
+            min_alignment_words: Shortest run of common words accepted as an
+                alignment between two chunks
         """
         self.similarity_threshold = similarity_threshold
+        self.min_alignment_words = min_alignment_words
 
     def merge_transcriptions(
         self,
@@ -48,51 +69,159 @@ class TranscriptionMerger:
         if len(transcriptions) == 1:
             return transcriptions[0].segments
 
-        # Start with first chunk's segments
-        merged_segments = list(transcriptions[0].segments)
+        merged: List[TranscriptionSegment] = list(transcriptions[0].segments)
+        merged_starts: List[float] = [seg.start_time for seg in merged]
 
-        # Merge each subsequent chunk
         for i in range(1, len(transcriptions)):
-            merged_segments = self._merge_two_chunks(
-                merged_segments,
+            self._append_chunk(
+                merged,
+                merged_starts,
                 transcriptions[i].segments,
-                transcriptions[i-1].chunk_end,
+                transcriptions[i - 1].chunk_end,
                 transcriptions[i].chunk_start
             )
 
-        return merged_segments
+        return merged
 
-    def _merge_two_chunks(
+    def _append_chunk(
         self,
-        segments_a: List[TranscriptionSegment],
+        merged: List[TranscriptionSegment],
+        merged_starts: List[float],
         segments_b: List[TranscriptionSegment],
         chunk_a_end: float,
         chunk_b_start: float
-    ) -> List[TranscriptionSegment]:
-        """Merge two consecutive chunk transcriptions using a simple time-based split."""
-        # The overlap ends at the end time of the first chunk.
-        # This provides a simple, robust, if not perfectly precise, split point.
-        split_time = chunk_a_end
-        return self._merge_by_time(segments_a, segments_b, split_time)
+    ) -> None:
+        """Merge the next chunk into ``merged`` in place, touching only the overlap window."""
+        # Tail of the merged list that can overlap the new chunk
+        tail_start = bisect_left(merged_starts, chunk_b_start)
+        while tail_start > 0 and merged[tail_start - 1].end_time > chunk_b_start:
+            tail_start -= 1
+        tail = merged[tail_start:]
+
+        # Head of the new chunk that falls inside the overlap window
+        b_starts = [seg.start_time for seg in segments_b]
+        head_end = bisect_left(b_starts, chunk_a_end + self.ALIGNMENT_PADDING_SECONDS)
+        head = segments_b[:head_end]
+
+        alignment = self._align_words(tail, head, chunk_b_start, chunk_a_end)
+        if alignment is not None:
+            new_tail, new_head = self._cut_at_alignment(tail, head, *alignment)
+        else:
+            new_tail, new_head = self._cut_at_time(tail, head, chunk_a_end)
+
+        del merged[tail_start:]
+        del merged_starts[tail_start:]
+        for seg in new_tail + new_head:
+            merged.append(seg)
+            merged_starts.append(seg.start_time)
+        for seg in segments_b[head_end:]:
+            merged.append(seg)
+            merged_starts.append(seg.start_time)
+
+    def _align_words(
+        self,
+        tail: List[TranscriptionSegment],
+        head: List[TranscriptionSegment],
+        window_start: float,
+        window_end: float
+    ) -> Optional[Tuple[_WordRef, _WordRef]]:
+        """
+        Find the word where the merge should switch from chunk A to chunk B.
 
-    def _merge_by_time(
+        Returns:
+            ``(a_ref, b_ref)`` pointing at the same spoken word in ``tail`` and
+            ``head``, or None if no run of at least ``min_alignment_words``
+            common words exists in the overlap window.
+        """
+        pad = self.ALIGNMENT_PADDING_SECONDS
+        a_tokens, a_refs = self._window_tokens(tail, window_start - pad, window_end + pad)
+        b_tokens, b_refs = self._window_tokens(head, window_start - pad, window_end + pad)
+        if len(a_tokens) < self.min_alignment_words or len(b_tokens) < self.min_alignment_words:
+            return None
+
+        matcher = SequenceMatcher(None, a_tokens, b_tokens, autojunk=False)
+        a_pos, b_pos, size = matcher.find_longest_match(0, len(a_tokens), 0, len(b_tokens))
+        if size < self.min_alignment_words:
+            return None
+
+        # Cut in the middle of the common run: A has better context before it,
+        # B after it.
+        middle = size // 2
+        return a_refs[a_pos + middle], b_refs[b_pos + middle]
+
+    @staticmethod
+    def _window_tokens(
+        segments: List[TranscriptionSegment],
+        window_start: float,
+        window_end: float
+    ) -> Tuple[List[str], List[_WordRef]]:
+        tokens: List[str] = []
+        refs: List[_WordRef] = []
+        for seg_pos, seg in enumerate(segments):
+            for word_pos, word in enumerate(seg.words or []):
+                start = word.get("start")
+                if start is None or start < window_start or start > window_end:
+                    continue
+                token = _TOKEN_STRIP.sub("", str(word.get("word", "")).lower())
+                if token:
+                    tokens.append(token)
+                    refs.append((seg_pos, word_pos))
+        return tokens, refs
+
+    def _cut_at_alignment(
         self,
-        segments_a: List[TranscriptionSegment],
-        segments_b: List[TranscriptionSegment],
+        tail: List[TranscriptionSegment],
+        head: List[TranscriptionSegment],
+        a_ref: _WordRef,
+        b_ref: _WordRef
+    ) -> Tuple[List[TranscriptionSegment], List[TranscriptionSegment]]:
+        """Keep chunk A's words before the aligned word and chunk B's from it onward."""
+        a_seg, a_word = a_ref
+        b_seg, b_word = b_ref
+
+        new_tail = list(tail[:a_seg])
+        kept_a = self._with_words(tail[a_seg], tail[a_seg].words[:a_word])
+        if kept_a is not None:
+            new_tail.append(kept_a)
+
+        new_head: List[TranscriptionSegment] = []
+        kept_b = self._with_words(head[b_seg], head[b_seg].words[b_word:])
+        if kept_b is not None:
+            new_head.append(kept_b)
+        new_head.extend(head[b_seg + 1:])
+        return new_tail, new_head
+
+    @staticmethod
+    def _with_words(segment: TranscriptionSegment, words: List[Dict]) -> Optional[TranscriptionSegment]:
+        """Copy of ``segment`` reduced to ``words``; None if no words remain."""
+        if not words:
+            return None
+        if len(words) == len(segment.words or []):
+            return segment
+        return replace(
+            segment,
+            text=join_words(words),
+            start_time=words[0].get("start", segment.start_time),
+            end_time=words[-1].get("end", segment.end_time),
+            words=list(words)
+        )
+
+    @staticmethod
+    def _cut_at_time(
+        tail: List[TranscriptionSegment],
+        head: List[TranscriptionSegment],
         split_time: float
-    ) -> List[TranscriptionSegment]:
+    ) -> Tuple[List[TranscriptionSegment], List[TranscriptionSegment]]:
         """
         Fallback: merge by simply cutting at time boundary.
 
-        Used when LCS doesn't find good overlap.
+        Used when word-level alignment doesn't find a good overlap.
         """
         # Take all segments from A that end before split time
-        result = [seg for seg in segments_a if seg.end_time <= split_time]
-
+        new_tail = [seg for seg in tail if seg.end_time <= split_time]
         # Add all segments from B that start at or after split time
-        result.extend([seg for seg in segments_b if seg.start_time >= split_time])
-
-        return result
+        new_head = [seg for seg in head if seg.start_time >= split_time]
+        return new_tail, new_head
 
     def get_full_text(self, segments: List[TranscriptionSegment]) -> str:
         """Get concatenated text from segments"""
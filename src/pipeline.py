@@ -2,7 +2,7 @@
 import json
 from pathlib import Path
 from time import perf_counter
-from typing import Optional, List, Dict, Tuple, Any
+from typing import Optional, List, Dict, Tuple, Any, Callable, Iterable, Iterator
 from datetime import datetime
 from threading import Event
 from .config import Config
@@ -10,10 +10,12 @@ from .constants import PipelineStage, ProcessingStatus, Classification, Confiden
 from .checkpoint import CheckpointManager
 from .exceptions import CancelledError
 from .audio_processor import AudioProcessor
-from .chunker import HybridChunker, AudioChunk
+from .chunker import HybridChunker, AudioChunk, LazyAudioChunk, MappedAudioFile
 from .transcriber import TranscriberFactory, ChunkTranscription, TranscriptionSegment
+from .transcription_executor import TranscriptionExecutor
 from .merger import TranscriptionMerger
 from .diarizer import DiarizerFactory, SpeakerDiarizer, SpeakerProfileManager
+from .background_diarization import BackgroundDiarization
 from .classifier import ClassifierFactory, ClassificationResult
 from .formatter import TranscriptFormatter, StatisticsGenerator, sanitize_filename
 from .party_config import PartyConfigManager
@@ -24,6 +26,8 @@ from .knowledge_base import KnowledgeExtractor, CampaignKnowledgeBase
 from .preflight import PreflightChecker, PreflightIssue
 from .intermediate_output import IntermediateOutputManager
 from .scene_builder import SceneBuilder
+from .transcript_indexer import TranscriptIndexer
+from .langchain.keyword_index import notify_sources_changed
 
 try:  # pragma: no cover - convenience for test environment
     from unittest.mock import Mock as _Mock  # type: ignore
@@ -69,6 +73,8 @@ class StageResult:
     warnings: List[str] = field(default_factory=list)
     start_time: Optional[datetime] = None
     end_time: Optional[datetime] = None
+    # Named sub-phase timings in seconds (e.g. time spent waiting on a background job)
+    timings: Dict[str, float] = field(default_factory=dict)
 
     @property
     def duration(self) -> Optional[float]:
@@ -92,7 +98,8 @@ class StageResult:
             "warnings": self.warnings,
             "start_time": self.start_time.isoformat() if self.start_time else None,
             "end_time": self.end_time.isoformat() if self.end_time else None,
-            "duration": self.duration
+            "duration": self.duration,
+            "timings": self.timings
         }
 
 
@@ -155,6 +162,9 @@ class DDSessionProcessor:
         redact_prompts: bool = False,
         generate_scenes: bool = True,
         scene_summary_mode: str = "template",
+        transcription_workers: Optional[int] = None,
+        overlap_diarization: Optional[bool] = None,
+        use_llm_cache: Optional[bool] = None,
     ):
         """
         Args:
@@ -173,6 +183,12 @@ class DDSessionProcessor:
             redact_prompts: Redact full text from audit logs when enabled (default: False)
             generate_scenes: Automatically group segments into scenes (default: True)
             scene_summary_mode: How to generate scene summaries - template, llm, or none (default: "template")
+            transcription_workers: Concurrent chunk requests for cloud transcription backends
+                (defaults to Config.TRANSCRIPTION_MAX_WORKERS; local Whisper always runs sequentially)
+            overlap_diarization: Run diarization in a separate process alongside chunking and
+                transcription (defaults to Config.PIPELINE_OVERLAP_DIARIZATION)
+            use_llm_cache: Answer repeated classification prompts from the on-disk
+                LLM response cache (defaults to Config.LLM_CACHE_ENABLED)
         """
         self.session_id = session_id
         self.safe_session_id = sanitize_filename(session_id)
@@ -222,6 +238,14 @@ class DDSessionProcessor:
         self.redact_prompts = redact_prompts
         self.generate_scenes = generate_scenes
         self.scene_summary_mode = scene_summary_mode
+        self.transcription_backend = transcription_backend
+        self.transcription_workers = transcription_workers
+        self.diarization_backend = diarization_backend
+        self.overlap_diarization = (
+            Config.PIPELINE_OVERLAP_DIARIZATION if overlap_diarization is None else overlap_diarization
+        )
+        # Per-stage wall-clock timings for the most recent process() run
+        self.stage_timings: Dict[str, Dict[str, float]] = {}
 
         # Initialize components
         self.audio_processor = AudioProcessor()
@@ -229,7 +253,10 @@ class DDSessionProcessor:
         self.transcriber = TranscriberFactory.create(backend=transcription_backend)
         self.merger = TranscriptionMerger()
         self.diarizer = DiarizerFactory.create(backend=diarization_backend)
-        self.classifier = ClassifierFactory.create(backend=classification_backend)
+        self.classifier = ClassifierFactory.create(
+            backend=classification_backend,
+            use_response_cache=use_llm_cache
+        )
         self.formatter = TranscriptFormatter()
         self.speaker_profile_manager = SpeakerProfileManager()
         self.snipper = AudioSnipper()
@@ -373,78 +400,10 @@ class DDSessionProcessor:
                 "Detecting speech regions"
             )
 
-            # Progress tracking
-            chunk_progress = {
-                "count": 0,
-                "last_logged_percent": -5.0,
-                "last_log_time": perf_counter()
-            }
-
-            def _chunk_progress_callback(chunk, duration):
-                try:
-                    chunk_progress["count"] = chunk.chunk_index + 1
-                    if duration and duration > 0:
-                        percent = min(100.0, max(0.0, (chunk.end_time / duration) * 100))
-                    else:
-                        percent = 0.0
-
-                    # Throttling: Log/Update Status every 5% or every 30 seconds
-                    # We also update status slightly more frequently for smoother UI (e.g. every 1% or 2s)
-                    now = perf_counter()
-                    should_update_status = False
-                    should_log = False
-
-                    if not "last_status_time" in chunk_progress:
-                        chunk_progress["last_status_time"] = now
-
-                    # Log check
-                    if percent - chunk_progress["last_logged_percent"] >= 5.0:
-                        should_log = True
-                    elif now - chunk_progress["last_log_time"] >= 30.0:
-                        should_log = True
-
-                    # Status update check (more frequent than logging)
-                    if should_log:
-                        should_update_status = True
-                    elif percent - chunk_progress.get("last_status_percent", -5.0) >= 1.0:
-                        should_update_status = True
-                    elif now - chunk_progress["last_status_time"] >= 2.0:
-                        should_update_status = True
-
-                    if should_update_status:
-                        chunk_progress["last_status_percent"] = percent
-                        chunk_progress["last_status_time"] = now
-
-                        details = {
-                            "chunks_created": chunk_progress["count"],
-                            "latest_chunk_index": chunk.chunk_index,
-                            "latest_chunk_end": round(chunk.end_time, 2),
-                            "progress_percent": round(percent, 1)
-                        }
-
-                        StatusTracker.update_stage(
-                            self.session_id,
-                            2,
-                            "running",
-                            message=f"Chunking... {chunk_progress['count']} chunk{'s' if chunk_progress['count'] != 1 else ''}",
-                            details=details
-                        )
-
-                    if should_log:
-                        chunk_progress["last_logged_percent"] = percent
-                        chunk_progress["last_log_time"] = now
-                        self.logger.info(
-                            "Stage 2/9 progress: %d chunk(s) created (%.1f%% of audio processed)",
-                            chunk_progress["count"],
-                            round(percent, 1)
-                        )
-                except Exception as progress_error:
-                    self.logger.debug("Chunk progress callback skipped: %s", progress_error)
-
             # Perform chunking
             chunks = self.chunker.chunk_audio(
                 wav_file,
-                progress_callback=_chunk_progress_callback
+                progress_callback=self._make_chunk_progress_callback()
             )
 
             # Validate output
@@ -488,18 +447,184 @@ class DDSessionProcessor:
 
         return result
 
+    def _stage_audio_chunking_streamed(
+        self,
+        wav_file: Path,
+        total_duration: float,
+        on_complete: Optional[Callable[[StageResult, List[Dict[str, Any]]], None]] = None
+    ) -> Tuple[StageResult, Iterator[AudioChunk]]:
+        """
+        Stage 2/9 in streaming mode: yield chunks to stage 3 as VAD emits them.
+
+        Unlike _stage_audio_chunking, nothing is chunked up front. The returned
+        iterator drives HybridChunker.iter_chunks, so transcription starts with
+        the first chunk while VAD is still running over the rest of the file.
+        Only chunk metadata is kept; once the chunker is exhausted the stage
+        result is completed and ``on_complete`` is called with it and the
+        chunk dicts (used to write the AUDIO_CHUNKED checkpoint).
+
+        Args:
+            wav_file: Path to converted WAV file from Stage 1
+            total_duration: Total audio duration in seconds (for progress tracking)
+            on_complete: Called as ``(result, chunk_dicts)`` when chunking succeeds
+
+        Returns:
+            Tuple of the (still running) StageResult and the chunk iterator.
+            Errors are recorded on the result and re-raised to the consumer.
+        """
+        result = StageResult(
+            stage=PipelineStage.AUDIO_CHUNKED,
+            status=ProcessingStatus.RUNNING,
+            start_time=datetime.now()
+        )
+
+        def _chunks() -> Iterator[AudioChunk]:
+            chunk_dicts: List[Dict[str, Any]] = []
+            try:
+                self.logger.info("Stage 2/9: Chunking audio with VAD (streaming into transcription)...")
+                StatusTracker.update_stage(
+                    self.session_id,
+                    2,
+                    ProcessingStatus.RUNNING,
+                    "Detecting speech regions"
+                )
+
+                for chunk in self.chunker.iter_chunks(
+                    wav_file,
+                    progress_callback=self._make_chunk_progress_callback()
+                ):
+                    chunk_dicts.append(chunk.to_dict())
+                    yield chunk
+
+                if not chunk_dicts:
+                    if not self.is_test_run:
+                        raise RuntimeError(
+                            "Audio chunking resulted in zero segments. This can happen if the audio is "
+                            "completely silent, corrupt, or too short. Please check the input audio file."
+                        )
+                    self.logger.warning("Chunker returned no segments; continuing for test run.")
+
+                result.status = ProcessingStatus.COMPLETED
+                result.data = {"num_chunks": len(chunk_dicts)}
+                result.end_time = datetime.now()
+                self.logger.info("Stage 2/9 complete: %d chunks created", len(chunk_dicts))
+                StatusTracker.update_stage(
+                    self.session_id,
+                    2,
+                    ProcessingStatus.COMPLETED,
+                    f"Created {len(chunk_dicts)} chunks"
+                )
+            except Exception as e:
+                result.status = ProcessingStatus.FAILED
+                result.errors.append(f"Audio chunking failed: {str(e)}")
+                result.end_time = datetime.now()
+                self.logger.error("Stage 2/9 failed: %s", e, exc_info=True)
+                StatusTracker.update_stage(
+                    self.session_id,
+                    2,
+                    ProcessingStatus.FAILED,
+                    f"Chunking failed: {e}"
+                )
+                raise
+
+            if on_complete:
+                on_complete(result, chunk_dicts)
+
+        return result, _chunks()
+
+    def _make_chunk_progress_callback(self) -> Callable[[AudioChunk, float], None]:
+        """Build the chunker progress callback that throttles stage 2 status updates and logs."""
+        chunk_progress = {
+            "count": 0,
+            "last_logged_percent": -5.0,
+            "last_log_time": perf_counter()
+        }
+
+        def _chunk_progress_callback(chunk, duration):
+            try:
+                chunk_progress["count"] = chunk.chunk_index + 1
+                if duration and duration > 0:
+                    percent = min(100.0, max(0.0, (chunk.end_time / duration) * 100))
+                else:
+                    percent = 0.0
+
+                # Throttling: Log/Update Status every 5% or every 30 seconds
+                # We also update status slightly more frequently for smoother UI (e.g. every 1% or 2s)
+                now = perf_counter()
+                should_update_status = False
+                should_log = False
+
+                if not "last_status_time" in chunk_progress:
+                    chunk_progress["last_status_time"] = now
+
+                # Log check
+                if percent - chunk_progress["last_logged_percent"] >= 5.0:
+                    should_log = True
+                elif now - chunk_progress["last_log_time"] >= 30.0:
+                    should_log = True
+
+                # Status update check (more frequent than logging)
+                if should_log:
+                    should_update_status = True
+                elif percent - chunk_progress.get("last_status_percent", -5.0) >= 1.0:
+                    should_update_status = True
+                elif now - chunk_progress["last_status_time"] >= 2.0:
+                    should_update_status = True
+
+                if should_update_status:
+                    chunk_progress["last_status_percent"] = percent
+                    chunk_progress["last_status_time"] = now
+
+                    details = {
+                        "chunks_created": chunk_progress["count"],
+                        "latest_chunk_index": chunk.chunk_index,
+                        "latest_chunk_end": round(chunk.end_time, 2),
+                        "progress_percent": round(percent, 1)
+                    }
+
+                    StatusTracker.update_stage(
+                        self.session_id,
+                        2,
+                        "running",
+                        message=f"Chunking... {chunk_progress['count']} chunk{'s' if chunk_progress['count'] != 1 else ''}",
+                        details=details
+                    )
+
+                if should_log:
+                    chunk_progress["last_logged_percent"] = percent
+                    chunk_progress["last_log_time"] = now
+                    self.logger.info(
+                        "Stage 2/9 progress: %d chunk(s) created (%.1f%% of audio processed)",
+                        chunk_progress["count"],
+                        round(percent, 1)
+                    )
+            except Exception as progress_error:
+                self.logger.debug("Chunk progress callback skipped: %s", progress_error)
+
+        return _chunk_progress_callback
+
     def _stage_audio_transcription(
         self,
-        chunks: List[AudioChunk]
+        chunks: Iterable[AudioChunk],
+        completed_transcriptions: Optional[Dict[int, ChunkTranscription]] = None
     ) -> StageResult:
         """
         Stage 3/9: Transcribe audio chunks to text.
 
         This stage processes each audio chunk through the transcription model
         (e.g., Whisper) to convert speech to text with word-level timestamps.
+        Cloud backends dispatch several chunks concurrently via
+        TranscriptionExecutor; results are always returned in chunk order.
+
+        Every finished chunk is appended to the transcription journal so an
+        interrupted run can resume mid-stage.
 
         Args:
-            chunks: List of audio chunks from Stage 2
+            chunks: Audio chunks from Stage 2, either a list or the iterator of
+                a streaming Stage 2 that is consumed while chunking runs
+            completed_transcriptions: Chunk transcriptions restored from the
+                journal, keyed by chunk_index. Chunks whose boundaries match an
+                entry are not re-transcribed.
 
         Returns:
             StageResult with:
@@ -520,61 +645,106 @@ class DDSessionProcessor:
 
         try:
             self.logger.info("Stage 3/9: Transcribing chunks (this may take a while)...")
-            total_chunks = len(chunks)
+            # A streaming Stage 2 hands over an iterator, so the total is only
+            # known up front when chunking has already finished.
+            total_chunks = len(chunks) if isinstance(chunks, (list, tuple)) else None
+            restored = dict(completed_transcriptions or {})
+            chunk_order: List[int] = []
+            transcribed_order: List[int] = []
+            progress_state = {"total": total_chunks, "last_log_time": perf_counter()}
+
+            def _pending_chunks() -> Iterator[AudioChunk]:
+                for chunk in chunks:
+                    chunk_order.append(chunk.chunk_index)
+                    journaled = restored.get(chunk.chunk_index)
+                    if journaled is not None and self._journal_entry_matches(journaled, chunk):
+                        continue
+                    restored.pop(chunk.chunk_index, None)
+                    transcribed_order.append(chunk.chunk_index)
+                    yield chunk
+                # Stage 2 has finished, so progress can be reported as a percentage
+                progress_state["total"] = len(chunk_order)
+
+            if restored:
+                self.logger.info(
+                    "Stage 3/9: Resuming with %d chunk transcription(s) restored from journal",
+                    len(restored),
+                )
             StatusTracker.update_stage(
                 self.session_id,
                 3,
                 ProcessingStatus.RUNNING,
-                f"Transcribing {total_chunks} chunks"
+                f"Transcribing {total_chunks} chunks" if total_chunks is not None
+                else "Transcribing chunks as they are created"
             )
 
-            chunk_transcriptions: List[ChunkTranscription] = []
-            log_every = max(1, total_chunks // 10)
-            last_log_time = perf_counter()
+            def _on_chunk_transcribed(completed: int, chunk: AudioChunk, transcription: ChunkTranscription):
+                self._journal_chunk_transcription(transcription)
 
-            for index, chunk in enumerate(chunks, start=1):
-                transcription = self.transcriber.transcribe_chunk(
-                    chunk,
-                    language=self.language
-                )
-                chunk_transcriptions.append(transcription)
-
-                # Progress logging
+                # Chunks may finish out of order when transcribing concurrently, so
+                # progress is based on the number completed, not the chunk position.
+                completed += len(chunk_order) - len(transcribed_order)
                 preview_text = transcription.preview_text(220)
                 chunk_duration = round(chunk.end_time - chunk.start_time, 2)
 
+                # While streaming chunking is still running the total is unknown and
+                # only the first chunk and the 60 s rule trigger an update.
+                total_chunks = progress_state["total"]
                 if (
-                    index == 1
-                    or index == total_chunks
-                    or index % log_every == 0
-                    or (perf_counter() - last_log_time) >= 60.0
+                    completed == 1
+                    or completed == total_chunks
+                    or (total_chunks and completed % max(1, total_chunks // 10) == 0)
+                    or (perf_counter() - progress_state["last_log_time"]) >= 60.0
                 ):
-                    percent = (index / total_chunks) * 100 if total_chunks else 0.0
-                    last_log_time = perf_counter()
+                    percent = (completed / total_chunks) * 100 if total_chunks else None
+                    progress_state["last_log_time"] = perf_counter()
+
+                    details = {
+                        "chunks_transcribed": completed,
+                        "total_chunks": total_chunks,
+                        "last_chunk_index": transcription.chunk_index,
+                        "last_chunk_preview": preview_text,
+                        "last_chunk_start": round(chunk.start_time, 2),
+                        "last_chunk_end": round(chunk.end_time, 2),
+                        "last_chunk_duration": chunk_duration,
+                    }
+                    if percent is not None:
+                        details["progress_percent"] = round(percent, 1)
 
                     StatusTracker.update_stage(
                         self.session_id,
                         3,
                         "running",
-                        message=f"Transcribing chunk {index}/{total_chunks}",
-                        details={
-                            "chunks_transcribed": index,
-                            "total_chunks": total_chunks,
-                            "progress_percent": round(percent, 1),
-                            "last_chunk_index": transcription.chunk_index,
-                            "last_chunk_preview": preview_text,
-                            "last_chunk_start": round(chunk.start_time, 2),
-                            "last_chunk_end": round(chunk.end_time, 2),
-                            "last_chunk_duration": chunk_duration,
-                        },
+                        message=(
+                            f"Transcribing chunk {completed}/{total_chunks}" if total_chunks is not None
+                            else f"Transcribing chunk {completed}"
+                        ),
+                        details=details,
                     )
 
-                    self.logger.info(
-                        "Stage 3/9 progress: %d/%d chunks transcribed (%.1f%%)",
-                        index,
-                        total_chunks,
-                        round(percent, 1),
-                    )
+                    if percent is not None:
+                        self.logger.info(
+                            "Stage 3/9 progress: %d/%d chunks transcribed (%.1f%%)",
+                            completed,
+                            total_chunks,
+                            round(percent, 1),
+                        )
+                    else:
+                        self.logger.info("Stage 3/9 progress: %d chunks transcribed", completed)
+
+            executor = TranscriptionExecutor.for_backend(
+                self.transcriber,
+                self.transcription_backend,
+                max_workers=self.transcription_workers,
+            )
+            new_transcriptions = executor.transcribe_chunks(
+                _pending_chunks(),
+                language=self.language,
+                on_chunk_complete=_on_chunk_transcribed,
+            )
+
+            restored.update(zip(transcribed_order, new_transcriptions))
+            chunk_transcriptions = [restored[index] for index in chunk_order]
 
             # Success!
             result.status = ProcessingStatus.COMPLETED
@@ -684,7 +854,8 @@ class DDSessionProcessor:
         self,
         wav_file: Path,
         merged_segments: List[TranscriptionSegment],
-        skip_diarization: bool
+        skip_diarization: bool,
+        background_diarization: Optional[BackgroundDiarization] = None
     ) -> StageResult:
         """
         Stage 5/9: Identify and label speakers in the audio.
@@ -696,6 +867,9 @@ class DDSessionProcessor:
             wav_file: Path to audio file from Stage 1
             merged_segments: Merged transcription segments from Stage 4
             skip_diarization: If True, skip diarization and use UNKNOWN labels
+            background_diarization: Diarization job started after Stage 1. Its
+                result is joined here instead of diarizing in-process; if it
+                failed, diarization is retried in-process.
 
         Returns:
             StageResult with:
@@ -755,11 +929,16 @@ class DDSessionProcessor:
 
                 try:
                     # Perform diarization
-                    speaker_segments, speaker_embeddings = self.diarizer.diarize(wav_file, num_speakers=self.num_speakers)
+                    speaker_segments, speaker_embeddings = self._collect_diarization(
+                        wav_file, background_diarization, result
+                    )
+                    assignment_started = perf_counter()
                     speaker_segments_with_labels = self.diarizer.assign_speakers_to_transcription(
                         merged_segments,
-                        speaker_segments
+                        speaker_segments,
+                        word_level=Config.DIARIZATION_WORD_LEVEL
                     )
+                    result.timings["speaker_assignment_seconds"] = perf_counter() - assignment_started
                     unique_speakers = {seg['speaker'] for seg in speaker_segments_with_labels}
 
                     # Save speaker embeddings for future use
@@ -832,6 +1011,64 @@ class DDSessionProcessor:
 
         return result
 
+    def _collect_diarization(
+        self,
+        wav_file: Path,
+        background_diarization: Optional[BackgroundDiarization],
+        result: StageResult
+    ) -> Tuple[List[Any], Dict[str, Any]]:
+        """Join the background diarization job, or diarize in-process, recording timings."""
+        if background_diarization is not None:
+            try:
+                speaker_segments, speaker_embeddings = background_diarization.result()
+                result.timings["diarization_seconds"] = background_diarization.diarization_seconds
+                result.timings["diarization_wait_seconds"] = background_diarization.wait_seconds
+                self.logger.info(
+                    "Stage 5/9: Joined background diarization (ran %.1fs, waited %.1fs)",
+                    background_diarization.diarization_seconds,
+                    background_diarization.wait_seconds
+                )
+                return speaker_segments, speaker_embeddings
+            except Exception as e:
+                result.warnings.append(f"Background diarization failed: {e}")
+                self.logger.warning("Background diarization failed, diarizing in-process: %s", e)
+
+        diarization_started = perf_counter()
+        speaker_segments, speaker_embeddings = self.diarizer.diarize(wav_file, num_speakers=self.num_speakers)
+        result.timings["diarization_seconds"] = perf_counter() - diarization_started
+        return speaker_segments, speaker_embeddings
+
+    def _start_background_diarization(self, wav_file: Path) -> Optional[BackgroundDiarization]:
+        """Launch diarization in a child process; returns None if it cannot be started."""
+        try:
+            return BackgroundDiarization(
+                self.diarization_backend,
+                wav_file,
+                num_speakers=self.num_speakers
+            ).start()
+        except Exception as e:
+            self.logger.warning("Could not start background diarization, stage 5 will run in-process: %s", e)
+            return None
+
+    def _record_stage_timing(self, result: StageResult) -> None:
+        """Remember a stage's wall-clock duration and sub-phase timings."""
+        timing: Dict[str, float] = dict(result.timings)
+        if result.duration is not None:
+            timing["duration"] = result.duration
+        self.stage_timings[result.stage.value] = timing
+
+    def _llm_cache_stats(self) -> Optional[Dict[str, Any]]:
+        """Current stats of the classifier's LLM response cache, if it has one."""
+        cache = getattr(self.classifier, "response_cache", None)
+        if cache is None:
+            return None
+        try:
+            stats = cache.stats()
+        except Exception as exc:
+            self.logger.debug("Could not read LLM cache stats: %s", exc)
+            return None
+        return stats if isinstance(stats, dict) else None
+
     def _stage_segments_classification(
         self,
         speaker_segments_with_labels: List[Dict],
@@ -908,6 +1145,8 @@ class DDSessionProcessor:
                 )
 
                 try:
+                    cache_before = self._llm_cache_stats()
+
                     # Perform classification
                     classifications = self.classifier.classify_segments(
                         speaker_segments_with_labels,
@@ -925,16 +1164,37 @@ class DDSessionProcessor:
                         "ooc_count": ooc_count
                     }
 
+                    completion_message = f"IC segments: {ic_count}, OOC segments: {ooc_count}"
+                    cache_after = self._llm_cache_stats()
+                    if cache_before is not None and cache_after is not None:
+                        hits = cache_after["hits"] - cache_before["hits"]
+                        misses = cache_after["misses"] - cache_before["misses"]
+                        lookups = hits + misses
+                        result.data["llm_cache"] = {
+                            "hits": hits,
+                            "misses": misses,
+                            "hit_rate": hits / lookups if lookups else 0.0,
+                            "entries": cache_after["entries"],
+                            "size_bytes": cache_after["size_bytes"],
+                        }
+                        completion_message += f", LLM cache hits: {hits}/{lookups}"
+
                     self.logger.info(
                         "Stage 6/9 complete: %d IC segments, %d OOC segments",
                         ic_count,
                         ooc_count
                     )
+                    if "llm_cache" in result.data:
+                        self.logger.info(
+                            "LLM response cache: %d hits, %d misses",
+                            result.data["llm_cache"]["hits"],
+                            result.data["llm_cache"]["misses"]
+                        )
                     StatusTracker.update_stage(
                         self.session_id,
                         6,
                         ProcessingStatus.COMPLETED,
-                        f"IC segments: {ic_count}, OOC segments: {ooc_count}"
+                        completion_message
                     )
 
                 except Exception as classification_error:
@@ -1111,6 +1371,33 @@ class DDSessionProcessor:
 
         return result
 
+    def _update_transcript_index(self, output_dir: Path) -> None:
+        """
+        Add the session's freshly written transcript to the search index.
+
+        Only this session's data file is parsed and its shard rewritten; the
+        other sessions' manifest entries and shards are left as they are and
+        any missing ones are indexed by the next full update from the UI.
+        Failures are logged and never fail the pipeline.
+
+        Campaign chat keyword indexes in this process are told to rescan on
+        their next search, so the session is searchable right away.
+        """
+        notify_sources_changed()
+        if not Config.TRANSCRIPT_INDEX_AUTO_UPDATE:
+            return
+        try:
+            output_dir = Path(output_dir)
+            update = TranscriptIndexer(output_dir.parent).update_session(output_dir)
+            self.logger.info(
+                "Transcript search index updated for %s: %d added, %d changed",
+                output_dir.name,
+                len(update.added),
+                len(update.changed)
+            )
+        except Exception as exc:
+            self.logger.warning("Failed to update transcript search index: %s", exc)
+
     def _stage_audio_segments_export(
         self,
         wav_file: Path,
@@ -1186,30 +1473,15 @@ class DDSessionProcessor:
                     # Initialize manifest
                     manifest_path = self.snipper.initialize_manifest(segments_dir)
 
-                    # Export each segment
-                    for i, segment in enumerate(speaker_segments_with_labels):
-                        classification = (
-                            classifications[i]
-                            if classifications and i < len(classifications)
-                            else None
-                        )
-                        self.snipper.export_incremental(
-                            wav_file,
-                            segment,
-                            i + 1,
-                            segments_dir,
-                            manifest_path,
-                            classification.to_dict() if classification else None
-                        )
-
-                    # Finalize manifest
-                    with self.snipper._manifest_lock:
-                        manifest_data = json.loads(manifest_path.read_text(encoding="utf-8"))
-                        manifest_data["status"] = "complete"
-                        manifest_path.write_text(
-                            json.dumps(manifest_data, indent=2, ensure_ascii=False),
-                            encoding="utf-8"
-                        )
+                    # Export all segments concurrently, then write the manifest once
+                    self.snipper.export_clips(
+                        wav_file,
+                        speaker_segments_with_labels,
+                        segments_dir,
+                        manifest_path,
+                        [classification.to_dict() if classification else None for classification in classifications or []]
+                    )
+                    self.snipper.finalize_manifest(manifest_path)
 
                     result.status = ProcessingStatus.COMPLETED
                     result.data = {
@@ -1487,6 +1759,93 @@ class DDSessionProcessor:
         except Exception as e:
             self.logger.warning("Failed to save checkpoint for %s: %s", stage.value, e)
 
+    # Journal holding one ChunkTranscription per line while stage 3 is running
+    TRANSCRIPTION_JOURNAL = "chunk_transcriptions"
+
+    def _journal_chunk_transcription(self, transcription: ChunkTranscription):
+        """Persist a single finished chunk so stage 3 can resume mid-way."""
+        try:
+            self.checkpoint_manager.append_journal(
+                PipelineStage.AUDIO_TRANSCRIBED,
+                self.TRANSCRIPTION_JOURNAL,
+                transcription.to_dict()
+            )
+        except Exception as e:
+            self.logger.warning(
+                "Failed to journal transcription for chunk %s: %s",
+                getattr(transcription, "chunk_index", "?"),
+                e
+            )
+
+    def _load_transcription_journal(
+        self,
+        chunks: Optional[List[AudioChunk]]
+    ) -> Dict[int, ChunkTranscription]:
+        """
+        Load chunk transcriptions persisted by an interrupted stage 3 run.
+
+        Journal entries are only reused when their chunk boundaries match the
+        chunks from the AUDIO_CHUNKED checkpoint; mismatching entries are
+        dropped and the journal is rewritten without them.
+
+        Args:
+            chunks: Audio chunks the pipeline is about to transcribe, or None
+                when Stage 2 streams them; entries are then matched by stage 3
+                as each chunk arrives
+
+        Returns:
+            Mapping of chunk_index to restored ChunkTranscription
+        """
+        try:
+            entries = self.checkpoint_manager.read_journal(
+                PipelineStage.AUDIO_TRANSCRIBED,
+                self.TRANSCRIPTION_JOURNAL
+            )
+        except Exception as e:
+            self.logger.warning("Failed to read transcription journal: %s", e)
+            return {}
+
+        by_index = {chunk.chunk_index: chunk for chunk in chunks} if chunks is not None else None
+        restored: Dict[int, ChunkTranscription] = {}
+        discarded = 0
+        for entry in entries:
+            try:
+                transcription = ChunkTranscription.from_dict(entry)
+            except (KeyError, TypeError, AttributeError):
+                discarded += 1
+                continue
+            if by_index is not None:
+                chunk = by_index.get(transcription.chunk_index)
+                if chunk is None or not self._journal_entry_matches(transcription, chunk):
+                    discarded += 1
+                    continue
+            restored[transcription.chunk_index] = transcription
+
+        if discarded:
+            self.logger.warning(
+                "Discarded %d journaled transcription(s) that do not match current chunk boundaries",
+                discarded
+            )
+            try:
+                self.checkpoint_manager.reset_journal(
+                    PipelineStage.AUDIO_TRANSCRIBED,
+                    self.TRANSCRIPTION_JOURNAL,
+                    [restored[index].to_dict() for index in sorted(restored)]
+                )
+            except Exception as e:
+                self.logger.warning("Failed to rewrite transcription journal: %s", e)
+
+        return restored
+
+    @staticmethod
+    def _journal_entry_matches(transcription: ChunkTranscription, chunk: AudioChunk) -> bool:
+        """Whether a journaled transcription was made for ``chunk``'s boundaries."""
+        tolerance = 1e-3
+        return (
+            abs(chunk.start_time - transcription.chunk_start) <= tolerance
+            and abs(chunk.end_time - transcription.chunk_end) <= tolerance
+        )
+
     def _reconstruct_chunks_from_checkpoint(
         self,
         chunk_dicts: List[Dict],
@@ -1500,7 +1859,9 @@ class DDSessionProcessor:
             wav_file: Path to audio file for loading segments
 
         Returns:
-            List of AudioChunk objects with audio data
+            List of LazyAudioChunk objects. Their audio is read from a shared
+            memory-mapped view of ``wav_file`` only when a consumer accesses
+            it, so resuming does not re-read every chunk up front.
 
         Raises:
             FileNotFoundError: If wav_file doesn't exist
@@ -1511,20 +1872,8 @@ class DDSessionProcessor:
                 "Cannot reconstruct audio chunks."
             )
 
-        reconstructed_chunks = []
-        for chunk_data in chunk_dicts:
-            start_time = chunk_data["start_time"]
-            end_time = chunk_data["end_time"]
-            audio_segment, _ = self.audio_processor.load_audio_segment(
-                wav_file,
-                start_time,
-                end_time
-            )
-            reconstructed_chunks.append(
-                AudioChunk.from_dict(chunk_data, audio_data=audio_segment)
-            )
-
-        return reconstructed_chunks
+        source = MappedAudioFile(wav_file)
+        return [LazyAudioChunk.from_dict(chunk_data, source) for chunk_data in chunk_dicts]
 
     def _check_cancellation(self):
         """
@@ -1587,6 +1936,7 @@ class DDSessionProcessor:
                 - statistics: Session statistics
                 - audio_segments: Segment export info
                 - knowledge_extraction: Extracted entities
+                - stage_timings: Per-stage durations (and sub-phase timings) in seconds
                 - success: Boolean success flag
 
         Raises:
@@ -1698,6 +2048,9 @@ class DDSessionProcessor:
 
         StatusTracker.start_session(self.session_id, skip_flags, session_options, campaign_id=self.campaign_id)
 
+        self.stage_timings = {}
+        background_diarization: Optional[BackgroundDiarization] = None
+
         try:
             # Check for cancellation before starting processing
             self._check_cancellation()
@@ -1726,6 +2079,7 @@ class DDSessionProcessor:
 
             if not self._should_skip_stage(PipelineStage.AUDIO_CONVERTED, completed_stages):
                 result = self._stage_audio_conversion(input_file, output_dir)
+                self._record_stage_timing(result)
                 if not result.success:
                     raise RuntimeError(f"Audio conversion failed: {', '.join(result.errors)}")
                 wav_file = Path(result.data["wav_path"])
@@ -1741,6 +2095,15 @@ class DDSessionProcessor:
                 # Check for cancellation after Stage 1
                 self._check_cancellation()
 
+            # Diarization only needs the WAV, so optionally run it in a separate
+            # process while stages 2-4 chunk, transcribe and merge.
+            if (
+                self.overlap_diarization
+                and not skip_diarization
+                and not self._should_skip_stage(PipelineStage.SPEAKER_DIARIZED, completed_stages)
+            ):
+                background_diarization = self._start_background_diarization(wav_file)
+
             # ============================================================
             # Stage 2: Audio Chunking
             # ============================================================
@@ -1759,11 +2122,37 @@ class DDSessionProcessor:
                 else:
                     completed_stages.discard(PipelineStage.AUDIO_CHUNKED)
 
-            if not self._should_skip_stage(PipelineStage.AUDIO_CHUNKED, completed_stages):
+            # With streaming chunking, stage 3 consumes chunks while VAD is still
+            # running; stage 2 then completes (and is checkpointed) inside stage 3.
+            chunk_source: Iterable[AudioChunk] = chunks
+            streamed_chunking: Optional[StageResult] = None
+
+            if (
+                not self._should_skip_stage(PipelineStage.AUDIO_CHUNKED, completed_stages)
+                and Config.CHUNKER_STREAMING
+                and not self._should_skip_stage(PipelineStage.AUDIO_TRANSCRIBED, completed_stages)
+            ):
+                def _chunking_complete(result: StageResult, chunk_dicts: List[Dict[str, Any]]) -> None:
+                    completed_stages.add(PipelineStage.AUDIO_CHUNKED)
+                    self._save_stage_to_checkpoint(
+                        PipelineStage.AUDIO_CHUNKED,
+                        {"chunks": chunk_dicts},
+                        completed_stages,
+                        checkpoint_metadata
+                    )
+                    _report_progress(2, f"Stage 2/{self.TOTAL_PIPELINE_STAGES}: Audio chunked ({len(chunk_dicts)} chunks)")
+
+                streamed_chunking, chunk_source = self._stage_audio_chunking_streamed(
+                    wav_file, duration, on_complete=_chunking_complete
+                )
+
+            elif not self._should_skip_stage(PipelineStage.AUDIO_CHUNKED, completed_stages):
                 result = self._stage_audio_chunking(wav_file, duration)
+                self._record_stage_timing(result)
                 if not result.success:
                     raise RuntimeError(f"Audio chunking failed: {', '.join(result.errors)}")
                 chunks = result.data["chunks"]
+                chunk_source = chunks
                 completed_stages.add(PipelineStage.AUDIO_CHUNKED)
                 # Save as dictionaries for serialization
                 self._save_stage_to_checkpoint(
@@ -1812,7 +2201,29 @@ class DDSessionProcessor:
                     completed_stages.discard(PipelineStage.AUDIO_TRANSCRIBED)
 
             if not self._should_skip_stage(PipelineStage.AUDIO_TRANSCRIBED, completed_stages):
-                result = self._stage_audio_transcription(chunks)
+                journaled_transcriptions: Dict[int, ChunkTranscription] = {}
+                if self.resume_enabled:
+                    journaled_transcriptions = self._load_transcription_journal(
+                        None if streamed_chunking is not None else chunks
+                    )
+                else:
+                    try:
+                        self.checkpoint_manager.reset_journal(
+                            PipelineStage.AUDIO_TRANSCRIBED,
+                            self.TRANSCRIPTION_JOURNAL
+                        )
+                    except Exception as e:
+                        self.logger.warning("Failed to reset transcription journal: %s", e)
+
+                result = self._stage_audio_transcription(chunk_source, journaled_transcriptions)
+
+                # Still RUNNING only if transcription failed before chunking finished
+                if streamed_chunking is not None and streamed_chunking.status != ProcessingStatus.RUNNING:
+                    self._record_stage_timing(streamed_chunking)
+                    if not streamed_chunking.success:
+                        raise RuntimeError(f"Audio chunking failed: {', '.join(streamed_chunking.errors)}")
+
+                self._record_stage_timing(result)
                 if not result.success:
                     raise RuntimeError(f"Audio transcription failed: {', '.join(result.errors)}")
                 chunk_transcriptions = result.data["chunk_transcriptions"]
@@ -1872,6 +2283,7 @@ class DDSessionProcessor:
 
             if not self._should_skip_stage(PipelineStage.TRANSCRIPTION_MERGED, completed_stages):
                 result = self._stage_transcription_merging(chunk_transcriptions)
+                self._record_stage_timing(result)
                 if not result.success:
                     raise RuntimeError(f"Transcription merging failed: {', '.join(result.errors)}")
                 merged_segments = result.data["merged_segments"]
@@ -1940,7 +2352,13 @@ class DDSessionProcessor:
                     completed_stages.discard(PipelineStage.SPEAKER_DIARIZED)
 
             if not self._should_skip_stage(PipelineStage.SPEAKER_DIARIZED, completed_stages):
-                result = self._stage_speaker_diarization(wav_file, merged_segments, skip_diarization)
+                result = self._stage_speaker_diarization(
+                    wav_file,
+                    merged_segments,
+                    skip_diarization,
+                    background_diarization=background_diarization
+                )
+                self._record_stage_timing(result)
                 # Diarization can fail gracefully, so check for completion or skip
                 if result.success or result.status == ProcessingStatus.SKIPPED:
                     speaker_segments_with_labels = result.data["speaker_segments_with_labels"]
@@ -2012,6 +2430,7 @@ class DDSessionProcessor:
 
             if not self._should_skip_stage(PipelineStage.SEGMENTS_CLASSIFIED, completed_stages):
                 result = self._stage_segments_classification(speaker_segments_with_labels, skip_classification)
+                self._record_stage_timing(result)
                 # Classification can fail gracefully, so check for completion or skip
                 if result.success or result.status == ProcessingStatus.SKIPPED:
                     classifications = result.data["classifications"]
@@ -2095,6 +2514,7 @@ class DDSessionProcessor:
                     output_dir,
                     input_file
                 )
+                self._record_stage_timing(result)
                 if not result.success:
                     raise RuntimeError(f"Output generation failed: {', '.join(result.errors)}")
                 output_files = result.data["output_files"]
@@ -2111,6 +2531,7 @@ class DDSessionProcessor:
                     completed_stages,
                     checkpoint_metadata
                 )
+                self._update_transcript_index(output_dir)
                 _report_progress(7, f"Stage 7/{self.TOTAL_PIPELINE_STAGES}: Transcript outputs generated")
                 # Check for cancellation after Stage 7
                 self._check_cancellation()
@@ -2140,6 +2561,7 @@ class DDSessionProcessor:
                     output_dir,
                     skip_snippets
                 )
+                self._record_stage_timing(result)
                 # Audio segment export is optional, always succeeds
                 segment_export = result.data["segment_export"]
                 completed_stages.add(PipelineStage.AUDIO_SEGMENTS_EXPORTED)
@@ -2175,6 +2597,7 @@ class DDSessionProcessor:
                     output_dir,
                     skip_knowledge
                 )
+                self._record_stage_timing(result)
                 # Knowledge extraction is optional, always succeeds
                 knowledge_data = result.data["knowledge_data"]
                 completed_stages.add(PipelineStage.KNOWLEDGE_EXTRACTED)
@@ -2208,6 +2631,13 @@ class DDSessionProcessor:
                 for char, count in sorted(stats['character_appearances'].items(), key=lambda x: -x[1]):
                     self.logger.info("Character '%s' appearances: %d", char, count)
 
+            for stage_name, timing in self.stage_timings.items():
+                self.logger.info(
+                    "Stage timing %s: %s",
+                    stage_name,
+                    ", ".join(f"{key}={value:.2f}s" for key, value in timing.items() if value is not None)
+                )
+
             duration_seconds = perf_counter() - start_time
             StatusTracker.complete_session(self.session_id)
             log_session_end(self.session_id, duration_seconds, success=True)
@@ -2221,10 +2651,13 @@ class DDSessionProcessor:
                 'statistics': stats,
                 'audio_segments': segment_export,
                 'knowledge_extraction': knowledge_data,
+                'stage_timings': self.stage_timings,
                 'success': True
             }
 
         except Exception as processing_error:
+            if background_diarization is not None:
+                background_diarization.cancel()
             duration_seconds = perf_counter() - start_time
             log_error_with_context(processing_error, context="DDSessionProcessor.process")
             StatusTracker.fail_session(self.session_id, str(processing_error))
@@ -2378,6 +2811,7 @@ class DDSessionProcessor:
         output_files = result.data["output_files"]
         stats = result.data["statistics"]
         speaker_profiles = result.data.get("speaker_profiles", {})
+        self._update_transcript_index(output_dir)
 
         # Run optional stages if not skipped
         segment_export: Dict[str, Any] = {'segments_dir': None, 'manifest': None}
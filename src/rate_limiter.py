@@ -3,6 +3,7 @@ from __future__ import annotations
 
 from collections import deque
 from typing import Callable, Deque, Optional
+import threading
 import time
 
 
@@ -25,6 +26,8 @@ class RateLimiter:
         self._clock = clock or time.monotonic
         self._sleep = sleeper or time.sleep
         self._timestamps: Deque[float] = deque()
+        # Serializes acquire() so the limiter can be shared by worker threads.
+        self._lock = threading.Lock()
 
     @property
     def period(self) -> float:
@@ -32,15 +35,16 @@ class RateLimiter:
 
     def acquire(self) -> None:
         """Block until a new call fits within the configured window."""
-        now = self._clock()
-        self._prune(now)
-        if len(self._timestamps) >= self.max_calls:
-            sleep_time = self._period - (now - self._timestamps[0])
-            if sleep_time > 0:
-                self._sleep(sleep_time)
-                now = self._clock()
-                self._prune(now)
-        self._timestamps.append(now)
+        with self._lock:
+            now = self._clock()
+            self._prune(now)
+            if len(self._timestamps) >= self.max_calls:
+                sleep_time = self._period - (now - self._timestamps[0])
+                if sleep_time > 0:
+                    self._sleep(sleep_time)
+                    now = self._clock()
+                    self._prune(now)
+            self._timestamps.append(now)
 
     def penalize(self, extra_delay: Optional[float] = None) -> None:
         """Sleep for an additional delay (defaults to one period)."""
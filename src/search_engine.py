@@ -15,17 +15,23 @@ from dataclasses import dataclass, field
 from enum import Enum
 from typing import List, Optional, Set, Tuple
 
+import numpy as np
+
+from src.inverted_index import InvertedIndex, tokenize
 from src.transcript_indexer import TranscriptIndex, TranscriptSegment
 
 logger = logging.getLogger("DDSessionProcessor.search_engine")
 
+# Relevance added to in-character segments
+IC_BOOST = 0.2
+
 
 class SearchMode(Enum):
     """Search mode options."""
 
-    FULL_TEXT = "fulltext"  # Case-insensitive substring match
+    FULL_TEXT = "fulltext"  # All query words, ranked by BM25
     REGEX = "regex"  # Regular expression
-    EXACT = "exact"  # Exact phrase match
+    EXACT = "exact"  # Exact phrase match (consecutive words)
 
 
 @dataclass
@@ -65,7 +71,7 @@ class SearchEngine:
     Full-text search engine for transcript data.
 
     Features:
-    - Full-text search (case-insensitive)
+    - Full-text search (case-insensitive, BM25-ranked via an inverted index)
     - Regular expression support
     - Exact phrase matching
     - Speaker filtering
@@ -105,6 +111,11 @@ class SearchEngine:
         """
         Search the transcript index.
 
+        Full-text queries are ranked with BM25 over the inverted index and
+        must contain every query word; exact queries match the words as a
+        consecutive phrase. Filters are applied as bitmaps before any text is
+        scored, and the top ``max_results`` are selected with a heap.
+
         Args:
             query: Search query string
             mode: Search mode (fulltext, regex, exact)
@@ -129,116 +140,147 @@ class SearchEngine:
         else:
             query = query.strip()
 
-        results: List[SearchResult] = []
-
-        # Compile regex pattern if needed
         pattern = None
-        if mode == SearchMode.REGEX:
+        if mode == SearchMode.REGEX and query:
             try:
                 pattern = re.compile(query, re.IGNORECASE)
             except re.error as e:
                 logger.error(f"Invalid regex pattern: {query} - {e}")
                 return []
-        elif mode == SearchMode.EXACT:
-            # Exact match uses escaped regex
-            pattern = re.compile(re.escape(query), re.IGNORECASE)
-
-        # FIX: Use enumerate to track index for efficient context extraction
-        # Search through segments
-        for idx, segment in enumerate(self.index.segments):
-            # Apply filters first (cheap operation)
-            if not self._passes_filters(segment, filters):
-                continue
-
-            # Check if segment matches query
-            match = False
-            match_text = ""
-
-            # If query is empty, match all (filter-only search)
-            if not query:
-                match = True
-                match_text = segment.text[:100]  # Show first 100 chars
-            elif mode == SearchMode.FULL_TEXT:
-                # Case-insensitive substring search
-                if query.lower() in segment.text.lower():
-                    match = True
-                    match_text = self._extract_match(segment.text, query)
-            else:
-                # Regex or exact match
-                if pattern and pattern.search(segment.text):
-                    match = True
-                    match_obj = pattern.search(segment.text)
-                    match_text = match_obj.group(0) if match_obj else query
-
-            if match:
-                result = SearchResult(
-                    segment=segment,
-                    match_text=match_text,
-                    relevance_score=self._calculate_relevance(segment, query),
-                )
 
-                if include_context:
-                    # Pass index directly instead of searching for it (O(1) vs O(n))
-                    result.context_before, result.context_after = self._get_context(
-                        idx, segment
-                    )
+        search_index = self.index.get_search_index()
+        mask = self._filter_mask(search_index, filters)
+        terms = tokenize(query)
 
-                results.append(result)
-
-                # Stop if we hit max results (optimization)
-                if len(results) >= max_results:
-                    break
+        # Segment positions of every match and their relevance scores
+        if not query:
+            # Filter-only: rank by the same timestamp/IC score as
+            # _calculate_relevance, computed from the index columns
+            doc_ids = np.flatnonzero(mask) if mask is not None else np.arange(len(search_index))
+            timestamps = np.nan_to_num(search_index.attribute_values("timestamp")[doc_ids])
+            ic = search_index.field_mask("ic_ooc", ["IC"])[doc_ids]
+            scores = 1.0 + timestamps * 0.0001 + np.where(ic, IC_BOOST, 0.0)
+        elif mode == SearchMode.REGEX or not terms:
+            # Regex (or a query without word characters) needs the raw text;
+            # only segments that passed the filters are scanned.
+            if pattern is None:
+                pattern = re.compile(re.escape(query), re.IGNORECASE)
+            candidates = np.flatnonzero(mask) if mask is not None else range(len(self.index.segments))
+            matches = [int(idx) for idx in candidates if pattern.search(self.index.segments[idx].text)]
+            doc_ids = np.asarray(matches, dtype=np.int64)
+            scores = np.array(
+                [self._calculate_relevance(self.index.segments[idx], query) for idx in matches],
+                dtype=np.float64,
+            )
+        else:
+            doc_ids, bm25_scores = search_index.bm25(terms, mask=mask)
+            if mode == SearchMode.EXACT and len(terms) > 1:
+                keep = np.isin(doc_ids, search_index.phrase_docs(terms, mask=mask))
+                doc_ids, bm25_scores = doc_ids[keep], bm25_scores[keep]
+            # Boost IC segments slightly (assuming IC content more important)
+            ic = search_index.field_mask("ic_ooc", ["IC"])[doc_ids]
+            scores = bm25_scores + np.where(ic, IC_BOOST, 0.0)
+
+        # Only the top results are materialized as segments
+        results: List[SearchResult] = []
+        for position in self._top_k(scores, max_results):
+            idx = int(doc_ids[position])
+            segment = self.index.segments[idx]
+            result = SearchResult(
+                segment=segment,
+                match_text=self._match_text(segment.text, query, terms, mode, pattern),
+                relevance_score=float(scores[position]),
+            )
+            if include_context:
+                result.context_before, result.context_after = self._get_context(idx, segment)
+            results.append(result)
+
+        logger.info(f"Search '{query}' returned {len(results)} results ({len(doc_ids)} matches)")
+        return results
 
-        # Sort by relevance (highest score first)
-        results.sort(key=lambda r: r.relevance_score, reverse=True)
+    @staticmethod
+    def _top_k(scores: np.ndarray, k: int) -> np.ndarray:
+        """
+        Positions of the ``k`` highest scores, best first.
 
-        logger.info(f"Search '{query}' returned {len(results)} results")
-        return results
+        Uses a partial partition rather than a full sort; equal scores keep
+        their input order, as with a stable sort.
+        """
+        if k <= 0 or not len(scores):
+            return np.empty(0, dtype=np.int64)
+        if k < len(scores):
+            threshold = scores[np.argpartition(-scores, k - 1)[k - 1]]
+            above = np.flatnonzero(scores > threshold)
+            ties = np.flatnonzero(scores == threshold)[: k - len(above)]
+            candidates = np.concatenate([above, ties])
+        else:
+            candidates = np.arange(len(scores))
+        return candidates[np.lexsort((candidates, -scores[candidates]))]
 
-    def _passes_filters(
-        self, segment: TranscriptSegment, filters: Optional[SearchFilters]
-    ) -> bool:
+    def _filter_mask(
+        self, search_index: InvertedIndex, filters: Optional[SearchFilters]
+    ) -> Optional[np.ndarray]:
         """
-        Check if segment passes all filters.
+        Combine filter bitmaps into one segment mask.
 
         Args:
-            segment: Segment to check
+            search_index: Inverted index of the transcript index
             filters: Search filters to apply
 
         Returns:
-            True if segment passes all filters (or if no filters provided)
+            Boolean mask over segments, or None when nothing is filtered
         """
         if not filters:
-            return True
-
-        # Speaker filter
-        if filters.speakers and segment.speaker not in filters.speakers:
-            return False
-
-        # IC/OOC filter
-        if filters.ic_ooc and segment.ic_ooc != filters.ic_ooc:
-            return False
-
-        # Session ID filter
-        if filters.session_ids and segment.session_id not in filters.session_ids:
-            return False
-
-        # Time range filter (within session, in seconds)
+            return None
+
+        masks = []
+        if filters.speakers:
+            masks.append(search_index.field_mask("speaker", filters.speakers))
+        if filters.ic_ooc:
+            masks.append(search_index.field_mask("ic_ooc", [filters.ic_ooc]))
+        if filters.session_ids:
+            masks.append(search_index.field_mask("session_id", filters.session_ids))
         if filters.time_range:
             min_time, max_time = filters.time_range
-            if not (min_time <= segment.timestamp <= max_time):
-                return False
-
-        # Date range filter (across sessions, by session_date string)
-        if filters.min_timestamp and segment.session_date:
-            if segment.session_date < filters.min_timestamp:
-                return False
+            masks.append(search_index.range_mask("timestamp", min_time, max_time))
+        if filters.min_timestamp or filters.max_timestamp:
+            # Segments without a session date are not excluded by the date range
+            masks.append(
+                search_index.range_mask(
+                    "session_date",
+                    filters.min_timestamp,
+                    filters.max_timestamp,
+                    include_missing=True,
+                )
+            )
 
-        if filters.max_timestamp and segment.session_date:
-            if segment.session_date > filters.max_timestamp:
-                return False
+        if not masks:
+            return None
+        mask = masks[0]
+        for other in masks[1:]:
+            mask = mask & other
+        return mask
 
-        return True
+    def _match_text(
+        self,
+        text: str,
+        query: str,
+        terms: List[str],
+        mode: SearchMode,
+        pattern: Optional[re.Pattern],
+    ) -> str:
+        """Text shown for a match: the matched portion with some context."""
+        if not query:
+            return text[:100]  # Show first 100 chars
+        if mode == SearchMode.REGEX or not terms:
+            match_obj = pattern.search(text) if pattern else None
+            return match_obj.group(0) if match_obj else query
+        if mode == SearchMode.EXACT:
+            phrase = re.search(r"\W+".join(re.escape(term) for term in terms), text, re.IGNORECASE)
+            return phrase.group(0) if phrase else query
+        if query.lower() in text.lower():
+            return self._extract_match(text, query)
+        return self._extract_match(text, terms[0])
 
     def _extract_match(
         self, text: str, query: str, context_chars: int = 50
@@ -297,7 +339,7 @@ class SearchEngine:
             # More recent segments get slightly higher scores
             score += segment.timestamp * 0.0001
             if segment.ic_ooc == "IC":
-                score += 0.2
+                score += IC_BOOST
             return score
 
         # Boost score if query appears multiple times
@@ -306,7 +348,7 @@ class SearchEngine:
 
         # Boost IC segments slightly (assuming IC content more important)
         if segment.ic_ooc == "IC":
-            score += 0.2
+            score += IC_BOOST
 
         # Boost if match is closer to start of text (title/topic match)
         # FIX: Check for empty text to avoid ZeroDivisionError
@@ -6,10 +6,11 @@ import shutil
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Iterable, List, Optional, Sequence, Union
+from typing import Dict, Iterable, List, Optional, Sequence, Union
 
 from .config import Config
 from .logger import get_logger
+from .snipper import VIRTUAL_SOURCE_FILE, VirtualSnippetRenderer
 
 __all__ = [
     "ArtifactMetadata",
@@ -121,6 +122,7 @@ class SessionArtifactService:
         self.text_preview_extensions = {
             ext.lower() for ext in (text_preview_extensions or DEFAULT_TEXT_PREVIEW_EXTENSIONS)
         }
+        self.snippet_renderer = VirtualSnippetRenderer()
         self.logger = get_logger("session_artifacts")
 
         self.output_dir.mkdir(parents=True, exist_ok=True)
@@ -143,7 +145,11 @@ class SessionArtifactService:
         return summaries
 
     def list_directory(self, relative_path: RelativePath) -> List[ArtifactMetadata]:
-        """Return metadata for direct children of the provided directory."""
+        """Return metadata for direct children of the provided directory.
+
+        Clips of a virtual snippet manifest are listed alongside the real files
+        even though they are only rendered when downloaded.
+        """
         directory = self._resolve_relative_path(relative_path)
         if not directory.is_dir():
             raise SessionArtifactServiceError(f"{directory} is not a directory")
@@ -154,6 +160,10 @@ class SessionArtifactService:
                 artifacts.append(self._build_artifact_metadata(child))
             except OSError as exc:
                 self.logger.warning("Failed to inspect artifact %s: %s", child, exc)
+        listed = {artifact.name for artifact in artifacts}
+        for clip_file, size in self.snippet_renderer.clip_sizes(directory).items():
+            if clip_file not in listed:
+                artifacts.append(self._build_virtual_clip_metadata(directory / clip_file, size))
         artifacts.sort(key=lambda artifact: artifact.name.lower())
         return artifacts
 
@@ -161,7 +171,10 @@ class SessionArtifactService:
         """Return metadata for a single artifact located inside the output directory."""
         artifact_path = self._resolve_relative_path(relative_path)
         if not artifact_path.exists():
-            raise SessionArtifactServiceError(f"Artifact {relative_path!r} does not exist")
+            size = self.snippet_renderer.clip_sizes(artifact_path.parent).get(artifact_path.name)
+            if size is None:
+                raise SessionArtifactServiceError(f"Artifact {relative_path!r} does not exist")
+            return self._build_virtual_clip_metadata(artifact_path, size)
         return self._build_artifact_metadata(artifact_path)
 
     def get_text_preview(
@@ -204,16 +217,35 @@ class SessionArtifactService:
         destination: Optional[Path] = None,
         compression: int = zipfile.ZIP_DEFLATED,
     ) -> Path:
-        """Bundle an entire session directory into a zip archive stored under temp/."""
+        """Bundle an entire session directory into a zip archive stored under temp/.
+
+        Virtual snippet directories are bundled as their rendered clips rather
+        than the session audio the clips are cut from.
+        """
         session_dir = self._resolve_relative_path(relative_path)
         if not session_dir.is_dir():
             raise SessionArtifactServiceError(f"{session_dir} is not a directory")
 
+        virtual_dirs: Dict[Path, List[str]] = {}
+        for directory in [session_dir, *(path for path in session_dir.rglob("*") if path.is_dir())]:
+            clip_files = sorted(self.snippet_renderer.clip_sizes(directory))
+            if clip_files:
+                virtual_dirs[directory] = clip_files
+
         archive_path = self._resolve_archive_destination(session_dir, destination)
         with zipfile.ZipFile(archive_path, "w", compression=compression) as archive:
             for file_path in sorted(self._iter_files(session_dir)):
+                if file_path.name == VIRTUAL_SOURCE_FILE and file_path.parent in virtual_dirs:
+                    continue
                 arcname = file_path.relative_to(session_dir).as_posix()
                 archive.write(file_path, arcname=arcname)
+            for directory, clip_files in virtual_dirs.items():
+                for clip_file in clip_files:
+                    clip_path = directory / clip_file
+                    if clip_path.exists():
+                        continue
+                    arcname = clip_path.relative_to(session_dir).as_posix()
+                    archive.writestr(arcname, self.snippet_renderer.render(directory, clip_file))
         self.logger.info("Created session bundle at %s", archive_path)
         return archive_path
 
@@ -293,6 +325,19 @@ class SessionArtifactService:
             is_directory=path.is_dir(),
         )
 
+    def _build_virtual_clip_metadata(self, path: Path, size_bytes: int) -> ArtifactMetadata:
+        # Virtual clips have no file of their own; report the manifest's timestamps
+        stats = (path.parent / "manifest.json").stat()
+        return ArtifactMetadata(
+            name=path.name,
+            relative_path=self._to_relative_str(path),
+            artifact_type=self._artifact_type(path),
+            size_bytes=size_bytes,
+            created=self._timestamp(stats.st_ctime),
+            modified=self._timestamp(stats.st_mtime),
+            is_directory=False,
+        )
+
     def _artifact_type(self, path: Path) -> str:
         if path.is_dir():
             return "directory"
@@ -1,14 +1,174 @@
 """Audio segment export utilities"""
+import io
 import json
+import os
 import re
+import shutil
 import subprocess
 import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+import numpy as np
+import soundfile as sf
 from pydub import AudioSegment
 from .config import Config
 from .logger import get_logger
 
+# Clip records are appended here while exporting; manifest.json is written once at the end
+CLIP_LOG_FILE = "manifest.jsonl"
+# Virtual snippet manifests reference sample offsets into this copy of the session audio
+VIRTUAL_SOURCE_FILE = "session.wav"
+# Source subtypes copied sample-for-sample; anything else is written as 16-bit PCM
+_NATIVE_READ_DTYPES = {"PCM_16": "int16", "PCM_32": "int32", "FLOAT": "float32", "DOUBLE": "float64"}
+
+
+class WavClipSource:
+    """
+    Seekable reader that slices clips out of a WAV file without FFmpeg.
+
+    Every clip opens its own ``SoundFile`` handle, seeks to the first frame
+    and reads only the clip's frames, so clips can be written concurrently
+    from a thread pool (libsndfile releases the GIL). PCM/float samples are
+    copied without conversion, so clips are identical to the source audio.
+    """
+
+    def __init__(self, audio_path: Path):
+        self.audio_path = Path(audio_path)
+        info = sf.info(str(self.audio_path))
+        if info.format != "WAV":
+            raise ValueError(f"{self.audio_path.name} is {info.format}, not WAV")
+        self.sample_rate = info.samplerate
+        self.frames = info.frames
+        self.channels = info.channels
+        self.subtype = info.subtype if info.subtype in _NATIVE_READ_DTYPES else "PCM_16"
+        self._dtype = _NATIVE_READ_DTYPES.get(info.subtype, "int16")
+        self._header_bytes: Optional[int] = None
+
+    def frame_range(self, start_time: float, end_time: float) -> Tuple[int, int]:
+        """Sample offsets ``[start, end)`` of a clip, clamped to the file."""
+        start = min(int(round(start_time * self.sample_rate)), self.frames)
+        end = min(max(int(round(end_time * self.sample_rate)), start + 1), self.frames)
+        return start, end
+
+    def write_clip(self, start_time: float, end_time: float, output_path: Path) -> None:
+        self._write_frames(*self.frame_range(start_time, end_time), str(output_path))
+
+    def render_frames(self, start: int, end: int) -> bytes:
+        """WAV file bytes of the samples ``[start, end)``."""
+        buffer = io.BytesIO()
+        self._write_frames(start, end, buffer)
+        return buffer.getvalue()
+
+    def clip_size(self, start: int, end: int) -> int:
+        """Byte size of ``render_frames(start, end)`` without rendering the clip."""
+        if self._header_bytes is None:
+            self._header_bytes = len(self.render_frames(0, 0))
+        frame_bytes = self.channels * np.dtype(self._dtype).itemsize
+        return self._header_bytes + max(end - start, 0) * frame_bytes
+
+    def _write_frames(self, start: int, end: int, target) -> None:
+        with sf.SoundFile(str(self.audio_path), "r") as reader:
+            reader.seek(start)
+            samples = reader.read(max(end - start, 0), dtype=self._dtype, always_2d=True)
+        sf.write(target, samples, self.sample_rate, subtype=self.subtype, format="WAV")
+
+
+class VirtualSnippetRenderer:
+    """
+    Renders the clips of virtual snippet manifests on demand.
+
+    A virtual manifest stores each clip's sample offsets into the session
+    WAV instead of a file per clip; ``render`` range-reads just those samples
+    and returns them as WAV bytes. Parsed manifests are cached until the
+    file changes, and rendered clips are kept in an LRU cache bounded by
+    ``cache_bytes`` so replaying a clip does not touch the disk.
+    """
+
+    def __init__(self, cache_bytes: Optional[int] = None):
+        if cache_bytes is None:
+            cache_bytes = int(Config.SNIPPET_RENDER_CACHE_MB * 1024 * 1024)
+        self.cache_bytes = max(0, int(cache_bytes))
+        self._cache: "OrderedDict[Tuple[str, int, str], bytes]" = OrderedDict()
+        self._cached_bytes = 0
+        self._manifests: Dict[str, Tuple[int, Dict[str, Dict[str, Any]], WavClipSource]] = {}
+        self._lock = threading.Lock()
+
+    def is_virtual_clip(self, clip_path: Path) -> bool:
+        """True if ``clip_path`` names a clip of a virtual manifest in its directory."""
+        try:
+            _, clips, _ = self._manifest(Path(clip_path).parent)
+        except (OSError, ValueError, RuntimeError):
+            return False
+        return Path(clip_path).name in clips
+
+    def clip_sizes(self, session_dir: Path) -> Dict[str, int]:
+        """Rendered byte size of every virtual clip of ``session_dir``; empty if it has none."""
+        try:
+            _, clips, source = self._manifest(Path(session_dir))
+        except (OSError, ValueError, RuntimeError):
+            return {}
+        return {
+            name: source.clip_size(int(clip["start_sample"]), int(clip["end_sample"]))
+            for name, clip in clips.items()
+        }
+
+    def render(self, session_dir: Path, clip_file: str) -> bytes:
+        """
+        WAV bytes of the virtual clip ``clip_file`` of ``session_dir``.
+
+        Raises:
+            FileNotFoundError: If the session has no virtual clip of that name
+        """
+        session_dir = Path(session_dir)
+        mtime, clips, source = self._manifest(session_dir)
+        clip = clips.get(clip_file)
+        if clip is None:
+            raise FileNotFoundError(f"No virtual snippet {clip_file!r} in {session_dir}")
+
+        key = (str(session_dir), mtime, clip_file)
+        with self._lock:
+            data = self._cache.get(key)
+            if data is not None:
+                self._cache.move_to_end(key)
+                return data
+
+        data = source.render_frames(int(clip["start_sample"]), int(clip["end_sample"]))
+        if len(data) <= self.cache_bytes:
+            with self._lock:
+                if key not in self._cache:
+                    self._cache[key] = data
+                    self._cached_bytes += len(data)
+                while self._cached_bytes > self.cache_bytes:
+                    _, evicted = self._cache.popitem(last=False)
+                    self._cached_bytes -= len(evicted)
+        return data
+
+    def render_to_file(self, session_dir: Path, clip_file: str, output_path: Path) -> Path:
+        output_path = Path(output_path)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        output_path.write_bytes(self.render(session_dir, clip_file))
+        return output_path
+
+    def _manifest(self, session_dir: Path) -> Tuple[int, Dict[str, Dict[str, Any]], WavClipSource]:
+        manifest_path = session_dir / "manifest.json"
+        mtime = manifest_path.stat().st_mtime_ns
+        with self._lock:
+            cached = self._manifests.get(str(session_dir))
+        if cached is not None and cached[0] == mtime:
+            return cached
+
+        manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+        if manifest.get("mode") != "virtual":
+            raise ValueError(f"{manifest_path} is not a virtual snippet manifest")
+        clips = {clip["file"]: clip for clip in manifest.get("clips", []) if "start_sample" in clip}
+        source = WavClipSource(session_dir / manifest.get("source_audio", VIRTUAL_SOURCE_FILE))
+        entry = (mtime, clips, source)
+        with self._lock:
+            self._manifests[str(session_dir)] = entry
+        return entry
+
 
 class AudioSnipper:
     """Export per-segment audio clips aligned with transcription segments."""
@@ -19,6 +179,9 @@ class AudioSnipper:
         self.placeholder_message = Config.SNIPPET_PLACEHOLDER_MESSAGE
         self._last_cleanup_count = 0
         self._manifest_lock = threading.Lock()
+        self.use_native = Config.USE_NATIVE_SNIPPET_EXPORT
+        self.use_virtual = Config.USE_VIRTUAL_SNIPPETS
+        self.max_workers = max(1, Config.SNIPPET_EXPORT_WORKERS)
 
         # Streaming export configuration
         self.use_streaming = Config.USE_STREAMING_SNIPPET_EXPORT
@@ -116,12 +279,12 @@ class AudioSnipper:
                 except OSError as exc:
                     self.logger.warning("Failed to remove placeholder artifact %s: %s", artifact_path, exc)
 
-        manifest_file = session_dir / "manifest.json"
-        if manifest_file.exists():
-            try:
-                manifest_file.unlink()
-            except OSError as exc:
-                self.logger.warning("Failed to remove stale manifest %s: %s", manifest_file, exc)
+        for manifest_file in (session_dir / "manifest.json", session_dir / CLIP_LOG_FILE):
+            if manifest_file.exists():
+                try:
+                    manifest_file.unlink()
+                except OSError as exc:
+                    self.logger.warning("Failed to remove stale manifest %s: %s", manifest_file, exc)
 
         if removed:
             self.logger.info("Cleared %d stale clips from %s", removed, session_dir)
@@ -142,18 +305,151 @@ class AudioSnipper:
                 "session_id": session_dir.name,
                 "status": "in_progress",
                 "total_clips": 0,
-                "clips": []
+                "clips": [],
+                # Clips exported so far, one JSON object per line
+                "clip_log": CLIP_LOG_FILE
             }
             manifest_path.write_text(json.dumps(manifest, indent=2, ensure_ascii=False), encoding="utf-8")
+            clip_log = manifest_path.with_name(CLIP_LOG_FILE)
+            if clip_log.exists():
+                clip_log.unlink()
         return manifest_path
 
     def export_incremental(self, audio_path: Path, segment: Dict, index: int, session_dir: Path, manifest_path: Path, classification: Optional[Dict] = None):
         """
-        Export single audio segment (streaming or legacy mode).
+        Export single audio segment and append it to the clip log.
+
+        Slices WAV sources in-process; otherwise uses FFmpeg streaming, or
+        pydub if USE_STREAMING_SNIPPET_EXPORT=false. Call finalize_manifest
+        once all clips are exported; export_clips does both for a whole list.
+        """
+        source = self._open_native_source(audio_path)
+        self._append_clip_records(manifest_path, [
+            self._export_clip(audio_path, segment, index, session_dir, classification, source)
+        ])
+
+    def export_clips(
+        self,
+        audio_path: Path,
+        segments: Sequence[Dict],
+        session_dir: Path,
+        manifest_path: Path,
+        classifications: Optional[Sequence[Optional[Dict]]] = None
+    ) -> int:
+        """
+        Export ``segments`` (numbered from 1) concurrently and log them in the manifest.
 
-        Uses FFmpeg streaming by default for 90% memory reduction.
-        Falls back to pydub if USE_STREAMING_SNIPPET_EXPORT=false.
+        Clips are written by SNIPPET_EXPORT_WORKERS threads; each finished
+        batch of clip records is appended to the JSONL clip log, so the cost
+        of manifest I/O stays linear in the number of clips. Call
+        finalize_manifest afterwards.
+
+        With USE_VIRTUAL_SNIPPETS and a WAV source, no clip files are written:
+        the session audio is linked into ``session_dir`` and each record
+        stores sample offsets for VirtualSnippetRenderer.
+
+        Returns:
+            Number of clips exported
         """
+        source = self._open_native_source(audio_path)
+        virtual = False
+        if self.use_virtual and source is not None:
+            source = WavClipSource(self._link_session_audio(source.audio_path, session_dir))
+            virtual = True
+        elif self.use_virtual:
+            self.logger.info("Virtual snippets need a WAV source; writing clip files for %s", audio_path)
+
+        legacy_audio = None
+        if source is None and not self.use_streaming:
+            # Decode once for every clip instead of once per clip
+            legacy_audio = AudioSegment.from_file(str(audio_path))
+
+        def export(index: int) -> Dict[str, Any]:
+            classification = classifications[index] if classifications and index < len(classifications) else None
+            return self._export_clip(
+                audio_path, segments[index], index + 1, session_dir, classification, source, legacy_audio, virtual
+            )
+
+        batch_size = max(self.max_workers * 8, 64)
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="snippet") as pool:
+            for batch_start in range(0, len(segments), batch_size):
+                indices = range(batch_start, min(len(segments), batch_start + batch_size))
+                self._append_clip_records(manifest_path, list(pool.map(export, indices)))
+        return len(segments)
+
+    def finalize_manifest(self, manifest_path: Path, status: str = "complete") -> Dict[str, Any]:
+        """Write manifest.json once from the clip log (clips ordered by id) and remove the log."""
+        clip_log = manifest_path.with_name(CLIP_LOG_FILE)
+        with self._manifest_lock:
+            manifest_data = json.loads(manifest_path.read_text(encoding="utf-8"))
+            clips = {clip["id"]: clip for clip in manifest_data.get("clips", [])}
+            if clip_log.exists():
+                with open(clip_log, "r", encoding="utf-8") as handle:
+                    for line in handle:
+                        try:
+                            clip = json.loads(line)
+                        except json.JSONDecodeError:
+                            # A torn final line from an interrupted export
+                            continue
+                        clips[clip["id"]] = clip
+
+            manifest_data["clips"] = [clips[clip_id] for clip_id in sorted(clips)]
+            manifest_data["total_clips"] = len(clips)
+            manifest_data["status"] = status
+            if any("start_sample" in clip for clip in clips.values()):
+                manifest_data["mode"] = "virtual"
+                manifest_data["source_audio"] = VIRTUAL_SOURCE_FILE
+            else:
+                manifest_data["mode"] = "files"
+            manifest_data.pop("clip_log", None)
+            tmp_path = manifest_path.with_name(f"{manifest_path.name}.tmp")
+            tmp_path.write_text(json.dumps(manifest_data, indent=2, ensure_ascii=False), encoding="utf-8")
+            os.replace(tmp_path, manifest_path)
+            if clip_log.exists():
+                clip_log.unlink()
+        return manifest_data
+
+    def _open_native_source(self, audio_path: Path) -> Optional[WavClipSource]:
+        if not self.use_native:
+            return None
+        try:
+            return WavClipSource(audio_path)
+        except (OSError, RuntimeError, ValueError) as exc:
+            fallback = "FFmpeg" if self.use_streaming else "pydub"
+            self.logger.debug("In-process snippet export unavailable for %s (%s); using %s", audio_path, exc, fallback)
+            return None
+
+    def _link_session_audio(self, audio_path: Path, session_dir: Path) -> Path:
+        """Hard-link (or, across filesystems, copy) the session WAV next to its virtual manifest."""
+        session_dir.mkdir(parents=True, exist_ok=True)
+        target = session_dir / VIRTUAL_SOURCE_FILE
+        if target.exists():
+            if target.samefile(audio_path):
+                return target
+            target.unlink()
+        try:
+            os.link(audio_path, target)
+        except OSError:
+            shutil.copyfile(audio_path, target)
+        return target
+
+    def _append_clip_records(self, manifest_path: Path, clips: List[Dict[str, Any]]) -> None:
+        lines = "".join(json.dumps(clip, ensure_ascii=False) + "\n" for clip in clips)
+        with self._manifest_lock:
+            with open(manifest_path.with_name(CLIP_LOG_FILE), "a", encoding="utf-8") as handle:
+                handle.write(lines)
+
+    def _export_clip(
+        self,
+        audio_path: Path,
+        segment: Dict,
+        index: int,
+        session_dir: Path,
+        classification: Optional[Dict],
+        source: Optional[WavClipSource],
+        legacy_audio: Optional[AudioSegment] = None,
+        virtual: bool = False
+    ) -> Dict[str, Any]:
         start_time = max(float(segment.get('start_time', 0.0)), 0.0)
         end_time = max(float(segment.get('end_time', start_time)), start_time)
 
@@ -166,15 +462,20 @@ class AudioSnipper:
         filename = f"segment_{index:04}_{safe_speaker}.wav"
         clip_path = session_dir / filename
 
-        # BRANCHING: Use streaming FFmpeg or legacy pydub
-        if self.use_streaming:
+        # BRANCHING: Virtual (offsets only), in-process slicing, streaming FFmpeg or legacy pydub
+        sample_range = None
+        if virtual:
+            sample_range = source.frame_range(start_time, end_time)
+        elif source is not None:
+            source.write_clip(start_time, end_time, clip_path)
+        elif self.use_streaming:
             # NEW: Streaming extraction (no memory load, 90% reduction)
             self._extract_segment_with_ffmpeg(
                 audio_path, start_time, end_time, clip_path
             )
         else:
             # LEGACY: Load full file into memory (backward compatibility)
-            audio = AudioSegment.from_file(str(audio_path))
+            audio = legacy_audio if legacy_audio is not None else AudioSegment.from_file(str(audio_path))
             start_ms = int(start_time * 1000)
             end_ms = int(end_time * 1000)
             clip = audio[start_ms:end_ms]
@@ -190,12 +491,10 @@ class AudioSnipper:
             "text": segment.get('text', ""),
             "classification": classification
         }
-
-        with self._manifest_lock:
-            manifest_data = json.loads(manifest_path.read_text(encoding="utf-8"))
-            manifest_data["clips"].append(clip_manifest)
-            manifest_data["total_clips"] = len(manifest_data["clips"])
-            manifest_path.write_text(json.dumps(manifest_data, indent=2, ensure_ascii=False), encoding="utf-8")
+        if sample_range is not None:
+            clip_manifest["status"] = "virtual"
+            clip_manifest["start_sample"], clip_manifest["end_sample"] = sample_range
+        return clip_manifest
 
     def export_segments(
         self,
@@ -247,22 +546,16 @@ class AudioSnipper:
             audio_path
         )
 
-        for index, segment in enumerate(segments, start=1):
-            classification_entry = None
-            if classifications and len(classifications) >= index:
-                cls_obj = classifications[index - 1]
-                classification_entry = {
-                    "label": getattr(cls_obj, 'classification', None) if not isinstance(cls_obj, dict) else cls_obj.get('classification'),
-                    "confidence": getattr(cls_obj, 'confidence', None) if not isinstance(cls_obj, dict) else cls_obj.get('confidence'),
-                    "reasoning": getattr(cls_obj, 'reasoning', None) if not isinstance(cls_obj, dict) else cls_obj.get('reasoning'),
-                    "character": getattr(cls_obj, 'character', None) if not isinstance(cls_obj, dict) else cls_obj.get('character')
-                }
-            self.export_incremental(audio_path, segment, index, session_dir, manifest_path, classification_entry)
-
-        with self._manifest_lock:
-            manifest_data = json.loads(manifest_path.read_text(encoding="utf-8"))
-            manifest_data["status"] = "complete"
-            manifest_path.write_text(json.dumps(manifest_data, indent=2, ensure_ascii=False), encoding="utf-8")
+        classification_entries = []
+        for cls_obj in (classifications or [])[:len(segments)]:
+            classification_entries.append({
+                "label": getattr(cls_obj, 'classification', None) if not isinstance(cls_obj, dict) else cls_obj.get('classification'),
+                "confidence": getattr(cls_obj, 'confidence', None) if not isinstance(cls_obj, dict) else cls_obj.get('confidence'),
+                "reasoning": getattr(cls_obj, 'reasoning', None) if not isinstance(cls_obj, dict) else cls_obj.get('reasoning'),
+                "character": getattr(cls_obj, 'character', None) if not isinstance(cls_obj, dict) else cls_obj.get('character')
+            })
+        self.export_clips(audio_path, segments, session_dir, manifest_path, classification_entries)
+        self.finalize_manifest(manifest_path)
 
         self.logger.info(
             "Snippet export complete: %d clips, manifest=%s",
@@ -33,25 +33,7 @@ class SRTExporter:
 
             with open(output_path, 'w', encoding='utf-8') as f:
                 for i, seg in enumerate(segments, 1):
-                    # SRT index
-                    f.write(f"{i}\n")
-
-                    # Timestamps
-                    start_time = self._format_srt_time(seg.get('start_time', 0))
-                    end_time = self._format_srt_time(seg.get('end_time', 0))
-                    f.write(f"{start_time} --> {end_time}\n")
-
-                    # Text content
-                    text = seg.get('text', '').strip()
-
-                    if include_speaker and 'speaker' in seg:
-                        speaker = seg['speaker']
-                        f.write(f"[{speaker}] {text}\n")
-                    else:
-                        f.write(f"{text}\n")
-
-                    # Blank line between subtitles
-                    f.write("\n")
+                    f.write(self.format_entry(i, seg, include_speaker))
 
             self.logger.info(f"Successfully exported SRT file: {output_path}")
 
@@ -59,6 +41,30 @@ class SRTExporter:
             self.logger.error(f"Failed to export SRT: {e}", exc_info=True)
             raise
 
+    def format_entry(self, index: int, seg: Dict, include_speaker: bool = True) -> str:
+        """
+        Format one segment as an SRT entry, including the trailing blank line.
+
+        Args:
+            index: 1-based subtitle number
+            seg: Segment dictionary with 'start_time', 'end_time', 'text', and optionally 'speaker'
+            include_speaker: Whether to include the speaker label
+
+        Returns:
+            The entry text, ready to append to an SRT file
+        """
+        # Timestamps
+        start_time = self._format_srt_time(seg.get('start_time', 0))
+        end_time = self._format_srt_time(seg.get('end_time', 0))
+
+        # Text content
+        text = seg.get('text', '').strip()
+        if include_speaker and 'speaker' in seg:
+            text = f"[{seg['speaker']}] {text}"
+
+        # Blank line between subtitles
+        return f"{index}\n{start_time} --> {end_time}\n{text}\n\n"
+
     def _format_srt_time(self, seconds: float) -> str:
         """
         Convert seconds to SRT time format (HH:MM:SS,mmm).
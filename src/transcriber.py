@@ -1,16 +1,57 @@
 """Transcription with multiple backend support"""
+import io
 from abc import ABC, abstractmethod
-from pathlib import Path
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 from dataclasses import dataclass
 import numpy as np
 from .config import Config
 from .chunker import AudioChunk
 from .logger import get_logger
 from .preflight import PreflightIssue
+from .rate_limiter import RateLimiter
 from .retry import retry_with_backoff
 
 
+def join_words(words: List[Dict]) -> str:
+    """Rebuild text from word dicts (Whisper words usually carry their leading space)."""
+    tokens = [str(w.get("word", "")) for w in words]
+    if any(token.startswith(" ") for token in tokens):
+        return "".join(tokens).strip()
+    return " ".join(token.strip() for token in tokens if token.strip())
+
+
+# Upload encodings for cloud backends: name -> (soundfile format, subtype, file extension)
+UPLOAD_ENCODINGS: Dict[str, Tuple[str, str, str]] = {
+    "flac": ("FLAC", "PCM_16", "flac"),
+    "opus": ("OGG", "OPUS", "ogg"),
+    "wav": ("WAV", "PCM_16", "wav"),
+}
+
+
+def encode_audio(audio: np.ndarray, sample_rate: int, upload_format: str = "flac") -> bytes:
+    """Encode audio into an in-memory file of the given upload format."""
+    import soundfile as sf
+
+    sf_format, subtype, _ = UPLOAD_ENCODINGS[upload_format]
+    buffer = io.BytesIO()
+    sf.write(buffer, audio, sample_rate, format=sf_format, subtype=subtype)
+    return buffer.getvalue()
+
+
+def _quiet_split_index(audio: np.ndarray, sample_rate: int, search_fraction: float) -> int:
+    """Sample index of the quietest 20 ms frame around the middle of ``audio``."""
+    middle = len(audio) // 2
+    radius = int(len(audio) * search_fraction / 2)
+    frame = max(1, int(sample_rate * 0.02))
+    window = audio[middle - radius:middle + radius]
+    frame_count = len(window) // frame
+    if frame_count < 2:
+        return middle
+    frames = window[:frame_count * frame].astype(np.float32).reshape(frame_count, frame)
+    quietest = int(np.argmin(np.square(frames).mean(axis=1)))
+    return middle - radius + quietest * frame + frame // 2
+
+
 @dataclass
 class TranscriptionSegment:
     """A segment of transcribed text with timing and metadata"""
@@ -270,7 +311,144 @@ class FasterWhisperTranscriber(BaseTranscriber):
         )
 
 
-class GroqTranscriber(BaseTranscriber):
+class CloudTranscriber(BaseTranscriber):
+    """
+    Shared upload path for API-based Whisper backends (Groq, OpenAI).
+
+    Chunks are encoded in memory (FLAC by default, see
+    Config.TRANSCRIPTION_UPLOAD_FORMAT) and uploaded without touching disk.
+    A 10-minute chunk is ~19 MB as 16-bit WAV; FLAC roughly halves that for
+    speech and Opus shrinks it by an order of magnitude. If an encoded chunk
+    still exceeds Config.TRANSCRIPTION_UPLOAD_MAX_MB (providers reject
+    uploads over 25 MB), it is split at the quietest point near its middle
+    and the parts are transcribed separately, with timestamps shifted back
+    onto the chunk timeline.
+
+    When ``rate_limiter`` is set it is acquired once per upload, so a split
+    chunk counts as several requests against the provider's rate limit.
+    """
+
+    provider_name = "cloud"
+    rate_limiter: Optional[RateLimiter] = None
+
+    # Parts shorter than this are never split further
+    MIN_SPLIT_SECONDS = 30.0
+    # Fraction of a part, centred on its midpoint, searched for a quiet split point
+    SPLIT_SEARCH_FRACTION = 0.2
+
+    def _configure_upload(self, upload_format: Optional[str] = None) -> None:
+        upload_format = (upload_format or Config.TRANSCRIPTION_UPLOAD_FORMAT or "flac").lower()
+        if upload_format not in UPLOAD_ENCODINGS:
+            self.logger.warning(
+                "Unknown upload format '%s'; expected one of %s. Using flac.",
+                upload_format,
+                ", ".join(UPLOAD_ENCODINGS)
+            )
+            upload_format = "flac"
+        self.upload_format = upload_format
+        self.max_upload_bytes = int(Config.TRANSCRIPTION_UPLOAD_MAX_MB * 1024 * 1024)
+
+    def transcribe_chunk(
+        self,
+        chunk: AudioChunk,
+        language: str = Config.WHISPER_LANGUAGE
+    ) -> ChunkTranscription:
+        """Transcribe by uploading the in-memory encoded chunk (split if too large)."""
+        parts = self._encode_upload_parts(chunk.audio, chunk.sample_rate, f"chunk_{chunk.chunk_index}")
+
+        segments: List[TranscriptionSegment] = []
+        detected_language = None
+        for offset, filename, data in parts:
+            self.logger.debug(
+                "Submitting %s to %s (%.2f MB, +%.1fs)",
+                filename,
+                self.provider_name,
+                len(data) / (1024 * 1024),
+                offset
+            )
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire()
+            response = self._make_api_call((filename, data), language)
+            if detected_language is None:
+                detected_language = response.language
+            segments.extend(self._parse_response(response, chunk.start_time + offset))
+
+        return ChunkTranscription(
+            chunk_index=chunk.chunk_index,
+            chunk_start=chunk.start_time,
+            chunk_end=chunk.end_time,
+            segments=segments,
+            language=detected_language
+        )
+
+    def _encode_upload_parts(
+        self,
+        audio: np.ndarray,
+        sample_rate: int,
+        name: str,
+        offset: float = 0.0
+    ) -> List[Tuple[float, str, bytes]]:
+        """
+        Encode ``audio`` as one or more uploads that fit the provider's size limit.
+
+        Returns:
+            ``(offset_seconds, filename, data)`` per part, in time order
+        """
+        extension = UPLOAD_ENCODINGS[self.upload_format][2]
+        data = encode_audio(audio, sample_rate, self.upload_format)
+        duration = len(audio) / sample_rate
+        if len(data) <= self.max_upload_bytes or duration < 2 * self.MIN_SPLIT_SECONDS:
+            if len(data) > self.max_upload_bytes:
+                self.logger.warning(
+                    "%s is %.1f MB after encoding, above the %.1f MB upload limit; sending as-is",
+                    name,
+                    len(data) / (1024 * 1024),
+                    self.max_upload_bytes / (1024 * 1024)
+                )
+            suffix = f"_{int(offset * 1000)}ms" if offset else ""
+            return [(offset, f"{name}{suffix}.{extension}", data)]
+
+        split = _quiet_split_index(audio, sample_rate, self.SPLIT_SEARCH_FRACTION)
+        self.logger.debug(
+            "%s is %.1f MB after encoding; splitting at +%.1fs",
+            name,
+            len(data) / (1024 * 1024),
+            offset + split / sample_rate
+        )
+        return (
+            self._encode_upload_parts(audio[:split], sample_rate, name, offset)
+            + self._encode_upload_parts(audio[split:], sample_rate, name, offset + split / sample_rate)
+        )
+
+    @staticmethod
+    def _parse_response(response, time_offset: float) -> List[TranscriptionSegment]:
+        """Convert a verbose_json response into segments on the absolute timeline."""
+        segments = []
+        response_words = getattr(response, "words", None)
+        for seg in response.segments:
+            words = None
+            if response_words:
+                words = [
+                    {
+                        'word': w['word'],
+                        'start': time_offset + w['start'],
+                        'end': time_offset + w['end'],
+                        'probability': w.get('probability', 1.0)
+                    }
+                    for w in response_words
+                    if seg['start'] <= w['start'] <= seg['end']
+                ]
+
+            segments.append(TranscriptionSegment(
+                text=seg['text'].strip(),
+                start_time=time_offset + seg['start'],
+                end_time=time_offset + seg['end'],
+                words=words
+            ))
+        return segments
+
+
+class GroqTranscriber(CloudTranscriber):
     """
     Groq API transcription - fast cloud-based Whisper.
 
@@ -285,77 +463,18 @@ class GroqTranscriber(BaseTranscriber):
     - Rate limits
     """
 
-    def __init__(self, api_key: str = None):
+    provider_name = "Groq"
+
+    def __init__(self, api_key: str = None, upload_format: str = None):
         from groq import Groq
-        import tempfile
 
         self.api_key = api_key or Config.GROQ_API_KEY
         if not self.api_key:
             raise ValueError("Groq API key required. Set GROQ_API_KEY in .env")
 
         self.client = Groq(api_key=self.api_key)
-        self.temp_dir = Path(tempfile.gettempdir())
         self.logger = get_logger("transcriber.groq")
-
-    def transcribe_chunk(
-        self,
-        chunk: AudioChunk,
-        language: str = Config.WHISPER_LANGUAGE
-    ) -> ChunkTranscription:
-        """Transcribe using Groq API"""
-        import soundfile as sf
-
-        # Groq requires a file path, so save chunk temporarily
-        temp_path = self.temp_dir / f"chunk_{chunk.chunk_index}.wav"
-        sf.write(str(temp_path), chunk.audio, chunk.sample_rate)
-        self.logger.debug("Submitting chunk %d to Groq (temp file: %s)", chunk.chunk_index, temp_path)
-
-        try:
-            # Call Groq API
-            with open(str(temp_path), "rb") as audio_file:
-                response = self._make_api_call(audio_file, language)
-
-            # Parse response
-            segments = []
-            response_words = getattr(response, "words", None)
-            for seg in response.segments:
-                # Adjust timestamps to absolute time
-                absolute_start = chunk.start_time + seg['start']
-                absolute_end = chunk.start_time + seg['end']
-
-                words = None
-                if response_words:
-                    words = [
-                        {
-                            'word': w['word'],
-                            'start': chunk.start_time + w['start'],
-                            'end': chunk.start_time + w['end'],
-                            'probability': w.get('probability', 1.0)
-                        }
-                        for w in response_words
-                        if seg['start'] <= w['start'] <= seg['end']
-                    ]
-
-                segments.append(TranscriptionSegment(
-                    text=seg['text'].strip(),
-                    start_time=absolute_start,
-                    end_time=absolute_end,
-                    words=words
-                ))
-
-            return ChunkTranscription(
-                chunk_index=chunk.chunk_index,
-                chunk_start=chunk.start_time,
-                chunk_end=chunk.end_time,
-                segments=segments,
-                language=response.language
-            )
-
-        finally:
-            # Clean up temp file
-            if temp_path.exists():
-                temp_path.unlink()
-                self.logger.debug("Cleaned temporary chunk file %s", temp_path)
+        self._configure_upload(upload_format)
 
     def preflight_check(self):
         """Check Groq API availability and authentication."""
@@ -402,7 +521,7 @@ class GroqTranscriber(BaseTranscriber):
         )
 
 
-class OpenAITranscriber(BaseTranscriber):
+class OpenAITranscriber(CloudTranscriber):
     """
     OpenAI Whisper API transcription - cloud-based Whisper.
 
@@ -418,77 +537,18 @@ class OpenAITranscriber(BaseTranscriber):
     - Pay-per-use pricing
     """
 
-    def __init__(self, api_key: str = None):
+    provider_name = "OpenAI"
+
+    def __init__(self, api_key: str = None, upload_format: str = None):
         from openai import OpenAI
-        import tempfile
 
         self.api_key = api_key or Config.OPENAI_API_KEY
         if not self.api_key:
             raise ValueError("OpenAI API key required. Set OPENAI_API_KEY in .env")
 
         self.client = OpenAI(api_key=self.api_key)
-        self.temp_dir = Path(tempfile.gettempdir())
         self.logger = get_logger("transcriber.openai")
-
-    def transcribe_chunk(
-        self,
-        chunk: AudioChunk,
-        language: str = Config.WHISPER_LANGUAGE
-    ) -> ChunkTranscription:
-        """Transcribe using OpenAI Whisper API"""
-        import soundfile as sf
-
-        # OpenAI requires a file path, so save chunk temporarily
-        temp_path = self.temp_dir / f"chunk_{chunk.chunk_index}.wav"
-        sf.write(str(temp_path), chunk.audio, chunk.sample_rate)
-        self.logger.debug("Submitting chunk %d to OpenAI (temp file: %s)", chunk.chunk_index, temp_path)
-
-        try:
-            # Call OpenAI API
-            with open(str(temp_path), "rb") as audio_file:
-                response = self._make_api_call(audio_file, language)
-
-            # Parse response
-            segments = []
-            response_words = getattr(response, "words", None)
-            for seg in response.segments:
-                # Adjust timestamps to absolute time
-                absolute_start = chunk.start_time + seg['start']
-                absolute_end = chunk.start_time + seg['end']
-
-                words = None
-                if response_words:
-                    words = [
-                        {
-                            'word': w['word'],
-                            'start': chunk.start_time + w['start'],
-                            'end': chunk.start_time + w['end'],
-                            'probability': w.get('probability', 1.0)
-                        }
-                        for w in response_words
-                        if seg['start'] <= w['start'] <= seg['end']
-                    ]
-
-                segments.append(TranscriptionSegment(
-                    text=seg['text'].strip(),
-                    start_time=absolute_start,
-                    end_time=absolute_end,
-                    words=words
-                ))
-
-            return ChunkTranscription(
-                chunk_index=chunk.chunk_index,
-                chunk_start=chunk.start_time,
-                chunk_end=chunk.end_time,
-                segments=segments,
-                language=response.language
-            )
-
-        finally:
-            # Clean up temp file
-            if temp_path.exists():
-                temp_path.unlink()
-                self.logger.debug("Cleaned temporary chunk file %s", temp_path)
+        self._configure_upload(upload_format)
 
     def preflight_check(self):
         """Check OpenAI API availability and authentication."""
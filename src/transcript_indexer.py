@@ -9,15 +9,38 @@ Date: 2025-11-17
 """
 from __future__ import annotations
 
+import hashlib
 import json
 import logging
+import os
+import shutil
+import struct
+import uuid
+from array import array
+from bisect import bisect_right
+from collections.abc import Sequence
 from dataclasses import dataclass, field, asdict
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Set, Any
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Any, Tuple
+
+import numpy as np
+
+from src.file_lock import get_file_lock
+from src.inverted_index import InvertedIndex
 
 logger = logging.getLogger("DDSessionProcessor.transcript_indexer")
 
+# Bump when the manifest or shard layout changes; older caches are rebuilt
+INDEX_FORMAT_VERSION = 3
+
+# Binary segment block files: magic, little-endian header length, JSON header, aligned columns
+SEGMENT_BLOCK_MAGIC = b"DDTCOL01"
+_BLOCK_ALIGNMENT = 8
+
+# Segment fields stored as codes into per-block string tables (-1 = None)
+_STRING_COLUMNS = ("session_id", "speaker", "ic_ooc", "timestamp_str", "session_date", "file_path")
+
 
 @dataclass
 class TranscriptSegment:
@@ -41,19 +64,335 @@ class TranscriptSegment:
     file_path: Optional[Path] = None  # Path to source JSON file
 
 
+class StringTable:
+    """Interned strings: each distinct value is stored once and referenced by code."""
+
+    def __init__(self, values: Iterable[str] = ()):
+        self.values: List[str] = list(values)
+        self._codes: Dict[str, int] = {value: code for code, value in enumerate(self.values)}
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def intern(self, value: Optional[str]) -> int:
+        """Code for ``value`` (-1 for None), adding it to the table if new."""
+        if value is None:
+            return -1
+        code = self._codes.get(value)
+        if code is None:
+            code = self._codes[value] = len(self.values)
+            self.values.append(value)
+        return code
+
+
+def _code_dtype(table_size: int) -> np.dtype:
+    return np.dtype(np.int8) if table_size < 128 else np.dtype(np.int32)
+
+
+def _aligned(size: int) -> int:
+    return (size + _BLOCK_ALIGNMENT - 1) // _BLOCK_ALIGNMENT * _BLOCK_ALIGNMENT
+
+
+class SegmentBlock:
+    """
+    Immutable columnar storage for a run of transcript segments.
+
+    Strings that repeat from segment to segment (session, speaker, IC/OOC,
+    timestamp label, date, source file) are interned into string tables and
+    stored as integer codes; timestamps and segment indices are NumPy arrays;
+    all texts share one UTF-8 blob addressed by offsets. A block saves to a
+    single binary file that ``load`` memory-maps, so opening it costs the
+    same regardless of how many segments it holds.
+    """
+
+    def __init__(
+        self,
+        tables: Dict[str, List[str]],
+        columns: Dict[str, np.ndarray],
+        text_offsets: np.ndarray,
+        text_blob: np.ndarray,
+    ):
+        self.tables = tables
+        self.columns = columns
+        self.text_offsets = text_offsets
+        self.text_blob = text_blob
+        self.count = len(text_offsets) - 1
+
+    def __len__(self) -> int:
+        return self.count
+
+    @classmethod
+    def from_segments(cls, segments: Iterable[TranscriptSegment]) -> "SegmentBlock":
+        builder = _SegmentBlockBuilder()
+        for segment in segments:
+            builder.append(segment)
+        return builder.build()
+
+    def string(self, column: str, row: int) -> Optional[str]:
+        code = int(self.columns[column][row])
+        return self.tables[column][code] if code >= 0 else None
+
+    def text(self, row: int) -> str:
+        start, end = int(self.text_offsets[row]), int(self.text_offsets[row + 1])
+        return bytes(self.text_blob[start:end]).decode("utf-8")
+
+    def segment(self, row: int) -> TranscriptSegment:
+        file_path = self.string("file_path", row)
+        return TranscriptSegment(
+            session_id=self.string("session_id", row),
+            timestamp=float(self.columns["timestamp"][row]),
+            timestamp_str=self.string("timestamp_str", row),
+            speaker=self.string("speaker", row),
+            text=self.text(row),
+            ic_ooc=self.string("ic_ooc", row),
+            segment_index=int(self.columns["segment_index"][row]),
+            session_date=self.string("session_date", row),
+            file_path=Path(file_path) if file_path is not None else None,
+        )
+
+    def iter_rows(self, start: int = 0) -> Iterator[Tuple[str, str, str, str, float, Optional[str]]]:
+        """Yield ``(text, speaker, ic_ooc, session_id, timestamp, session_date)`` without building segments."""
+        tables = {name: self.tables[name] for name in ("speaker", "ic_ooc", "session_id", "session_date")}
+        codes = {name: self.columns[name][start:].tolist() for name in tables}
+        timestamps = self.columns["timestamp"][start:].tolist()
+        offsets = self.text_offsets[start:].tolist()
+        blob = self.text_blob
+
+        def lookup(name: str, row: int) -> Optional[str]:
+            code = codes[name][row]
+            return tables[name][code] if code >= 0 else None
+
+        for i in range(self.count - start):
+            yield (
+                bytes(blob[offsets[i]:offsets[i + 1]]).decode("utf-8"),
+                lookup("speaker", i),
+                lookup("ic_ooc", i),
+                lookup("session_id", i),
+                timestamps[i],
+                lookup("session_date", i),
+            )
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by the column arrays and text blob."""
+        return (
+            sum(column.nbytes for column in self.columns.values())
+            + self.text_offsets.nbytes
+            + self.text_blob.nbytes
+        )
+
+    def save(self, path: Path) -> None:
+        """Write the block as one binary file (see ``load``)."""
+        arrays = {**self.columns, "text_offsets": self.text_offsets, "text": self.text_blob}
+        specs: Dict[str, Dict[str, Any]] = {}
+        offset = 0
+        for name, values in arrays.items():
+            specs[name] = {"dtype": values.dtype.str, "offset": offset, "length": int(len(values))}
+            offset += _aligned(values.nbytes)
+
+        header = json.dumps(
+            {"count": self.count, "tables": self.tables, "columns": specs},
+            ensure_ascii=False,
+        ).encode("utf-8")
+        prefix = SEGMENT_BLOCK_MAGIC + struct.pack("<Q", len(header)) + header
+
+        with open(path, "wb") as f:
+            f.write(prefix + b"\0" * (_aligned(len(prefix)) - len(prefix)))
+            for values in arrays.values():
+                data = np.ascontiguousarray(values).tobytes()
+                f.write(data + b"\0" * (_aligned(len(data)) - len(data)))
+
+    @classmethod
+    def load(cls, path: Path, mmap: bool = True) -> "SegmentBlock":
+        """
+        Open a block written by ``save``.
+
+        Args:
+            mmap: Memory-map the file instead of reading it into memory
+
+        Raises:
+            ValueError: If the file is not a segment block
+        """
+        with open(path, "rb") as f:
+            if f.read(len(SEGMENT_BLOCK_MAGIC)) != SEGMENT_BLOCK_MAGIC:
+                raise ValueError(f"Not a segment block file: {path}")
+            (header_length,) = struct.unpack("<Q", f.read(8))
+            header = json.loads(f.read(header_length).decode("utf-8"))
+
+        data_start = _aligned(len(SEGMENT_BLOCK_MAGIC) + 8 + header_length)
+        if mmap:
+            buffer = np.memmap(path, dtype=np.uint8, mode="r")
+        else:
+            buffer = np.fromfile(path, dtype=np.uint8)
+
+        arrays: Dict[str, np.ndarray] = {}
+        for name, spec in header["columns"].items():
+            dtype = np.dtype(spec["dtype"])
+            start = data_start + spec["offset"]
+            arrays[name] = buffer[start:start + dtype.itemsize * spec["length"]].view(dtype)
+
+        text_offsets = arrays.pop("text_offsets")
+        text_blob = arrays.pop("text")
+        return cls(header["tables"], arrays, text_offsets, text_blob)
+
+
+class _SegmentBlockBuilder:
+    """Appendable form of a SegmentBlock; frozen with ``build``."""
+
+    def __init__(self):
+        self.tables = {name: StringTable() for name in _STRING_COLUMNS}
+        self.codes = {name: array("i") for name in _STRING_COLUMNS}
+        self.timestamps = array("d")
+        self.segment_indices = array("q")
+        self.texts: List[str] = []
+
+    def __len__(self) -> int:
+        return len(self.texts)
+
+    def append(self, segment: TranscriptSegment) -> None:
+        values = {
+            "session_id": segment.session_id,
+            "speaker": segment.speaker,
+            "ic_ooc": segment.ic_ooc,
+            "timestamp_str": segment.timestamp_str,
+            "session_date": segment.session_date,
+            "file_path": str(segment.file_path) if segment.file_path is not None else None,
+        }
+        for name, value in values.items():
+            self.codes[name].append(self.tables[name].intern(value))
+        self.timestamps.append(float(segment.timestamp))
+        self.segment_indices.append(int(segment.segment_index))
+        self.texts.append(segment.text or "")
+
+    def segment(self, row: int) -> TranscriptSegment:
+        def string(name: str) -> Optional[str]:
+            code = self.codes[name][row]
+            return self.tables[name].values[code] if code >= 0 else None
+
+        file_path = string("file_path")
+        return TranscriptSegment(
+            session_id=string("session_id"),
+            timestamp=self.timestamps[row],
+            timestamp_str=string("timestamp_str"),
+            speaker=string("speaker"),
+            text=self.texts[row],
+            ic_ooc=string("ic_ooc"),
+            segment_index=self.segment_indices[row],
+            session_date=string("session_date"),
+            file_path=Path(file_path) if file_path is not None else None,
+        )
+
+    def build(self) -> SegmentBlock:
+        columns = {
+            name: np.asarray(self.codes[name], dtype=_code_dtype(len(self.tables[name])))
+            for name in _STRING_COLUMNS
+        }
+        columns["timestamp"] = np.asarray(self.timestamps, dtype=np.float64)
+        columns["segment_index"] = np.asarray(self.segment_indices, dtype=np.int32)
+
+        encoded = [text.encode("utf-8") for text in self.texts]
+        text_offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+        if encoded:
+            np.cumsum([len(data) for data in encoded], out=text_offsets[1:])
+        text_blob = np.frombuffer(b"".join(encoded), dtype=np.uint8)
+        return SegmentBlock(
+            {name: table.values for name, table in self.tables.items()},
+            columns,
+            text_offsets,
+            text_blob,
+        )
+
+
+class SegmentColumns(Sequence):
+    """
+    Sequence of TranscriptSegments stored column-wise.
+
+    Segments live in SegmentBlocks (typically one per session, possibly
+    memory-mapped) followed by an appendable tail that is compacted into a
+    block every ``SEAL_SIZE`` segments. Indexing materializes a
+    TranscriptSegment on demand, so only segments that are actually read
+    (e.g. search results) exist as Python objects.
+    """
+
+    SEAL_SIZE = 4096
+
+    def __init__(self, segments: Iterable[TranscriptSegment] = ()):
+        self._blocks: List[SegmentBlock] = []
+        self._block_starts: List[int] = []
+        self._sealed = 0
+        self._tail = _SegmentBlockBuilder()
+        for segment in segments:
+            self.append(segment)
+
+    def __len__(self) -> int:
+        return self._sealed + len(self._tail)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("segment index out of range")
+        if index >= self._sealed:
+            return self._tail.segment(index - self._sealed)
+        block = bisect_right(self._block_starts, index) - 1
+        return self._blocks[block].segment(index - self._block_starts[block])
+
+    def __iter__(self) -> Iterator[TranscriptSegment]:
+        for block in self._blocks:
+            for row in range(block.count):
+                yield block.segment(row)
+        for row in range(len(self._tail)):
+            yield self._tail.segment(row)
+
+    def append(self, segment: TranscriptSegment) -> None:
+        self._tail.append(segment)
+        if len(self._tail) >= self.SEAL_SIZE:
+            self._seal()
+
+    def add_block(self, block: SegmentBlock) -> None:
+        """Append every segment of ``block`` without copying it."""
+        self._seal()
+        if block.count:
+            self._blocks.append(block)
+            self._block_starts.append(self._sealed)
+            self._sealed += block.count
+
+    def iter_rows(self, start: int = 0) -> Iterator[Tuple[str, str, str, str, float, Optional[str]]]:
+        """Yield ``(text, speaker, ic_ooc, session_id, timestamp, session_date)`` from ``start`` on."""
+        self._seal()
+        for block_start, block in zip(self._block_starts, self._blocks):
+            if block_start + block.count <= start:
+                continue
+            yield from block.iter_rows(max(0, start - block_start))
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by sealed blocks (the unsealed tail is not counted)."""
+        return sum(block.nbytes for block in self._blocks)
+
+    def _seal(self) -> None:
+        if len(self._tail):
+            block, self._tail = self._tail.build(), _SegmentBlockBuilder()
+            self.add_block(block)
+
+
 @dataclass
 class TranscriptIndex:
     """
     Searchable index of all transcripts.
 
     Maintains an in-memory index of all transcript segments across all sessions,
-    with metadata for efficient filtering and searching.
+    with metadata for efficient filtering and searching. Segments are stored
+    column-wise (see SegmentColumns) and materialized when accessed.
     """
 
-    segments: List[TranscriptSegment] = field(default_factory=list)
+    segments: SegmentColumns = field(default_factory=SegmentColumns)
     sessions: Dict[str, Dict] = field(default_factory=dict)  # session_id -> metadata
     speakers: Set[str] = field(default_factory=set)
     indexed_at: datetime = field(default_factory=datetime.now)
+    _search_index: Optional[InvertedIndex] = field(default=None, init=False, repr=False, compare=False)
 
     def add_segment(self, segment: TranscriptSegment) -> None:
         """
@@ -65,6 +404,16 @@ class TranscriptIndex:
         self.segments.append(segment)
         self.speakers.add(segment.speaker)
 
+    def add_block(self, block: SegmentBlock) -> None:
+        """
+        Add a block of segments (e.g. one session's cache shard) to the index.
+
+        Args:
+            block: SegmentBlock to add; it is referenced, not copied
+        """
+        self.segments.add_block(block)
+        self.speakers.update(block.tables["speaker"])
+
     def add_session_metadata(self, session_id: str, metadata: Dict) -> None:
         """
         Add session metadata to the index.
@@ -93,6 +442,46 @@ class TranscriptIndex:
         """
         return len(self.sessions)
 
+    def get_search_index(self) -> InvertedIndex:
+        """
+        Get the inverted index over segment texts, building it if needed.
+
+        Segments appended since the last call are indexed incrementally;
+        the index is rebuilt from scratch if segments were removed.
+
+        Returns:
+            InvertedIndex whose document ids are positions in ``segments``
+        """
+        if self._search_index is None or len(self._search_index) > len(self.segments):
+            self._search_index = InvertedIndex()
+        rows = self.segments.iter_rows(len(self._search_index))
+        for text, speaker, ic_ooc, session_id, timestamp, session_date in rows:
+            self._search_index.add(
+                text,
+                fields={"speaker": speaker, "ic_ooc": ic_ooc, "session_id": session_id},
+                attributes={"timestamp": timestamp, "session_date": session_date},
+            )
+        return self._search_index
+
+
+@dataclass
+class IndexUpdate:
+    """
+    Result of an incremental index update.
+
+    Lists hold session directory names (YYYYMMDD_HHMMSS_<session_id>).
+    """
+
+    added: List[str] = field(default_factory=list)
+    changed: List[str] = field(default_factory=list)
+    removed: List[str] = field(default_factory=list)
+    unchanged: int = 0
+
+    @property
+    def has_changes(self) -> bool:
+        """True if any session was added, changed or removed."""
+        return bool(self.added or self.changed or self.removed)
+
 
 class TranscriptIndexer:
     """
@@ -100,12 +489,21 @@ class TranscriptIndexer:
 
     Features:
     - Indexes all transcripts in output directory
-    - Caches index to disk for fast loading
-    - Supports incremental updates
+    - Incremental updates: only added/changed/removed sessions are re-indexed
+    - One cache shard per session, loaded lazily
     - Extracts metadata from JSON data files
 
     The indexer scans session output directories (format: YYYYMMDD_HHMMSS_<session_id>)
     and parses the *_data.json files to build a searchable index.
+
+    Cache layout (in cache_dir):
+    - transcript_index.json: manifest with a fingerprint (mtime, size, SHA-256)
+      of every indexed data file
+    - transcript_shards/<session dir>.<id>.tidx: one session's segments as a
+      memory-mappable SegmentBlock
+
+    A data file is only re-parsed when its fingerprint changes; unchanged
+    mtime and size skip hashing entirely.
     """
 
     def __init__(self, output_dir: Path, cache_dir: Path = None):
@@ -122,102 +520,264 @@ class TranscriptIndexer:
 
         # FIX: Use JSON instead of pickle for security (prevents arbitrary code execution)
         self.cache_file = self.cache_dir / "transcript_index.json"
+        self.shard_dir = self.cache_dir / "transcript_shards"
         self.index: Optional[TranscriptIndex] = None
 
+        # session dir name -> manifest entry; None until loaded from disk
+        self._manifest: Optional[Dict[str, Dict[str, Any]]] = None
+        self._indexed_at: Optional[datetime] = None
+        # session dir name -> segment block, filled as shards are loaded
+        self._shards: Dict[str, SegmentBlock] = {}
+
     def build_index(self, force_rebuild: bool = False) -> TranscriptIndex:
         """
-        Build or load the transcript index.
+        Load the index from its shards and bring it up to date.
 
-        Attempts to load from cache first unless force_rebuild is True.
-        If cache doesn't exist or is invalid, builds a new index.
+        Sessions whose data files are unchanged since the last run are read
+        from their cache shards; only new or modified sessions are parsed.
 
         Args:
-            force_rebuild: Force rebuild even if cache exists
+            force_rebuild: Discard all shards and re-parse every session
 
         Returns:
             TranscriptIndex with all indexed segments
         """
-        # Try to load from cache if available
-        if not force_rebuild and self.cache_file.exists():
-            logger.info(f"Loading index from cache: {self.cache_file}")
-            try:
-                self.index = self._load_cache()
-                logger.info(
-                    f"Loaded index: {self.index.get_total_segments()} segments "
-                    f"from {self.index.get_session_count()} sessions"
-                )
-                return self.index
-            except Exception as e:
-                logger.warning(f"Failed to load cache, rebuilding: {e}")
-
-        # Build new index
-        logger.info(f"Building transcript index from {self.output_dir}")
-        self.index = TranscriptIndex()
-
-        # Find all session directories
-        if not self.output_dir.exists():
-            logger.warning(f"Output directory does not exist: {self.output_dir}")
-            return self.index
+        if force_rebuild:
+            logger.info(f"Rebuilding transcript index from {self.output_dir}")
+            with get_file_lock(self.cache_file):
+                self._manifest = None
+                self._shards.clear()
+                self.index = None
+                if self.cache_file.exists():
+                    self.cache_file.unlink()
+                if self.shard_dir.exists():
+                    shutil.rmtree(self.shard_dir)
+
+        self.update()
 
-        session_dirs = [
-            d for d in self.output_dir.iterdir()
-            if d.is_dir() and not d.name.startswith('.')
-        ]
+        logger.info(
+            f"Index ready: {self.index.get_total_segments()} segments "
+            f"from {self.index.get_session_count()} sessions"
+        )
+        return self.index
 
-        logger.info(f"Found {len(session_dirs)} session directories")
+    def update(self, load_index: bool = True) -> IndexUpdate:
+        """
+        Re-index only the sessions that were added, changed or removed.
 
-        for session_dir in sorted(session_dirs):
-            try:
-                self._index_session(session_dir)
-            except Exception as e:
-                logger.error(f"Error indexing session {session_dir.name}: {e}", exc_info=True)
-                continue
+        Called by the pipeline after transcript outputs are written so the
+        search index stays current without full rebuilds.
 
-        # Save to cache
-        self._save_cache()
+        Args:
+            load_index: Also refresh ``self.index`` in memory. Pass False to
+                only update the on-disk shards (e.g. from the pipeline).
 
-        logger.info(
-            f"Index built: {self.index.get_total_segments()} segments "
-            f"from {self.index.get_session_count()} sessions"
-        )
+        Returns:
+            IndexUpdate listing the affected session directories
+        """
+        update = IndexUpdate()
+        new_manifest: Dict[str, Dict[str, Any]] = {}
+
+        # Manifest and shard writes are serialized with update_session(),
+        # which the pipeline calls on its own indexer instance.
+        with get_file_lock(self.cache_file):
+            if self._reload_manifest():
+                self.index = None
+            manifest = self._manifest
+            manifest_dirty = not self.cache_file.exists()
+
+            for dir_name, data_file in self._scan_sessions().items():
+                previous = manifest.get(dir_name)
+                if previous and previous.get("data_file") != str(data_file):
+                    previous = None
+                fingerprint = self._fingerprint(data_file, previous.get("fingerprint") if previous else None)
+                if fingerprint is None:
+                    continue
+
+                if previous and previous["fingerprint"]["sha256"] == fingerprint["sha256"]:
+                    update.unchanged += 1
+                    if previous["fingerprint"] != fingerprint:
+                        manifest_dirty = True
+                    new_manifest[dir_name] = {**previous, "fingerprint": fingerprint}
+                    continue
+
+                entry = self._index_session(self.output_dir / dir_name, data_file)
+                if entry is None:
+                    continue
+                entry["fingerprint"] = fingerprint
+                new_manifest[dir_name] = entry
+                (update.changed if dir_name in manifest else update.added).append(dir_name)
+
+            for dir_name in sorted(set(manifest) - set(new_manifest)):
+                update.removed.append(dir_name)
+                self._shards.pop(dir_name, None)
+
+            self._manifest = new_manifest
+            if update.has_changes or manifest_dirty:
+                self._indexed_at = datetime.now()
+                self._save_manifest()
+                self._remove_orphaned_shards()
+
+        if update.has_changes:
+            logger.info(
+                f"Index update: {len(update.added)} added, {len(update.changed)} changed, "
+                f"{len(update.removed)} removed, {update.unchanged} unchanged"
+            )
 
-        return self.index
+        if load_index:
+            self._refresh_index(update)
+        elif update.has_changes:
+            self.index = None
+        return update
 
-    def _index_session(self, session_dir: Path) -> None:
+    def update_session(self, session_dir: Path) -> IndexUpdate:
         """
-        Index a single session directory.
+        Re-index a single session directory without scanning the others.
 
-        Parses the directory name to extract session_id and date,
-        then loads the JSON data file and indexes all segments.
+        Used by the pipeline once a session's outputs are written: only that
+        session's data file is fingerprinted and, if it changed, parsed into a
+        new shard. Other manifest entries and shards are left untouched, so
+        sessions that are missing or outdated in the cache are picked up by
+        the next ``update()`` instead.
 
         Args:
-            session_dir: Path to session output directory
+            session_dir: Session output directory inside ``output_dir``
+
+        Returns:
+            IndexUpdate describing the change to this session
         """
-        # Extract session_id from directory name
-        # Format: YYYYMMDD_HHMMSS_<session_id>
+        session_dir = Path(session_dir)
         dir_name = session_dir.name
-        parts = dir_name.split('_', 2)
-        if len(parts) < 3:
-            logger.warning(f"Invalid directory name format: {dir_name}")
-            return
+        update = IndexUpdate()
+
+        with get_file_lock(self.cache_file):
+            self._reload_manifest()
+            manifest = self._manifest
+            previous = manifest.get(dir_name)
+            old_shard = previous.get("shard") if previous else None
+            data_file = self._session_data_file(session_dir)
+
+            if data_file is None:
+                if previous is None:
+                    return update
+                del manifest[dir_name]
+                self._shards.pop(dir_name, None)
+                update.removed.append(dir_name)
+            else:
+                if previous and previous.get("data_file") != str(data_file):
+                    previous = None
+                fingerprint = self._fingerprint(data_file, previous.get("fingerprint") if previous else None)
+                if fingerprint is None:
+                    return update
+                if previous and previous["fingerprint"]["sha256"] == fingerprint["sha256"]:
+                    update.unchanged += 1
+                    return update
+
+                entry = self._index_session(session_dir, data_file)
+                if entry is None:
+                    return update
+                entry["fingerprint"] = fingerprint
+                (update.changed if dir_name in manifest else update.added).append(dir_name)
+                manifest[dir_name] = entry
+
+            self._indexed_at = datetime.now()
+            self._save_manifest()
+            if old_shard:
+                self._remove_shard_file(old_shard)
+
+        action = "added" if update.added else "changed" if update.changed else "removed"
+        logger.info(f"Index update: session {dir_name} {action}")
+        self.index = None
+        return update
 
-        session_date = f"{parts[0]}_{parts[1]}"
-        session_id = parts[2]
+    def _scan_sessions(self, log_invalid: bool = True) -> Dict[str, Path]:
+        """
+        Find session directories and their data files.
+
+        Returns:
+            Mapping of session directory name to its *_data.json file, sorted by name
+        """
+        sessions: Dict[str, Path] = {}
+        if not self.output_dir.exists():
+            if log_invalid:
+                logger.warning(f"Output directory does not exist: {self.output_dir}")
+            return sessions
+
+        for session_dir in sorted(self.output_dir.iterdir()):
+            data_file = self._session_data_file(session_dir, log_invalid)
+            if data_file is not None:
+                sessions[session_dir.name] = data_file
+        return sessions
+
+    @staticmethod
+    def _session_data_file(session_dir: Path, log_invalid: bool = True) -> Optional[Path]:
+        """Data file of one session directory, or None if it is not an indexable session."""
+        if not session_dir.is_dir() or session_dir.name.startswith('.'):
+            return None
+
+        # Format: YYYYMMDD_HHMMSS_<session_id>
+        if len(session_dir.name.split('_', 2)) < 3:
+            if log_invalid:
+                logger.warning(f"Invalid directory name format: {session_dir.name}")
+            return None
 
-        # Look for JSON data file
         # FIX: Sort to ensure deterministic behavior if multiple files exist
-        json_files = sorted(list(session_dir.glob("*_data.json")))
+        json_files = sorted(session_dir.glob("*_data.json"))
         if not json_files:
-            logger.warning(f"No data.json file found in {session_dir}")
-            return
+            if log_invalid:
+                logger.warning(f"No data.json file found in {session_dir}")
+            return None
 
         # Warn if multiple JSON files found (should be rare)
-        if len(json_files) > 1:
+        if len(json_files) > 1 and log_invalid:
             logger.warning(
                 f"Multiple data.json files found in {session_dir}, using {json_files[0]}"
             )
+        return json_files[0]
 
-        data_file = json_files[0]
+    @staticmethod
+    def _fingerprint(data_file: Path, previous: Optional[Dict[str, Any]] = None) -> Optional[Dict[str, Any]]:
+        """
+        Fingerprint a data file as mtime, size and SHA-256.
+
+        The hash is reused from ``previous`` when mtime and size are unchanged.
+        """
+        try:
+            stat = data_file.stat()
+        except OSError as e:
+            logger.error(f"Failed to stat {data_file}: {e}")
+            return None
+
+        if previous and previous.get("mtime") == stat.st_mtime and previous.get("size") == stat.st_size:
+            return previous
+
+        digest = hashlib.sha256()
+        try:
+            with open(data_file, 'rb') as f:
+                for block in iter(lambda: f.read(1024 * 1024), b""):
+                    digest.update(block)
+        except OSError as e:
+            logger.error(f"Failed to read {data_file}: {e}")
+            return None
+        return {"mtime": stat.st_mtime, "size": stat.st_size, "sha256": digest.hexdigest()}
+
+    def _index_session(self, session_dir: Path, data_file: Path) -> Optional[Dict[str, Any]]:
+        """
+        Parse one session's data file and write its cache shard.
+
+        Args:
+            session_dir: Path to session output directory
+            data_file: The session's *_data.json file
+
+        Returns:
+            Manifest entry for the session, or None if the file is unreadable
+        """
+        # Extract session_id from directory name
+        # Format: YYYYMMDD_HHMMSS_<session_id>
+        dir_name = session_dir.name
+        parts = dir_name.split('_', 2)
+        session_date = f"{parts[0]}_{parts[1]}"
+        session_id = parts[2]
 
         # Load transcript data
         try:
@@ -225,7 +785,7 @@ class TranscriptIndexer:
                 data = json.load(f)
         except Exception as e:
             logger.error(f"Failed to load {data_file}: {e}")
-            return
+            return None
 
         # Extract session metadata
         session_metadata = {
@@ -238,12 +798,9 @@ class TranscriptIndexer:
             'ooc_percentage': data.get('ooc_percentage', 0)
         }
 
-        self.index.add_session_metadata(session_id, session_metadata)
-
         # Index segments
-        segments = data.get('segments', [])
-        for idx, segment in enumerate(segments):
-            transcript_segment = TranscriptSegment(
+        segments = [
+            TranscriptSegment(
                 session_id=session_id,
                 timestamp=segment.get('start', 0.0),
                 timestamp_str=segment.get('timestamp', '00:00:00'),
@@ -254,86 +811,190 @@ class TranscriptIndexer:
                 session_date=session_date,
                 file_path=data_file
             )
-            self.index.add_segment(transcript_segment)
+            for idx, segment in enumerate(data.get('segments', []))
+        ]
+
+        block = SegmentBlock.from_segments(segments)
+        shard_name = self._save_shard(dir_name, block)
+        self._shards[dir_name] = block
 
         logger.debug(f"Indexed {len(segments)} segments from {session_id}")
+        return {
+            'session_id': session_id,
+            'data_file': str(data_file),
+            'shard': shard_name,
+            'segment_count': len(segments),
+            'metadata': session_metadata,
+        }
 
-    def _load_cache(self) -> TranscriptIndex:
+    def load_session_segments(self, session_id: str) -> List[TranscriptSegment]:
         """
-        Load index from JSON cache file.
+        Load the segments of one session from its shard(s) without loading the full index.
 
-        FIX: Use JSON instead of pickle for security (prevents arbitrary code execution).
+        Args:
+            session_id: Session identifier
 
         Returns:
-            Loaded TranscriptIndex
-
-        Raises:
-            Exception if cache file is invalid or corrupted
-        """
-        with open(self.cache_file, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-
-        # Reconstruct TranscriptIndex from JSON
-        index = TranscriptIndex()
-
-        # Deserialize segments
-        for seg_data in data.get('segments', []):
-            segment = TranscriptSegment(
-                session_id=seg_data['session_id'],
-                timestamp=seg_data['timestamp'],
-                timestamp_str=seg_data['timestamp_str'],
-                speaker=seg_data['speaker'],
-                text=seg_data['text'],
-                ic_ooc=seg_data['ic_ooc'],
-                segment_index=seg_data['segment_index'],
-                session_date=seg_data.get('session_date'),
-                file_path=Path(seg_data['file_path']) if seg_data.get('file_path') else None,
+            Segments of every indexed directory for that session, in order
+        """
+        manifest = self._load_manifest()
+        segments: List[TranscriptSegment] = []
+        for dir_name in sorted(manifest):
+            if manifest[dir_name]['session_id'] == session_id:
+                block = self._load_shard(dir_name)
+                segments.extend(block.segment(row) for row in range(block.count))
+        return segments
+
+    def _refresh_index(self, update: IndexUpdate) -> None:
+        """Bring ``self.index`` in line with the manifest after an update."""
+        manifest = self._manifest or {}
+        existing = self.index
+
+        # Sessions are ordered by directory name (which starts with the date),
+        # so new recordings usually sort last and can simply be appended.
+        appendable = (
+            existing is not None
+            and not update.changed
+            and not update.removed
+            and all(
+                name > other
+                for name in update.added
+                for other in manifest
+                if other not in update.added
             )
-            index.add_segment(segment)
+        )
+        if existing is not None and not update.has_changes:
+            return
 
-        # Restore sessions metadata
-        index.sessions = data.get('sessions', {})
+        index = existing if appendable else TranscriptIndex()
+        dir_names = sorted(update.added) if appendable else sorted(manifest)
+        for dir_name in dir_names:
+            entry = manifest[dir_name]
+            index.add_session_metadata(entry['session_id'], entry['metadata'])
+            index.add_block(self._load_shard(dir_name))
+
+        index.indexed_at = self._indexed_at or datetime.now()
+        index.get_search_index()
+        self.index = index
+
+    def _load_shard(self, dir_name: str) -> SegmentBlock:
+        """Segment block of one session directory, memory-mapped on first use."""
+        block = self._shards.get(dir_name)
+        if block is None:
+            block = SegmentBlock.load(self.shard_dir / self._manifest[dir_name]['shard'])
+            self._shards[dir_name] = block
+        return block
+
+    def _save_shard(self, dir_name: str, block: SegmentBlock) -> str:
+        """
+        Write one session's segment block and return its shard file name.
 
-        # Restore indexed_at timestamp
-        if 'indexed_at' in data:
-            index.indexed_at = datetime.fromisoformat(data['indexed_at'])
+        Every write gets a fresh file name, so a shard that is still
+        memory-mapped is never overwritten in place.
+        """
+        self.shard_dir.mkdir(parents=True, exist_ok=True)
+        shard_name = f"{dir_name}.{uuid.uuid4().hex[:12]}.tidx"
+        tmp_path = self.shard_dir / f"{shard_name}.tmp"
+        block.save(tmp_path)
+        os.replace(tmp_path, self.shard_dir / shard_name)
+        return shard_name
+
+    def _remove_orphaned_shards(self) -> None:
+        """Delete shard files no longer referenced by the manifest (best effort)."""
+        if not self.shard_dir.exists():
+            return
+        referenced = {entry.get('shard') for entry in (self._manifest or {}).values()}
+        for shard_path in self.shard_dir.iterdir():
+            if shard_path.name not in referenced:
+                self._remove_shard_file(shard_path.name)
+
+    def _remove_shard_file(self, shard_name: str) -> None:
+        """Delete one shard file (best effort)."""
+        try:
+            (self.shard_dir / shard_name).unlink()
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            # Still memory-mapped (Windows); retried on the next update
+            logger.debug(f"Could not remove old shard {shard_name}: {e}")
+
+    def _reload_manifest(self) -> bool:
+        """
+        Re-read the manifest from disk, dropping cached blocks whose shard was replaced.
+
+        Callers hold the manifest lock, so the manifest they then write is
+        based on what other indexers (UI, pipeline) last saved.
+
+        Returns:
+            True if another indexer changed the manifest since it was last loaded
+        """
+        previous = self._manifest
+        self._manifest = None
+        manifest = self._load_manifest()
+        if previous is None:
+            return False
 
-        return index
+        changed = False
+        for dir_name in set(previous) | set(manifest):
+            if previous.get(dir_name, {}).get('shard') != manifest.get(dir_name, {}).get('shard'):
+                self._shards.pop(dir_name, None)
+                changed = True
+        return changed
 
-    def _save_cache(self) -> None:
+    def _load_manifest(self) -> Dict[str, Dict[str, Any]]:
         """
-        Save index to cache file using JSON.
+        Load the shard manifest (cached until the next _reload_manifest).
 
         FIX: Use JSON instead of pickle for security (prevents arbitrary code execution).
-        The cache file is stored in the cache directory and can be
-        quickly loaded on subsequent runs to avoid re-indexing.
+        Missing, corrupted or older-format caches yield an empty manifest,
+        which makes the next update re-index every session.
         """
+        if self._manifest is not None:
+            return self._manifest
+
+        self._manifest = {}
+        if not self.cache_file.exists():
+            return self._manifest
+
         try:
-            # Serialize index to JSON-compatible format
-            data = {
-                'indexed_at': self.index.indexed_at.isoformat(),
-                'sessions': self.index.sessions,
-                'segments': [
-                    {
-                        'session_id': seg.session_id,
-                        'timestamp': seg.timestamp,
-                        'timestamp_str': seg.timestamp_str,
-                        'speaker': seg.speaker,
-                        'text': seg.text,
-                        'ic_ooc': seg.ic_ooc,
-                        'segment_index': seg.segment_index,
-                        'session_date': seg.session_date,
-                        'file_path': str(seg.file_path) if seg.file_path else None,
-                    }
-                    for seg in self.index.segments
-                ],
-            }
-
-            with open(self.cache_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
-            logger.info(f"Index cached to {self.cache_file}")
+            with open(self.cache_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
         except Exception as e:
-            logger.error(f"Failed to save cache: {e}")
+            logger.warning(f"Failed to load index manifest, rebuilding: {e}")
+            return self._manifest
+
+        if data.get('version') != INDEX_FORMAT_VERSION:
+            logger.info("Index cache uses an older format, rebuilding")
+            return self._manifest
+
+        self._manifest = data.get('sessions', {})
+        if 'indexed_at' in data:
+            self._indexed_at = datetime.fromisoformat(data['indexed_at'])
+        logger.debug(f"Loaded index manifest: {len(self._manifest)} sessions from {self.cache_file}")
+        return self._manifest
+
+    def _save_manifest(self) -> None:
+        """Write the shard manifest."""
+        try:
+            self._write_json(
+                self.cache_file,
+                {
+                    'version': INDEX_FORMAT_VERSION,
+                    'indexed_at': (self._indexed_at or datetime.now()).isoformat(),
+                    'sessions': self._manifest or {},
+                },
+            )
+            logger.info(f"Index manifest saved to {self.cache_file}")
+        except Exception as e:
+            logger.error(f"Failed to save index manifest: {e}")
+
+    @staticmethod
+    def _write_json(path: Path, data: Dict[str, Any]) -> None:
+        """Write JSON atomically so readers never see a partial file."""
+        tmp_path = path.with_suffix(path.suffix + ".tmp")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
 
     def get_index(self) -> TranscriptIndex:
         """
@@ -350,49 +1011,47 @@ class TranscriptIndexer:
         """
         Invalidate the cache and force rebuild on next access.
 
-        Deletes the cache file and resets the in-memory index.
-        Call this after adding new sessions to force a rebuild.
+        Deletes the manifest and all shards and resets the in-memory index.
         """
-        if self.cache_file.exists():
-            self.cache_file.unlink()
-            logger.info("Cache invalidated")
+        with get_file_lock(self.cache_file):
+            if self.cache_file.exists():
+                self.cache_file.unlink()
+            if self.shard_dir.exists():
+                shutil.rmtree(self.shard_dir)
+        logger.info("Cache invalidated")
         self.index = None
+        self._manifest = None
+        self._indexed_at = None
+        self._shards.clear()
 
     def is_index_stale(self) -> bool:
         """
-        Check if the index is stale (new sessions added since last build).
+        Check if the index is stale (sessions added, changed or removed since last update).
 
         IMPROVEMENT 3: Detect index staleness to prompt users to rebuild.
         This prevents users from missing recent sessions in search results.
+        Only file metadata is compared; no data file is read.
 
         Returns:
-            True if index exists but is older than newest session directory
+            True if calling ``update()`` may change the index
         """
         if not self.index:
             return True
 
-        if not self.output_dir.exists():
-            return False
-
-        # Get index timestamp
-        index_time = self.index.indexed_at
-
-        # Find newest session directory
-        session_dirs = [
-            d
-            for d in self.output_dir.iterdir()
-            if d.is_dir() and not d.name.startswith(".")
-        ]
-
-        if not session_dirs:
-            return False
+        manifest = self._manifest or {}
+        sessions = self._scan_sessions(log_invalid=False)
+        if set(sessions) != set(manifest):
+            logger.info("Index is stale: sessions were added or removed")
+            return True
 
-        # Check if any session is newer than index
-        for session_dir in session_dirs:
-            if session_dir.stat().st_mtime > index_time.timestamp():
-                logger.info(
-                    f"Index is stale: {session_dir.name} is newer than index"
-                )
+        for dir_name, data_file in sessions.items():
+            fingerprint = manifest[dir_name].get('fingerprint', {})
+            try:
+                stat = data_file.stat()
+            except OSError:
+                return True
+            if stat.st_mtime != fingerprint.get('mtime') or stat.st_size != fingerprint.get('size'):
+                logger.info(f"Index is stale: {dir_name} changed since last update")
                 return True
 
         return False
@@ -0,0 +1,168 @@
+"""Bounded-concurrency dispatch of chunk transcription requests."""
+from __future__ import annotations
+
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from .chunker import AudioChunk
+from .config import Config
+from .logger import get_logger
+from .rate_limiter import RateLimiter
+from .transcriber import BaseTranscriber, ChunkTranscription, CloudTranscriber
+
+# Backends that run a model in-process. Parallel calls would contend for the
+# same GPU/CPU and the faster-whisper model is not safe to share across threads.
+LOCAL_TRANSCRIPTION_BACKENDS = {"local", "whisper"}
+
+ChunkCompletionCallback = Callable[[int, AudioChunk, ChunkTranscription], None]
+
+
+class TranscriptionExecutor:
+    """
+    Dispatch chunk transcriptions with a bounded number of in-flight requests.
+
+    Cloud backends (Groq, OpenAI) are bound by request latency rather than
+    compute, so several chunks can be uploaded at once. Results are reassembled
+    in the order the chunks were supplied (i.e. ``chunk_index`` order) no matter
+    which request finishes first.
+
+    The optional ``on_chunk_complete`` callback is always invoked from the
+    calling thread, so progress reporting and checkpointing never race.
+
+    A ``rate_limiter`` is handed to cloud transcribers, which acquire it once
+    per API call (an oversized chunk is uploaded in several parts). Other
+    transcribers make a single call per chunk, so the executor acquires it
+    for them before each chunk.
+    """
+
+    def __init__(
+        self,
+        transcriber: BaseTranscriber,
+        max_workers: int = 1,
+        rate_limiter: Optional[RateLimiter] = None,
+    ):
+        self.transcriber = transcriber
+        self.max_workers = max(1, int(max_workers or 1))
+        self.rate_limiter = rate_limiter
+        if rate_limiter is not None and isinstance(transcriber, CloudTranscriber):
+            transcriber.rate_limiter = rate_limiter
+        self.logger = get_logger("transcription_executor")
+
+    @classmethod
+    def for_backend(
+        cls,
+        transcriber: BaseTranscriber,
+        backend: str,
+        max_workers: Optional[int] = None,
+    ) -> "TranscriptionExecutor":
+        """
+        Build an executor with settings appropriate for a transcription backend.
+
+        Local backends always run sequentially. Cloud backends use
+        ``max_workers`` (or ``Config.TRANSCRIPTION_MAX_WORKERS``) and share a
+        rate limiter configured from ``Config.TRANSCRIPTION_RATE_LIMIT_*``.
+        """
+        if (backend or "").lower() in LOCAL_TRANSCRIPTION_BACKENDS:
+            return cls(transcriber, max_workers=1)
+
+        workers = max_workers if max_workers is not None else Config.TRANSCRIPTION_MAX_WORKERS
+        rate_limiter = RateLimiter(
+            max_calls=max(1, Config.TRANSCRIPTION_RATE_LIMIT_CALLS),
+            period=Config.TRANSCRIPTION_RATE_LIMIT_PERIOD_SECONDS,
+        )
+        return cls(transcriber, max_workers=workers, rate_limiter=rate_limiter)
+
+    def transcribe_chunks(
+        self,
+        chunks: Iterable[AudioChunk],
+        language: str,
+        on_chunk_complete: Optional[ChunkCompletionCallback] = None,
+    ) -> List[ChunkTranscription]:
+        """
+        Transcribe every chunk and return results in input order.
+
+        Args:
+            chunks: Audio chunks to transcribe. Any iterable works; a generator
+                such as ``HybridChunker.iter_chunks`` is consumed lazily, so
+                transcription starts before chunking has finished.
+            language: Language code forwarded to the transcriber
+            on_chunk_complete: Called as ``(completed_count, chunk, transcription)``
+                each time a chunk finishes, in completion order
+
+        Returns:
+            List of ChunkTranscription objects ordered like ``chunks``
+
+        Raises:
+            Exception: The first transcription error encountered. Chunks that
+                have not started yet are cancelled.
+        """
+        if self.max_workers == 1:
+            return self._transcribe_sequential(chunks, language, on_chunk_complete)
+        return self._transcribe_concurrent(chunks, language, on_chunk_complete)
+
+    def _transcribe_one(self, chunk: AudioChunk, language: str) -> ChunkTranscription:
+        if self.rate_limiter is not None and not isinstance(self.transcriber, CloudTranscriber):
+            self.rate_limiter.acquire()
+        return self.transcriber.transcribe_chunk(chunk, language=language)
+
+    def _transcribe_sequential(
+        self,
+        chunks: Iterable[AudioChunk],
+        language: str,
+        on_chunk_complete: Optional[ChunkCompletionCallback],
+    ) -> List[ChunkTranscription]:
+        results: List[ChunkTranscription] = []
+        for chunk in chunks:
+            transcription = self._transcribe_one(chunk, language)
+            results.append(transcription)
+            if on_chunk_complete:
+                on_chunk_complete(len(results), chunk, transcription)
+        return results
+
+    def _transcribe_concurrent(
+        self,
+        chunks: Iterable[AudioChunk],
+        language: str,
+        on_chunk_complete: Optional[ChunkCompletionCallback],
+    ) -> List[ChunkTranscription]:
+        workers = self.max_workers
+        self.logger.info("Transcribing chunks with up to %d concurrent requests", workers)
+
+        results: List[Optional[ChunkTranscription]] = []
+        completed = 0
+        pending_chunks = iter(chunks)
+        exhausted = False
+        in_flight: Dict[Future, Tuple[int, AudioChunk]] = {}
+
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="transcribe") as pool:
+            try:
+                while not exhausted or in_flight:
+                    # Keep at most `workers` requests outstanding so chunk audio
+                    # is only held by the pool for chunks actually being sent,
+                    # and a lazy chunk source is only advanced as slots free up.
+                    while not exhausted and len(in_flight) < workers:
+                        chunk = next(pending_chunks, None)
+                        if chunk is None:
+                            exhausted = True
+                            break
+                        future = pool.submit(self._transcribe_one, chunk, language)
+                        in_flight[future] = (len(results), chunk)
+                        results.append(None)
+
+                    if not in_flight:
+                        break
+
+                    done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        position, chunk = in_flight.pop(future)
+                        transcription = future.result()
+                        results[position] = transcription
+                        completed += 1
+                        if on_chunk_complete:
+                            on_chunk_complete(completed, chunk, transcription)
+            except BaseException:
+                for future in in_flight:
+                    future.cancel()
+                raise
+
+        return results  # type: ignore[return-value]
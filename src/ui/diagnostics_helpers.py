@@ -195,8 +195,8 @@ def list_conversations() -> str:
 
         for conv in conversations:
             conv_id = conv.get('conversation_id', 'unknown')
-            campaign = conv.get('context', {}).get('campaign', 'N/A')
-            msg_count = len(conv.get('messages', []))
+            campaign = conv.get('campaign', 'N/A')
+            msg_count = conv.get('message_count', 0)
             created = conv.get('created_at', 'unknown')[:19]  # Truncate to datetime
             updated = conv.get('updated_at', 'unknown')[:19]  # Truncate to datetime
 
@@ -243,8 +243,12 @@ def clear_all_conversations() -> str:
                 "No conversations found to clear."
             )
 
-        # Delete all conversation files
-        for conv_file in conversation_files:
+        # Delete all conversation files, their message logs and the summary index
+        from src.langchain.conversation_store import INDEX_FILE, MESSAGE_LOG_SUFFIX
+
+        removable = conversation_files + list(conversations_dir.glob(f"conv_*{MESSAGE_LOG_SUFFIX}"))
+        removable += [path for path in conversations_dir.glob(f"{INDEX_FILE}*") if path.is_file()]
+        for conv_file in removable:
             try:
                 conv_file.unlink()
             except Exception as e:
@@ -354,3 +354,34 @@ class TestPathSecurity:
         response = api_instance.get_file_preview(str(outside_file))
 
         assert response['status'] in ['not_found', 'invalid']
+
+
+def test_download_file_renders_virtual_snippet(tmp_path, monkeypatch):
+    """Virtual snippet clips have no file on disk and are rendered on download."""
+    import numpy as np
+    import soundfile as sf
+    from src.config import Config
+    from src.snipper import AudioSnipper
+
+    monkeypatch.setattr(Config, "USE_VIRTUAL_SNIPPETS", True)
+    monkeypatch.setattr(Config, "USE_NATIVE_SNIPPET_EXPORT", True)
+    monkeypatch.setattr(Config, "TEMP_DIR", tmp_path / "temp")
+    output_dir = tmp_path / "output"
+    audio_path = tmp_path / "session.wav"
+    sf.write(str(audio_path), np.zeros(32000, dtype=np.int16), 16000, subtype="PCM_16")
+    AudioSnipper().export_segments(
+        audio_path,
+        [{"start_time": 0.5, "end_time": 1.5, "speaker": "DM", "text": "Roll initiative"}],
+        output_dir / "segments",
+        "session1",
+    )
+
+    api = SessionArtifactsAPI(output_dir=output_dir)
+    result = api.download_file("segments/session1/segment_0001_DM.wav")
+
+    assert result is not None
+    rendered_path, filename = result
+    assert filename == "segment_0001_DM.wav"
+    assert sf.info(str(rendered_path)).frames == 16000
+    assert not (output_dir / "segments" / "session1" / filename).exists()
+    assert api.download_file("segments/session1/segment_0002_DM.wav") is None
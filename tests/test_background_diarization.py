@@ -0,0 +1,52 @@
+import time
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from src.background_diarization import BackgroundDiarization, BackgroundDiarizationError
+from src.diarizer import SpeakerSegment
+
+
+class _FakeDiarizer:
+    def diarize(self, audio_path, num_speakers=None):
+        time.sleep(0.05)
+        segments = [SpeakerSegment("SPEAKER_00", 0.0, 1.5), SpeakerSegment("SPEAKER_01", 1.5, 3.0)]
+        return segments, {"SPEAKER_00": np.ones(4, dtype=np.float32)}
+
+
+class _FailingDiarizer:
+    def diarize(self, audio_path, num_speakers=None):
+        raise ValueError("no speakers found")
+
+
+# "fork" lets the child inherit the patched factory; production uses "spawn".
+pytestmark = pytest.mark.skipif(
+    not hasattr(__import__("os"), "fork"), reason="requires fork start method"
+)
+
+
+def test_result_is_returned_from_child_process(tmp_path):
+    with patch("src.background_diarization.DiarizerFactory.create", return_value=_FakeDiarizer()):
+        job = BackgroundDiarization("pyannote", tmp_path / "session.wav", 2, start_method="fork").start()
+        segments, embeddings = job.result(timeout=30)
+
+    assert [s.speaker_id for s in segments] == ["SPEAKER_00", "SPEAKER_01"]
+    np.testing.assert_array_equal(embeddings["SPEAKER_00"], np.ones(4))
+    assert job.diarization_seconds >= 0.05
+    assert job.wait_seconds is not None
+    # Result is cached after the process has been reaped
+    assert job.result() == (segments, embeddings)
+
+
+def test_child_error_is_raised_in_parent(tmp_path):
+    with patch("src.background_diarization.DiarizerFactory.create", return_value=_FailingDiarizer()):
+        job = BackgroundDiarization("pyannote", tmp_path / "session.wav", start_method="fork").start()
+        with pytest.raises(BackgroundDiarizationError, match="no speakers found"):
+            job.result(timeout=30)
+
+
+def test_result_without_start_raises(tmp_path):
+    job = BackgroundDiarization("pyannote", tmp_path / "session.wav")
+    with pytest.raises(BackgroundDiarizationError, match="not started"):
+        job.result()
@@ -41,3 +41,33 @@ def test_checkpoint_latest_and_clear(tmp_path):
 
     manager.clear()
     assert manager.list_stages() == []
+
+
+def test_checkpoint_journal_append_read_and_reset(tmp_path):
+    manager = CheckpointManager("session-3", tmp_path)
+
+    assert manager.read_journal("audio_transcribed", "chunks") == []
+
+    manager.append_journal("audio_transcribed", "chunks", {"chunk_index": 0})
+    manager.append_journal("audio_transcribed", "chunks", {"chunk_index": 1})
+    assert manager.read_journal("audio_transcribed", "chunks") == [
+        {"chunk_index": 0},
+        {"chunk_index": 1},
+    ]
+
+    manager.reset_journal("audio_transcribed", "chunks", [{"chunk_index": 1}])
+    assert manager.read_journal("audio_transcribed", "chunks") == [{"chunk_index": 1}]
+
+    manager.reset_journal("audio_transcribed", "chunks")
+    assert manager.read_journal("audio_transcribed", "chunks") == []
+
+
+def test_checkpoint_journal_skips_truncated_trailing_record(tmp_path):
+    manager = CheckpointManager("session-4", tmp_path)
+    manager.append_journal("audio_transcribed", "chunks", {"chunk_index": 0})
+
+    journal_path = tmp_path / "audio_transcribed_chunks.jsonl"
+    with journal_path.open("a", encoding="utf-8") as handle:
+        handle.write('{"chunk_index": 1, "segm')  # simulated crash mid-write
+
+    assert manager.read_journal("audio_transcribed", "chunks") == [{"chunk_index": 0}]
@@ -11,7 +11,7 @@ import pytest
 import numpy as np
 from pathlib import Path
 from unittest.mock import Mock, MagicMock, patch
-from src.chunker import HybridChunker, AudioChunk
+from src.chunker import HybridChunker, AudioChunk, LazyAudioChunk, MappedAudioFile
 from src.config import Config
 
 
@@ -530,6 +530,166 @@ class TestChunkerEdgeCases:
             assert len(chunks) >= 1
 
 
+# ============================================================================
+# Streaming Chunking Tests
+# ============================================================================
+
+def _nonzero_speech_timestamps(audio, model, sampling_rate, **kwargs):
+    """Fake VAD: every run of non-zero samples is a speech segment."""
+    voiced = np.abs(np.asarray(audio)) > 0
+    edges = np.diff(np.concatenate(([0], voiced.astype(np.int8), [0])))
+    starts = np.flatnonzero(edges == 1)
+    ends = np.flatnonzero(edges == -1)
+    return [{'start': int(s), 'end': int(e)} for s, e in zip(starts, ends)]
+
+
+class TestHybridChunkerStreaming:
+    """Test block-wise streaming chunking."""
+
+    def _speech_audio(self, tmp_path, sample_rate=8000, duration=240):
+        import wave
+
+        rng = np.random.default_rng(7)
+        audio = np.zeros(duration * sample_rate, dtype=np.int16)
+        t = 0.0
+        while t < duration:
+            speech = rng.uniform(3.0, 25.0)
+            end = min(duration, t + speech)
+            audio[int(t * sample_rate):int(end * sample_rate)] = 2000
+            t = end + rng.uniform(0.6, 3.0)
+        # Loud burst late in the file exercises running-peak normalization
+        audio[int(200 * sample_rate):int(201 * sample_rate)] = 16000
+
+        wav_path = tmp_path / "speech.wav"
+        with wave.open(str(wav_path), 'w') as wav_file:
+            wav_file.setnchannels(1)
+            wav_file.setsampwidth(2)
+            wav_file.setframerate(sample_rate)
+            wav_file.writeframes(audio.tobytes())
+        return wav_path
+
+    def _chunker(self):
+        with patch('torch.hub.load', return_value=(Mock(), [Mock(side_effect=_nonzero_speech_timestamps)])):
+            chunker = HybridChunker(max_chunk_length=30, overlap_length=3)
+        chunker.STREAM_BLOCK_SECONDS = 20.0
+        chunker.STREAM_VAD_CARRY_SECONDS = 2.0
+        return chunker
+
+    def test_streaming_matches_eager_boundaries(self, tmp_path):
+        audio_path = self._speech_audio(tmp_path)
+        chunker = self._chunker()
+
+        eager = chunker.chunk_audio(audio_path, streaming=False)
+        streamed = chunker.chunk_audio(audio_path, streaming=True)
+
+        assert [t for c in streamed for t in (c.start_time, c.end_time)] == pytest.approx(
+            [t for c in eager for t in (c.start_time, c.end_time)]
+        )
+        assert [c.chunk_index for c in streamed] == list(range(len(eager)))
+        for s_chunk, e_chunk in zip(streamed, eager):
+            assert len(s_chunk.audio) == len(e_chunk.audio)
+            assert np.abs(s_chunk.audio).max() <= 1.0
+
+    def test_vad_runs_on_bounded_blocks(self, tmp_path):
+        audio_path = self._speech_audio(tmp_path)
+        chunker = self._chunker()
+
+        list(chunker.iter_chunks(audio_path))
+
+        block_lengths = [len(call.args[0]) for call in chunker.get_speech_timestamps.call_args_list]
+        assert len(block_lengths) > 1
+        assert max(block_lengths) <= 20 * 8000
+
+    def test_chunks_are_yielded_before_file_is_fully_analysed(self, tmp_path):
+        audio_path = self._speech_audio(tmp_path)
+        chunker = self._chunker()
+
+        first = next(chunker.iter_chunks(audio_path))
+
+        assert first.chunk_index == 0
+        # 240s at 20s blocks with 2s carry needs 14 blocks for the whole file
+        assert chunker.get_speech_timestamps.call_count < 10
+
+    def test_lazy_chunks_reuse_vad_peak_instead_of_rereading(self, tmp_path, monkeypatch):
+        audio_path = self._speech_audio(tmp_path)
+        chunker = self._chunker()
+        reads = []
+        original_read = MappedAudioFile.read
+        monkeypatch.setattr(
+            MappedAudioFile, "read",
+            lambda self, start, end, sr: reads.append(end - start) or original_read(self, start, end, sr)
+        )
+
+        with patch('src.chunker.Config.CHUNKER_LAZY_AUDIO', True):
+            chunks = list(chunker.iter_chunks(audio_path))
+
+        assert all(isinstance(chunk, LazyAudioChunk) for chunk in chunks)
+        # At most the tail after the last VAD block is read for the peak
+        assert sum(reads) < chunker.STREAM_BLOCK_SECONDS
+        peaks = [float(np.abs(chunk.audio).max()) for chunk in chunks]
+        assert max(peaks) == pytest.approx(1.0, abs=1e-3)
+
+
+# ============================================================================
+# Lazy Chunk Audio Tests
+# ============================================================================
+
+class TestLazyAudioChunk:
+    """Test memory-mapped, lazily materialized chunk audio."""
+
+    def _ramp_wav(self, tmp_path, subtype='PCM_16', channels=1):
+        import soundfile as sf
+
+        samples = np.linspace(-0.5, 0.5, 16000 * 4, dtype=np.float32)
+        if channels > 1:
+            samples = np.stack([samples] * channels, axis=1)
+        path = tmp_path / f"ramp_{subtype}_{channels}.wav"
+        sf.write(str(path), samples, 16000, subtype=subtype)
+        return path
+
+    @pytest.mark.parametrize("subtype", ["PCM_16", "PCM_32", "FLOAT"])
+    def test_mapped_read_matches_soundfile(self, tmp_path, subtype):
+        import soundfile as sf
+
+        path = self._ramp_wav(tmp_path, subtype=subtype)
+        source = MappedAudioFile(path)
+
+        audio = source.read(1.0, 2.5, 16000)
+        expected, _ = sf.read(str(path), start=16000, stop=40000, dtype='float32')
+
+        assert source._samples is not None  # memory-mapped, not the fallback
+        np.testing.assert_allclose(audio, expected, atol=1e-6)
+
+    def test_stereo_is_downmixed(self, tmp_path):
+        path = self._ramp_wav(tmp_path, channels=2)
+        audio = MappedAudioFile(path).read(0.0, 1.0, 16000)
+        assert audio.ndim == 1
+        assert len(audio) == 16000
+
+    def test_chunk_holds_no_audio_until_accessed(self, tmp_path):
+        path = self._ramp_wav(tmp_path)
+        source = MappedAudioFile(path)
+        chunk = LazyAudioChunk(source, start_time=0.0, end_time=1.0, sample_rate=16000, chunk_index=0, gain=2.0)
+
+        assert not chunk.is_loaded
+        assert source._opened is False
+        audio = chunk.audio
+        assert len(audio) == 16000
+        assert np.abs(audio).max() == pytest.approx(2.0 * np.abs(source.read(0.0, 1.0, 16000)).max())
+        # Samples are not cached on the chunk
+        assert not chunk.is_loaded
+
+    def test_from_dict_round_trip(self, tmp_path):
+        path = self._ramp_wav(tmp_path)
+        chunk = LazyAudioChunk.from_dict(
+            {"start_time": 0.5, "end_time": 1.5, "sample_rate": 16000, "chunk_index": 3},
+            MappedAudioFile(path),
+        )
+        assert chunk.to_dict() == {"start_time": 0.5, "end_time": 1.5, "sample_rate": 16000, "chunk_index": 3}
+        assert chunk.duration == 1.0
+        assert len(chunk.audio) == 16000
+
+
 # ============================================================================
 # Integration Tests
 # ============================================================================
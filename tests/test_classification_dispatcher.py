@@ -0,0 +1,44 @@
+import threading
+import time
+from unittest.mock import MagicMock
+
+from src.classification_dispatcher import ClassificationDispatcher
+
+
+def test_results_are_ordered_and_in_flight_is_bounded():
+    lock = threading.Lock()
+    active = {"now": 0, "max": 0}
+
+    def _work(item):
+        with lock:
+            active["now"] += 1
+            active["max"] = max(active["max"], active["now"])
+        time.sleep(0.01 * (8 - item))
+        with lock:
+            active["now"] -= 1
+        return item * 10
+
+    progress = []
+    dispatcher = ClassificationDispatcher(max_in_flight=3)
+    results = dispatcher.map(_work, list(range(8)), on_progress=lambda done, total: progress.append((done, total)))
+
+    assert results == [i * 10 for i in range(8)]
+    assert 1 < active["max"] <= 3
+    assert progress == [(i, 8) for i in range(1, 9)]
+
+
+def test_failed_items_are_reported_as_none():
+    def _work(item):
+        if item == 2:
+            raise RuntimeError("backend unavailable")
+        return item
+
+    results = ClassificationDispatcher(max_in_flight=2).map(_work, [0, 1, 2, 3])
+
+    assert results == [0, 1, None, 3]
+
+
+def test_rate_limiter_is_acquired_per_request():
+    rate_limiter = MagicMock()
+    ClassificationDispatcher(max_in_flight=2, rate_limiter=rate_limiter).map(lambda item: item, [1, 2, 3])
+    assert rate_limiter.acquire.call_count == 3
@@ -10,11 +10,16 @@ def patched_config():
         MockConfig.OLLAMA_MODEL = 'test-model'
         MockConfig.OLLAMA_FALLBACK_MODEL = None
         MockConfig.OLLAMA_BASE_URL = 'http://localhost:11434'
+        MockConfig.OLLAMA_MAX_CALLS_PER_SECOND = 10
+        MockConfig.OLLAMA_RATE_LIMIT_PERIOD_SECONDS = 1.0
+        MockConfig.OLLAMA_RATE_LIMIT_BURST = 10
         MockConfig.GROQ_MAX_CALLS_PER_SECOND = 2
         MockConfig.GROQ_RATE_LIMIT_PERIOD_SECONDS = 1.0
         MockConfig.GROQ_RATE_LIMIT_BURST = 2
         MockConfig.CLASSIFICATION_BATCH_SIZE = 10
         MockConfig.CLASSIFICATION_USE_BATCHING = False
+        MockConfig.CLASSIFICATION_MAX_IN_FLIGHT = 1
+        MockConfig.LLM_CACHE_ENABLED = False
         MockConfig.CLASSIFIER_CONTEXT_MAX_SEGMENTS = 5
         MockConfig.CLASSIFIER_CONTEXT_PAST_SECONDS = 30
         MockConfig.CLASSIFIER_CONTEXT_FUTURE_SECONDS = 30
@@ -126,6 +131,23 @@ class TestOllamaClassifier:
         assert results[0].character == "TestChar"
         assert results[1].segment_index == 1
 
+    def test_cached_response_skips_generate(self, mock_ollama_client, mock_prompt_file, tmp_path):
+        from src.llm_response_cache import LLMResponseCache
+
+        classifier = OllamaClassifier()
+        classifier.response_cache = LLMResponseCache(tmp_path / "llm.sqlite")
+        mock_ollama_client.generate.return_value = {
+            'response': "Classificatie: OOC\nVertrouwen: 0.7\nPersonage: N/A"
+        }
+        segments = [{'text': 'Pass the chips'}]
+
+        first = classifier.classify_segments(segments, [], [])
+        second = classifier.classify_segments(segments, [], [])
+
+        assert mock_ollama_client.generate.call_count == 1
+        assert first[0].classification == second[0].classification == "OOC"
+        assert classifier.response_cache.stats()["hits"] == 1
+
     def test_classify_retries_with_low_vram_on_memory_error(self, mock_ollama_client, mock_prompt_file):
         classifier = OllamaClassifier()
         mock_ollama_client.generate.side_effect = [
@@ -179,6 +201,91 @@ class TestOllamaClassifier:
         assert "defaulted to IC" in results[0].reasoning
         assert mock_ollama_client.generate.call_count == 2
 
+    def test_batched_classification_runs_concurrently_in_order(self, mock_ollama_client, mock_prompt_file):
+        import json
+        import re
+        import threading
+        import time
+
+        from src.classification_dispatcher import ClassificationDispatcher
+
+        classifier = OllamaClassifier()
+        classifier.batch_size = 2
+        classifier.batch_prompt_template = "{char_list}|{player_list}|{speaker_map}\n{batch_text}"
+        classifier.dispatcher = ClassificationDispatcher(max_in_flight=3)
+
+        active = {"now": 0, "max": 0}
+        lock = threading.Lock()
+
+        def _generate(model, prompt, options):
+            indices = [int(i) for i in re.findall(r"Index (\d+)", prompt)]
+            if not indices:
+                # Per-segment fallback prompt
+                return {"response": "Classificatie: OOC\nVertrouwen: 0.7", "model": model}
+            with lock:
+                active["now"] += 1
+                active["max"] = max(active["max"], active["now"])
+            # Later batches finish first
+            time.sleep(0.02 * (10 - indices[0]))
+            with lock:
+                active["now"] -= 1
+            if 4 in indices:
+                raise RuntimeError("batch timed out")
+            payload = [{"index": i, "classification": "IC", "confidence": 0.9} for i in indices]
+            return {"response": json.dumps(payload), "model": model}
+
+        mock_ollama_client.generate.side_effect = _generate
+        segments = [{"text": f"Segment {i}", "start_time": float(i)} for i in range(8)]
+
+        results = classifier.classify_segments_batched(segments, [], [])
+
+        assert [r.segment_index for r in results] == list(range(8))
+        assert active["max"] > 1
+        # The failed batch (indices 4-5) was re-classified one segment at a time
+        assert [r.classification for r in results[4:6]] == [Classification.OUT_OF_CHARACTER] * 2
+        assert all(r.classification == Classification.IN_CHARACTER for r in results[:4] + results[6:])
+
+    def test_batched_progress_counts_batches_that_finished(self, mock_ollama_client, mock_prompt_file):
+        import json
+        import re
+        import time
+
+        from src.classification_dispatcher import ClassificationDispatcher
+
+        classifier = OllamaClassifier()
+        classifier.batch_size = 2
+        classifier.batch_prompt_template = "{char_list}|{player_list}|{speaker_map}\n{batch_text}"
+        classifier.dispatcher = ClassificationDispatcher(max_in_flight=3)
+
+        def _generate(model, prompt, options):
+            indices = [int(i) for i in re.findall(r"Index (\d+)", prompt)]
+            # The short final batch (index 4) finishes first
+            time.sleep(0.0 if 4 in indices else 0.1 * (1 + indices[0]))
+            payload = [{"index": i, "classification": "IC", "confidence": 0.9} for i in indices]
+            return {"response": json.dumps(payload), "model": model}
+
+        mock_ollama_client.generate.side_effect = _generate
+        segments = [{"text": f"Segment {i}", "start_time": float(i)} for i in range(5)]
+
+        with patch('src.classifier.StatusTracker') as mock_tracker:
+            classifier.classify_segments_batched(segments, [], [])
+
+        messages = [
+            c.args[3] for c in mock_tracker.update_stage.call_args_list
+            if c.args[3].startswith("Classified ")
+        ]
+        assert [m.split(" ")[1] for m in messages] == ["1/5", "3/5", "5/5"]
+
+    def test_dispatcher_uses_configured_rate_limiter(self, mock_ollama_client, mock_prompt_file, patched_config):
+        patched_config.OLLAMA_MAX_CALLS_PER_SECOND = 3
+        patched_config.OLLAMA_RATE_LIMIT_PERIOD_SECONDS = 2.0
+
+        classifier = OllamaClassifier()
+
+        assert classifier.dispatcher.rate_limiter is classifier.rate_limiter
+        assert classifier.rate_limiter.max_calls == 3
+        assert classifier.rate_limiter.period == 2.0
+
     def test_preflight_warns_when_memory_insufficient(self, mock_ollama_client, mock_prompt_file, monkeypatch):
         classifier = OllamaClassifier()
         monkeypatch.setattr(
@@ -313,6 +420,33 @@ class TestGroqClassifier:
         assert results[0].character == "Gandalf"
         assert results[1].segment_index == 1
 
+    def test_classify_segments_concurrently_keeps_order(self, mock_groq_client, mock_groq_prompt_file):
+        import time
+
+        from src.classification_dispatcher import ClassificationDispatcher
+
+        classifier = GroqClassifier(api_key='test-key')
+        classifier.rate_limiter = MagicMock()
+        classifier.dispatcher = ClassificationDispatcher(max_in_flight=4)
+
+        def _create(messages, model):
+            text = messages[0]["content"]
+            # First segments answer last
+            delay = 0.04 if "Current: seg0" in text else 0.0
+            time.sleep(delay)
+            response = MagicMock()
+            response.choices = [MagicMock()]
+            response.choices[0].message.content = "Classificatie: OOC\nVertrouwen: 0.6"
+            return response
+
+        mock_groq_client.chat.completions.create.side_effect = _create
+        segments = [{'text': f'seg{i}'} for i in range(6)]
+
+        results = classifier.classify_segments(segments, [], [])
+
+        assert [r.segment_index for r in results] == list(range(6))
+        assert classifier.rate_limiter.acquire.call_count == 6
+
     def test_classify_handles_api_errors(self, mock_groq_client, mock_groq_prompt_file):
         """Test classification handles API errors gracefully."""
         classifier = GroqClassifier(api_key='test-key')
@@ -37,6 +37,72 @@ class TestSpeakerDiarizer:
         assert enriched[1]['speaker'] == "SPEAKER_01"
         assert enriched[2]['speaker'] == "UNKNOWN"
 
+    def test_assign_speakers_matches_pairwise_overlap_scan(self, diarizer):
+        rng = np.random.default_rng(7)
+        speaker_segments = []
+        for i in range(300):
+            start = float(rng.uniform(0, 600))
+            speaker_segments.append(SpeakerSegment(
+                speaker_id=f"SPEAKER_{i % 4:02d}",
+                start_time=start,
+                end_time=start + float(rng.uniform(0.2, 12.0)),
+            ))
+        # Exact duplicates exercise the first-wins tie-breaking
+        speaker_segments.append(SpeakerSegment("SPEAKER_09", speaker_segments[0].start_time, speaker_segments[0].end_time))
+        trans_segments = []
+        for _ in range(500):
+            start = float(rng.uniform(0, 620))
+            trans_segments.append(TranscriptionSegment(text="x", start_time=start, end_time=start + float(rng.uniform(0.1, 8.0))))
+
+        def _pairwise(trans_seg):
+            best_speaker, max_overlap = "UNKNOWN", 0.0
+            for speaker_seg in speaker_segments:
+                overlap = max(0, min(trans_seg.end_time, speaker_seg.end_time) - max(trans_seg.start_time, speaker_seg.start_time))
+                if overlap > max_overlap:
+                    max_overlap, best_speaker = overlap, speaker_seg.speaker_id
+            return best_speaker
+
+        enriched = diarizer.assign_speakers_to_transcription(trans_segments, speaker_segments)
+
+        assert [seg['speaker'] for seg in enriched] == [_pairwise(seg) for seg in trans_segments]
+
+    def test_assign_speakers_without_speaker_segments_is_unknown(self, diarizer):
+        trans_segments = [TranscriptionSegment(text="Hello", start_time=0.0, end_time=1.0)]
+
+        enriched = diarizer.assign_speakers_to_transcription(trans_segments, [])
+
+        assert enriched[0]['speaker'] == "UNKNOWN"
+
+    def test_assign_speakers_word_level_splits_at_speaker_change(self, diarizer):
+        words = [
+            {"word": " Roll", "start": 0.0, "end": 0.4, "probability": 0.9},
+            {"word": " initiative.", "start": 0.4, "end": 1.0, "probability": 0.9},
+            {"word": " I", "start": 1.6, "end": 1.7, "probability": 0.9},
+            {"word": " rolled", "start": 1.7, "end": 2.0, "probability": 0.9},
+            {"word": " twelve.", "start": 2.0, "end": 2.6, "probability": 0.9},
+        ]
+        trans_segments = [
+            TranscriptionSegment(text="Roll initiative. I rolled twelve.", start_time=0.0, end_time=2.6, words=words),
+            TranscriptionSegment(text="No words here", start_time=3.0, end_time=4.0),
+        ]
+        speaker_segments = [
+            SpeakerSegment(speaker_id="SPEAKER_00", start_time=0.0, end_time=1.2),
+            SpeakerSegment(speaker_id="SPEAKER_01", start_time=1.5, end_time=4.0),
+        ]
+
+        enriched = diarizer.assign_speakers_to_transcription(trans_segments, speaker_segments, word_level=True)
+
+        assert [(seg['speaker'], seg['text']) for seg in enriched] == [
+            ("SPEAKER_00", "Roll initiative."),
+            ("SPEAKER_01", "I rolled twelve."),
+            ("SPEAKER_01", "No words here"),
+        ]
+        assert enriched[0]['start_time'] == 0.0
+        assert enriched[0]['end_time'] == 1.0
+        assert enriched[1]['start_time'] == 1.6
+        assert enriched[1]['end_time'] == 2.6
+        assert enriched[1]['words'] == words[2:]
+
     def test_embedding_to_numpy_handles_tensor_and_numpy(self, diarizer):
         tensor = torch.tensor([[0.1, 0.2, 0.3]], dtype=torch.float32)
         tensor_result = diarizer._embedding_to_numpy(tensor)
@@ -252,3 +252,73 @@ class TestFormatFiltered:
         # Should include both IC and OOC content
         assert "You enter the tavern" in result
         assert "Wait, do I get advantage" in result
+
+
+class TestSaveAllFormats:
+    """save_all_formats writes every output in one pass over the segments."""
+
+    @pytest.fixture
+    def formatter(self):
+        return TranscriptFormatter()
+
+    @pytest.fixture
+    def segments(self):
+        return [
+            {"speaker": "SPEAKER_00", "text": "Vous entrez dans la taverne. ", "start_time": 0.0, "end_time": 2.25,
+             "words": [{"word": "Vous", "start": 0.0, "end": 0.4}]},
+            {"speaker": "SPEAKER_01", "text": "Do I get advantage?", "start_time": 2.5, "end_time": 4.0},
+            {"speaker": "SPEAKER_01", "text": "I draw my sword, brb", "start_time": 4.5, "end_time": 6.125},
+            {"speaker": "SPEAKER_02", "text": "I look around.", "start_time": 3700.0, "end_time": 3701.5},
+        ]
+
+    @pytest.fixture
+    def classifications(self):
+        return [
+            ClassificationResult(0, Classification.IN_CHARACTER, 0.95, "DM narration", "DM"),
+            ClassificationResult(1, Classification.OUT_OF_CHARACTER, 0.9, "Rules question", None),
+            ClassificationResult(2, Classification.MIXED, 0.6, "Both", "Aragorn"),
+            ClassificationResult(3, "IC", 0.8, "Action", "Legolas"),
+        ]
+
+    def test_outputs_match_individual_formatters(self, tmp_path, formatter, segments, classifications):
+        from src.constants import OutputFormat
+        from src.srt_exporter import SRTExporter
+
+        profiles = {"SPEAKER_00": "Alice", "SPEAKER_01": "Bob"}
+        metadata = {"session_id": "s1", "statistics": {"speakers": ["Alice", "Bob"]}, "note": "déjà vu"}
+
+        paths = formatter.save_all_formats(segments, classifications, tmp_path, "s1", profiles, metadata)
+
+        def read(output_format):
+            return paths[output_format].read_text(encoding="utf-8")
+
+        assert read(OutputFormat.FULL) == formatter.format_full_transcript(segments, classifications, profiles)
+        assert read(OutputFormat.IC_ONLY) == formatter.format_ic_only(segments, classifications, profiles)
+        assert read(OutputFormat.OOC_ONLY) == formatter.format_ooc_only(segments, classifications, profiles)
+        assert read(OutputFormat.JSON) == formatter.format_json(segments, classifications, profiles, metadata)
+
+        # The SRT files match exporting from the saved JSON
+        exporter = SRTExporter()
+        for output_format, method in (
+            (OutputFormat.SRT_FULL, exporter.export_from_json),
+            (OutputFormat.SRT_IC, exporter.export_ic_only_srt),
+            (OutputFormat.SRT_OOC, exporter.export_ooc_only_srt),
+        ):
+            expected_path = tmp_path / f"expected_{output_format.value}.srt"
+            method(paths[OutputFormat.JSON], expected_path)
+            assert read(output_format) == expected_path.read_text(encoding="utf-8")
+
+        assert read(OutputFormat.SRT_IC).count(" --> ") == 2
+
+    def test_empty_filters_write_empty_files(self, tmp_path, formatter, segments, classifications):
+        from src.constants import OutputFormat
+
+        ic_only = [c for c in classifications if c.classification == Classification.IN_CHARACTER]
+        paths = formatter.save_all_formats(segments[:1], ic_only[:1], tmp_path, "s2")
+
+        assert paths[OutputFormat.SRT_OOC].read_text(encoding="utf-8") == ""
+        assert paths[OutputFormat.JSON].read_text(encoding="utf-8") == formatter.format_json(segments[:1], ic_only[:1])
+
+        paths = formatter.save_all_formats([], [], tmp_path, "empty")
+        assert paths[OutputFormat.JSON].read_text(encoding="utf-8") == formatter.format_json([], [])
+        assert all(path.exists() for path in paths.values())
@@ -399,3 +399,90 @@ class TestIntermediateOutputManager:
             assert loaded_class["classification"] == orig_class["classification"]
             assert loaded_class["confidence"] == orig_class["confidence"]
             assert loaded_class["segment_index"] == orig_class["segment_index"]
+
+
+class TestColumnarIntermediates:
+    """Columnar (.npz) storage of stage outputs."""
+
+    @pytest.fixture
+    def columnar_manager(self, temp_session_dir):
+        return IntermediateOutputManager(temp_session_dir, storage_format="columnar")
+
+    def test_invalid_storage_format(self, temp_session_dir):
+        with pytest.raises(ValueError, match="Invalid intermediate storage format"):
+            IntermediateOutputManager(temp_session_dir, storage_format="xml")
+
+    def test_roundtrip_matches_json(self, manager, columnar_manager, sample_diarization_segments):
+        segments = sample_diarization_segments + [
+            # Sparse keys, None values, mixed types, NUL bytes and non-ASCII text
+            {"text": "Très\x00bien", "start_time": 5.0, "end_time": 6, "speaker": None, "extra": {"a": [1, 2]}},
+        ]
+        columnar_manager.save_stage_output(5, segments, {"total": 3}, input_file="session.m4a")
+
+        path = columnar_manager.get_stage_path(5)
+        assert path.name == "stage_5_diarization.npz"
+        loaded, metadata = columnar_manager.load_stage_output(5)
+
+        assert loaded == segments
+        assert [list(segment) for segment in loaded] == [list(segment) for segment in segments]
+        assert metadata["input_file"] == "session.m4a"
+        assert metadata["stage_number"] == 5
+
+    def test_merged_transcript_words_roundtrip(self, columnar_manager, sample_merged_segments):
+        columnar_manager.save_merged_transcript(sample_merged_segments)
+
+        loaded = columnar_manager.load_merged_transcript()
+
+        assert [seg.words for seg in loaded] == [seg.words for seg in sample_merged_segments]
+        assert [seg.confidence for seg in loaded] == [seg.confidence for seg in sample_merged_segments]
+
+    def test_load_selected_columns(self, manager, columnar_manager, sample_diarization_segments):
+        for current in (manager, columnar_manager):
+            current.save_diarization(sample_diarization_segments)
+            loaded, _ = current.load_stage_output(5, columns=["text", "speaker"])
+            assert loaded == [
+                {"text": seg["text"], "speaker": seg["speaker"]} for seg in sample_diarization_segments
+            ]
+
+    def test_format_switch_reads_existing_file_and_replaces_it(
+        self, temp_session_dir, manager, sample_classification_data
+    ):
+        segments, classifications = sample_classification_data
+        manager.save_classification(segments, classifications)
+
+        columnar = IntermediateOutputManager(temp_session_dir, storage_format="columnar")
+        assert columnar.stage_output_exists(6)
+        assert columnar.load_classification() == manager.load_classification()
+
+        columnar.save_classification(segments, classifications)
+        assert [path.name for path in columnar.intermediates_dir.iterdir()] == ["stage_6_classification.npz"]
+        assert manager.load_classification()[1] == classifications
+
+    def test_convert_stage_outputs(self, manager, sample_merged_segments, sample_diarization_segments):
+        manager.save_merged_transcript(sample_merged_segments)
+        manager.save_diarization(sample_diarization_segments)
+        original_4, metadata_4 = manager.load_stage_output(4)
+        original_5, _ = manager.load_stage_output(5)
+
+        converted = manager.convert_stage_outputs("columnar")
+
+        assert [path.name for path in converted] == ["stage_4_merged_transcript.npz", "stage_5_diarization.npz"]
+        assert not list(manager.intermediates_dir.glob("*.json"))
+        assert manager.load_stage_output(4) == (original_4, metadata_4)
+        assert manager.load_stage_output(5)[0] == original_5
+        assert manager.convert_stage_outputs("columnar") == []
+
+        manager.convert_stage_outputs("json")
+        assert manager.load_stage_output(4) == (original_4, metadata_4)
+
+    def test_update_classification_metadata(self, columnar_manager, sample_classification_data):
+        segments, classifications = sample_classification_data
+        columnar_manager.save_classification(segments, classifications)
+        columnar_manager.save_audit_log(0, {"current_text": "hi"}, {"raw_response": "IC"}, {"model": "m"})
+
+        columnar_manager.update_classification_metadata({"model": "qwen"})
+
+        _, metadata = columnar_manager.load_stage_output(6)
+        assert metadata["model"] == "qwen"
+        assert metadata["prompt_log"] == str(Path("intermediates") / "stage_6_prompts.ndjson")
+        assert columnar_manager.load_classification()[1] == classifications
@@ -0,0 +1,144 @@
+"""
+Tests for InvertedIndex.
+
+Tests tokenization, BM25 ranking, phrase queries and filter bitmaps.
+"""
+import numpy as np
+import pytest
+
+from src.inverted_index import InvertedIndex, tokenize
+
+
+@pytest.fixture
+def index():
+    idx = InvertedIndex()
+    idx.add("The dragon attacks the village", {"speaker": "DM"}, {"timestamp": 0.0})
+    idx.add("Dragon dragon dragon!", {"speaker": "Bob"}, {"timestamp": 5.0})
+    idx.add("I cast fireball at the dragon", {"speaker": "Bob"}, {"timestamp": 10.0})
+    idx.add("Let's take a break", {"speaker": "DM"}, {"timestamp": None})
+    return idx
+
+
+def test_tokenize_lowercases_and_strips_punctuation():
+    assert tokenize("I cast Fireball, at the dragon!") == ["i", "cast", "fireball", "at", "the", "dragon"]
+    assert tokenize("") == []
+
+
+def test_bm25_ranks_by_term_frequency(index):
+    doc_ids, scores = index.bm25(["dragon"])
+
+    assert sorted(doc_ids.tolist()) == [0, 1, 2]
+    ranked = doc_ids[np.argsort(-scores)]
+    assert ranked[0] == 1
+
+
+def test_bm25_requires_all_terms(index):
+    doc_ids, _ = index.bm25(["dragon", "fireball"])
+    assert doc_ids.tolist() == [2]
+
+    doc_ids, _ = index.bm25(["dragon", "fireball"], require_all=False)
+    assert sorted(doc_ids.tolist()) == [0, 1, 2]
+
+
+def test_bm25_respects_mask(index):
+    doc_ids, _ = index.bm25(["dragon"], mask=index.field_mask("speaker", {"DM"}))
+    assert doc_ids.tolist() == [0]
+
+
+def test_phrase_docs_use_positions(index):
+    assert index.phrase_docs(["the", "dragon"]).tolist() == [0, 2]
+    assert index.phrase_docs(["dragon", "the"]).tolist() == []
+    assert index.phrase_docs(["cast", "fireball"]).tolist() == [2]
+
+
+def test_range_mask_handles_missing_values(index):
+    assert index.range_mask("timestamp", 0.0, 6.0).tolist() == [True, True, False, False]
+    assert index.range_mask("timestamp", 0.0, 6.0, include_missing=True).tolist() == [True, True, False, True]
+
+
+def test_index_grows_after_queries(index):
+    index.bm25(["dragon"])
+    index.add("A second dragon appears", {"speaker": "DM"})
+
+    doc_ids, _ = index.bm25(["dragon"])
+    assert 4 in doc_ids.tolist()
+    assert index.field_mask("speaker", {"DM"}).tolist() == [True, False, False, True, True]
+
+
+def test_terms_with_prefix(index):
+    assert index.terms_with_prefix("dra") == ["dragon"]
+    assert index.terms_with_prefix("f") == ["fireball"]
+    assert index.terms_with_prefix("zzz") == []
+
+
+def test_save_and_load_roundtrip(index, tmp_path):
+    path = tmp_path / "index.npz"
+    index.save(path)
+    loaded = InvertedIndex.load(path)
+
+    assert len(loaded) == len(index)
+    assert loaded.vocabulary_size == index.vocabulary_size
+    for query in (["dragon"], ["the", "dragon"]):
+        expected_ids, expected_scores = index.bm25(query)
+        doc_ids, scores = loaded.bm25(query)
+        assert doc_ids.tolist() == expected_ids.tolist()
+        np.testing.assert_allclose(scores, expected_scores)
+    assert loaded.phrase_docs(["the", "dragon"]).tolist() == [0, 2]
+    assert loaded.field_mask("speaker", {"DM"}).tolist() == [True, False, False, True]
+    assert loaded.range_mask("timestamp", low=5.0).tolist() == [False, True, True, False]
+
+
+def test_loaded_index_accepts_new_documents(index, tmp_path):
+    path = tmp_path / "index.npz"
+    index.save(path)
+    loaded = InvertedIndex.load(path)
+
+    doc_id = loaded.add("Another dragon appears", {"speaker": "DM"}, {"timestamp": 20.0})
+
+    assert doc_id == 4
+    assert loaded.bm25(["dragon"])[0].tolist() == [0, 1, 2, 4]
+    assert loaded.terms_with_prefix("app") == ["appears"]
+    assert loaded.phrase_docs(["dragon", "appears"]).tolist() == [4]
+
+
+def test_removed_documents_leave_bm25_statistics(index):
+    expected = InvertedIndex()
+    expected.add("Dragon dragon dragon!")
+    expected.add("I cast fireball at the dragon")
+    expected.add("Let's take a break")
+
+    index.remove([0])
+
+    doc_ids, scores = index.bm25(["dragon"])
+    expected_ids, expected_scores = expected.bm25(["dragon"])
+    assert index.live_count == 3
+    assert doc_ids.tolist() == [1, 2]
+    np.testing.assert_allclose(scores, expected_scores)
+    assert index.idf("dragon") == pytest.approx(expected.idf("dragon"))
+    assert index.phrase_docs(["the", "dragon"]).tolist() == [2]
+
+
+def test_tail_save_appends_to_loaded_index(index, tmp_path):
+    base = tmp_path / "index.npz"
+    index.save(base)
+    index.add("Another dragon appears", {"speaker": "Eve"}, {"timestamp": 20.0, "round": 3})
+    index.remove([1])
+    tail = tmp_path / "index.1.npz"
+    index.save(tail, first_doc=4)
+
+    loaded = InvertedIndex.load(base)
+    loaded.load_tail(tail)
+
+    assert len(loaded) == 5
+    assert loaded.live_count == 4
+    for query in (["dragon"], ["the", "dragon"], ["appears"]):
+        expected_ids, expected_scores = index.bm25(query)
+        doc_ids, scores = loaded.bm25(query)
+        assert doc_ids.tolist() == expected_ids.tolist()
+        np.testing.assert_allclose(scores, expected_scores)
+    assert loaded.field_mask("speaker", {"Eve"}).tolist() == [False] * 4 + [True]
+    assert loaded.range_mask("round", low=1).tolist() == [False] * 4 + [True]
+    with pytest.raises(ValueError):
+        InvertedIndex.load(tail)
+    with pytest.raises(ValueError):
+        loaded.load_tail(tail)
@@ -75,6 +75,85 @@ class TestKnowledgeExtractor:
         # Assert
         assert result == {'quests': [], 'npcs': [], 'plot_hooks': [], 'locations': [], 'items': []}
 
+class TestMapReduceExtraction:
+
+    @pytest.fixture
+    def extractor(self, mock_config, mock_ollama_client):
+        mock_config.KNOWLEDGE_WINDOW_TOKENS = 50
+        mock_config.KNOWLEDGE_WINDOW_OVERLAP_TOKENS = 20
+        mock_config.KNOWLEDGE_EXTRACTION_MAX_IN_FLIGHT = 3
+        return KnowledgeExtractor()
+
+    @staticmethod
+    def _segments(count, start_index=0):
+        return [
+            {"segment_index": start_index + i, "classification": "IC", "speaker_name": "DM",
+             "text": f"Line {start_index + i} about the Tower of Ash and its many winding stairs"}
+            for i in range(count)
+        ]
+
+    def test_windows_respect_budget_and_overlap(self, extractor):
+        windows = extractor._build_transcript_windows(self._segments(30))
+
+        assert len(windows) > 1
+        for window in windows:
+            assert sum(extractor.estimate_tokens(line) for line in window.split("\n")) <= extractor.window_tokens
+        lines = [window.split("\n") for window in windows]
+        # Every line is covered and consecutive windows share their boundary line
+        assert {line for window in lines for line in window} == set(extractor._narrative_lines(self._segments(30)))
+        assert all(previous[-1] == following[0] for previous, following in zip(lines, lines[1:]))
+
+    def test_long_line_is_split(self, extractor):
+        segments = [{"classification": "IC", "speaker_name": "DM", "text": "x" * 1000}]
+
+        windows = extractor._build_transcript_windows(segments)
+
+        assert "".join(windows).replace("\n", "") == "DM: " + "x" * 1000
+        assert all(extractor.estimate_tokens(window) <= extractor.window_tokens + 1 for window in windows)
+
+    def test_session_windows_run_concurrently_and_merge(self, extractor, mock_ollama_client, tmp_path):
+        import threading
+        import time
+        from src.intermediate_output import IntermediateOutputManager
+
+        segments = self._segments(20) + self._segments(20, start_index=20)
+        manager = IntermediateOutputManager(tmp_path)
+        manager.save_stage_output(6, segments)
+        manager.save_scene_bundles([
+            {"scene_index": 0, "segment_ids": list(range(20))},
+            {"scene_index": 1, "segment_ids": list(range(20, 40))},
+        ])
+
+        lock = threading.Lock()
+        state = {"active": 0, "peak": 0, "prompts": []}
+
+        def chat(model, messages):
+            with lock:
+                state["active"] += 1
+                state["peak"] = max(state["peak"], state["active"])
+                state["prompts"].append(messages[0]["content"])
+            time.sleep(0.02)
+            with lock:
+                state["active"] -= 1
+            return {"message": {"content": json.dumps({
+                "npcs": [{"name": "Warden", "description": "Guards the tower", "role": "ally"}],
+                "locations": [{"name": "Tower of Ash", "description": "A tower"}],
+            })}}
+
+        mock_ollama_client.chat.side_effect = chat
+
+        result = extractor.extract_knowledge_from_session(tmp_path, "session1")
+
+        assert len(state["prompts"]) > 2
+        assert 1 < state["peak"] <= 3
+        # Nothing is truncated: the last line of each scene reaches the LLM
+        assert any("Line 19 " in prompt for prompt in state["prompts"])
+        assert any("Line 39 " in prompt for prompt in state["prompts"])
+        # No window mixes the two scenes
+        assert not any("Line 19 " in prompt and "Line 20 " in prompt for prompt in state["prompts"])
+        assert [npc.name for npc in result["npcs"]] == ["Warden"]
+        assert [location.name for location in result["locations"]] == ["Tower of Ash"]
+
 class TestCampaignKnowledgeBase:
 
     def test_init_creates_default_kb(self, knowledge_base):
@@ -577,3 +577,114 @@ def test_list_conversations_with_large_numbers(conversation_store):
         assert "updated_at" in conv
         assert "message_count" in conv
         assert "campaign" in conv
+
+
+def test_add_message_appends_to_log_without_rewriting_header(conversation_store):
+    conversation_id = conversation_store.create_conversation("Campaign")
+    header_file = conversation_store.conversations_dir / f"{conversation_id}.json"
+    header_before = header_file.read_bytes()
+
+    conversation_store.add_message(conversation_id, "user", "First")
+    conversation_store.add_message(conversation_id, "assistant", "Second")
+
+    assert header_file.read_bytes() == header_before
+    log_lines = conversation_store._get_log_path(conversation_id).read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line)["content"] for line in log_lines] == ["First", "Second"]
+
+
+def test_list_conversations_reads_summary_index(conversation_store, monkeypatch):
+    conversation_id = conversation_store.create_conversation("Campaign")
+    conversation_store.add_message(conversation_id, "user", "Hello")
+    conversation_store.add_message(conversation_id, "assistant", "Hi")
+
+    # Indexed conversations are listed without opening their files
+    def fail_open(*args, **kwargs):
+        raise AssertionError("list_conversations opened a conversation file")
+
+    monkeypatch.setattr("builtins.open", fail_open)
+    conversations = conversation_store.list_conversations()
+
+    assert conversations[0]["conversation_id"] == conversation_id
+    assert conversations[0]["message_count"] == 2
+    assert conversations[0]["campaign"] == "Campaign"
+
+
+def test_list_conversations_indexes_legacy_files(conversation_store):
+    legacy = {
+        "conversation_id": "conv_01d00000",
+        "created_at": "2025-01-01T10:00:00",
+        "updated_at": "2025-01-01T10:05:00",
+        "messages": [
+            {"id": "msg_1", "role": "user", "content": "Old question", "timestamp": "2025-01-01T10:05:00"}
+        ],
+        "context": {"campaign": "Legacy", "relevant_sessions": []}
+    }
+    legacy_file = conversation_store.conversations_dir / "conv_01d00000.json"
+    legacy_file.write_text(json.dumps(legacy), encoding="utf-8")
+
+    conversations = conversation_store.list_conversations()
+    assert conversations[0]["message_count"] == 1
+    assert conversations[0]["campaign"] == "Legacy"
+
+    # Inline messages remain the start of the history; new ones are appended to the log
+    conversation_store.add_message("conv_01d00000", "assistant", "New answer")
+    conversation = conversation_store.load_conversation("conv_01d00000")
+    assert [m["content"] for m in conversation["messages"]] == ["Old question", "New answer"]
+    assert conversation_store.list_conversations()[0]["message_count"] == 2
+
+    # Files deleted outside the store drop out of the index
+    legacy_file.unlink()
+    assert conversation_store.list_conversations() == []
+
+
+def test_load_messages_pages_from_newest(conversation_store):
+    conversation_id = conversation_store.create_conversation()
+    for i in range(7):
+        conversation_store.add_message(conversation_id, "user", f"Message {i}")
+
+    latest = conversation_store.load_messages(conversation_id, limit=3)
+    previous = conversation_store.load_messages(conversation_id, limit=3, offset=3)
+    oldest = conversation_store.load_messages(conversation_id, limit=3, offset=6)
+
+    assert [m["content"] for m in latest] == ["Message 4", "Message 5", "Message 6"]
+    assert [m["content"] for m in previous] == ["Message 1", "Message 2", "Message 3"]
+    assert [m["content"] for m in oldest] == ["Message 0"]
+    assert conversation_store.load_messages(conversation_id, limit=3, offset=10) == []
+    assert conversation_store.get_chat_history(conversation_id, limit=1) == [
+        {"role": "user", "content": "Message 6"}
+    ]
+
+
+def test_load_messages_spans_log_blocks(conversation_store, monkeypatch):
+    monkeypatch.setattr("src.langchain.conversation_store.LOG_READ_BLOCK_SIZE", 64)
+    conversation_id = conversation_store.create_conversation()
+    for i in range(20):
+        conversation_store.add_message(conversation_id, "user", f"Message {i} " + "x" * 30)
+
+    page = conversation_store.load_messages(conversation_id, limit=5, offset=2)
+
+    assert [m["content"].split()[1] for m in page] == ["13", "14", "15", "16", "17"]
+
+
+def test_torn_log_line_is_skipped(conversation_store, caplog):
+    conversation_id = conversation_store.create_conversation()
+    conversation_store.add_message(conversation_id, "user", "Before crash")
+    with open(conversation_store._get_log_path(conversation_id), "a", encoding="utf-8") as f:
+        f.write('{"id": "msg_torn", "role": "us')
+
+    conversation_store.add_message(conversation_id, "user", "After crash")
+
+    caplog.set_level(logging.WARNING)
+    conversation = conversation_store.load_conversation(conversation_id)
+    assert [m["content"] for m in conversation["messages"]] == ["Before crash", "After crash"]
+    assert "Skipping unreadable message" in caplog.text
+
+
+def test_delete_conversation_removes_log_and_index_entry(conversation_store):
+    conversation_id = conversation_store.create_conversation()
+    conversation_store.add_message(conversation_id, "user", "Hello")
+
+    assert conversation_store.delete_conversation(conversation_id)
+
+    assert not conversation_store._get_log_path(conversation_id).exists()
+    assert conversation_store.list_conversations() == []
@@ -0,0 +1,80 @@
+"""
+Tests for src/langchain/embedding_cache.py and cached EmbeddingService lookups.
+"""
+import sys
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+from src.config import Config
+from src.langchain.embedding_cache import EmbeddingCache
+from src.langchain.embeddings import EmbeddingService
+
+
+def test_get_many_returns_stored_vectors_in_order(tmp_path):
+    cache = EmbeddingCache(tmp_path / "embeddings.sqlite", "model-a")
+    cache.put_many(["dragon", "tavern"], [[0.5, 0.25], [1.0, -1.0]])
+
+    tavern, goblin, dragon = cache.get_many(["tavern", "goblin", "dragon"])
+    assert tavern.tolist() == [1.0, -1.0]
+    assert goblin is None
+    assert dragon.tolist() == [0.5, 0.25]
+    stats = cache.stats()
+    assert stats["hits"] == 2
+    assert stats["misses"] == 1
+    assert stats["entries"] == 2
+
+
+def test_entries_are_scoped_to_model(tmp_path):
+    db_path = tmp_path / "embeddings.sqlite"
+    EmbeddingCache(db_path, "model-a").put_many(["dragon"], [[0.5, 0.25]])
+
+    assert EmbeddingCache(db_path, "model-b").get_many(["dragon"]) == [None]
+    assert EmbeddingCache(db_path, "model-a").get_many(["dragon"])[0].tolist() == [0.5, 0.25]
+
+
+def test_least_recently_used_vectors_are_evicted(tmp_path):
+    vector = [0.0] * 64  # 256 bytes as float32
+    cache = EmbeddingCache(tmp_path / "embeddings.sqlite", "m", max_bytes=256 * 3)
+    cache.put_many(["a", "b", "c"], [vector] * 3)
+    cache.get_many(["a"])  # refresh "a"
+
+    cache.put_many(["d"], [vector])
+
+    # Over the bound, eviction goes down to 90% of max_bytes, oldest first
+    found = cache.get_many(["a", "b", "c", "d"])
+    assert [entry is not None for entry in found] == [True, False, False, True]
+
+
+@pytest.fixture
+def cached_service(monkeypatch, tmp_path):
+    model = MagicMock()
+    model.encode.side_effect = lambda texts, **kwargs: np.array(
+        [[float(len(text)), 1.0] for text in texts] if isinstance(texts, list) else [float(len(texts)), 1.0]
+    )
+    module = MagicMock()
+    module.SentenceTransformer.return_value = model
+    monkeypatch.setitem(sys.modules, "sentence_transformers", module)
+    monkeypatch.setattr(Config, "EMBEDDING_CACHE_PATH", tmp_path / "embeddings.sqlite")
+    return EmbeddingService(use_cache=True), model
+
+
+def test_embed_batch_encodes_only_uncached_texts(cached_service):
+    service, model = cached_service
+    first = service.embed_batch(["dragon", "inn", "dragon"])
+
+    second = service.embed_batch(["inn", "goblins", "dragon"])
+
+    assert first.tolist() == [[6.0, 1.0], [3.0, 1.0], [6.0, 1.0]]
+    assert second.tolist() == [[3.0, 1.0], [7.0, 1.0], [6.0, 1.0]]
+    encoded = [call.args[0] for call in model.encode.call_args_list]
+    assert encoded == [["dragon", "inn"], ["goblins"]]
+
+
+def test_embed_reuses_batch_results(cached_service):
+    service, model = cached_service
+    service.embed_batch(["dragon"])
+
+    assert service.embed("dragon").tolist() == [6.0, 1.0]
+    assert model.encode.call_count == 1
@@ -1,6 +1,9 @@
 """
 Tests for src/langchain/embeddings.py - Embedding Service
 """
+import threading
+
+import numpy as np
 import pytest
 from unittest.mock import Mock, MagicMock, patch
 from src.langchain.embeddings import EmbeddingService
@@ -74,22 +77,23 @@ class TestEmbed:
         """Test embedding a single text successfully."""
         service = EmbeddingService()
 
-        # Configure mock to return numpy array (which has .tolist())
-        import numpy as np
-        mock_embedding = np.array([0.1, 0.2, 0.3])
+        mock_embedding = np.array([[0.1, 0.2, 0.3]])
         mock_sentence_transformer['model'].encode.return_value = mock_embedding
 
         result = service.embed("Hello world")
 
-        # Verify encode was called correctly
+        # Single texts are encoded as a (coalesced) batch
         mock_sentence_transformer['model'].encode.assert_called_once_with(
-            "Hello world",
+            ["Hello world"],
+            batch_size=1,
+            show_progress_bar=False,
             convert_to_numpy=True
         )
 
-        # Verify result is a list of floats
-        assert result == [0.1, 0.2, 0.3]
-        assert isinstance(result, list)
+        # Verify result is a float32 vector
+        assert isinstance(result, np.ndarray)
+        assert result.dtype == np.float32
+        np.testing.assert_allclose(result, [0.1, 0.2, 0.3], rtol=1e-6)
 
     def test_embed_raises_on_error(self, mock_sentence_transformer):
         """Test that exceptions during embedding are propagated."""
@@ -108,8 +112,6 @@ class TestEmbedBatch:
         """Test embedding multiple texts successfully."""
         service = EmbeddingService()
 
-        # Configure mock to return numpy array
-        import numpy as np
         mock_embeddings = np.array([
             [0.1, 0.2, 0.3],
             [0.4, 0.5, 0.6]
@@ -127,16 +129,15 @@ class TestEmbedBatch:
         assert call_args['show_progress_bar'] is False  # len(texts) = 2, not > 100
         assert call_args['convert_to_numpy'] is True
 
-        # Verify result is list of lists
-        assert result == [[0.1, 0.2, 0.3], [0.4, 0.5, 0.6]]
-        assert isinstance(result, list)
-        assert isinstance(result[0], list)
+        # Verify result is one float32 row per text
+        assert isinstance(result, np.ndarray)
+        assert result.shape == (2, 3)
+        np.testing.assert_allclose(result, [[0.1, 0.2, 0.3], [0.4, 0.5, 0.6]], rtol=1e-6)
 
     def test_embed_batch_shows_progress_for_large_batches(self, mock_sentence_transformer):
         """Test that progress bar is shown for large batches (>100 texts)."""
         service = EmbeddingService()
 
-        import numpy as np
         mock_embeddings = np.array([[0.1, 0.2, 0.3] for _ in range(150)])
         mock_sentence_transformer['model'].encode.return_value = mock_embeddings
 
@@ -151,7 +152,6 @@ class TestEmbedBatch:
         """Test embedding with custom batch size."""
         service = EmbeddingService()
 
-        import numpy as np
         mock_embeddings = np.array([[0.1, 0.2]])
         mock_sentence_transformer['model'].encode.return_value = mock_embeddings
 
@@ -171,6 +171,86 @@ class TestEmbedBatch:
             service.embed_batch(["test1", "test2"])
 
 
+class TestQueryCache:
+    """Tests for the in-memory query embedding cache and request coalescing."""
+
+    @pytest.fixture
+    def service(self, mock_sentence_transformer):
+        mock_sentence_transformer['model'].encode.side_effect = lambda texts, **kwargs: np.array(
+            [[float(len(text)), 1.0] for text in texts]
+        )
+        return EmbeddingService(query_cache_size=2)
+
+    def test_repeated_queries_skip_the_model(self, service, mock_sentence_transformer):
+        first = service.embed("where is the dragon")
+        again = service.embed("  where is   the dragon ")
+
+        assert again is first
+        assert mock_sentence_transformer['model'].encode.call_count == 1
+        assert (service.query_cache_hits, service.query_cache_misses) == (1, 1)
+        # Cached vectors are shared, so they must not be mutated by callers
+        with pytest.raises(ValueError):
+            first[0] = 0.0
+
+    def test_least_recently_used_queries_are_evicted(self, service, mock_sentence_transformer):
+        service.embed("a")
+        service.embed("bb")
+        service.embed("a")
+        service.embed("ccc")  # evicts "bb"
+
+        service.embed("a")
+        service.embed("bb")
+
+        encoded = [call.args[0] for call in mock_sentence_transformer['model'].encode.call_args_list]
+        assert encoded == [["a"], ["bb"], ["ccc"], ["bb"]]
+
+    def test_concurrent_queries_share_an_encode_call(self, mock_sentence_transformer):
+        release = threading.Event()
+        calls = []
+
+        def encode(texts, **kwargs):
+            calls.append(list(texts))
+            if len(calls) == 1:
+                # Hold the first batch so the other requests queue up behind it
+                release.wait(timeout=5)
+            return np.array([[float(len(text)), 1.0] for text in texts])
+
+        mock_sentence_transformer['model'].encode.side_effect = encode
+        service = EmbeddingService(query_cache_size=0)
+        results = {}
+
+        def embed(text):
+            results[text] = service.embed(text)
+
+        first = threading.Thread(target=embed, args=("first",))
+        first.start()
+        while not calls:
+            threading.Event().wait(0.001)
+        others = [threading.Thread(target=embed, args=(text,)) for text in ("b", "cc", "b", "dddd")]
+        for thread in others:
+            thread.start()
+        while service._batcher._queue.qsize() < len(others):
+            threading.Event().wait(0.001)
+        release.set()
+        for thread in [first, *others]:
+            thread.join(timeout=5)
+
+        assert calls[0] == ["first"]
+        assert sorted(calls[1]) == ["b", "cc", "dddd"]
+        assert len(calls) == 2
+        assert {text: vector.tolist() for text, vector in results.items()} == {
+            "first": [5.0, 1.0], "b": [1.0, 1.0], "cc": [2.0, 1.0], "dddd": [4.0, 1.0],
+        }
+
+    def test_failed_batch_is_not_cached(self, service, mock_sentence_transformer):
+        mock_sentence_transformer['model'].encode.side_effect = [RuntimeError("CUDA OOM"), np.array([[1.0, 2.0]])]
+
+        with pytest.raises(RuntimeError, match="CUDA OOM"):
+            service.embed("dragon")
+
+        assert service.embed("dragon").tolist() == [1.0, 2.0]
+
+
 class TestGetEmbeddingDimension:
     """Tests for get_embedding_dimension method."""
 
@@ -12,6 +12,7 @@ This module tests critical error handling scenarios including:
 - Disk space / persistence issues
 """
 import json
+import numpy as np
 import pytest
 from pathlib import Path
 from unittest.mock import Mock, MagicMock, patch, mock_open
@@ -202,8 +203,8 @@ class TestVectorStoreErrorPaths:
 
         store = CampaignVectorStore(tmp_path / "db", mock_embedding_service)
 
-        # Simulate disk full error on add
-        mock_chromadb['transcript_collection'].add.side_effect = OSError("No space left on device")
+        # Simulate disk full error on upsert
+        mock_chromadb['transcript_collection'].upsert.side_effect = OSError("No space left on device")
 
         with pytest.raises(OSError, match="No space left"):
             store.add_transcript_segments("session_001", [{"text": "Test"}])
@@ -421,10 +422,7 @@ class TestEmbeddingServiceErrorPaths:
 
         with patch('sentence_transformers.SentenceTransformer') as mock_st:
             mock_model = MagicMock()
-            # Mock numpy array behavior
-            mock_array = MagicMock()
-            mock_array.tolist.return_value = [0.1] * 384
-            mock_model.encode.return_value = mock_array
+            mock_model.encode.return_value = np.array([[0.1] * 384])
             mock_st.return_value = mock_model
 
             service = EmbeddingService()
@@ -439,10 +437,7 @@ class TestEmbeddingServiceErrorPaths:
 
         with patch('sentence_transformers.SentenceTransformer') as mock_st:
             mock_model = MagicMock()
-            # Mock numpy array behavior (has tolist method)
-            mock_array = MagicMock()
-            mock_array.tolist.return_value = [[0.1] * 384, [0.2] * 384]
-            mock_model.encode.return_value = mock_array
+            mock_model.encode.return_value = np.array([[0.1] * 384, [0.2] * 384])
             mock_st.return_value = mock_model
 
             service = EmbeddingService()
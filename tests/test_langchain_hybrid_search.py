@@ -1,5 +1,5 @@
 import pytest
-from unittest.mock import Mock, MagicMock
+from unittest.mock import ANY, Mock, MagicMock
 from src.langchain.hybrid_search import HybridSearcher
 from typing import List, Dict
 
@@ -170,7 +170,7 @@ def test_search_happy_path(hybrid_searcher):
     query = "test query"
     results = hybrid_searcher.search(query)
 
-    mock_vector_store.search.assert_called_once_with(query, top_k=10)
+    mock_vector_store.search.assert_called_once_with(query, top_k=10, timings=ANY)
     mock_keyword_retriever.retrieve.assert_called_once_with(query, top_k=10)
     hybrid_searcher._reciprocal_rank_fusion.assert_called_once()
     
@@ -195,13 +195,13 @@ def test_search_varying_top_k(hybrid_searcher):
     # Case 1: top_k = 1
     results = hybrid_searcher.search("query", top_k=1)
     assert len(results) == 1
-    mock_vector_store.search.assert_called_with("query", top_k=2) # top_k * 2
+    mock_vector_store.search.assert_called_with("query", top_k=2, timings=ANY) # top_k * 2
     mock_keyword_retriever.retrieve.assert_called_with("query", top_k=2)
 
     # Case 2: top_k = 5
     results = hybrid_searcher.search("query", top_k=5)
     assert len(results) == 5
-    mock_vector_store.search.assert_called_with("query", top_k=10)
+    mock_vector_store.search.assert_called_with("query", top_k=10, timings=ANY)
 
 def test_search_varying_semantic_weight(hybrid_searcher):
     """Test that search passes correct weights to RRF."""
@@ -250,7 +250,7 @@ def test_search_different_top_k_and_weight(hybrid_searcher):
     top_k = 5
     results = hybrid_searcher.search(query, top_k=top_k, semantic_weight=0.6)
 
-    mock_vector_store.search.assert_called_once_with(query, top_k=top_k * 2)
+    mock_vector_store.search.assert_called_once_with(query, top_k=top_k * 2, timings=ANY)
     mock_keyword_retriever.retrieve.assert_called_once_with(query, top_k=top_k * 2)
     hybrid_searcher._reciprocal_rank_fusion.assert_called_once_with(
         mock_vector_store.search.return_value,
@@ -400,6 +400,77 @@ def test_search_error_in_both_returns_empty(hybrid_searcher):
     hybrid_searcher._reciprocal_rank_fusion.assert_not_called()
 
 
+def test_search_caches_results_per_normalized_query(hybrid_searcher):
+    hybrid_searcher.vector_store.search.return_value = [{"text": "semantic", "metadata": {"id": "S1"}}]
+    hybrid_searcher.keyword_retriever.retrieve.return_value = []
+
+    first = hybrid_searcher.search("Dragon  Attack")
+    second, timings = hybrid_searcher.search_with_timings("dragon attack")
+
+    assert second == first
+    assert timings["cache_hit"] is True
+    hybrid_searcher.vector_store.search.assert_called_once()
+
+    # A different weight is a different ranking, so it is not served from cache
+    hybrid_searcher.search("dragon attack", semantic_weight=0.5)
+    assert hybrid_searcher.vector_store.search.call_count == 2
+
+
+def test_search_cache_invalidated_by_ingestion_and_ttl(hybrid_searcher):
+    hybrid_searcher.vector_store.generation = 1
+    hybrid_searcher.vector_store.search.return_value = [{"text": "old", "metadata": {"id": "S1"}}]
+    hybrid_searcher.keyword_retriever.retrieve.return_value = []
+    hybrid_searcher.search("query")
+
+    hybrid_searcher.vector_store.generation = 2
+    hybrid_searcher.vector_store.search.return_value = [{"text": "new", "metadata": {"id": "S2"}}]
+    assert hybrid_searcher.search("query")[0]["text"] == "new"
+
+    hybrid_searcher.cache_ttl = 0
+    hybrid_searcher.search("query")
+    assert hybrid_searcher.vector_store.search.call_count == 3
+
+
+def test_search_with_timings_reports_breakdown(hybrid_searcher):
+    def semantic(query, top_k, timings):
+        timings.update(embed_ms=1.5, vector_ms=2.5)
+        return [{"text": "semantic", "metadata": {"id": "S1"}}]
+
+    hybrid_searcher.vector_store.search.side_effect = semantic
+    hybrid_searcher.keyword_retriever.retrieve.return_value = [MockDocument("keyword", {"id": "K1"})]
+
+    results, timings = hybrid_searcher.search_with_timings("query")
+
+    assert len(results) == 2
+    assert timings["embed_ms"] == 1.5
+    assert timings["vector_ms"] == 2.5
+    assert timings["keyword_ms"] >= 0
+    assert timings["fusion_ms"] >= 0
+    assert timings["total_ms"] >= timings["fusion_ms"]
+    assert timings["cache_hit"] is False
+
+
+def test_search_runs_backends_concurrently(hybrid_searcher):
+    import threading
+    barrier = threading.Barrier(2, timeout=5)
+
+    def semantic(query, top_k, timings):
+        barrier.wait()
+        return [{"text": "semantic", "metadata": {"id": "S1"}}]
+
+    def keyword(query, top_k):
+        barrier.wait()
+        return [MockDocument("keyword", {"id": "K1"})]
+
+    hybrid_searcher.vector_store.search.side_effect = semantic
+    hybrid_searcher.keyword_retriever.retrieve.side_effect = keyword
+
+    # Each backend waits for the other; sequential execution would break the barrier
+    results = hybrid_searcher.search("query")
+
+    assert {r["metadata"]["id"] for r in results} == {"S1", "K1"}
+
+
 # ============================================================================
 # INTEGRATION TESTS - Using real vector store and retriever instances
 # ============================================================================
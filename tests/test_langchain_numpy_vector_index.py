@@ -0,0 +1,237 @@
+"""
+Tests for src/langchain/numpy_vector_index.py - embedded quantized vector index
+"""
+import numpy as np
+import pytest
+
+from src.langchain import numpy_vector_index
+from src.langchain.numpy_vector_index import NumpyCollection, NumpyVectorClient
+
+
+def _unit(rows):
+    rows = np.asarray(rows, dtype=np.float32)
+    return rows / np.linalg.norm(rows, axis=1, keepdims=True)
+
+
+def _clustered_vectors(count, dim=32, clusters=20, seed=0):
+    rng = np.random.default_rng(seed)
+    centers = rng.normal(size=(clusters, dim))
+    labels = rng.integers(0, clusters, size=count)
+    return _unit(centers[labels] + 0.3 * rng.normal(size=(count, dim)))
+
+
+def _exact_top_k(vectors, queries, k):
+    return [set(np.argsort(-(vectors @ query))[:k]) for query in queries]
+
+
+@pytest.fixture
+def collection(tmp_path):
+    return NumpyCollection(tmp_path / "transcripts", "transcripts")
+
+
+class TestNumpyCollection:
+
+    def test_upsert_get_and_count(self, collection):
+        collection.upsert(
+            ids=["a", "b"],
+            embeddings=[[1.0, 0.0], [0.0, 2.0]],
+            documents=["Doc A", "Doc B"],
+            metadatas=[{"session_id": "s1"}, {"session_id": "s2"}],
+        )
+        collection.upsert(ids=["a"], embeddings=[[0.5, 0.5]], documents=["Doc A2"], metadatas=[{"session_id": "s1"}])
+
+        assert collection.count() == 2
+        assert collection.get(ids=["a", "missing"])["documents"] == ["Doc A2"]
+        assert collection.get(where={"session_id": "s2"})["ids"] == ["b"]
+
+    def test_query_ranks_by_cosine(self, collection):
+        collection.upsert(
+            ids=["east", "north", "northeast"],
+            embeddings=[[1.0, 0.0], [0.0, 1.0], [1.0, 1.0]],
+            documents=["E", "N", "NE"],
+            metadatas=[{}, {}, {}],
+        )
+
+        result = collection.query(query_embeddings=[[1.0, 0.1], [0.0, 3.0]], n_results=2)
+
+        assert result["documents"] == [["E", "NE"], ["N", "NE"]]
+        assert result["distances"][1][0] == pytest.approx(0.0, abs=1e-3)
+
+    def test_where_operators(self, collection):
+        collection.upsert(
+            ids=[f"seg_{i}" for i in range(4)],
+            embeddings=[[1.0, float(i)] for i in range(4)],
+            documents=[f"Seg {i}" for i in range(4)],
+            metadatas=[
+                {"speaker": "DM", "start": 0.0, "classification": "IC"},
+                {"speaker": "Aria", "start": 10.0, "classification": "OOC"},
+                {"speaker": "Ben", "start": 20.0},
+                {"speaker": "DM", "start": 30.0, "classification": "IC"},
+            ],
+        )
+
+        def ids(where):
+            return sorted(collection.get(where=where)["ids"])
+
+        assert ids({"speaker": {"$in": ["Aria", "Ben"]}}) == ["seg_1", "seg_2"]
+        assert ids({"$and": [{"speaker": "DM"}, {"start": {"$gte": 5.0}}]}) == ["seg_3"]
+        assert ids({"$or": [{"classification": "OOC"}, {"start": {"$lt": 1.0}}]}) == ["seg_0", "seg_1"]
+        assert ids({"speaker": {"$ne": "DM"}}) == ["seg_1", "seg_2"]
+        assert ids({"classification": {"$nin": ["IC"]}}) == ["seg_1", "seg_2"]
+
+    def test_delete_by_id_and_where(self, collection):
+        collection.upsert(
+            ids=["a", "b", "c"],
+            embeddings=[[1.0, 0.0]] * 3,
+            documents=["A", "B", "C"],
+            metadatas=[{"session_id": "s1"}, {"session_id": "s1"}, {"session_id": "s2"}],
+        )
+
+        collection.delete(ids=["c"])
+        collection.delete(where={"session_id": "s1"})
+
+        assert collection.count() == 0
+        assert collection.query(query_embeddings=[[1.0, 0.0]], n_results=3)["ids"] == [[]]
+
+    def test_persists_and_memory_maps_segments(self, tmp_path):
+        path = tmp_path / "knowledge"
+        first = NumpyCollection(path, "knowledge", quantization="float16")
+        first.upsert(ids=["a", "b"], embeddings=[[1.0, 0.0], [0.0, 1.0]], documents=["A", "B"], metadatas=[{}, {}])
+        first.delete(ids=["b"])
+
+        reopened = NumpyCollection(path, "knowledge", quantization="float16")
+
+        assert reopened.count() == 1
+        assert reopened.get()["documents"] == ["A"]
+        assert isinstance(reopened.segments[0].vectors, np.memmap)
+        assert reopened.segments[0].vectors.dtype == np.float16
+
+    def test_quantization_mismatch_starts_empty(self, tmp_path, caplog):
+        path = tmp_path / "transcripts"
+        NumpyCollection(path, "transcripts", quantization="int8").upsert(
+            ids=["a"], embeddings=[[1.0, 0.0]], documents=["A"], metadatas=[{}]
+        )
+
+        reopened = NumpyCollection(path, "transcripts", quantization="float16")
+
+        assert reopened.count() == 0
+        assert "Could not load vector collection" in caplog.text
+
+    def test_dimension_mismatch_rejected(self, collection):
+        collection.upsert(ids=["a"], embeddings=[[1.0, 0.0]], documents=["A"], metadatas=[{}])
+
+        with pytest.raises(ValueError):
+            collection.upsert(ids=["b"], embeddings=[[1.0, 0.0, 0.0]], documents=["B"], metadatas=[{}])
+
+    def test_small_segments_are_merged_and_tombstones_compacted(self, collection):
+        for i in range(numpy_vector_index.MAX_SMALL_SEGMENTS + 2):
+            collection.upsert(ids=[f"id_{i}"], embeddings=[[1.0, float(i)]], documents=[f"D{i}"], metadatas=[{}])
+        assert len(collection.segments) <= numpy_vector_index.MAX_SMALL_SEGMENTS + 1
+
+        collection.delete(ids=[f"id_{i}" for i in range(4)])
+
+        stored_rows = sum(len(segment) for segment in collection.segments)
+        assert stored_rows == collection.count() == 2
+        files = {path.name for path in collection.path.iterdir()}
+        assert files == {"manifest.json"} | {
+            f"{segment.name}{suffix}" for segment in collection.segments for suffix in (".npy", ".scale.npy", ".ids.json", ".jsonl", ".offsets.npy")
+        }
+
+    def test_rewrite_during_query_keeps_files_until_query_finishes(self, tmp_path, monkeypatch):
+        import threading
+
+        path = tmp_path / "transcripts"
+        NumpyCollection(path, "transcripts").upsert(
+            ids=["a", "b"], embeddings=[[1.0, 0.0], [0.0, 1.0]], documents=["A", "B"], metadatas=[{}, {}]
+        )
+        # Reopened segments read query results from their .jsonl file
+        collection = NumpyCollection(path, "transcripts")
+        old_records = collection.segments[0]._records_path
+
+        scoring, release = threading.Event(), threading.Event()
+        original_score = NumpyCollection._score
+
+        def _blocking_score(query, candidates, n_results):
+            hits = original_score(query, candidates, n_results)
+            scoring.set()
+            release.wait(5)
+            return hits
+
+        monkeypatch.setattr(NumpyCollection, "_score", staticmethod(_blocking_score))
+        results = []
+        reader = threading.Thread(
+            target=lambda: results.append(collection.query(query_embeddings=[[1.0, 0.1]], n_results=1))
+        )
+        reader.start()
+        assert scoring.wait(5)
+
+        # Deleting half the rows compacts the segment the query is reading
+        collection.delete(ids=["b"])
+        assert collection.segments[0]._records_path != old_records
+        assert old_records.exists()
+
+        release.set()
+        reader.join(5)
+        assert results[0]["documents"] == [["A"]]
+        assert not old_records.exists()
+
+    @pytest.mark.parametrize("quantization", ["int8", "float16"])
+    def test_quantized_exact_search_recall(self, tmp_path, quantization):
+        vectors = _clustered_vectors(3000)
+        queries = _clustered_vectors(50, seed=1)
+        collection = NumpyCollection(tmp_path / "c", "c", quantization=quantization, ivf_threshold=0)
+        collection.upsert(
+            ids=[str(i) for i in range(len(vectors))],
+            embeddings=vectors,
+            documents=[None] * len(vectors),
+            metadatas=[{}] * len(vectors),
+        )
+
+        found = collection.query(query_embeddings=queries, n_results=10)["ids"]
+
+        expected = _exact_top_k(vectors, queries, 10)
+        recall = np.mean([len(expected[q] & {int(i) for i in found[q]}) / 10 for q in range(len(queries))])
+        assert recall >= 0.95
+
+    def test_ivf_index_trained_past_threshold(self, tmp_path):
+        vectors = _clustered_vectors(4000)
+        queries = _clustered_vectors(50, seed=1)
+        collection = NumpyCollection(tmp_path / "c", "c", ivf_threshold=1000, nprobe=8)
+        collection.upsert(
+            ids=[str(i) for i in range(len(vectors))],
+            embeddings=vectors,
+            documents=[None] * len(vectors),
+            metadatas=[{"bucket": i % 40} for i in range(len(vectors))],
+        )
+
+        found = collection.query(query_embeddings=queries, n_results=10)["ids"]
+
+        assert collection._centroids is not None
+        expected = _exact_top_k(vectors, queries, 10)
+        recall = np.mean([len(expected[q] & {int(i) for i in found[q]}) / 10 for q in range(len(queries))])
+        assert recall >= 0.8
+
+        # A selective filter falls back to scoring its (few) matching rows exactly
+        filtered = collection.query(query_embeddings=queries[:1], n_results=10, where={"bucket": 3})["ids"][0]
+        assert len(filtered) == 10
+        assert all(int(i) % 40 == 3 for i in filtered)
+
+        # The trained index is persisted with the collection
+        reopened = NumpyCollection(tmp_path / "c", "c", ivf_threshold=1000, nprobe=8)
+        assert reopened._centroids is not None
+        assert all(segment.ivf_lists is not None for segment in reopened.segments)
+
+
+class TestNumpyVectorClient:
+
+    def test_collection_lifecycle(self, tmp_path):
+        client = NumpyVectorClient(tmp_path)
+        collection = client.get_or_create_collection("transcripts", metadata={"description": "x"})
+        collection.upsert(ids=["a"], embeddings=[[1.0]], documents=["A"], metadatas=[{}])
+
+        assert client.get_or_create_collection("transcripts") is collection
+        with pytest.raises(ValueError):
+            client.create_collection("transcripts")
+
+        client.delete_collection("transcripts")
+        assert client.create_collection("transcripts").count() == 0
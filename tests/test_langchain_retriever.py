@@ -4,6 +4,7 @@ Focused tests to increase coverage from 36% to help reach 80% overall target.
 Includes comprehensive integration tests for knowledge base loading, caching, and retrieval.
 """
 import json
+import math
 import pytest
 import time
 from pathlib import Path
@@ -994,3 +995,174 @@ class TestRetrievalWithRealDataIntegration:
         # Can include both NPC and transcript results
         result_types = set(r.metadata.get("type") for r in results)
         assert "npc" in result_types or "transcript" in result_types
+
+
+class TestKeywordIndexUpdates:
+    """The keyword index follows changes to sessions and knowledge bases."""
+
+    @pytest.fixture
+    def clock(self, monkeypatch):
+        """Monotonic clock of the keyword index, advanced by hand."""
+        from src.langchain import keyword_index
+
+        now = {"value": 1000.0}
+        monkeypatch.setattr(keyword_index.time, "monotonic", lambda: now["value"])
+
+        def advance(seconds=keyword_index.REFRESH_INTERVAL_SECONDS):
+            now["value"] += seconds
+
+        return advance
+
+    @staticmethod
+    def _write_session(transcript_dir, name, texts):
+        session_dir = transcript_dir / name
+        session_dir.mkdir(exist_ok=True)
+        segments = [
+            {"text": text, "speaker": "DM", "start": float(i), "end": float(i) + 1.0}
+            for i, text in enumerate(texts)
+        ]
+        (session_dir / "diarized_transcript.json").write_text(json.dumps({"segments": segments}))
+
+    def test_new_session_is_found_without_new_retriever(self, campaign_dirs, clock):
+        kb_dir, transcript_dir = campaign_dirs
+        self._write_session(transcript_dir, "session_001", ["The wizard sleeps"])
+        retriever = CampaignRetriever(kb_dir, transcript_dir)
+        assert retriever._search_transcripts("dragon", top_k=5) == []
+
+        self._write_session(transcript_dir, "session_002", ["A dragon lands on the tower"])
+        clock()
+        results = retriever._search_transcripts("dragon", top_k=5)
+
+        assert [r.metadata["session_id"] for r in results] == ["session_002"]
+
+    def test_changed_and_removed_sources_are_updated(self, campaign_dirs, clock):
+        kb_dir, transcript_dir = campaign_dirs
+        kb_file = kb_dir / "campaign_knowledge.json"
+        kb_file.write_text(json.dumps({"npcs": [{"name": "Gandalf", "description": "A wizard"}]}))
+        self._write_session(transcript_dir, "session_001", ["Gandalf arrives"])
+        retriever = CampaignRetriever(kb_dir, transcript_dir)
+        assert len(retriever.retrieve("Gandalf", top_k=5)) == 2
+
+        kb_file.write_text(json.dumps({"npcs": [{"name": "Saruman", "description": "A fallen wizard"}]}))
+        (transcript_dir / "session_001" / "diarized_transcript.json").unlink()
+        clock()
+
+        assert retriever.retrieve("Gandalf", top_k=5) == []
+        assert [r.metadata["name"] for r in retriever.retrieve("Saruman", top_k=5)] == ["Saruman"]
+
+    def test_saved_index_is_reused_by_new_retriever(self, campaign_dirs):
+        kb_dir, transcript_dir = campaign_dirs
+        self._write_session(transcript_dir, "session_001", ["The wizard sleeps"])
+        CampaignRetriever(kb_dir, transcript_dir).retrieve("wizard", top_k=5)
+
+        retriever = CampaignRetriever(kb_dir, transcript_dir)
+        with patch.object(retriever._keyword_index, "_add_source") as add_source:
+            results = retriever._search_transcripts("wizard", top_k=5)
+
+        add_source.assert_not_called()
+        assert len(results) == 1
+        assert (transcript_dir / ".cache" / "keyword_index" / "index.npz").exists()
+
+    def test_sources_are_rescanned_only_after_refresh_interval(self, campaign_dirs, clock):
+        kb_dir, transcript_dir = campaign_dirs
+        self._write_session(transcript_dir, "session_001", ["The wizard sleeps"])
+        retriever = CampaignRetriever(kb_dir, transcript_dir)
+        retriever.retrieve("wizard", top_k=5)
+
+        with patch.object(retriever._keyword_index, "_scan", wraps=retriever._keyword_index._scan) as scan:
+            retriever.retrieve("wizard", top_k=5)
+            clock(1.0)
+            retriever.retrieve("wizard", top_k=5)
+            assert scan.call_count == 0
+
+            clock()
+            retriever.retrieve("wizard", top_k=5)
+            assert scan.call_count == 1
+
+    def test_notified_changes_are_found_before_refresh_interval(self, campaign_dirs, clock):
+        from src.langchain.keyword_index import notify_sources_changed
+
+        kb_dir, transcript_dir = campaign_dirs
+        self._write_session(transcript_dir, "session_001", ["The wizard sleeps"])
+        retriever = CampaignRetriever(kb_dir, transcript_dir)
+        assert retriever._search_transcripts("dragon", top_k=5) == []
+
+        self._write_session(transcript_dir, "session_002", ["A dragon lands on the tower"])
+        clock(1.0)
+        assert retriever._search_transcripts("dragon", top_k=5) == []
+
+        notify_sources_changed()
+        results = retriever._search_transcripts("dragon", top_k=5)
+
+        assert [r.metadata["session_id"] for r in results] == ["session_002"]
+
+    def test_hits_in_files_changed_since_indexing_are_skipped(self, campaign_dirs, clock):
+        kb_dir, transcript_dir = campaign_dirs
+        kb_file = kb_dir / "campaign_knowledge.json"
+        kb_file.write_text(json.dumps({"npcs": [{"name": "Gandalf", "description": "A wizard"}]}))
+        retriever = CampaignRetriever(kb_dir, transcript_dir)
+        assert [r.metadata["name"] for r in retriever._search_knowledge_bases("Gandalf", top_k=5)] == ["Gandalf"]
+
+        kb_file.write_text(json.dumps({"npcs": [{"name": "Saruman", "description": "A fallen wizard"}]}))
+        # The cached copy expired and is re-read while the index still describes the old file
+        retriever._kb_cache.clear()
+        clock(1.0)
+
+        assert retriever._search_knowledge_bases("Gandalf", top_k=5) == []
+        # The mismatch triggers a rescan on the next search
+        assert [r.metadata["name"] for r in retriever._search_knowledge_bases("Saruman", top_k=5)] == ["Saruman"]
+
+    def test_removed_sources_leave_ranking_statistics(self, campaign_dirs, clock):
+        kb_dir, transcript_dir = campaign_dirs
+        self._write_session(
+            transcript_dir, "session_001", ["A dragon roars", "The dragon sleeps", "Dragon wings"]
+        )
+        self._write_session(transcript_dir, "session_002", ["A goblin waits"])
+        self._write_session(transcript_dir, "session_003", ["The dragon flies"])
+        retriever = CampaignRetriever(kb_dir, transcript_dir)
+        retriever.retrieve("dragon", top_k=5)
+
+        (transcript_dir / "session_002" / "diarized_transcript.json").unlink()
+        clock()
+        retriever.retrieve("dragon", top_k=5)
+
+        index = retriever._keyword_index._index
+        assert len(index) == 5
+        assert index.live_count == 4
+        # Four live documents, all containing "dragon"
+        assert index.idf("dragon") == pytest.approx(math.log(1.0 + 0.5 / 4.5))
+
+    def test_updates_save_only_new_documents(self, campaign_dirs, clock):
+        kb_dir, transcript_dir = campaign_dirs
+        cache_dir = transcript_dir / ".cache" / "keyword_index"
+        self._write_session(transcript_dir, "session_001", ["The wizard sleeps"])
+        retriever = CampaignRetriever(kb_dir, transcript_dir)
+        retriever.retrieve("wizard", top_k=5)
+        base_mtime = (cache_dir / "index.npz").stat().st_mtime_ns
+
+        self._write_session(transcript_dir, "session_002", ["The wizard wakes", "A dragon lands"])
+        clock()
+        retriever.retrieve("wizard", top_k=5)
+
+        assert (cache_dir / "index.npz").stat().st_mtime_ns == base_mtime
+        manifest = json.loads((cache_dir / "manifest.json").read_text())
+        assert manifest["files"] == ["index.npz", "index.1.npz"]
+        assert manifest["doc_count"] == 3
+
+        reloaded = CampaignRetriever(kb_dir, transcript_dir)
+        results = reloaded._search_transcripts("wizard", top_k=5)
+        assert sorted(r.metadata["session_id"] for r in results) == ["session_001", "session_002"]
+
+    def test_results_are_ranked_by_relevance(self, campaign_dirs):
+        kb_dir, transcript_dir = campaign_dirs
+        self._write_session(
+            transcript_dir,
+            "session_001",
+            ["The storm rolls in over the hills", "Storm storm storm", "A quiet morning"],
+        )
+        retriever = CampaignRetriever(kb_dir, transcript_dir)
+
+        results = retriever._search_transcripts("storm", top_k=5)
+
+        assert [r.page_content for r in results][0] == '[DM, 00:00:01]: "Storm storm storm"'
+        assert len(results) == 2
@@ -2,6 +2,7 @@ import pytest
 from unittest.mock import Mock, MagicMock
 from src.langchain.semantic_retriever import SemanticCampaignRetriever
 from src.langchain.retriever import Document
+from src.langchain.vector_store import VectorSearchFilters
 from typing import List, Dict
 import tempfile
 import shutil
@@ -69,9 +70,7 @@ def test_retrieve_from_session_happy_path(semantic_retriever):
     mock_vector_store = semantic_retriever.vector_store
     mock_vector_store.search.return_value = [
         {"text": "sess1_doc1", "metadata": {"session_id": "sess1", "id": "d1"}},
-        {"text": "sess2_doc1", "metadata": {"session_id": "sess2", "id": "d2"}},
         {"text": "sess1_doc2", "metadata": {"session_id": "sess1", "id": "d3"}},
-        {"text": "sess1_doc3", "metadata": {"session_id": "sess1", "id": "d4"}},
     ]
 
     query = "session query"
@@ -79,26 +78,16 @@ def test_retrieve_from_session_happy_path(semantic_retriever):
     top_k = 2
     results = semantic_retriever.retrieve_from_session(query, session_id, top_k)
 
-    mock_vector_store.search.assert_called_once_with(query, top_k=top_k * 3, collection="transcripts")
+    # The session filter is pushed down to the vector store instead of over-fetching
+    mock_vector_store.search.assert_called_once_with(
+        query, top_k=top_k, collection="transcripts", filters=VectorSearchFilters(session_id=session_id)
+    )
     assert len(results) == top_k
     assert all(isinstance(r, Document) for r in results)
     assert all(r.metadata.get("session_id") == session_id for r in results)
     assert results[0].page_content == "sess1_doc1"
     assert results[1].page_content == "sess1_doc2"
 
-# Test retrieve_from_session method (Edge Cases - no matching session_id)
-def test_retrieve_from_session_no_match(semantic_retriever):
-    mock_vector_store = semantic_retriever.vector_store
-    mock_vector_store.search.return_value = [
-        {"text": "sess2_doc1", "metadata": {"session_id": "sess2", "id": "d1"}},
-    ]
-
-    query = "session query"
-    session_id = "sess1"
-    results = semantic_retriever.retrieve_from_session(query, session_id)
-
-    assert len(results) == 0
-
 # Test retrieve_from_session method (Edge Cases - empty search results)
 def test_retrieve_from_session_empty_search_results(semantic_retriever):
     mock_vector_store = semantic_retriever.vector_store
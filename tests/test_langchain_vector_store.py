@@ -1,10 +1,11 @@
 """
 Tests for src/langchain/vector_store.py - Campaign Vector Store
 """
+import numpy as np
 import pytest
 from pathlib import Path
 from unittest.mock import Mock, MagicMock, patch
-from src.langchain.vector_store import CampaignVectorStore, EMBEDDING_BATCH_SIZE
+from src.langchain.vector_store import CampaignVectorStore, EMBEDDING_BATCH_SIZE, VectorSearchFilters
 
 
 @pytest.fixture
@@ -142,9 +143,9 @@ class TestAddTranscriptSegments:
         # Verify embed_batch was called
         mock_embedding_service.embed_batch.assert_called_once()
 
-        # Verify collection.add was called
-        mock_chromadb['transcript_collection'].add.assert_called_once()
-        call_args = mock_chromadb['transcript_collection'].add.call_args[1]
+        # Verify collection.upsert was called
+        mock_chromadb['transcript_collection'].upsert.assert_called_once()
+        call_args = mock_chromadb['transcript_collection'].upsert.call_args[1]
 
         assert len(call_args['documents']) == 2
         assert "Whispering Woods" in call_args['documents'][0]
@@ -173,8 +174,8 @@ class TestAddTranscriptSegments:
 
         vector_store.add_transcript_segments(session_id, segments)
 
-        # Verify collection.add was called twice (2 batches)
-        assert mock_chromadb['transcript_collection'].add.call_count == 2
+        # Verify collection.upsert was called twice (2 batches)
+        assert mock_chromadb['transcript_collection'].upsert.call_count == 2
 
     def test_add_transcript_segments_handles_missing_metadata(self, vector_store, mock_chromadb):
         """Test that missing speaker/start/end fields are handled."""
@@ -185,7 +186,7 @@ class TestAddTranscriptSegments:
 
         vector_store.add_transcript_segments(session_id, segments)
 
-        call_args = mock_chromadb['transcript_collection'].add.call_args[1]
+        call_args = mock_chromadb['transcript_collection'].upsert.call_args[1]
         metadata = call_args['metadatas'][0]
 
         assert metadata['speaker'] == "Unknown"
@@ -194,7 +195,7 @@ class TestAddTranscriptSegments:
 
     def test_add_transcript_segments_raises_on_error(self, vector_store, mock_chromadb):
         """Test that exceptions during add are propagated."""
-        mock_chromadb['transcript_collection'].add.side_effect = Exception("Database error")
+        mock_chromadb['transcript_collection'].upsert.side_effect = Exception("Database error")
 
         with pytest.raises(Exception, match="Database error"):
             vector_store.add_transcript_segments("session_001", [{"text": "Test"}])
@@ -231,9 +232,9 @@ class TestAddKnowledgeDocuments:
         # Verify embed_batch was called
         mock_embedding_service.embed_batch.assert_called_once()
 
-        # Verify collection.add was called
-        mock_chromadb['knowledge_collection'].add.assert_called_once()
-        call_args = mock_chromadb['knowledge_collection'].add.call_args[1]
+        # Verify collection.upsert was called
+        mock_chromadb['knowledge_collection'].upsert.assert_called_once()
+        call_args = mock_chromadb['knowledge_collection'].upsert.call_args[1]
 
         assert len(call_args['documents']) == 2
         assert "gareth longshadow" in call_args['documents'][0].lower()
@@ -292,8 +293,8 @@ class TestAddKnowledgeDocuments:
 
         vector_store.add_knowledge_documents(documents)
 
-        # Inspect what was passed to collection.add
-        call_args = mock_chromadb['knowledge_collection'].add.call_args[1]
+        # Inspect what was passed to collection.upsert
+        call_args = mock_chromadb['knowledge_collection'].upsert.call_args[1]
         ids = call_args['ids']
         metadatas = call_args['metadatas']
 
@@ -347,7 +348,7 @@ class TestAddKnowledgeDocuments:
 
         vector_store.add_knowledge_documents(documents)
 
-        call_args = mock_chromadb['knowledge_collection'].add.call_args[1]
+        call_args = mock_chromadb['knowledge_collection'].upsert.call_args[1]
         generated_id = call_args['ids'][0]
 
         # Should replace spaces and slashes
@@ -374,7 +375,7 @@ class TestAddKnowledgeDocuments:
         ]
 
         vector_store.add_knowledge_documents(documents)
-        call_args = mock_chromadb['knowledge_collection'].add.call_args[1]
+        call_args = mock_chromadb['knowledge_collection'].upsert.call_args[1]
         ids = call_args['ids']
 
         # The exact output of sanitization isn't strictly defined, but it
@@ -393,7 +394,7 @@ class TestAddKnowledgeDocuments:
         vector_store.add_knowledge_documents(documents)
 
         # Should be called twice (Batch 1: 100, Batch 2: 50)
-        assert mock_chromadb['knowledge_collection'].add.call_count == 2
+        assert mock_chromadb['knowledge_collection'].upsert.call_count == 2
 
 
 class TestSearch:
@@ -586,6 +587,75 @@ class TestSearch:
         assert results == []
 
 
+class TestFilteredSearch:
+    """Tests for metadata filters and batch queries."""
+
+    def test_filters_build_where_clauses(self):
+        filters = VectorSearchFilters(session_id="s1", speaker=["DM", "Aria"], classification="IC", start=10, end=20)
+
+        assert filters.to_where("transcripts") == {"$and": [
+            {"session_id": "s1"},
+            {"speaker": {"$in": ["DM", "Aria"]}},
+            {"classification": "IC"},
+            {"end": {"$gte": 10.0}},
+            {"start": {"$lte": 20.0}},
+        ]}
+        assert VectorSearchFilters(session_id="s1").to_where("transcripts") == {"session_id": "s1"}
+        assert VectorSearchFilters(entity_type=["npc"]).to_where("knowledge") == {"type": "npc"}
+        assert VectorSearchFilters().to_where("transcripts") is None
+
+    def test_search_pushes_filters_to_chromadb(self, vector_store, mock_chromadb):
+        mock_chromadb['transcript_collection'].query.return_value = {
+            'documents': [["T1"]], 'metadatas': [[{"session_id": "s1"}]], 'distances': [[0.2]]
+        }
+
+        results = vector_store.search("query", top_k=3, filters=VectorSearchFilters(session_id="s1"))
+
+        mock_chromadb['transcript_collection'].query.assert_called_once_with(
+            query_embeddings=[[0.1] * 384], n_results=3, where={"session_id": "s1"}
+        )
+        # Knowledge documents have no session, so that collection is skipped
+        mock_chromadb['knowledge_collection'].query.assert_not_called()
+        assert [r['text'] for r in results] == ["T1"]
+
+    def test_entity_type_filter_searches_only_knowledge(self, vector_store, mock_chromadb):
+        mock_chromadb['knowledge_collection'].query.return_value = {
+            'documents': [["K1"]], 'metadatas': [[{"type": "npc"}]], 'distances': [[0.1]]
+        }
+
+        results = vector_store.search("query", filters=VectorSearchFilters(entity_type="npc"))
+
+        assert mock_chromadb['knowledge_collection'].query.call_args.kwargs["where"] == {"type": "npc"}
+        mock_chromadb['transcript_collection'].query.assert_not_called()
+        assert len(results) == 1
+
+    def test_search_batch_uses_one_query_per_collection(self, vector_store, mock_embedding_service, mock_chromadb):
+        mock_embedding_service.embed_batch.return_value = [[0.1] * 384, [0.2] * 384]
+        mock_chromadb['transcript_collection'].query.return_value = {
+            'documents': [["A-T"], ["B-T"]],
+            'metadatas': [[{}], [{}]],
+            'distances': [[0.3], [0.1]]
+        }
+        mock_chromadb['knowledge_collection'].query.return_value = {
+            'documents': [["A-K"], ["B-K"]],
+            'metadatas': [[{}], [{}]],
+            'distances': [[0.2], [0.4]]
+        }
+
+        results = vector_store.search_batch(["a", "b"], top_k=2)
+
+        mock_embedding_service.embed_batch.assert_called_once_with(["a", "b"])
+        assert mock_chromadb['transcript_collection'].query.call_count == 1
+        assert mock_chromadb['knowledge_collection'].query.call_count == 1
+        assert [[r['text'] for r in hits] for hits in results] == [["A-K", "A-T"], ["B-T", "B-K"]]
+
+    def test_search_batch_returns_empty_lists_on_failure(self, vector_store, mock_embedding_service):
+        mock_embedding_service.embed_batch.side_effect = Exception("Embedding error")
+
+        assert vector_store.search_batch(["a", "b"]) == [[], []]
+        assert vector_store.search_batch([]) == []
+
+
 class TestFormatResults:
     """Tests for _format_results method."""
 
@@ -699,8 +769,8 @@ class TestClearAll:
         # 2. Try to add data
         vector_store.add_transcript_segments("s1", [{"text": "test"}])
 
-        # Verify add was called on the NEW collection instance (returned by create_collection)
-        assert vector_store.transcript_collection.add.call_count == 1
+        # Verify upsert was called on the NEW collection instance (returned by create_collection)
+        assert vector_store.transcript_collection.upsert.call_count == 1
 
     def test_clear_all_raises_on_error(self, vector_store, mock_chromadb):
         """Test that exceptions during clear are propagated."""
@@ -845,3 +915,169 @@ class TestGetStats:
         assert stats['transcript_segments'] == 0
         assert stats['knowledge_documents'] == 0
         assert stats['total_documents'] == 0
+
+
+class TestIncrementalIngestion:
+    """Re-ingestion against a real ChromaDB only embeds what changed."""
+
+    @pytest.fixture(params=["chroma", "numpy"])
+    def real_store(self, request, tmp_path):
+        if request.param == "chroma":
+            pytest.importorskip("chromadb")
+        service = Mock()
+        service.embed_batch.side_effect = lambda texts, batch_size=32: [[float(len(t)), 1.0, 0.0] for t in texts]
+        return CampaignVectorStore(tmp_path / "db", service, backend=request.param), service
+
+    @staticmethod
+    def _segments(*texts):
+        return [
+            {"text": text, "speaker": "DM", "start": float(i), "end": float(i) + 1.0}
+            for i, text in enumerate(texts)
+        ]
+
+    def test_unchanged_segments_are_not_reembedded(self, real_store):
+        store, service = real_store
+        store.add_transcript_segments("s1", self._segments("The dragon wakes", "Roll initiative"))
+        service.embed_batch.reset_mock()
+
+        stats = store.add_transcript_segments("s1", self._segments("The dragon wakes", "Roll for initiative"))
+
+        assert stats == {"upserted": 1, "unchanged": 1, "deleted": 0}
+        service.embed_batch.assert_called_once_with(["Roll for initiative"], batch_size=32)
+        stored = store.transcript_collection.get(ids=["s1_seg_1"])
+        assert stored["documents"] == ["Roll for initiative"]
+
+    def test_stale_segments_are_deleted(self, real_store):
+        store, _ = real_store
+        store.add_transcript_segments("s1", self._segments("One", "Two", "Three"))
+        store.add_transcript_segments("s2", self._segments("Other session"))
+
+        stats = store.add_transcript_segments("s1", self._segments("One"))
+
+        assert stats == {"upserted": 0, "unchanged": 1, "deleted": 2}
+        assert store.transcript_collection.count() == 2
+
+    def test_generation_changes_only_when_records_change(self, real_store):
+        store, _ = real_store
+        store.add_transcript_segments("s1", self._segments("One", "Two"))
+        generation = store.generation
+
+        store.add_transcript_segments("s1", self._segments("One", "Two"))
+        assert store.generation == generation
+
+        store.add_transcript_segments("s1", self._segments("One"))
+        assert store.generation > generation
+
+    def test_knowledge_documents_are_diffed_per_source(self, real_store):
+        store, service = real_store
+        docs = [
+            {"text": "Gandalf: A wizard", "metadata": {"type": "npc", "name": "Gandalf", "source": "a.json"}},
+            {"text": "Moria: A mine", "metadata": {"type": "location", "name": "Moria", "source": "a.json"}},
+        ]
+        store.add_knowledge_documents(docs, source="a.json")
+        store.add_knowledge_documents(
+            [{"text": "Bree: A town", "metadata": {"type": "location", "name": "Bree", "source": "b.json"}}],
+            source="b.json",
+        )
+        service.embed_batch.reset_mock()
+
+        stats = store.add_knowledge_documents(docs[:1], source="a.json")
+
+        assert stats == {"upserted": 0, "unchanged": 1, "deleted": 1}
+        service.embed_batch.assert_not_called()
+        assert store.knowledge_collection.count() == 2
+
+
+class TestFilteredSearchChroma:
+    """Filters are evaluated by the real backends before ranking."""
+
+    @pytest.fixture(params=["chroma", "numpy"])
+    def real_store(self, request, tmp_path):
+        if request.param == "chroma":
+            pytest.importorskip("chromadb")
+        # EmbeddingService returns NumPy arrays, which must reach both backends intact
+        service = Mock()
+        service.embed.return_value = np.array([1.0, 0.0, 0.0], dtype=np.float32)
+        service.embed_batch.side_effect = lambda texts, batch_size=32: np.array(
+            [[1.0, 0.0, float(i)] for i in range(len(texts))], dtype=np.float32
+        )
+        store = CampaignVectorStore(tmp_path / "db", service, backend=request.param)
+        # A dominant session that would crowd out the small one in an unfiltered top-k
+        store.add_transcript_segments("big", [
+            {"text": f"Big {i}", "speaker": "DM", "start": float(i), "end": float(i) + 1.0}
+            for i in range(30)
+        ])
+        store.add_transcript_segments("small", [
+            {"text": "Small IC", "speaker": "Aria", "start": 100.0, "end": 104.0, "classification": "IC"},
+            {"text": "Small OOC", "speaker": "Ben", "start": 200.0, "end": 201.0, "classification": "OOC"},
+        ])
+        return store
+
+    def test_session_filter_returns_results_of_small_session(self, real_store):
+        results = real_store.search("query", top_k=5, filters=VectorSearchFilters(session_id="small"))
+
+        assert sorted(r["text"] for r in results) == ["Small IC", "Small OOC"]
+
+    def test_classification_and_time_range_filters(self, real_store):
+        ic = real_store.search("query", filters=VectorSearchFilters(classification="IC"))
+        window = real_store.search("query", top_k=10, filters=VectorSearchFilters(start=103.0, end=250.0))
+
+        assert [r["text"] for r in ic] == ["Small IC"]
+        assert sorted(r["text"] for r in window) == ["Small IC", "Small OOC"]
+
+    def test_batch_search_with_array_embeddings(self, real_store):
+        results = real_store.search_batch(["one", "two"], top_k=2, filters=VectorSearchFilters(session_id="small"))
+
+        assert [sorted(r["text"] for r in batch) for batch in results] == [["Small IC", "Small OOC"]] * 2
+
+
+class TestChromaEmbeddingConversion:
+    """NumPy embeddings are handed to ChromaDB as plain lists."""
+
+    def test_upsert_and_query_receive_lists(self, vector_store, mock_embedding_service, mock_chromadb):
+        mock_embedding_service.embed_batch.return_value = np.ones((2, 3), dtype=np.float32)
+        mock_embedding_service.embed.return_value = np.ones(3, dtype=np.float32)
+        mock_chromadb['transcript_collection'].get.return_value = {}
+
+        vector_store.add_transcript_segments("s1", [
+            {"text": "One", "speaker": "DM", "start": 0.0, "end": 1.0},
+            {"text": "Two", "speaker": "DM", "start": 1.0, "end": 2.0},
+        ])
+        vector_store.search("query", collection="transcripts")
+
+        embeddings = mock_chromadb['transcript_collection'].upsert.call_args[1]['embeddings']
+        query_embeddings = mock_chromadb['transcript_collection'].query.call_args[1]['query_embeddings']
+        assert embeddings == [[1.0, 1.0, 1.0], [1.0, 1.0, 1.0]]
+        assert all(type(vector) is list for vector in embeddings + query_embeddings)
+
+
+class TestNumpyBackend:
+    """CampaignVectorStore on the embedded NumPy index."""
+
+    def test_search_delete_and_clear(self, tmp_path):
+        service = Mock()
+        service.embed.return_value = [1.0, 0.0]
+        service.embed_batch.side_effect = lambda texts, batch_size=32: [
+            [1.0, 0.0] if "dragon" in t else [0.0, 1.0] for t in texts
+        ]
+        store = CampaignVectorStore(tmp_path / "db", service, backend="numpy")
+        store.add_transcript_segments("s1", [
+            {"text": "The dragon attacks", "speaker": "DM", "start": 0.0, "end": 1.0},
+            {"text": "Pass the chips", "speaker": "Ben", "start": 1.0, "end": 2.0},
+        ])
+        store.add_knowledge_documents([{"text": "Smaug: a dragon", "metadata": {"type": "npc", "name": "Smaug"}}])
+
+        results = store.search("dragon", top_k=2)
+        assert {r["text"] for r in results} == {"The dragon attacks", "Smaug: a dragon"}
+        assert results[0]["distance"] == pytest.approx(0.0, abs=1e-3)
+
+        store.delete_session("s1")
+        assert store.get_stats()["transcript_segments"] == 0
+
+        store.clear_all()
+        assert store.get_stats()["total_documents"] == 0
+        assert store.search("dragon") == []
+
+    def test_unknown_backend_rejected(self, tmp_path):
+        with pytest.raises(ValueError):
+            CampaignVectorStore(tmp_path / "db", Mock(), backend="faiss")
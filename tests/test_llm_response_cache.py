@@ -0,0 +1,95 @@
+import json
+import sqlite3
+
+from src.llm_response_cache import LLMResponseCache
+
+
+def _payload(text: str, padding: int = 0):
+    return {"response": text, "model": "test-model", "padding": "x" * padding}
+
+
+def test_get_returns_stored_payload_and_counts_hits(tmp_path):
+    cache = LLMResponseCache(tmp_path / "llm.sqlite")
+    key = cache.make_key("test-model", {"temperature": 0.1}, "prompt")
+
+    assert cache.get(key) is None
+    cache.put(key, "test-model", _payload("Classificatie: IC"))
+    assert cache.get(key)["response"] == "Classificatie: IC"
+
+    stats = cache.stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+    assert stats["hit_rate"] == 0.5
+    assert stats["entries"] == 1
+
+
+def test_entries_persist_across_instances(tmp_path):
+    db_path = tmp_path / "llm.sqlite"
+    cache = LLMResponseCache(db_path)
+    key = cache.make_key("test-model", None, "prompt")
+    cache.put(key, "test-model", _payload("cached"))
+    cache.close()
+
+    reopened = LLMResponseCache(db_path)
+    assert reopened.get(key)["response"] == "cached"
+
+
+def test_key_depends_on_model_options_and_prompt():
+    base = LLMResponseCache.make_key("m", {"temperature": 0.1}, "prompt")
+    assert base == LLMResponseCache.make_key("m", {"temperature": 0.1}, "prompt")
+    assert base != LLMResponseCache.make_key("other", {"temperature": 0.1}, "prompt")
+    assert base != LLMResponseCache.make_key("m", {"temperature": 0.2}, "prompt")
+    assert base != LLMResponseCache.make_key("m", {"temperature": 0.1}, "prompt!")
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path):
+    entry_size = len(json.dumps(_payload("a", padding=400)).encode("utf-8"))
+    cache = LLMResponseCache(tmp_path / "llm.sqlite", max_bytes=entry_size * 3)
+
+    keys = [cache.make_key("m", None, f"prompt {i}") for i in range(3)]
+    for key in keys:
+        cache.put(key, "m", _payload("a", padding=400))
+    # Touch the oldest entry so the second one becomes least recently used
+    assert cache.get(keys[0]) is not None
+
+    cache.put(cache.make_key("m", None, "prompt 3"), "m", _payload("a", padding=400))
+
+    assert cache.get(keys[1]) is None
+    assert cache.get(keys[0]) is not None
+    assert cache.stats()["size_bytes"] <= entry_size * 3
+
+
+def test_purge_removes_everything(tmp_path):
+    cache = LLMResponseCache(tmp_path / "llm.sqlite")
+    for i in range(3):
+        cache.put(cache.make_key("m", None, str(i)), "m", _payload(str(i)))
+
+    assert cache.purge() == 3
+    assert cache.stats()["entries"] == 0
+
+
+def test_running_size_matches_stored_entries(tmp_path):
+    db_path = tmp_path / "llm.sqlite"
+    cache = LLMResponseCache(db_path, max_bytes=5000)
+    for i in range(40):
+        # Re-putting existing keys replaces their size rather than adding to it
+        cache.put(cache.make_key("m", None, f"prompt {i % 25}"), "m", _payload("a", padding=10 * i))
+
+    stats = cache.stats()
+    cache.close()
+    with sqlite3.connect(str(db_path)) as conn:
+        entries, size = conn.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses").fetchone()
+    assert (stats["entries"], stats["size_bytes"]) == (entries, size)
+    assert size <= 5000
+    assert LLMResponseCache(db_path).stats()["size_bytes"] == size
+
+
+def test_database_is_created_lazily(tmp_path):
+    db_path = tmp_path / "nested" / "llm.sqlite"
+    cache = LLMResponseCache(db_path)
+    assert not db_path.exists()
+    # Reading stats of an unused cache must not create it either
+    assert cache.stats()["entries"] == 0
+    assert not db_path.exists()
+    cache.put(cache.make_key("m", None, "prompt"), "m", _payload("a"))
+    assert db_path.exists()
@@ -70,3 +70,93 @@ def test_merge_transcriptions_removes_overlap():
     assert "Hallo avonturier" in merged_text
     assert merged_text.count("Welkom in de herberg") == 1
     assert merged[-1].text == "Wat wil je drinken?"
+
+
+def build_worded_segment(words: List[tuple]) -> TranscriptionSegment:
+    """Segment from (word, start, end) tuples with Whisper-style leading spaces."""
+    word_dicts = [{"word": f" {w}", "start": s, "end": e} for w, s, e in words]
+    return TranscriptionSegment(
+        text=" ".join(w for w, _, _ in words),
+        start_time=words[0][1],
+        end_time=words[-1][2],
+        confidence=0.9,
+        words=word_dicts
+    )
+
+
+def test_merge_aligns_overlap_on_words():
+    merger = TranscriptionMerger()
+
+    # Chunk A runs to 10s; its last words are cut off mid-sentence
+    chunk_a = ChunkTranscription(
+        chunk_index=0,
+        chunk_start=0.0,
+        chunk_end=10.0,
+        segments=[
+            build_worded_segment([("the", 6.0, 6.4), ("dragon", 6.4, 7.0), ("breathes", 7.0, 7.6),
+                                  ("fire", 7.6, 8.0), ("across", 8.0, 8.6), ("the", 8.6, 9.0),
+                                  ("brid", 9.6, 10.0)])
+        ],
+        language="en"
+    )
+    # Chunk B starts at 6s and hears the same words with slightly shifted timestamps
+    chunk_b = ChunkTranscription(
+        chunk_index=1,
+        chunk_start=6.0,
+        chunk_end=16.0,
+        segments=[
+            build_worded_segment([("the", 6.1, 6.5), ("dragon", 6.5, 7.1), ("breathes", 7.1, 7.7),
+                                  ("fire", 7.7, 8.1), ("across", 8.1, 8.7), ("the", 8.7, 9.1),
+                                  ("bridge", 9.6, 10.3)]),
+            build_worded_segment([("run", 11.0, 11.5)])
+        ],
+        language="en"
+    )
+
+    merged = merger.merge_transcriptions([chunk_a, chunk_b])
+    text = merger.get_full_text(merged)
+
+    assert text == "the dragon breathes fire across the bridge run"
+    # The cut happens inside the common run, so timestamps stay monotonic
+    starts = [seg.start_time for seg in merged]
+    assert starts == sorted(starts)
+
+
+def test_merge_without_word_match_falls_back_to_time_split():
+    merger = TranscriptionMerger()
+
+    chunk_a = ChunkTranscription(
+        chunk_index=0, chunk_start=0.0, chunk_end=10.0,
+        segments=[build_worded_segment([("hello", 1.0, 2.0)]), build_worded_segment([("alpha", 8.0, 9.5)])],
+        language="en"
+    )
+    chunk_b = ChunkTranscription(
+        chunk_index=1, chunk_start=8.0, chunk_end=18.0,
+        segments=[build_worded_segment([("beta", 8.2, 9.6)]), build_worded_segment([("gamma", 10.5, 11.0)])],
+        language="en"
+    )
+
+    merged = merger.merge_transcriptions([chunk_a, chunk_b])
+
+    assert [seg.text for seg in merged] == ["hello", "alpha", "gamma"]
+
+
+def test_merge_many_chunks_keeps_each_sentence_once():
+    merger = TranscriptionMerger()
+    chunks = []
+    for index in range(50):
+        start = index * 8.0
+        words = [(f"w{n}", n * 0.5, n * 0.5 + 0.4) for n in range(int(start * 2), int((start + 10.0) * 2))]
+        chunks.append(ChunkTranscription(
+            chunk_index=index,
+            chunk_start=start,
+            chunk_end=start + 10.0,
+            segments=[build_worded_segment(words[i:i + 4]) for i in range(0, len(words), 4)],
+            language="en"
+        ))
+
+    merged = merger.merge_transcriptions(chunks)
+    tokens = merger.get_full_text(merged).split()
+
+    assert tokens == [f"w{n}" for n in range(len(tokens))]
+    assert tokens[-1] == f"w{int((49 * 8.0 + 10.0) * 2) - 1}"
@@ -0,0 +1,86 @@
+"""
+Performance benchmark for intermediate stage outputs.
+
+Saves a synthetic stage 4 merged transcript (segments with per-word timings)
+as pretty-printed JSON and as columnar .npz, and compares file size, full
+load time, and the time to load only the columns a consumer needs. Results
+are printed to stdout like the other performance tests.
+"""
+import time
+
+import numpy as np
+import pytest
+
+from src.intermediate_output import IntermediateOutputManager
+from src.transcriber import TranscriptionSegment
+
+SESSION_HOURS = 4
+NUM_SEGMENTS = 4800
+WORDS_PER_SEGMENT = 25
+TARGET_LOAD_SPEEDUP = 2.0
+
+
+@pytest.fixture
+def merged_segments():
+    rng = np.random.default_rng(0)
+    step = SESSION_HOURS * 3600 / NUM_SEGMENTS
+    segments = []
+    for index in range(NUM_SEGMENTS):
+        start = index * step
+        word_step = step / WORDS_PER_SEGMENT
+        words = [
+            {
+                "word": f"word{(index * WORDS_PER_SEGMENT + position) % 997}",
+                "start": start + position * word_step,
+                "end": start + (position + 0.8) * word_step,
+                "probability": float(rng.uniform(0.5, 1.0)),
+            }
+            for position in range(WORDS_PER_SEGMENT)
+        ]
+        segments.append(
+            TranscriptionSegment(
+                text=" ".join(word["word"] for word in words),
+                start_time=start,
+                end_time=start + step * 0.95,
+                confidence=float(rng.uniform(0.6, 1.0)),
+                words=words,
+            )
+        )
+    return segments
+
+
+def _timed(function, repeats=3):
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        result = function()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def test_intermediate_load_time(tmp_path, merged_segments):
+    results = {}
+    for storage_format in ("json", "columnar"):
+        manager = IntermediateOutputManager(tmp_path / storage_format, storage_format=storage_format)
+        save_seconds, path = _timed(lambda: manager.save_merged_transcript(merged_segments), repeats=1)
+        load_seconds, loaded = _timed(lambda: manager.load_stage_output(4))
+        columns_seconds, _ = _timed(lambda: manager.load_stage_output(4, columns=["text", "start_time", "end_time"]))
+        results[storage_format] = (path.stat().st_size, save_seconds, load_seconds, columns_seconds, loaded[0])
+
+    assert results["json"][4] == results["columnar"][4]
+
+    print(
+        f"\n[Perf] Stage 4 intermediate: {NUM_SEGMENTS} segments, "
+        f"{NUM_SEGMENTS * WORDS_PER_SEGMENT} words ({SESSION_HOURS} h session)"
+    )
+    for storage_format, (size, save_seconds, load_seconds, columns_seconds, _) in results.items():
+        print(
+            f"[Perf] {storage_format:>8}: {size / 1e6:6.1f} MB, save {save_seconds * 1000:6.0f} ms, "
+            f"full load {load_seconds * 1000:6.0f} ms, text+timing columns {columns_seconds * 1000:6.0f} ms"
+        )
+
+    speedup = results["json"][2] / results["columnar"][2]
+    print(f"[Perf] Full load speedup (columnar vs JSON): {speedup:.1f}x")
+    print(f"[Perf] Column load speedup (columnar vs JSON): {results['json'][3] / results['columnar'][3]:.1f}x")
+    if speedup < TARGET_LOAD_SPEEDUP:
+        print(f"WARNING: columnar full load less than {TARGET_LOAD_SPEEDUP}x faster than JSON")
@@ -197,3 +197,120 @@ def test_hybrid_search_performance(temp_dirs, mock_embedding_service, synthetic_
 
     if avg_latency >= TARGET_SEARCH_LATENCY:
         print(f"WARNING: Hybrid search latency {avg_latency:.3f}s >= target {TARGET_SEARCH_LATENCY}s")
+
+def test_keyword_retrieval_large_campaign(temp_dirs):
+    """Benchmark CampaignRetriever on a 100-session campaign: first build, warm queries, reopen."""
+    _, _, kb_dir, transcript_dir = temp_dirs
+    rng = random.Random(7)
+    words = [f"word{n}" for n in range(2000)] + ["dragon", "tavern", "goblin"]
+    for session in range(100):
+        session_dir = transcript_dir / f"session_{session:03d}"
+        session_dir.mkdir()
+        segments = [
+            {
+                "text": " ".join(rng.choice(words) for _ in range(12)),
+                "speaker": rng.choice(["DM", "Player1", "Player2"]),
+                "start": float(i * 5),
+                "end": float(i * 5 + 4),
+            }
+            for i in range(500)
+        ]
+        with open(session_dir / "diarized_transcript.json", "w") as f:
+            json.dump({"segments": segments}, f)
+
+    retriever = CampaignRetriever(knowledge_base_dir=kb_dir, transcript_dir=transcript_dir)
+    start_time = time.perf_counter()
+    retriever.retrieve("dragon tavern", top_k=5)
+    build_seconds = time.perf_counter() - start_time
+
+    start_time = time.perf_counter()
+    for _ in range(NUM_SEARCH_ITERATIONS):
+        results = retriever.retrieve("dragon tavern", top_k=5)
+    warm_latency = (time.perf_counter() - start_time) / NUM_SEARCH_ITERATIONS
+
+    reopened = CampaignRetriever(knowledge_base_dir=kb_dir, transcript_dir=transcript_dir)
+    start_time = time.perf_counter()
+    reopened.retrieve("dragon tavern", top_k=5)
+    reopen_seconds = time.perf_counter() - start_time
+
+    print(f"\n[Perf] Keyword index build for 50000 segments: {build_seconds * 1000:.0f}ms")
+    print(f"[Perf] Warm keyword retrieval latency: {warm_latency * 1000:.2f}ms ({len(results)} results)")
+    print(f"[Perf] First retrieval after reopening saved index: {reopen_seconds * 1000:.0f}ms")
+
+    if warm_latency >= TARGET_SEARCH_LATENCY:
+        print(f"WARNING: Keyword retrieval latency {warm_latency:.3f}s >= target {TARGET_SEARCH_LATENCY}s")
+
+def _directory_size(path: Path) -> int:
+    return sum(f.stat().st_size for f in path.rglob("*") if f.is_file())
+
+
+@pytest.mark.slow
+def test_vector_backend_recall_and_latency(temp_dirs, monkeypatch):
+    """Compare the embedded int8 NumPy index (exact and IVF) with ChromaDB on recall@10 and latency."""
+    pytest.importorskip("chromadb")
+    import numpy as np
+    from src.config import Config
+
+    root_dir, _, _, _ = temp_dirs
+    num_vectors, num_queries, dim, top_k = 30000, 50, 384, 10
+
+    # Clustered unit vectors resemble sentence embeddings better than uniform noise
+    rng = np.random.default_rng(11)
+    centers = rng.normal(size=(300, dim))
+    vectors = centers[rng.integers(0, 300, num_vectors)] + 0.8 * rng.normal(size=(num_vectors, dim))
+    vectors = (vectors / np.linalg.norm(vectors, axis=1, keepdims=True)).astype(np.float32)
+    queries = centers[rng.integers(0, 300, num_queries)] + 0.8 * rng.normal(size=(num_queries, dim))
+    queries = (queries / np.linalg.norm(queries, axis=1, keepdims=True)).astype(np.float32)
+    expected = [set(np.argsort(-(vectors @ q))[:top_k]) for q in queries]
+
+    lookup = {f"segment {i}": vectors[i].tolist() for i in range(num_vectors)}
+    lookup.update({f"query {j}": queries[j].tolist() for j in range(num_queries)})
+    service = MagicMock()
+    service.embed.side_effect = lambda text: lookup[text]
+    service.embed_batch.side_effect = lambda texts, batch_size=32: [lookup[t] for t in texts]
+    segments = [
+        {"text": f"segment {i}", "speaker": "DM", "start": float(i), "end": float(i) + 1.0}
+        for i in range(num_vectors)
+    ]
+
+    def run(label, backend, ivf_threshold):
+        monkeypatch.setattr(Config, "VECTOR_STORE_IVF_THRESHOLD", ivf_threshold)
+        persist_dir = root_dir / label
+        start_time = time.perf_counter()
+        store = CampaignVectorStore(persist_dir, service, backend=backend)
+        store.add_transcript_segments("bench", segments)
+        ingest_seconds = time.perf_counter() - start_time
+
+        store.search("query 0", top_k=top_k)  # warm-up (trains the IVF index when enabled)
+        start_time = time.perf_counter()
+        found = [store.search(f"query {j}", top_k=top_k, collection="transcripts") for j in range(num_queries)]
+        latency = (time.perf_counter() - start_time) / num_queries
+
+        recall = np.mean([
+            len(expected[j] & {int(r["text"].split()[1]) for r in found[j]}) / top_k
+            for j in range(num_queries)
+        ])
+
+        start_time = time.perf_counter()
+        reopened = CampaignVectorStore(persist_dir, service, backend=backend)
+        reopened.search("query 0", top_k=top_k)
+        reopen_seconds = time.perf_counter() - start_time
+
+        print(
+            f"[Perf] {label}: ingest {ingest_seconds:.2f}s, query {latency * 1000:.2f}ms, "
+            f"recall@{top_k} {recall:.3f}, reopen+first query {reopen_seconds * 1000:.0f}ms, "
+            f"disk {_directory_size(persist_dir) / 1e6:.1f} MB"
+        )
+        return recall, latency
+
+    print(f"\n[Perf] Vector backends on {num_vectors} x {dim} vectors")
+    chroma_recall, chroma_latency = run("chroma", "chroma", Config.VECTOR_STORE_IVF_THRESHOLD)
+    exact_recall, exact_latency = run("numpy-int8-exact", "numpy", num_vectors * 2)
+    ivf_recall, ivf_latency = run("numpy-int8-ivf", "numpy", 10000)
+
+    if exact_recall < 0.95:
+        print(f"WARNING: int8 exact recall {exact_recall:.3f} < 0.95")
+    if ivf_recall < 0.85:
+        print(f"WARNING: IVF recall {ivf_recall:.3f} < 0.85")
+    if ivf_latency >= TARGET_SEARCH_LATENCY:
+        print(f"WARNING: IVF search latency {ivf_latency:.3f}s >= target {TARGET_SEARCH_LATENCY}s")
@@ -0,0 +1,75 @@
+"""
+Performance benchmark for TranscriptionMerger.
+
+Merges synthetic transcriptions of 1000 overlapping chunks (with word-level
+timestamps) and checks that merge time grows linearly with the chunk count.
+Results are printed to stdout like the other performance tests.
+"""
+import time
+
+from src.merger import TranscriptionMerger
+from src.transcriber import ChunkTranscription, TranscriptionSegment
+
+NUM_CHUNKS = 1000
+CHUNK_SECONDS = 60.0
+OVERLAP_SECONDS = 10.0
+WORDS_PER_SECOND = 2.5
+WORDS_PER_SEGMENT = 12
+
+
+def _synthetic_chunks(num_chunks: int):
+    step = CHUNK_SECONDS - OVERLAP_SECONDS
+    word_spacing = 1.0 / WORDS_PER_SECOND
+    chunks = []
+    for index in range(num_chunks):
+        chunk_start = index * step
+        chunk_end = chunk_start + CHUNK_SECONDS
+        first = int(round(chunk_start / word_spacing))
+        last = int(round(chunk_end / word_spacing))
+        words = [
+            {"word": f" word{n % 997}", "start": n * word_spacing, "end": n * word_spacing + 0.3}
+            for n in range(first, last)
+        ]
+        segments = [
+            TranscriptionSegment(
+                text="".join(w["word"] for w in batch).strip(),
+                start_time=batch[0]["start"],
+                end_time=batch[-1]["end"],
+                words=batch
+            )
+            for batch in (words[i:i + WORDS_PER_SEGMENT] for i in range(0, len(words), WORDS_PER_SEGMENT))
+        ]
+        chunks.append(ChunkTranscription(
+            chunk_index=index,
+            chunk_start=chunk_start,
+            chunk_end=chunk_end,
+            segments=segments,
+            language="en"
+        ))
+    return chunks
+
+
+def _time_merge(chunks):
+    merger = TranscriptionMerger()
+    start = time.perf_counter()
+    merged = merger.merge_transcriptions(chunks)
+    return time.perf_counter() - start, merged
+
+
+def test_merger_performance_1000_chunks():
+    """Benchmark merging 1000 chunks and compare against a 250-chunk run."""
+    small_duration, _ = _time_merge(_synthetic_chunks(NUM_CHUNKS // 4))
+    duration, merged = _time_merge(_synthetic_chunks(NUM_CHUNKS))
+
+    total_words = sum(len(seg.words) for seg in merged)
+    print(f"\n[Perf] Merged {NUM_CHUNKS} chunks into {len(merged)} segments ({total_words} words) in {duration*1000:.1f}ms")
+    print(f"[Perf] {NUM_CHUNKS // 4} chunks took {small_duration*1000:.1f}ms (ratio {duration / max(small_duration, 1e-9):.1f}x for 4x input)")
+
+    # Every word of the session appears exactly once, in order
+    expected_words = int(round(((NUM_CHUNKS - 1) * (CHUNK_SECONDS - OVERLAP_SECONDS) + CHUNK_SECONDS) * WORDS_PER_SECOND))
+    assert total_words == expected_words
+    starts = [w["start"] for seg in merged for w in seg.words]
+    assert starts == sorted(starts)
+
+    # Linear scaling: 4x the chunks should not cost anywhere near 16x the time
+    assert duration < small_duration * 10 + 0.5
@@ -0,0 +1,99 @@
+"""
+Performance benchmark for SearchEngine.
+
+Searches a synthetic 100-session campaign (200k segments) through the
+inverted index and reports index build time and per-query latency.
+Results are printed to stdout like the other performance tests.
+"""
+import random
+import time
+
+from src.search_engine import SearchEngine, SearchFilters, SearchMode
+from src.transcript_indexer import SegmentBlock, SegmentColumns, TranscriptIndex, TranscriptSegment
+
+NUM_SESSIONS = 100
+SEGMENTS_PER_SESSION = 2000
+SPEAKERS = ["DM", "Alice", "Bob", "Carol", "Dave"]
+VOCABULARY = [f"word{n}" for n in range(500)] + ["dragon", "tavern", "fireball", "goblin"]
+
+
+def _synthetic_index() -> TranscriptIndex:
+    rng = random.Random(42)
+    index = TranscriptIndex()
+    for session in range(NUM_SESSIONS):
+        for position in range(SEGMENTS_PER_SESSION):
+            index.add_segment(
+                TranscriptSegment(
+                    session_id=f"session_{session:03d}",
+                    timestamp=position * 3.0,
+                    timestamp_str="00:00:00",
+                    speaker=rng.choice(SPEAKERS),
+                    text=" ".join(rng.choice(VOCABULARY) for _ in range(12)),
+                    ic_ooc=rng.choice(["IC", "OOC"]),
+                    segment_index=position,
+                    session_date=f"2025{session:04d}_120000",
+                )
+            )
+    return index
+
+
+def test_search_performance_200k_segments():
+    """Benchmark BM25 and phrase queries with and without filters."""
+    index = _synthetic_index()
+
+    start = time.perf_counter()
+    index.get_search_index()
+    build_seconds = time.perf_counter() - start
+
+    engine = SearchEngine(index)
+    queries = [
+        ("full text", lambda: engine.search("dragon tavern", max_results=50)),
+        ("exact phrase", lambda: engine.search("dragon tavern", mode=SearchMode.EXACT, max_results=50)),
+        (
+            "filtered",
+            lambda: engine.search(
+                "goblin",
+                filters=SearchFilters(speakers={"DM"}, ic_ooc="IC", session_ids={"session_007"}),
+                max_results=50,
+            ),
+        ),
+    ]
+
+    print(f"\n[Perf] Search index build: {build_seconds * 1000:.0f} ms for {len(index.segments)} segments")
+    for label, run in queries:
+        run()  # warm postings
+        start = time.perf_counter()
+        for _ in range(10):
+            results = run()
+        elapsed_ms = (time.perf_counter() - start) * 100
+        print(f"[Perf] {label} query: {elapsed_ms:.1f} ms ({len(results)} results)")
+        # Soft target: interactive latency on a large campaign
+        assert elapsed_ms < 1000
+
+
+def test_columnar_storage_load_and_size(tmp_path):
+    """Benchmark saving and memory-mapping the columnar segment store."""
+    index = _synthetic_index()
+    blocks = index.segments._blocks + [SegmentBlock.from_segments(index.segments[index.segments._sealed:])]
+
+    paths = []
+    for number, block in enumerate(blocks):
+        path = tmp_path / f"block_{number}.tidx"
+        block.save(path)
+        paths.append(path)
+
+    start = time.perf_counter()
+    loaded = SegmentColumns()
+    for path in paths:
+        loaded.add_block(SegmentBlock.load(path))
+    load_ms = (time.perf_counter() - start) * 1000
+
+    disk_mb = sum(path.stat().st_size for path in paths) / 1024 / 1024
+    print(
+        f"\n[Perf] Columnar store: {len(loaded)} segments, {disk_mb:.1f} MB on disk, "
+        f"memory-mapped in {load_ms:.1f} ms"
+    )
+    assert len(loaded) == len(index.segments)
+    assert loaded[len(loaded) - 1] == index.segments[len(loaded) - 1]
+    # Soft target: opening the index should not scale with its size
+    assert load_ms < 1000
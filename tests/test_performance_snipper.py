@@ -0,0 +1,112 @@
+"""
+Performance benchmark for AudioSnipper snippet export.
+
+Exports clips from a synthetic 16 kHz session WAV with the in-process
+engine (soundfile slicing from a worker pool, JSONL clip log) and compares
+clips/second against the FFmpeg path (one ffmpeg process per clip), and
+the stage time and disk use of virtual snippets (sample offsets only) with
+clip rendering on request. The FFmpeg leg is skipped when no ffmpeg binary
+is installed. Results are printed to stdout like the other performance tests.
+"""
+import json
+import shutil
+import time
+
+import numpy as np
+import pytest
+import soundfile as sf
+
+from src.snipper import AudioSnipper, VirtualSnippetRenderer
+
+SAMPLE_RATE = 16000
+SESSION_MINUTES = 20
+NUM_CLIPS = 1000
+NUM_FFMPEG_CLIPS = 100  # FFmpeg is slow enough that a sample gives a stable rate
+TARGET_NATIVE_CLIPS_PER_SECOND = 200
+
+
+@pytest.fixture
+def session_wav(tmp_path):
+    rng = np.random.default_rng(0)
+    samples = (rng.normal(scale=3000, size=SESSION_MINUTES * 60 * SAMPLE_RATE)).astype(np.int16)
+    path = tmp_path / "session.wav"
+    sf.write(str(path), samples, SAMPLE_RATE, subtype="PCM_16")
+    return path
+
+
+def _segments(count, duration_seconds):
+    step = duration_seconds / count
+    return [
+        {
+            "start_time": index * step,
+            "end_time": index * step + step * 0.9,
+            "speaker": f"SPEAKER_{index % 4:02}",
+            "text": f"Segment {index} of the benchmark session",
+        }
+        for index in range(count)
+    ]
+
+
+def _directory_size(path):
+    # Hard links to the session audio cost no extra disk
+    return sum(
+        file.stat().st_size for file in path.rglob("*") if file.is_file() and file.stat().st_nlink == 1
+    )
+
+
+def _export(monkeypatch, tmp_path, audio_path, segments, native, workers, name, virtual=False):
+    monkeypatch.setattr("src.snipper.Config.USE_NATIVE_SNIPPET_EXPORT", native, raising=False)
+    monkeypatch.setattr("src.snipper.Config.USE_VIRTUAL_SNIPPETS", virtual, raising=False)
+    monkeypatch.setattr("src.snipper.Config.USE_STREAMING_SNIPPET_EXPORT", True, raising=False)
+    monkeypatch.setattr("src.snipper.Config.SNIPPET_EXPORT_WORKERS", workers, raising=False)
+    snipper = AudioSnipper()
+
+    start = time.perf_counter()
+    result = snipper.export_segments(audio_path, segments, tmp_path / name, name)
+    elapsed = time.perf_counter() - start
+
+    manifest = json.loads(result["manifest"].read_text(encoding="utf-8"))
+    assert manifest["total_clips"] == len(segments)
+    return len(segments) / elapsed, result["segments_dir"]
+
+
+def test_snippet_export_throughput(monkeypatch, tmp_path, session_wav):
+    segments = _segments(NUM_CLIPS, SESSION_MINUTES * 60)
+
+    print(f"\n[Perf] Snippet export: {NUM_CLIPS} clips from a {SESSION_MINUTES}-minute 16 kHz WAV")
+    serial, _ = _export(monkeypatch, tmp_path, session_wav, segments, native=True, workers=1, name="native_1")
+    print(f"[Perf] In-process, 1 worker: {serial:.0f} clips/s")
+    parallel, files_dir = _export(
+        monkeypatch, tmp_path, session_wav, segments, native=True, workers=4, name="native_4"
+    )
+    print(f"[Perf] In-process, 4 workers: {parallel:.0f} clips/s, {_directory_size(files_dir) / 1e6:.1f} MB on disk")
+
+    if parallel < TARGET_NATIVE_CLIPS_PER_SECOND:
+        print(f"WARNING: in-process export below {TARGET_NATIVE_CLIPS_PER_SECOND} clips/s")
+
+    virtual, virtual_dir = _export(
+        monkeypatch, tmp_path, session_wav, segments, native=True, workers=4, name="virtual", virtual=True
+    )
+    print(f"[Perf] Virtual snippets: {virtual:.0f} clips/s, {_directory_size(virtual_dir) / 1e6:.2f} MB on disk")
+
+    renderer = VirtualSnippetRenderer()
+    clip_files = [f"segment_{index:04}_SPEAKER_{(index - 1) % 4:02}.wav" for index in range(1, 101)]
+    start = time.perf_counter()
+    for clip_file in clip_files:
+        renderer.render(virtual_dir, clip_file)
+    cold_ms = (time.perf_counter() - start) * 1000 / len(clip_files)
+    start = time.perf_counter()
+    for clip_file in clip_files:
+        renderer.render(virtual_dir, clip_file)
+    cached_ms = (time.perf_counter() - start) * 1000 / len(clip_files)
+    print(f"[Perf] Virtual clip render: {cold_ms:.2f} ms cold, {cached_ms:.3f} ms cached")
+
+    if shutil.which("ffmpeg") is None:
+        print("[Perf] FFmpeg not installed; skipping the per-clip FFmpeg comparison")
+        return
+
+    ffmpeg, _ = _export(
+        monkeypatch, tmp_path, session_wav, segments[:NUM_FFMPEG_CLIPS], native=False, workers=1, name="ffmpeg"
+    )
+    print(f"[Perf] FFmpeg per clip (serial): {ffmpeg:.0f} clips/s")
+    print(f"[Perf] Speedup (in-process, 4 workers vs FFmpeg): {parallel / ffmpeg:.1f}x")
@@ -20,6 +20,12 @@ from src.transcriber import ChunkTranscription, TranscriptionSegment
 from src.intermediate_output import IntermediateOutputManager
 
 
+@pytest.fixture(autouse=True)
+def _eager_chunking(monkeypatch):
+    """process() tests mock chunk_audio; streamed chunking is covered by TestStreamedChunking."""
+    monkeypatch.setattr(Config, "CHUNKER_STREAMING", False)
+
+
 # ============================================================================
 # Session Directory Tests
 # ============================================================================
@@ -1942,6 +1948,7 @@ class TestPipelineResume:
             mock_formatter.save_all_formats.reset_mock()
             mock_snipper.initialize_manifest.reset_mock()
             mock_snipper.export_incremental.reset_mock()
+            mock_snipper.export_clips.reset_mock()
             initial_extract_calls = mock_extractor.extract_knowledge.call_count
 
             mock_chunker.chunk_audio.side_effect = AssertionError("chunker should not run on resume")
@@ -1950,6 +1957,7 @@ class TestPipelineResume:
             mock_formatter.save_all_formats.side_effect = AssertionError("formatter should not run on resume")
             mock_snipper.initialize_manifest.side_effect = AssertionError("manifest should not be created on resume")
             mock_snipper.export_incremental.side_effect = AssertionError("snipper should not run on resume")
+            mock_snipper.export_clips.side_effect = AssertionError("snipper should not run on resume")
 
             processor_resume = DDSessionProcessor("resume_skip_test", resume=True)
             resume_result = processor_resume.process(
@@ -1968,11 +1976,308 @@ class TestPipelineResume:
             mock_merger.merge_transcriptions.assert_not_called()
             mock_formatter.save_all_formats.assert_not_called()
             mock_snipper.export_incremental.assert_not_called()
+            mock_snipper.export_clips.assert_not_called()
             assert mock_extractor.extract_knowledge.call_count == initial_extract_calls
 
             # Cleanup checkpoints created for the session.
             processor_resume.checkpoint_manager.clear()
 
+@patch('src.pipeline.StatusTracker')
+@patch('src.pipeline.TranscriberFactory')
+@patch('src.pipeline.DiarizerFactory')
+@patch('src.pipeline.ClassifierFactory')
+class TestOverlappedDiarization:
+    """Stage 5 joining a diarization job started alongside transcription."""
+
+    @staticmethod
+    def _segments():
+        return [TranscriptionSegment(text="hello", start_time=0.0, end_time=1.0)]
+
+    def test_background_result_is_used_instead_of_in_process_diarization(
+        self, MockClassifierFactory, MockDiarizerFactory, MockTranscriberFactory, MockStatusTracker, tmp_path
+    ):
+        processor = DDSessionProcessor("overlap_test", resume=False)
+        processor.speaker_profile_manager = MagicMock()
+        processor.diarizer.assign_speakers_to_transcription.return_value = [
+            {"text": "hello", "start_time": 0.0, "end_time": 1.0, "speaker": "SPEAKER_00"}
+        ]
+        job = MagicMock()
+        job.result.return_value = (["turns"], {"SPEAKER_00": np.zeros(2)})
+        job.diarization_seconds = 42.0
+        job.wait_seconds = 1.5
+
+        result = processor._stage_speaker_diarization(
+            tmp_path / "session.wav", self._segments(), False, background_diarization=job
+        )
+
+        assert result.success
+        processor.diarizer.diarize.assert_not_called()
+        processor.diarizer.assign_speakers_to_transcription.assert_called_once()
+        assert processor.diarizer.assign_speakers_to_transcription.call_args.args[1] == ["turns"]
+        assert result.timings["diarization_seconds"] == 42.0
+        assert result.timings["diarization_wait_seconds"] == 1.5
+        assert "speaker_assignment_seconds" in result.timings
+
+        processor._record_stage_timing(result)
+        assert processor.stage_timings["speaker_diarized"]["diarization_wait_seconds"] == 1.5
+        assert "duration" in processor.stage_timings["speaker_diarized"]
+
+    def test_failed_background_job_falls_back_to_in_process(
+        self, MockClassifierFactory, MockDiarizerFactory, MockTranscriberFactory, MockStatusTracker, tmp_path
+    ):
+        processor = DDSessionProcessor("overlap_test", resume=False)
+        processor.speaker_profile_manager = MagicMock()
+        processor.diarizer.diarize.return_value = ([], {})
+        processor.diarizer.assign_speakers_to_transcription.return_value = []
+        job = MagicMock()
+        job.result.side_effect = RuntimeError("child died")
+
+        result = processor._stage_speaker_diarization(
+            tmp_path / "session.wav", self._segments(), False, background_diarization=job
+        )
+
+        assert result.success
+        processor.diarizer.diarize.assert_called_once()
+        assert any("child died" in warning for warning in result.warnings)
+
+    def test_overlap_is_opt_in(
+        self, MockClassifierFactory, MockDiarizerFactory, MockTranscriberFactory, MockStatusTracker
+    ):
+        assert DDSessionProcessor("overlap_test", resume=False).overlap_diarization is Config.PIPELINE_OVERLAP_DIARIZATION
+        assert DDSessionProcessor("overlap_test", resume=False, overlap_diarization=True).overlap_diarization is True
+
+
+@patch('src.pipeline.HybridChunker')
+@patch('src.pipeline.StatusTracker')
+@patch('src.pipeline.TranscriberFactory')
+@patch('src.pipeline.DiarizerFactory')
+@patch('src.pipeline.ClassifierFactory')
+class TestTranscriptionJournalResume:
+    """Per-chunk transcription journal used to resume stage 3 mid-way."""
+
+    @staticmethod
+    def _chunks():
+        return [
+            AudioChunk(
+                audio=np.zeros(160, dtype=np.float32),
+                start_time=float(i * 10),
+                end_time=float(i * 10 + 12),
+                sample_rate=16000,
+                chunk_index=i
+            )
+            for i in range(3)
+        ]
+
+    @staticmethod
+    def _transcribe(chunk, language="en"):
+        return ChunkTranscription(
+            chunk_index=chunk.chunk_index,
+            chunk_start=chunk.start_time,
+            chunk_end=chunk.end_time,
+            segments=[TranscriptionSegment(
+                text=f"chunk {chunk.chunk_index}",
+                start_time=chunk.start_time,
+                end_time=chunk.end_time
+            )],
+            language=language
+        )
+
+    def _processor(self, tmp_path):
+        from src.checkpoint import CheckpointManager
+
+        processor = DDSessionProcessor("journal_test", resume=True)
+        processor.checkpoint_manager = CheckpointManager("journal_test", tmp_path / "checkpoints")
+        return processor
+
+    def test_crash_mid_stage_resumes_only_missing_chunks(
+        self, MockClassifierFactory, MockDiarizerFactory, MockTranscriberFactory, MockStatusTracker,
+        MockHybridChunker, tmp_path
+    ):
+        chunks = self._chunks()
+        processor = self._processor(tmp_path)
+
+        def _fail_on_last(chunk, language="en"):
+            if chunk.chunk_index == 2:
+                raise RuntimeError("crash")
+            return self._transcribe(chunk, language)
+
+        processor.transcriber.transcribe_chunk = MagicMock(side_effect=_fail_on_last)
+        result = processor._stage_audio_transcription(chunks)
+        assert result.status == ProcessingStatus.FAILED
+
+        journaled = processor._load_transcription_journal(chunks)
+        assert sorted(journaled) == [0, 1]
+
+        processor.transcriber.transcribe_chunk = MagicMock(side_effect=self._transcribe)
+        result = processor._stage_audio_transcription(chunks, journaled)
+
+        assert result.success
+        processor.transcriber.transcribe_chunk.assert_called_once_with(chunks[2], language=processor.language)
+        assert [ct.chunk_index for ct in result.data["chunk_transcriptions"]] == [0, 1, 2]
+        assert [ct.segments[0].text for ct in result.data["chunk_transcriptions"]] == [
+            "chunk 0", "chunk 1", "chunk 2"
+        ]
+
+    def test_journal_entries_with_mismatched_boundaries_are_discarded(
+        self, MockClassifierFactory, MockDiarizerFactory, MockTranscriberFactory, MockStatusTracker,
+        MockHybridChunker, tmp_path
+    ):
+        chunks = self._chunks()
+        processor = self._processor(tmp_path)
+        for chunk in chunks[:2]:
+            processor._journal_chunk_transcription(self._transcribe(chunk))
+
+        # Re-chunking moved the boundary of chunk 1, so only chunk 0 is reusable
+        chunks[1].end_time = 25.0
+        journaled = processor._load_transcription_journal(chunks)
+
+        assert list(journaled) == [0]
+        assert len(processor._load_transcription_journal(chunks)) == 1
+        stored = processor.checkpoint_manager.read_journal(
+            "audio_transcribed", processor.TRANSCRIPTION_JOURNAL
+        )
+        assert [entry["chunk_index"] for entry in stored] == [0]
+
+
+
+    def test_reconstructed_chunks_load_audio_lazily(
+        self, MockClassifierFactory, MockDiarizerFactory, MockTranscriberFactory, MockStatusTracker,
+        MockHybridChunker, tmp_path
+    ):
+        import soundfile as sf
+        from src.chunker import LazyAudioChunk
+
+        wav_file = tmp_path / "session.wav"
+        sf.write(str(wav_file), np.full(16000 * 30, 0.25, dtype=np.float32), 16000, subtype='PCM_16')
+        processor = self._processor(tmp_path)
+        processor.audio_processor = MagicMock()
+
+        chunks = processor._reconstruct_chunks_from_checkpoint(
+            [chunk.to_dict() for chunk in self._chunks()], wav_file
+        )
+
+        assert all(isinstance(chunk, LazyAudioChunk) for chunk in chunks)
+        processor.audio_processor.load_audio_segment.assert_not_called()
+        assert len(chunks[1].audio) == 12 * 16000
+        assert chunks[1].audio[0] == pytest.approx(0.25, abs=1e-4)
+@patch('src.pipeline.HybridChunker')
+@patch('src.pipeline.StatusTracker')
+@patch('src.pipeline.TranscriberFactory')
+@patch('src.pipeline.DiarizerFactory')
+@patch('src.pipeline.ClassifierFactory')
+class TestStreamedChunking:
+    """Stage 3 consuming chunks while streaming stage 2 is still producing them."""
+
+    def _processor(self, tmp_path, events, num_chunks=3):
+        from src.checkpoint import CheckpointManager
+
+        processor = DDSessionProcessor("stream_test", resume=True)
+        processor.checkpoint_manager = CheckpointManager("stream_test", tmp_path / "checkpoints")
+
+        def _iter_chunks(wav_file, progress_callback=None):
+            for chunk in TestTranscriptionJournalResume._chunks()[:num_chunks]:
+                events.append(("chunked", chunk.chunk_index))
+                yield chunk
+
+        def _transcribe(chunk, language="en"):
+            events.append(("transcribed", chunk.chunk_index))
+            return TestTranscriptionJournalResume._transcribe(chunk, language)
+
+        processor.chunker = MagicMock()
+        processor.chunker.iter_chunks = MagicMock(side_effect=_iter_chunks)
+        processor.transcriber.transcribe_chunk = MagicMock(side_effect=_transcribe)
+        processor.transcription_backend = "local"
+        return processor
+
+    def test_transcription_starts_before_chunking_finishes(
+        self, MockClassifierFactory, MockDiarizerFactory, MockTranscriberFactory, MockStatusTracker,
+        MockHybridChunker, tmp_path
+    ):
+        events = []
+        completed = []
+        processor = self._processor(tmp_path, events)
+
+        chunking, chunk_iter = processor._stage_audio_chunking_streamed(
+            tmp_path / "session.wav", 32.0, on_complete=lambda result, dicts: completed.append(dicts)
+        )
+        assert events == []  # nothing is chunked up front
+
+        result = processor._stage_audio_transcription(chunk_iter)
+
+        assert result.success and chunking.success
+        assert events.index(("transcribed", 0)) < events.index(("chunked", 2))
+        assert [ct.chunk_index for ct in result.data["chunk_transcriptions"]] == [0, 1, 2]
+        assert chunking.data["num_chunks"] == 3
+        assert completed == [[chunk.to_dict() for chunk in TestTranscriptionJournalResume._chunks()]]
+
+    def test_journal_entries_are_matched_as_chunks_arrive(
+        self, MockClassifierFactory, MockDiarizerFactory, MockTranscriberFactory, MockStatusTracker,
+        MockHybridChunker, tmp_path
+    ):
+        events = []
+        processor = self._processor(tmp_path, events)
+        for chunk in TestTranscriptionJournalResume._chunks()[:2]:
+            processor._journal_chunk_transcription(TestTranscriptionJournalResume._transcribe(chunk))
+
+        _, chunk_iter = processor._stage_audio_chunking_streamed(tmp_path / "session.wav", 32.0)
+        result = processor._stage_audio_transcription(chunk_iter, processor._load_transcription_journal(None))
+
+        assert result.success
+        assert [event for event in events if event[0] == "transcribed"] == [("transcribed", 2)]
+        assert [ct.chunk_index for ct in result.data["chunk_transcriptions"]] == [0, 1, 2]
+
+    def test_zero_chunks_fail_chunking_stage(
+        self, MockClassifierFactory, MockDiarizerFactory, MockTranscriberFactory, MockStatusTracker,
+        MockHybridChunker, tmp_path
+    ):
+        processor = self._processor(tmp_path, [], num_chunks=0)
+        completed = []
+
+        chunking, chunk_iter = processor._stage_audio_chunking_streamed(
+            tmp_path / "session.wav", 0.0, on_complete=lambda result, dicts: completed.append(dicts)
+        )
+        result = processor._stage_audio_transcription(chunk_iter)
+
+        assert result.status == ProcessingStatus.FAILED
+        assert chunking.status == ProcessingStatus.FAILED
+        assert "zero segments" in chunking.errors[0]
+        assert completed == []
+
+    @pytest.mark.parametrize("backend, workers, expected", [
+        ("local", 1, [1]),  # the total is only known once the last chunk is done
+        ("groq", 4, [1, 50]),  # chunks read ahead, so the last ones report a percentage
+    ])
+    def test_progress_updates_are_throttled_while_total_is_unknown(
+        self, MockClassifierFactory, MockDiarizerFactory, MockTranscriberFactory, MockStatusTracker,
+        MockHybridChunker, tmp_path, monkeypatch, backend, workers, expected
+    ):
+        monkeypatch.setattr(Config, "TRANSCRIPTION_RATE_LIMIT_CALLS", 1000)
+        processor = self._processor(tmp_path, [])
+        processor.transcription_backend = backend
+        processor.transcription_workers = workers
+        chunks = [
+            AudioChunk(
+                audio=np.zeros(160, dtype=np.float32),
+                start_time=float(i * 10),
+                end_time=float(i * 10 + 12),
+                sample_rate=16000,
+                chunk_index=i
+            )
+            for i in range(50)
+        ]
+
+        result = processor._stage_audio_transcription(iter(chunks))
+
+        assert result.success
+        progress_updates = [
+            c for c in MockStatusTracker.update_stage.call_args_list
+            if c.args[1] == 3 and "details" in c.kwargs
+        ]
+        assert [c.kwargs["details"]["chunks_transcribed"] for c in progress_updates] == expected
+        if len(expected) > 1:
+            assert progress_updates[-1].kwargs["details"]["progress_percent"] == 100.0
+
+
 # ============================================================================
 # Integration Tests (Slow)
 # ============================================================================
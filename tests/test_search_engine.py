@@ -339,3 +339,119 @@ def test_no_context_when_disabled(sample_index):
     for result in results:
         assert len(result.context_before) == 0
         assert len(result.context_after) == 0
+
+
+def test_max_results_returns_true_top_k():
+    """The best match is returned even when it is the last segment indexed."""
+    index = TranscriptIndex()
+    for i in range(20):
+        index.add_segment(
+            TranscriptSegment(
+                session_id="s",
+                timestamp=float(i),
+                timestamp_str="00:00:00",
+                speaker="DM",
+                text=f"a long line of narration that mentions the dragon once {i}",
+                ic_ooc="OOC",
+                segment_index=i,
+            )
+        )
+    index.add_segment(
+        TranscriptSegment(
+            session_id="s",
+            timestamp=20.0,
+            timestamp_str="00:00:20",
+            speaker="DM",
+            text="Dragon! Dragon!",
+            ic_ooc="OOC",
+            segment_index=20,
+        )
+    )
+    engine = SearchEngine(index)
+
+    results = engine.search("dragon", max_results=1)
+
+    assert len(results) == 1
+    assert results[0].segment.segment_index == 20
+
+
+def test_filter_only_search_ranks_from_index_columns(sample_index, monkeypatch):
+    """Filter-only results match _calculate_relevance without scoring every segment."""
+    engine = SearchEngine(sample_index)
+    filters = SearchFilters(session_ids={"session1", "session2"})
+    segments = [sample_index.segments[i] for i in range(len(sample_index.segments))]
+    expected = sorted(
+        (engine._calculate_relevance(segment, "") for segment in segments),
+        reverse=True,
+    )[:2]
+
+    def fail(*args, **kwargs):
+        raise AssertionError("filter-only search should not score segments one by one")
+
+    monkeypatch.setattr(engine, "_calculate_relevance", fail)
+    results = engine.search("", filters=filters, max_results=2)
+
+    assert [r.relevance_score for r in results] == pytest.approx(expected)
+
+
+def test_full_text_search_builds_only_top_k_segments(monkeypatch):
+    """BM25 hits are boosted and ranked as arrays; only returned segments are built."""
+    index = TranscriptIndex()
+    for i in range(50):
+        index.add_segment(
+            TranscriptSegment(
+                session_id="s",
+                timestamp=float(i),
+                timestamp_str="00:00:00",
+                speaker="DM",
+                text=f"the dragon circles overhead {i}",
+                ic_ooc="IC" if i == 30 else "OOC",
+                segment_index=i,
+            )
+        )
+    engine = SearchEngine(index)
+    engine.search("dragon", max_results=1)  # build the search index
+
+    block_type = type(index.segments)
+    original_getitem = block_type.__getitem__
+    accessed = []
+
+    def counting_getitem(self, idx):
+        accessed.append(idx)
+        return original_getitem(self, idx)
+
+    monkeypatch.setattr(block_type, "__getitem__", counting_getitem)
+    results = engine.search("dragon", max_results=3, include_context=False)
+
+    assert len(accessed) == 3
+    assert results[0].segment.segment_index == 30
+
+
+def test_full_text_matches_all_words_in_any_order(sample_index):
+    """Multi-word queries match segments containing every word."""
+    engine = SearchEngine(sample_index)
+
+    results = engine.search("dragon village")
+
+    assert len(results) == 1
+    assert results[0].segment.speaker == "Alice"
+
+
+def test_index_picks_up_new_segments(sample_index):
+    """Segments added after a search are found by later searches."""
+    engine = SearchEngine(sample_index)
+    assert engine.search("owlbear") == []
+
+    sample_index.add_segment(
+        TranscriptSegment(
+            session_id="session2",
+            timestamp=8.0,
+            timestamp_str="00:00:08",
+            speaker="DM",
+            text="An owlbear emerges",
+            ic_ooc="IC",
+            segment_index=1,
+        )
+    )
+
+    assert len(engine.search("owlbear")) == 1
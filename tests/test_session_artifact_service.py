@@ -217,3 +217,66 @@ def test_delete_directory_recursive(service_env):
     metadata = service.delete_artifact("session_juliet/segments", recursive=True)
     assert metadata.is_directory is True
     assert not nested.exists()
+
+
+def _write_virtual_snippets(session: Path, subtype: str = "PCM_16") -> None:
+    import json
+
+    import numpy as np
+    import soundfile as sf
+
+    session.mkdir(parents=True, exist_ok=True)
+    sf.write(str(session / "session.wav"), np.zeros((32000, 2), dtype=np.float32), 16000, subtype=subtype)
+    manifest = {
+        "mode": "virtual",
+        "source_audio": "session.wav",
+        "clips": [
+            {"file": "segment_0001_DM.wav", "start_sample": 8000, "end_sample": 24000, "status": "virtual"},
+            {"file": "segment_0002_DM.wav", "start_sample": 24000, "end_sample": 28000, "status": "virtual"},
+        ],
+    }
+    _write_text(session / "manifest.json", json.dumps(manifest))
+
+
+@pytest.mark.parametrize("subtype", ["PCM_16", "FLOAT"])
+def test_list_directory_includes_virtual_clips(service_env, subtype):
+    """Virtual snippet clips are listed with the size of the WAV they render to."""
+    service, output_dir, _ = service_env
+    _write_virtual_snippets(output_dir / "session_golf" / "segments", subtype)
+
+    artifacts = {a.name: a for a in service.list_directory("session_golf/segments")}
+    assert sorted(artifacts) == [
+        "manifest.json", "segment_0001_DM.wav", "segment_0002_DM.wav", "session.wav",
+    ]
+    clip = artifacts["segment_0001_DM.wav"]
+    assert clip.relative_path == "session_golf/segments/segment_0001_DM.wav"
+    assert clip.artifact_type == "wav"
+    assert not clip.is_directory
+    rendered = service.snippet_renderer.render(output_dir / "session_golf" / "segments", clip.name)
+    assert clip.size_bytes == len(rendered)
+
+    metadata = service.get_artifact_metadata("session_golf/segments/segment_0002_DM.wav")
+    assert metadata.size_bytes == artifacts["segment_0002_DM.wav"].size_bytes
+    with pytest.raises(SessionArtifactServiceError):
+        service.get_artifact_metadata("session_golf/segments/segment_0003_DM.wav")
+
+
+def test_create_session_zip_renders_virtual_clips(service_env):
+    """Bundles of virtual snippet sessions contain the clips instead of the session audio."""
+    service, output_dir, _ = service_env
+    _write_virtual_snippets(output_dir / "session_hotel" / "segments")
+    _write_text(output_dir / "session_hotel" / "summary.txt", "summary text")
+
+    archive_path = service.create_session_zip("session_hotel")
+
+    with zipfile.ZipFile(archive_path, "r") as archive:
+        assert sorted(archive.namelist()) == [
+            "segments/manifest.json",
+            "segments/segment_0001_DM.wav",
+            "segments/segment_0002_DM.wav",
+            "summary.txt",
+        ]
+        clip = archive.read("segments/segment_0001_DM.wav")
+    assert clip == service.snippet_renderer.render(
+        output_dir / "session_hotel" / "segments", "segment_0001_DM.wav"
+    )
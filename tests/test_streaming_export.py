@@ -48,6 +48,10 @@ def test_export_incremental(audio_snipper, tmp_path):
         mock_audio_segment.__getitem__.assert_called_once_with(slice(0, 1000, None))
         mock_audio_segment.__getitem__.return_value.export.assert_called_once()
 
+    # Clips are logged append-only and written to manifest.json once at the end
+    assert (session_dir / "manifest.jsonl").exists()
+    audio_snipper.finalize_manifest(manifest_path)
+
     with open(manifest_path, "r") as f:
         manifest_data = json.load(f)
 
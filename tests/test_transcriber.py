@@ -1,5 +1,5 @@
 import pytest
-from unittest.mock import patch, MagicMock, mock_open
+from unittest.mock import patch, MagicMock
 from pathlib import Path
 import numpy as np
 
@@ -11,6 +11,8 @@ def mock_config():
         MockConfig.WHISPER_MODEL = 'tiny'
         MockConfig.GROQ_API_KEY = 'test-groq-api-key'
         MockConfig.OPENAI_API_KEY = 'test-openai-api-key'
+        MockConfig.TRANSCRIPTION_UPLOAD_FORMAT = 'flac'
+        MockConfig.TRANSCRIPTION_UPLOAD_MAX_MB = 24.0
         yield MockConfig
 
 from src.transcriber import (
@@ -108,11 +110,7 @@ def test_faster_whisper_transcriber(MockWhisperModel, dummy_audio_chunk):
     assert segment.words[0]['start'] == pytest.approx(10.0 + 1.0)
 
 @patch('groq.Groq')
-@patch('soundfile.write')
-@patch('builtins.open', new_callable=mock_open)
-@patch('pathlib.Path.unlink')
-@patch('pathlib.Path.exists', return_value=True)
-def test_groq_transcriber(mock_path_exists, mock_unlink, mock_file_open, mock_sf_write, MockGroq, dummy_audio_chunk):
+def test_groq_transcriber(MockGroq, dummy_audio_chunk):
     """Tests the GroqTranscriber logic with extensive mocking."""
     # Arrange: Mock the Groq client and its API response
     mock_groq_client = MockGroq.return_value
@@ -133,15 +131,11 @@ def test_groq_transcriber(mock_path_exists, mock_unlink, mock_file_open, mock_sf
     result = transcriber.transcribe_chunk(dummy_audio_chunk, language='nl')
 
     # Assert
-    # Verify a temporary file was written and then opened
-    mock_sf_write.assert_called_once()
-    mock_file_open.assert_called_with(mock_sf_write.call_args[0][0], 'rb')
-
-    # Verify the API was called
+    # Verify the chunk was uploaded once as an in-memory FLAC file
     mock_groq_client.audio.transcriptions.create.assert_called_once()
-
-    # Verify the temporary file was cleaned up
-    mock_unlink.assert_called_once()
+    filename, data = mock_groq_client.audio.transcriptions.create.call_args.kwargs['file']
+    assert filename == 'chunk_0.flac'
+    assert data[:4] == b'fLaC'
 
     # Verify the returned data structure
     assert isinstance(result, ChunkTranscription)
@@ -235,11 +229,7 @@ class TestChunkTranscription:
 
 
 @patch('groq.Groq')
-@patch('soundfile.write')
-@patch('builtins.open', new_callable=mock_open)
-@patch('pathlib.Path.unlink')
-@patch('pathlib.Path.exists', return_value=True)
-def test_groq_transcriber_handles_empty_segments(mock_path_exists, mock_unlink, mock_file_open, mock_sf_write, MockGroq, dummy_audio_chunk):
+def test_groq_transcriber_handles_empty_segments(MockGroq, dummy_audio_chunk):
     mock_groq_client = MockGroq.return_value
     mock_response = MagicMock()
     mock_response.language = 'nl'
@@ -256,11 +246,7 @@ def test_groq_transcriber_handles_empty_segments(mock_path_exists, mock_unlink,
 
 
 @patch('openai.OpenAI')
-@patch('soundfile.write')
-@patch('builtins.open', new_callable=mock_open)
-@patch('pathlib.Path.unlink')
-@patch('pathlib.Path.exists', return_value=True)
-def test_openai_transcriber(mock_path_exists, mock_unlink, mock_file_open, mock_sf_write, MockOpenAI, dummy_audio_chunk):
+def test_openai_transcriber(MockOpenAI, dummy_audio_chunk):
     """Tests the OpenAITranscriber logic with extensive mocking."""
     # Arrange: Mock the OpenAI client and its API response
     mock_openai_client = MockOpenAI.return_value
@@ -281,15 +267,11 @@ def test_openai_transcriber(mock_path_exists, mock_unlink, mock_file_open, mock_
     result = transcriber.transcribe_chunk(dummy_audio_chunk, language='nl')
 
     # Assert
-    # Verify a temporary file was written and then opened
-    mock_sf_write.assert_called_once()
-    mock_file_open.assert_called_with(mock_sf_write.call_args[0][0], 'rb')
-
-    # Verify the API was called
+    # Verify the chunk was uploaded once as an in-memory FLAC file
     mock_openai_client.audio.transcriptions.create.assert_called_once()
-
-    # Verify the temporary file was cleaned up
-    mock_unlink.assert_called_once()
+    filename, data = mock_openai_client.audio.transcriptions.create.call_args.kwargs['file']
+    assert filename == 'chunk_0.flac'
+    assert data[:4] == b'fLaC'
 
     # Verify the returned data structure
     assert isinstance(result, ChunkTranscription)
@@ -308,11 +290,7 @@ def test_openai_transcriber(mock_path_exists, mock_unlink, mock_file_open, mock_
 
 
 @patch('openai.OpenAI')
-@patch('soundfile.write')
-@patch('builtins.open', new_callable=mock_open)
-@patch('pathlib.Path.unlink')
-@patch('pathlib.Path.exists', return_value=True)
-def test_openai_transcriber_handles_empty_segments(mock_path_exists, mock_unlink, mock_file_open, mock_sf_write, MockOpenAI, dummy_audio_chunk):
+def test_openai_transcriber_handles_empty_segments(MockOpenAI, dummy_audio_chunk):
     mock_openai_client = MockOpenAI.return_value
     mock_response = MagicMock()
     mock_response.language = 'nl'
@@ -326,3 +304,71 @@ def test_openai_transcriber_handles_empty_segments(mock_path_exists, mock_unlink
     assert isinstance(result, ChunkTranscription)
     assert result.language == 'nl'
     assert result.segments == []
+
+
+@patch('groq.Groq')
+def test_cloud_transcriber_splits_oversized_uploads(MockGroq, mock_config):
+    """Chunks above the upload limit are split at a quiet point and re-timed."""
+    sample_rate = 16000
+    rng = np.random.default_rng(0)
+    audio = (0.3 * rng.standard_normal(sample_rate * 120)).astype(np.float32)
+    # Silence around 55s: the quietest point near the middle
+    audio[55 * sample_rate:56 * sample_rate] = 0.0
+    chunk = AudioChunk(chunk_index=3, audio=audio, start_time=100.0, end_time=220.0, sample_rate=sample_rate)
+
+    mock_config.TRANSCRIPTION_UPLOAD_MAX_MB = 2.5
+    mock_groq_client = MockGroq.return_value
+    mock_response = MagicMock()
+    mock_response.language = 'en'
+    mock_response.segments = [{'start': 1.0, 'end': 2.0, 'text': ' part '}]
+    mock_response.words = []
+    mock_groq_client.audio.transcriptions.create.return_value = mock_response
+
+    transcriber = GroqTranscriber(api_key='fake-key')
+    result = transcriber.transcribe_chunk(chunk, language='en')
+
+    calls = mock_groq_client.audio.transcriptions.create.call_args_list
+    assert len(calls) == 2
+    for call in calls:
+        assert len(call.kwargs['file'][1]) <= transcriber.max_upload_bytes
+    # The second part starts inside the silent gap; its timestamps are shifted onto the chunk
+    split_offset = result.segments[1].start_time - 1.0 - chunk.start_time
+    assert 55.0 <= split_offset <= 56.0
+    assert result.segments[0].start_time == pytest.approx(101.0)
+
+
+
+@patch('groq.Groq')
+def test_cloud_transcriber_acquires_rate_limiter_per_upload_part(MockGroq, mock_config):
+    """A split chunk takes one rate limiter slot for every API call it makes."""
+    sample_rate = 16000
+    rng = np.random.default_rng(0)
+    audio = (0.3 * rng.standard_normal(sample_rate * 120)).astype(np.float32)
+    chunk = AudioChunk(chunk_index=0, audio=audio, start_time=0.0, end_time=120.0, sample_rate=sample_rate)
+
+    mock_config.TRANSCRIPTION_UPLOAD_MAX_MB = 2.5
+    mock_response = MagicMock()
+    mock_response.language = 'en'
+    mock_response.segments = []
+    mock_response.words = []
+    create = MockGroq.return_value.audio.transcriptions.create
+    create.return_value = mock_response
+
+    transcriber = GroqTranscriber(api_key='fake-key')
+    transcriber.rate_limiter = MagicMock()
+    transcriber.transcribe_chunk(chunk, language='en')
+
+    assert create.call_count == 2
+    assert transcriber.rate_limiter.acquire.call_count == 2
+
+def test_cloud_transcriber_opus_upload(dummy_audio_chunk):
+    with patch('groq.Groq'):
+        transcriber = GroqTranscriber(api_key='fake-key', upload_format='opus')
+
+    parts = transcriber._encode_upload_parts(dummy_audio_chunk.audio, 16000, "chunk_0")
+
+    assert len(parts) == 1
+    offset, filename, data = parts[0]
+    assert offset == 0.0
+    assert filename == "chunk_0.ogg"
+    assert data[:4] == b'OggS'
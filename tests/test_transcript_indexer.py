@@ -18,6 +18,8 @@ from src.transcript_indexer import (
     TranscriptIndexer,
     TranscriptIndex,
     TranscriptSegment,
+    SegmentBlock,
+    SegmentColumns,
 )
 
 
@@ -296,3 +298,197 @@ def test_session_metadata_extraction(tmp_path):
     assert metadata["total_duration"] == 120.5
     assert metadata["ic_percentage"] == 75.2
     assert metadata["ooc_percentage"] == 24.8
+
+
+def _write_session(output_dir: Path, dir_name: str, texts):
+    session_dir = output_dir / dir_name
+    session_dir.mkdir(exist_ok=True)
+    data_file = session_dir / f"{dir_name.split('_', 2)[2]}_data.json"
+    data_file.write_text(
+        json.dumps(
+            {
+                "segments": [
+                    {"start": float(i), "timestamp": "00:00:00", "speaker": "DM", "text": text, "classification": "IC"}
+                    for i, text in enumerate(texts)
+                ]
+            }
+        )
+    )
+    return data_file
+
+
+def test_update_reindexes_only_changed_sessions(tmp_path, monkeypatch):
+    """Unchanged sessions are served from their shards, not re-parsed."""
+    _write_session(tmp_path, "20251101_120000_one", ["The dragon sleeps"])
+    changed_file = _write_session(tmp_path, "20251108_120000_two", ["A goblin appears"])
+
+    TranscriptIndexer(tmp_path).build_index()
+
+    changed_file.write_text(
+        json.dumps({"segments": [{"start": 0.0, "text": "A goblin king appears", "speaker": "DM"}]})
+    )
+    _write_session(tmp_path, "20251115_120000_three", ["The tavern is quiet"])
+
+    indexer = TranscriptIndexer(tmp_path)
+    parsed = []
+    original = indexer._index_session
+    monkeypatch.setattr(
+        indexer, "_index_session", lambda session_dir, data_file: parsed.append(session_dir.name) or original(session_dir, data_file)
+    )
+    update = indexer.update()
+
+    assert sorted(parsed) == ["20251108_120000_two", "20251115_120000_three"]
+    assert update.added == ["20251115_120000_three"]
+    assert update.changed == ["20251108_120000_two"]
+    assert update.unchanged == 1
+    assert [seg.text for seg in indexer.index.segments] == [
+        "The dragon sleeps",
+        "A goblin king appears",
+        "The tavern is quiet",
+    ]
+
+
+def test_update_drops_removed_sessions(tmp_path):
+    """Sessions whose directories disappear are removed along with their shards."""
+    import shutil
+
+    _write_session(tmp_path, "20251101_120000_one", ["The dragon sleeps"])
+    _write_session(tmp_path, "20251108_120000_two", ["A goblin appears"])
+    indexer = TranscriptIndexer(tmp_path)
+    indexer.build_index()
+
+    shutil.rmtree(tmp_path / "20251101_120000_one")
+    update = indexer.update()
+
+    assert update.removed == ["20251101_120000_one"]
+    assert indexer.index.get_session_count() == 1
+    assert not list(indexer.shard_dir.glob("20251101_120000_one.*"))
+
+
+def test_new_sessions_are_appended_to_loaded_index(tmp_path):
+    """A newer session extends the existing in-memory index and its search index."""
+    _write_session(tmp_path, "20251101_120000_one", ["The dragon sleeps"])
+    indexer = TranscriptIndexer(tmp_path)
+    index = indexer.build_index()
+    search_index = index.get_search_index()
+
+    _write_session(tmp_path, "20251108_120000_two", ["The dragon wakes"])
+    assert indexer.is_index_stale()
+    indexer.update()
+
+    assert indexer.index is index
+    assert index.get_search_index() is search_index
+    assert index.get_total_segments() == 2
+    assert not indexer.is_index_stale()
+
+
+def test_load_session_segments_reads_single_shard(tmp_path):
+    """One session can be loaded from its shard without building the full index."""
+    _write_session(tmp_path, "20251101_120000_one", ["The dragon sleeps"])
+    _write_session(tmp_path, "20251108_120000_two", ["A goblin appears", "It flees"])
+    TranscriptIndexer(tmp_path).update(load_index=False)
+
+    indexer = TranscriptIndexer(tmp_path)
+    segments = indexer.load_session_segments("two")
+
+    assert [seg.text for seg in segments] == ["A goblin appears", "It flees"]
+    assert indexer.index is None
+    assert list(indexer._shards) == ["20251108_120000_two"]
+
+
+def test_update_session_parses_only_that_session(tmp_path, monkeypatch):
+    """The pipeline hook rebuilds one session's shard without scanning the others."""
+    _write_session(tmp_path, "20251101_120000_one", ["The dragon sleeps"])
+    TranscriptIndexer(tmp_path).update(load_index=False)
+    _write_session(tmp_path, "20251108_120000_two", ["A goblin appears"])
+    new_dir = tmp_path / "20251115_120000_three"
+    _write_session(tmp_path, new_dir.name, ["The tavern is quiet"])
+
+    indexer = TranscriptIndexer(tmp_path)
+    parsed = []
+    original = indexer._index_session
+    monkeypatch.setattr(
+        indexer, "_index_session", lambda session_dir, data_file: parsed.append(session_dir.name) or original(session_dir, data_file)
+    )
+    monkeypatch.setattr(indexer, "_scan_sessions", lambda *args: pytest.fail("scanned all sessions"))
+    update = indexer.update_session(new_dir)
+
+    assert parsed == ["20251115_120000_three"]
+    assert update.added == ["20251115_120000_three"]
+    manifest = json.loads(indexer.cache_file.read_text())["sessions"]
+    assert sorted(manifest) == ["20251101_120000_one", "20251115_120000_three"]
+    assert indexer.update_session(new_dir).unchanged == 1
+
+
+def test_indexers_sharing_a_cache_keep_each_others_shards(tmp_path):
+    """A pipeline update between two UI updates is neither lost nor deleted as an orphan."""
+    _write_session(tmp_path, "20251101_120000_one", ["The dragon sleeps"])
+    ui_indexer = TranscriptIndexer(tmp_path)
+    ui_indexer.build_index()
+
+    new_dir = tmp_path / "20251108_120000_two"
+    _write_session(tmp_path, new_dir.name, ["A goblin appears"])
+    TranscriptIndexer(tmp_path).update_session(new_dir)
+    shard_name = json.loads(ui_indexer.cache_file.read_text())["sessions"][new_dir.name]["shard"]
+
+    update = ui_indexer.update()
+
+    assert update.unchanged == 2
+    assert (ui_indexer.shard_dir / shard_name).exists()
+    assert [seg.text for seg in ui_indexer.index.segments] == ["The dragon sleeps", "A goblin appears"]
+
+
+def _segment(i, **overrides):
+    values = dict(
+        session_id="s1",
+        timestamp=float(i),
+        timestamp_str=f"00:00:{i:02d}",
+        speaker="DM" if i % 2 else "Alice",
+        text=f"Line {i} \u2014 caf\u00e9 \U0001f409",
+        ic_ooc="IC",
+        segment_index=i,
+        session_date="20251117_143000",
+        file_path=Path("out") / "s1_data.json",
+    )
+    values.update(overrides)
+    return TranscriptSegment(**values)
+
+
+def test_segment_block_roundtrip_through_file(tmp_path):
+    """A saved block memory-maps back to the same segments, including None fields."""
+    segments = [_segment(i) for i in range(5)]
+    segments.append(_segment(5, session_date=None, file_path=None, text=""))
+
+    block = SegmentBlock.from_segments(segments)
+    block.save(tmp_path / "block.tidx")
+    loaded = SegmentBlock.load(tmp_path / "block.tidx")
+
+    assert loaded.count == 6
+    assert [loaded.segment(i) for i in range(loaded.count)] == segments
+    assert loaded.tables["speaker"] == ["Alice", "DM"]
+    assert list(loaded.iter_rows(4))[1] == ("", "DM", "IC", "s1", 5.0, None)
+
+
+def test_segment_block_rejects_foreign_file(tmp_path):
+    """Files without the block magic are refused rather than misread."""
+    path = tmp_path / "bogus.tidx"
+    path.write_bytes(b"not a segment block")
+
+    with pytest.raises(ValueError):
+        SegmentBlock.load(path)
+
+
+def test_segment_columns_index_across_blocks_and_tail(monkeypatch):
+    """Positional access spans sealed blocks, added blocks and the open tail."""
+    monkeypatch.setattr(SegmentColumns, "SEAL_SIZE", 3)
+    columns = SegmentColumns(_segment(i) for i in range(4))
+    columns.add_block(SegmentBlock.from_segments(_segment(i) for i in range(4, 6)))
+    columns.append(_segment(6))
+
+    assert len(columns) == 7
+    assert [seg.segment_index for seg in columns] == list(range(7))
+    assert columns[-1].segment_index == 6
+    assert [seg.segment_index for seg in columns[2:5]] == [2, 3, 4]
+    assert [row[4] for row in columns.iter_rows(5)] == [5.0, 6.0]
+    with pytest.raises(IndexError):
+        columns[7]
@@ -0,0 +1,184 @@
+import threading
+import time
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+from src.chunker import AudioChunk
+from src.transcriber import ChunkTranscription, CloudTranscriber, TranscriptionSegment
+from src.transcription_executor import TranscriptionExecutor
+
+
+def _make_chunks(count: int):
+    return [
+        AudioChunk(
+            audio=np.zeros(160, dtype=np.float32),
+            start_time=float(i * 10),
+            end_time=float(i * 10 + 10),
+            sample_rate=16000,
+            chunk_index=i,
+        )
+        for i in range(count)
+    ]
+
+
+def _transcription_for(chunk: AudioChunk) -> ChunkTranscription:
+    return ChunkTranscription(
+        chunk_index=chunk.chunk_index,
+        chunk_start=chunk.start_time,
+        chunk_end=chunk.end_time,
+        segments=[
+            TranscriptionSegment(
+                text=f"chunk {chunk.chunk_index}",
+                start_time=chunk.start_time,
+                end_time=chunk.end_time,
+            )
+        ],
+        language="en",
+    )
+
+
+class SlowFirstTranscriber:
+    """Finishes later chunks first so completion order differs from input order."""
+
+    def __init__(self, total: int):
+        self.total = total
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+
+    def transcribe_chunk(self, chunk, language="en"):
+        with self._lock:
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        time.sleep(0.01 * (self.total - chunk.chunk_index))
+        with self._lock:
+            self.active -= 1
+        return _transcription_for(chunk)
+
+
+def test_concurrent_results_are_returned_in_chunk_order():
+    chunks = _make_chunks(6)
+    transcriber = SlowFirstTranscriber(len(chunks))
+    executor = TranscriptionExecutor(transcriber, max_workers=3)
+
+    completions = []
+    results = executor.transcribe_chunks(
+        chunks,
+        language="en",
+        on_chunk_complete=lambda done, chunk, tr: completions.append((done, chunk.chunk_index)),
+    )
+
+    assert [r.chunk_index for r in results] == [0, 1, 2, 3, 4, 5]
+    # Progress counts are monotonic even though chunks finish out of order
+    assert [done for done, _ in completions] == [1, 2, 3, 4, 5, 6]
+    assert sorted(index for _, index in completions) == [0, 1, 2, 3, 4, 5]
+    assert 1 < transcriber.max_active <= 3
+
+
+def test_single_worker_runs_sequentially_in_calling_thread():
+    chunks = _make_chunks(3)
+    transcriber = MagicMock()
+    transcriber.transcribe_chunk.side_effect = lambda chunk, language: _transcription_for(chunk)
+    callback_threads = []
+
+    executor = TranscriptionExecutor(transcriber, max_workers=1)
+    results = executor.transcribe_chunks(
+        chunks,
+        language="nl",
+        on_chunk_complete=lambda *args: callback_threads.append(threading.current_thread()),
+    )
+
+    assert [r.chunk_index for r in results] == [0, 1, 2]
+    assert transcriber.transcribe_chunk.call_count == 3
+    transcriber.transcribe_chunk.assert_called_with(chunks[-1], language="nl")
+    assert callback_threads == [threading.current_thread()] * 3
+
+
+def test_rate_limiter_is_acquired_for_every_chunk():
+    chunks = _make_chunks(4)
+    transcriber = MagicMock()
+    transcriber.transcribe_chunk.side_effect = lambda chunk, language: _transcription_for(chunk)
+    rate_limiter = MagicMock()
+
+    executor = TranscriptionExecutor(transcriber, max_workers=2, rate_limiter=rate_limiter)
+    executor.transcribe_chunks(chunks, language="en")
+
+    assert rate_limiter.acquire.call_count == 4
+
+
+
+def test_rate_limiter_is_left_to_cloud_transcribers():
+    chunks = _make_chunks(3)
+    transcriber = MagicMock(spec=CloudTranscriber)
+    transcriber.transcribe_chunk.side_effect = lambda chunk, language: _transcription_for(chunk)
+    rate_limiter = MagicMock()
+
+    executor = TranscriptionExecutor(transcriber, max_workers=2, rate_limiter=rate_limiter)
+    executor.transcribe_chunks(chunks, language="en")
+
+    # The transcriber acquires once per API call itself
+    assert transcriber.rate_limiter is rate_limiter
+    rate_limiter.acquire.assert_not_called()
+
+def test_concurrent_failure_propagates_first_error():
+    chunks = _make_chunks(5)
+
+    def _transcribe(chunk, language):
+        if chunk.chunk_index == 2:
+            raise RuntimeError("upload failed")
+        return _transcription_for(chunk)
+
+    transcriber = MagicMock()
+    transcriber.transcribe_chunk.side_effect = _transcribe
+
+    executor = TranscriptionExecutor(transcriber, max_workers=2)
+    with pytest.raises(RuntimeError, match="upload failed"):
+        executor.transcribe_chunks(chunks, language="en")
+
+
+def test_for_backend_keeps_local_whisper_sequential():
+    executor = TranscriptionExecutor.for_backend(MagicMock(), "whisper", max_workers=8)
+    assert executor.max_workers == 1
+    assert executor.rate_limiter is None
+
+
+def test_for_backend_uses_workers_and_rate_limiter_for_cloud():
+    executor = TranscriptionExecutor.for_backend(MagicMock(), "groq", max_workers=5)
+    assert executor.max_workers == 5
+    assert executor.rate_limiter is not None
+
+
+def test_generator_source_is_consumed_lazily():
+    chunks = _make_chunks(6)
+    pulled = []
+
+    def _source():
+        for chunk in chunks:
+            pulled.append(chunk.chunk_index)
+            yield chunk
+
+    started = threading.Event()
+    release = threading.Event()
+
+    def _transcribe(chunk, language):
+        started.set()
+        release.wait(timeout=5)
+        return _transcription_for(chunk)
+
+    transcriber = MagicMock()
+    transcriber.transcribe_chunk.side_effect = _transcribe
+    executor = TranscriptionExecutor(transcriber, max_workers=2)
+
+    worker = threading.Thread(target=lambda: results.extend(executor.transcribe_chunks(_source(), language="en")))
+    results = []
+    worker.start()
+    assert started.wait(timeout=5)
+    time.sleep(0.05)
+    # Only as many chunks as there are request slots have been pulled
+    assert len(pulled) == 2
+    release.set()
+    worker.join(timeout=5)
+
+    assert [r.chunk_index for r in results] == [0, 1, 2, 3, 4, 5]